@@ -5,5 +5,22 @@ from .model import BaseModel
 from .model import Domain
 from .model import Folder
 from .model import Link
+from .model import parse_created_at
 from .sync_tsv import T_LINK_DATA
+from .sync_tsv import SyncResult
+from .fingerprint import fingerprint_link
+from .fingerprint import fingerprint_link_data
+from .sync_plan import SyncPlan
+from .sync_state import SyncState
+from .executor import TaskResult
+from .retry import RetryPolicy
+from .rate_limit import TokenBucket
+from .rate_limit import FileTokenBucket
+from .rate_limit import RateLimiter
 from .client import Client
+from .async_client import AsyncClient
+from .paginator import Page
+from .link_table import LinkTable
+from .checkpoint import Checkpoint
+from .checkpoint import FileCheckpointStore
+from .checkpoint import SqliteCheckpointStore
@@ -0,0 +1,322 @@
+# -*- coding: utf-8 -*-
+
+"""
+Short.io asyncio API Client implementation.
+
+This module provides the :class:`AsyncClient` class, the asyncio counterpart of
+:class:`pyshortio.client.Client`. It exposes the same API surface (domain, link
+query, link management, link scan, TSV sync and export methods), but every API
+method is a coroutine and every ``pagi_*`` and ``scan_*`` method is an async
+generator.
+
+Requests are sent through one pooled :class:`httpx.AsyncClient`, and a
+configurable :class:`asyncio.Semaphore` bounds the number of in-flight requests,
+so a single event loop can safely drive hundreds of concurrent API calls:
+
+.. code-block:: python
+
+    import asyncio
+    from pyshortio.api import AsyncClient
+
+    async def main():
+        async with AsyncClient(token="...", max_concurrency=100) as client:
+            tasks = [
+                client.get_link_info_by_link_id(link_id=link_id)
+                for link_id in link_ids
+            ]
+            results = await asyncio.gather(*tasks)
+
+    asyncio.run(main())
+
+.. note::
+
+    This feature requires the ``httpx`` library, install it with
+    ``pip install "pyshortio[async]"``.
+"""
+
+import typing as T
+import json
+import asyncio
+import dataclasses
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    pass
+
+from .type_hint import T_KWARGS
+from .constants import DEFAULT_DEBUG
+from .retry import RetryPolicy
+from .rate_limit import RateLimiter
+from .json_backend import response_json
+from .client import normalize_endpoint
+
+# mixin modules
+from .async_domain import AsyncDomainMixin
+from .async_link_queries import AsyncLinkQueriesMixin
+from .async_link_management import AsyncLinkManagementMixin
+from .async_link_scan import AsyncLinkScanMixin
+from .async_link_table import AsyncLinkTableMixin
+from .async_sync_tsv import AsyncSyncTSVMixin
+from .async_export import AsyncExportMixin
+
+
+@dataclasses.dataclass
+class AsyncClient(
+    AsyncDomainMixin,
+    AsyncLinkQueriesMixin,
+    AsyncLinkManagementMixin,
+    AsyncLinkScanMixin,
+    AsyncLinkTableMixin,
+    AsyncSyncTSVMixin,
+    AsyncExportMixin,
+):
+    """
+    Main asyncio client class for interacting with the Short.io API.
+
+    The underlying :class:`httpx.AsyncClient` is created lazily on first use,
+    inside the running event loop, and released by :meth:`aclose` or by using
+    the client as an async context manager.
+
+    :param token: The Short.io API token for authentication
+    :param endpoint: The base URL for the Short.io API (defaults to "https://api.short.io")
+    :param max_connections: The maximum number of concurrent connections
+    :param max_keepalive_connections: The maximum number of idle keep-alive
+        connections kept in the pool
+    :param keepalive_expiry: Seconds an idle keep-alive connection is kept
+    :param max_concurrency: The maximum number of in-flight API requests,
+        enforced by an :class:`asyncio.Semaphore`
+    :param timeout: Timeout in seconds for every HTTP request
+    :param retry_policy: Optional :class:`~pyshortio.retry.RetryPolicy`,
+        see :class:`pyshortio.client.Client`
+    :param rate_limiter: Optional :class:`~pyshortio.rate_limit.RateLimiter`,
+        see :class:`pyshortio.client.Client`
+    """
+
+    token: str = dataclasses.field()
+    endpoint: str = dataclasses.field(default="https://api.short.io")
+    max_connections: int = dataclasses.field(default=100)
+    max_keepalive_connections: int = dataclasses.field(default=20)
+    keepalive_expiry: float = dataclasses.field(default=5.0)
+    max_concurrency: int = dataclasses.field(default=100)
+    timeout: float = dataclasses.field(default=60.0)
+    retry_policy: T.Optional[RetryPolicy] = dataclasses.field(default=None)
+    rate_limiter: T.Optional[RateLimiter] = dataclasses.field(default=None)
+
+    _http: T.Optional["httpx.AsyncClient"] = dataclasses.field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _semaphore: T.Optional[asyncio.Semaphore] = dataclasses.field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def __post_init__(self):
+        self.endpoint = normalize_endpoint(self.endpoint)
+        self._headers = {
+            "accept": "application/json",
+            "content-type": "application/json",
+            "authorization": self.token,
+        }
+        self._delete_headers = {
+            "accept": "application/json",
+            "authorization": self.token,
+        }
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """
+        Get the default HTTP headers for API requests.
+        """
+        return dict(self._headers)
+
+    @property
+    def delete_headers(self) -> dict[str, str]:
+        """
+        Get the default HTTP headers for delete API requests.
+        """
+        return dict(self._delete_headers)
+
+    @property
+    def http(self) -> "httpx.AsyncClient":
+        """
+        The pooled async HTTP transport, created on first access.
+        """
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                    keepalive_expiry=self.keepalive_expiry,
+                ),
+                timeout=self.timeout,
+            )
+        return self._http
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """
+        The semaphore that bounds the number of in-flight requests.
+        """
+        # create it lazily so that it binds to the running event loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def aclose(self):
+        """
+        Close the underlying HTTP transport and release all pooled connections.
+
+        The client stays usable, a new transport is created on the next API call.
+        The concurrency semaphore is kept, so the requests still in flight
+        keep counting against ``max_concurrency``.
+        """
+        http, self._http = self._http, None
+        if http is not None:
+            await http.aclose()
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    def _merge_headers(
+        self,
+        default_headers: dict[str, str],
+        headers: T.Optional[T_KWARGS],
+    ) -> dict[str, str]:
+        if headers is None:
+            return default_headers
+        else:  # pragma: no cover
+            return {**default_headers, **headers}
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        params: T.Optional[T_KWARGS] = None,
+        data: T.Optional[T_KWARGS] = None,
+    ) -> "httpx.Response":
+        # wait for the rate limiter before taking a concurrency slot
+        if self.rate_limiter is not None:
+            await self.rate_limiter.aacquire(url)
+        async with self.semaphore:
+            # httpx only allows a body on DELETE via the generic request method
+            return await self.http.request(
+                method,
+                url,
+                headers=headers,
+                params=params,
+                json=data,
+            )
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        params: T.Optional[T_KWARGS] = None,
+        data: T.Optional[T_KWARGS] = None,
+        idempotent: bool = True,
+        debug: bool = DEFAULT_DEBUG,
+    ) -> "httpx.Response":
+        if debug:  # pragma: no cover
+            print(f"===== Start of {method} request.url = {url} =====")
+            print(f"request.headers = {headers}")
+            print(f"request.params = {params}")
+            print(f"request.data = {data}")
+        if self.retry_policy is None:
+            res = await self._send(method, url, headers, params, data)
+        else:
+            # the semaphore is only held while the request is in flight,
+            # not while we are waiting for the next attempt
+            state = self.retry_policy.start()
+            while 1:
+                try:
+                    res = await self._send(method, url, headers, params, data)
+                except httpx.TransportError:
+                    delay = state.next_delay(response=None, idempotent=idempotent)
+                    if delay is None:
+                        raise
+                else:
+                    delay = state.next_delay(response=res, idempotent=idempotent)
+                    if delay is None:
+                        break
+                    await res.aclose()
+                await asyncio.sleep(delay)
+        if debug:  # pragma: no cover
+            print(f"response.status = {res.status_code}")
+            print(f"response.headers = {res.headers}")
+            print("response.data =")
+            print(json.dumps(response_json(res), indent=4, ensure_ascii=False))
+            print(f"===== End of {method} request.url = {url} =====")
+        return res
+
+    async def http_get(
+        self,
+        url: str,
+        headers: T.Optional[T_KWARGS] = None,
+        params: T.Optional[T_KWARGS] = None,
+        debug: bool = DEFAULT_DEBUG,
+    ) -> "httpx.Response":
+        """
+        Perform an HTTP GET request to the Short.io API.
+        """
+        return await self._request(
+            method="GET",
+            url=url,
+            headers=self._merge_headers(self._headers, headers),
+            params=params,
+            debug=debug,
+        )
+
+    async def http_post(
+        self,
+        url: str,
+        headers: T.Optional[T_KWARGS] = None,
+        params: T.Optional[T_KWARGS] = None,
+        data: T.Optional[T_KWARGS] = None,
+        retry_safe: bool = False,
+        debug: bool = DEFAULT_DEBUG,
+    ) -> "httpx.Response":
+        """
+        Perform an HTTP POST request to the Short.io API.
+
+        :param retry_safe: See :meth:`pyshortio.client.Client.http_post`
+        """
+        return await self._request(
+            method="POST",
+            url=url,
+            headers=self._merge_headers(self._headers, headers),
+            params=params,
+            data=data,
+            idempotent=retry_safe,
+            debug=debug,
+        )
+
+    async def http_delete(
+        self,
+        url: str,
+        headers: T.Optional[T_KWARGS] = None,
+        params: T.Optional[T_KWARGS] = None,
+        data: T.Optional[T_KWARGS] = None,
+        debug: bool = DEFAULT_DEBUG,
+    ) -> "httpx.Response":
+        """
+        Perform an HTTP DELETE request to the Short.io API.
+        """
+        return await self._request(
+            method="DELETE",
+            url=url,
+            headers=self._merge_headers(self._delete_headers, headers),
+            params=params,
+            data=data,
+            debug=debug,
+        )
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+"""
+Short.io Domain API implementation for :class:`pyshortio.async_client.AsyncClient`.
+
+Every method mirrors the one with the same name in :mod:`pyshortio.domain`,
+but is a coroutine. The request arguments and the response parsing are the
+helpers of :mod:`pyshortio.domain`.
+"""
+
+import typing as T
+
+from .arg import NA
+from .constants import DEFAULT_RAISE_FOR_STATUS
+from .model import Domain
+from .domain import (
+    _list_domains_request,
+    _parse_list_domains,
+    _get_domain_request,
+    _parse_get_domain,
+    _find_domain_by_hostname,
+)
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    import httpx
+    from .async_client import AsyncClient
+
+
+class AsyncDomainMixin:
+    """
+    Mixin class providing Domain-related API methods for the AsyncClient.
+    """
+
+    async def list_domains(
+        self: "AsyncClient",
+        limit: T.Optional[int] = NA,
+        offset: T.Optional[int] = NA,
+        no_team_id: T.Optional[bool] = NA,
+        pattern: T.Optional[str] = NA,
+        team_id: T.Optional[str] = NA,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+    ) -> tuple["httpx.Response", list[Domain]]:
+        """
+        See :meth:`pyshortio.domain.DomainMixin.list_domains`.
+        """
+        response = await self.http_get(
+            **_list_domains_request(
+                endpoint=self.endpoint,
+                limit=limit,
+                offset=offset,
+                no_team_id=no_team_id,
+                pattern=pattern,
+                team_id=team_id,
+            )
+        )
+        return response, _parse_list_domains(response, raise_for_status)
+
+    async def get_domain(
+        self: "AsyncClient",
+        domain_id: int,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+    ) -> tuple["httpx.Response", T.Optional[Domain]]:
+        """
+        See :meth:`pyshortio.domain.DomainMixin.get_domain`.
+        """
+        response = await self.http_get(
+            **_get_domain_request(endpoint=self.endpoint, domain_id=domain_id)
+        )
+        return response, _parse_get_domain(response, raise_for_status)
+
+    async def get_domain_by_hostname(
+        self: "AsyncClient",
+        hostname: str,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+    ) -> T.Tuple["httpx.Response", T.Optional[Domain]]:
+        """
+        See :meth:`pyshortio.domain.DomainMixin.get_domain_by_hostname`.
+        """
+        response, domain_list = await self.list_domains(
+            raise_for_status=raise_for_status
+        )
+        return response, _find_domain_by_hostname(domain_list, hostname)
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+
+"""
+Short.io Export functionality for :class:`pyshortio.async_client.AsyncClient`.
+
+See :mod:`pyshortio.export`.
+"""
+
+import io
+import typing as T
+from pathlib import Path
+
+from .arg import NA
+from .constants import DEFAULT_RAISE_FOR_STATUS
+from .type_hint import T_KWARGS
+from .export_writer import (
+    T_SINK,
+    open_sink,
+    get_export_writer,
+    write_all_async,
+)
+from .export_incremental import (
+    ExportManifest,
+    PartitionWriter,
+    split_partitions,
+    prepare_export,
+    finish_export,
+)
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    from .async_client import AsyncClient
+
+
+class AsyncExportMixin:
+    """
+    Mixin class providing export capabilities for the AsyncClient.
+    """
+
+    async def _get_folder_id_to_name_mapping(
+        self: "AsyncClient",
+        domain_id: int,
+    ) -> dict[str, str]:
+        _, folder_list = await self.list_folders(domain_id=domain_id)
+        return {folder.id: folder.name for folder in folder_list}
+
+    async def export_links(
+        self: "AsyncClient",
+        hostname: str,
+        sink: T_SINK,
+        format: str = "tsv",
+        limit: int = 150,
+        prefetch: int = 2,
+        writer_options: T.Optional[T_KWARGS] = None,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+    ) -> int:
+        """
+        See :meth:`pyshortio.export.ExportMixin.export_links`, the pages are
+        written in a worker thread, see
+        :func:`~pyshortio.export_writer.write_all_async`.
+        """
+        _, domain = await self.get_domain_by_hostname(hostname=hostname)
+        folder_id_to_name_mapping = await self._get_folder_id_to_name_mapping(
+            domain_id=domain.id,
+        )
+        n_link = 0
+        with open_sink(sink) as file:
+            writer = get_export_writer(format, file, **(writer_options or {}))
+
+            async def iter_dfs():
+                nonlocal n_link
+                async for table in self.iter_link_tables(
+                    domain_id=domain.id,
+                    limit=limit,
+                    prefetch=prefetch,
+                    raise_for_status=raise_for_status,
+                ):
+                    n_link += len(table)
+                    yield table.to_export_df(
+                        folder_id_to_name_mapping,
+                        typed=writer.typed,
+                    )
+
+            await write_all_async(writer, iter_dfs())
+        return n_link
+
+    async def export_links_incremental(
+        self: "AsyncClient",
+        hostname: str,
+        dir: T.Union[str, Path],
+        format: str = "parquet",
+        partition_format: str = "%Y-%m-%d",
+        limit: int = 150,
+        prefetch: int = 2,
+        writer_options: T.Optional[T_KWARGS] = None,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+    ) -> ExportManifest:
+        """
+        See :meth:`pyshortio.export.ExportMixin.export_links_incremental`, the
+        files are written in a worker thread.
+        """
+        _, domain = await self.get_domain_by_hostname(hostname=hostname)
+        manifest = prepare_export(
+            dir=Path(dir),
+            hostname=hostname,
+            domain_id=domain.id,
+            format=format,
+            partition_format=partition_format,
+        )
+        writer = PartitionWriter(
+            dir=Path(dir),
+            format=format,
+            folder_id_to_name_mapping=await self._get_folder_id_to_name_mapping(
+                domain_id=domain.id,
+            ),
+            writer_options=writer_options or {},
+            watermark=manifest.watermark,
+            watermark_ids=list(manifest.watermark_ids),
+        )
+
+        async def iter_pieces():
+            async for table in self.iter_link_tables(
+                domain_id=domain.id,
+                after_date=(
+                    NA if manifest.after_date is None else manifest.after_date
+                ),
+                # oldest first, so that a partition is one run of links
+                date_sort_order="asc",
+                limit=limit,
+                prefetch=prefetch,
+                raise_for_status=raise_for_status,
+            ):
+                for piece in split_partitions(
+                    table,
+                    partition_format=partition_format,
+                    exclude_ids=manifest.watermark_ids,
+                ):
+                    yield piece
+
+        await write_all_async(writer, iter_pieces())
+        return finish_export(dir=Path(dir), manifest=manifest, writer=writer)
+
+    async def export_to_tsv(
+        self: "AsyncClient",
+        hostname: str,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+    ) -> str:
+        """
+        See :meth:`pyshortio.export.ExportMixin.export_to_tsv`.
+        """
+        buffer = io.BytesIO()
+        await self.export_links(
+            hostname=hostname,
+            sink=buffer,
+            format="tsv",
+            raise_for_status=raise_for_status,
+        )
+        return buffer.getvalue().decode("utf-8")
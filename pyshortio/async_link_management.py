@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+
+"""
+Short.io Link Management API implementation for
+:class:`pyshortio.async_client.AsyncClient`.
+
+Every method mirrors the one with the same name in
+:mod:`pyshortio.link_management`, but is a coroutine. The request arguments
+and the response parsing are the helpers of :mod:`pyshortio.link_management`,
+so both clients always send identical payloads.
+"""
+
+try:
+    import typing_extensions as T
+except ImportError:  # pragma: no cover
+    import typing as T
+
+from datetime import datetime
+
+from .arg import NA
+from .constants import DEFAULT_RAISE_FOR_STATUS
+from .model import Link
+from .link_management import (
+    T_CREATE_BATCH_LINK,
+    _create_link_request,
+    _parse_create_link,
+    _batch_create_links_request,
+    _parse_batch_create_links,
+    _update_link_request,
+    _parse_update_link,
+    _delete_link_request,
+    _parse_delete_link,
+    _batch_delete_links_request,
+    _parse_batch_delete_links,
+)
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    import httpx
+    from .async_client import AsyncClient
+
+
+class AsyncLinkManagementMixin:
+    """
+    Mixin class providing Link management API methods for the AsyncClient.
+    """
+
+    async def create_link(
+        self: "AsyncClient",
+        hostname: str,
+        original_url: str,
+        cloaking: bool = NA,
+        password: str = NA,
+        redirect_type: str = NA,
+        expire_at: datetime = NA,
+        expire_url: str = NA,
+        title: str = NA,
+        tags: list[str] = NA,
+        utm_source: str = NA,
+        utm_medium: str = NA,
+        utm_campaign: str = NA,
+        utm_term: str = NA,
+        utm_content: str = NA,
+        ttl: datetime = NA,
+        path: str = NA,
+        android_url: str = NA,
+        iphone_url: str = NA,
+        created_at: datetime = NA,
+        clicks_limit: int = NA,
+        password_contact: bool = NA,
+        skip_qs: bool = NA,
+        archived: bool = NA,
+        split_url: str = NA,
+        split_percent: int = NA,
+        integration_adroll: str = NA,
+        integration_fb: str = NA,
+        integration_ga: str = NA,
+        integration_gtm: str = NA,
+        allow_duplicates: bool = NA,
+        folder_id: str = NA,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+    ) -> tuple["httpx.Response", T.Optional[Link]]:
+        """
+        See :meth:`pyshortio.link_management.LinkManagementMixin.create_link`.
+        """
+        response = await self.http_post(
+            **_create_link_request(
+                endpoint=self.endpoint,
+                hostname=hostname,
+                original_url=original_url,
+                cloaking=cloaking,
+                password=password,
+                redirect_type=redirect_type,
+                expire_at=expire_at,
+                expire_url=expire_url,
+                title=title,
+                tags=tags,
+                utm_source=utm_source,
+                utm_medium=utm_medium,
+                utm_campaign=utm_campaign,
+                utm_term=utm_term,
+                utm_content=utm_content,
+                ttl=ttl,
+                path=path,
+                android_url=android_url,
+                iphone_url=iphone_url,
+                created_at=created_at,
+                clicks_limit=clicks_limit,
+                password_contact=password_contact,
+                skip_qs=skip_qs,
+                archived=archived,
+                split_url=split_url,
+                split_percent=split_percent,
+                integration_adroll=integration_adroll,
+                integration_fb=integration_fb,
+                integration_ga=integration_ga,
+                integration_gtm=integration_gtm,
+                allow_duplicates=allow_duplicates,
+                folder_id=folder_id,
+            )
+        )
+        return response, _parse_create_link(response, raise_for_status)
+
+    async def batch_create_links(
+        self: "AsyncClient",
+        hostname: str,
+        links: list[T_CREATE_BATCH_LINK],
+        allow_duplicates: bool = NA,
+        folder_id: str = NA,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+    ) -> tuple["httpx.Response", T.Optional[list[Link]]]:
+        """
+        See :meth:`pyshortio.link_management.LinkManagementMixin.batch_create_links`.
+        """
+        response = await self.http_post(
+            **_batch_create_links_request(
+                endpoint=self.endpoint,
+                hostname=hostname,
+                links=links,
+                allow_duplicates=allow_duplicates,
+                folder_id=folder_id,
+            )
+        )
+        return response, _parse_batch_create_links(response, raise_for_status)
+
+    async def update_link(
+        self: "AsyncClient",
+        link_id: str,
+        domain_id: int = NA,
+        original_url: str = NA,
+        cloaking: bool = NA,
+        password: str = NA,
+        redirect_type: str = NA,
+        expire_at: datetime = NA,
+        expire_url: str = NA,
+        title: str = NA,
+        tags: list[str] = NA,
+        utm_source: str = NA,
+        utm_medium: str = NA,
+        utm_campaign: str = NA,
+        utm_term: str = NA,
+        utm_content: str = NA,
+        ttl: datetime = NA,
+        path: str = NA,
+        android_url: str = NA,
+        iphone_url: str = NA,
+        created_at: datetime = NA,
+        clicks_limit: int = NA,
+        password_contact: bool = NA,
+        skip_qs: bool = NA,
+        archived: bool = NA,
+        split_url: str = NA,
+        split_percent: int = NA,
+        integration_adroll: str = NA,
+        integration_fb: str = NA,
+        integration_ga: str = NA,
+        integration_gtm: str = NA,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+    ) -> tuple["httpx.Response", T.Optional[Link]]:
+        """
+        See :meth:`pyshortio.link_management.LinkManagementMixin.update_link`.
+        """
+        response = await self.http_post(
+            **_update_link_request(
+                endpoint=self.endpoint,
+                link_id=link_id,
+                domain_id=domain_id,
+                original_url=original_url,
+                cloaking=cloaking,
+                password=password,
+                redirect_type=redirect_type,
+                expire_at=expire_at,
+                expire_url=expire_url,
+                title=title,
+                tags=tags,
+                utm_source=utm_source,
+                utm_medium=utm_medium,
+                utm_campaign=utm_campaign,
+                utm_term=utm_term,
+                utm_content=utm_content,
+                ttl=ttl,
+                path=path,
+                android_url=android_url,
+                iphone_url=iphone_url,
+                created_at=created_at,
+                clicks_limit=clicks_limit,
+                password_contact=password_contact,
+                skip_qs=skip_qs,
+                archived=archived,
+                split_url=split_url,
+                split_percent=split_percent,
+                integration_adroll=integration_adroll,
+                integration_fb=integration_fb,
+                integration_ga=integration_ga,
+                integration_gtm=integration_gtm,
+            )
+        )
+        return response, _parse_update_link(response, raise_for_status)
+
+    async def delete_link(
+        self: "AsyncClient",
+        link_id: str,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+    ) -> tuple["httpx.Response", T.Optional[bool]]:
+        """
+        See :meth:`pyshortio.link_management.LinkManagementMixin.delete_link`.
+        """
+        response = await self.http_delete(
+            **_delete_link_request(endpoint=self.endpoint, link_id=link_id)
+        )
+        return response, _parse_delete_link(response, raise_for_status)
+
+    async def batch_delete_links(
+        self: "AsyncClient",
+        link_ids: list[str],
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+    ) -> tuple["httpx.Response", T.Optional[bool]]:
+        """
+        See :meth:`pyshortio.link_management.LinkManagementMixin.batch_delete_links`.
+        """
+        response = await self.http_delete(
+            **_batch_delete_links_request(endpoint=self.endpoint, link_ids=link_ids)
+        )
+        return response, _parse_batch_delete_links(response, raise_for_status)
@@ -0,0 +1,381 @@
+# -*- coding: utf-8 -*-
+
+"""
+Short.io Link query API implementation for
+:class:`pyshortio.async_client.AsyncClient`.
+
+Every method mirrors the one with the same name in :mod:`pyshortio.link_queries`,
+but is a coroutine. Methods prefixed with ``pagi_`` are async generators. The
+request arguments and the response parsing are the helpers of
+:mod:`pyshortio.link_queries`.
+"""
+
+import typing as T
+from datetime import datetime
+
+from .arg import NA
+from .constants import DEFAULT_RAISE_FOR_STATUS
+from .model import Link, Folder
+from .checkpoint import BaseCheckpointStore
+from .paginator import Page, _apaginate
+from .link_queries import (
+    _list_links_request,
+    _parse_list_links_page,
+    _get_link_opengraph_properties_request,
+    _parse_get_link_opengraph_properties,
+    _get_link_info_by_link_id_request,
+    _get_link_info_by_path_request,
+    _parse_get_link_info,
+    _list_links_by_original_url_request,
+    _parse_list_links_by_original_url,
+    _list_folders_request,
+    _parse_list_folders,
+    _get_folder_request,
+    _parse_get_folder,
+    _create_folder_request,
+    _parse_create_folder,
+)
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    import httpx
+    from .async_client import AsyncClient
+
+
+class AsyncLinkQueriesMixin:
+    """
+    Mixin class providing Link-related query methods for the AsyncClient.
+    """
+
+    async def _list_links_page(
+        self: "AsyncClient",
+        domain_id: int,
+        limit: T.Optional[int] = NA,
+        id_string: T.Optional[int] = NA,
+        create_at: T.Optional[datetime] = NA,
+        before_date: T.Optional[datetime] = NA,
+        after_date: T.Optional[datetime] = NA,
+        date_sort_order: T.Optional[str] = NA,
+        page_token: T.Optional[str] = NA,
+        folder_id: T.Optional[str] = NA,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+        lazy: bool = False,
+        table: bool = False,
+    ) -> Page:
+        """
+        Same as :meth:`list_links`, but returns a :class:`~pyshortio.paginator.Page`
+        that also carries the decoded response body.
+
+        :param lazy: Decode the links on access, see :mod:`pyshortio.lazy`
+        :param table: Read the links into a :class:`polars.DataFrame` with
+            :func:`~pyshortio.link_table.read_links_page`, the page ``result``
+            and ``data["links"]`` are this data frame, no
+            :class:`~pyshortio.model.Link` is created
+        """
+        response = await self.http_get(
+            **_list_links_request(
+                endpoint=self.endpoint,
+                domain_id=domain_id,
+                limit=limit,
+                id_string=id_string,
+                create_at=create_at,
+                before_date=before_date,
+                after_date=after_date,
+                date_sort_order=date_sort_order,
+                page_token=page_token,
+                folder_id=folder_id,
+            )
+        )
+        return _parse_list_links_page(
+            response,
+            raise_for_status=raise_for_status,
+            lazy=lazy,
+            table=table,
+        )
+
+    async def list_links(
+        self: "AsyncClient",
+        domain_id: int,
+        limit: T.Optional[int] = NA,
+        id_string: T.Optional[int] = NA,
+        create_at: T.Optional[datetime] = NA,
+        before_date: T.Optional[datetime] = NA,
+        after_date: T.Optional[datetime] = NA,
+        date_sort_order: T.Optional[str] = NA,
+        page_token: T.Optional[str] = NA,
+        folder_id: T.Optional[str] = NA,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+    ) -> tuple["httpx.Response", list[Link]]:
+        """
+        See :meth:`pyshortio.link_queries.LinkQueriesMixin.list_links`.
+        """
+        page = await self._list_links_page(
+            domain_id=domain_id,
+            limit=limit,
+            id_string=id_string,
+            create_at=create_at,
+            before_date=before_date,
+            after_date=after_date,
+            date_sort_order=date_sort_order,
+            page_token=page_token,
+            folder_id=folder_id,
+            raise_for_status=raise_for_status,
+        )
+        return page.response, page.result
+
+    async def pagi_list_links(
+        self: "AsyncClient",
+        domain_id: int,
+        limit: T.Optional[int] = NA,
+        id_string: T.Optional[int] = NA,
+        create_at: T.Optional[datetime] = NA,
+        before_date: T.Optional[datetime] = NA,
+        after_date: T.Optional[datetime] = NA,
+        date_sort_order: T.Optional[str] = NA,
+        folder_id: T.Optional[str] = NA,
+        total_max_results: T.Optional[int] = None,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+        prefetch: int = 0,
+        checkpoint_store: T.Optional[BaseCheckpointStore] = None,
+        checkpoint_key: T.Optional[str] = None,
+        lazy: bool = False,
+        table: bool = False,
+    ) -> T.AsyncIterator[Page]:
+        """
+        Auto-paginated version of :meth:`list_links`, an async generator.
+
+        >>> async for response, links in client.pagi_list_links(domain_id=45678):
+        >>>     for link in links:
+        >>>         process_link(link)
+
+        :param prefetch: If greater than 0, fetch up to this many pages ahead in
+            a background task while the current page is being processed
+        """
+
+        def get_next_token(res):
+            return res.get("nextPageToken")
+
+        def set_next_token(kwargs, next_token):
+            kwargs["page_token"] = next_token
+
+        async for page in _apaginate(
+            method=self._list_links_page,
+            list_key="links",
+            get_next_token=get_next_token,
+            set_next_token=set_next_token,
+            kwargs=dict(
+                domain_id=domain_id,
+                limit=limit,
+                id_string=id_string,
+                create_at=create_at,
+                before_date=before_date,
+                after_date=after_date,
+                date_sort_order=date_sort_order,
+                folder_id=folder_id,
+                raise_for_status=raise_for_status,
+                lazy=lazy,
+                table=table,
+            ),
+            max_results=total_max_results,
+            prefetch=prefetch,
+            checkpoint_store=checkpoint_store,
+            checkpoint_key=checkpoint_key,
+        ):
+            yield page
+
+    async def iter_links(
+        self: "AsyncClient",
+        domain_id: int,
+        limit: T.Optional[int] = 150,
+        before_date: T.Optional[datetime] = NA,
+        after_date: T.Optional[datetime] = NA,
+        date_sort_order: T.Optional[str] = NA,
+        folder_id: T.Optional[str] = NA,
+        max_results: T.Optional[int] = None,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+        prefetch: int = 0,
+        checkpoint_store: T.Optional[BaseCheckpointStore] = None,
+        checkpoint_key: T.Optional[str] = None,
+        lazy: bool = False,
+    ) -> T.AsyncIterator[Link]:
+        """
+        See :meth:`pyshortio.link_queries.LinkQueriesMixin.iter_links`.
+        """
+        n = 0
+        paginator = self.pagi_list_links(
+            domain_id=domain_id,
+            limit=limit,
+            before_date=before_date,
+            after_date=after_date,
+            date_sort_order=date_sort_order,
+            folder_id=folder_id,
+            total_max_results=max_results,
+            raise_for_status=raise_for_status,
+            prefetch=prefetch,
+            checkpoint_store=checkpoint_store,
+            checkpoint_key=checkpoint_key,
+            lazy=lazy,
+        )
+        async for page in paginator:
+            link_list = page.result
+            for link in link_list:
+                if max_results is not None and n >= max_results:
+                    return
+                n += 1
+                yield link
+
+    async def get_link_opengraph_properties(
+        self: "AsyncClient",
+        domain_id: int,
+        link_id: str,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+    ) -> tuple["httpx.Response", T.Optional[list]]:
+        """
+        See :meth:`pyshortio.link_queries.LinkQueriesMixin.get_link_opengraph_properties`.
+        """
+        response = await self.http_get(
+            **_get_link_opengraph_properties_request(
+                endpoint=self.endpoint,
+                domain_id=domain_id,
+                link_id=link_id,
+            )
+        )
+        return response, _parse_get_link_opengraph_properties(
+            response, raise_for_status
+        )
+
+    async def get_link_info_by_link_id(
+        self: "AsyncClient",
+        link_id: str,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+    ) -> tuple["httpx.Response", T.Optional[Link]]:
+        """
+        See :meth:`pyshortio.link_queries.LinkQueriesMixin.get_link_info_by_link_id`.
+        """
+        response = await self.http_get(
+            **_get_link_info_by_link_id_request(
+                endpoint=self.endpoint,
+                link_id=link_id,
+            )
+        )
+        return response, _parse_get_link_info(response, raise_for_status)
+
+    async def get_link_info_by_path(
+        self: "AsyncClient",
+        hostname: str,
+        path: str,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+    ) -> tuple["httpx.Response", T.Optional[Link]]:
+        """
+        See :meth:`pyshortio.link_queries.LinkQueriesMixin.get_link_info_by_path`.
+        """
+        response = await self.http_get(
+            **_get_link_info_by_path_request(
+                endpoint=self.endpoint,
+                hostname=hostname,
+                path=path,
+            )
+        )
+        return response, _parse_get_link_info(response, raise_for_status)
+
+    async def list_links_by_original_url(
+        self: "AsyncClient",
+        hostname: str,
+        original_url: str,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+    ) -> tuple["httpx.Response", list[Link]]:
+        """
+        See :meth:`pyshortio.link_queries.LinkQueriesMixin.list_links_by_original_url`.
+        """
+        response = await self.http_get(
+            **_list_links_by_original_url_request(
+                endpoint=self.endpoint,
+                hostname=hostname,
+                original_url=original_url,
+            )
+        )
+        return response, _parse_list_links_by_original_url(
+            response, raise_for_status
+        )
+
+    async def list_folders(
+        self: "AsyncClient",
+        domain_id: int,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+    ) -> tuple["httpx.Response", list[Folder]]:
+        """
+        See :meth:`pyshortio.link_queries.LinkQueriesMixin.list_folders`.
+        """
+        response = await self.http_get(
+            **_list_folders_request(endpoint=self.endpoint, domain_id=domain_id)
+        )
+        return response, _parse_list_folders(response, raise_for_status)
+
+    async def get_folder(
+        self: "AsyncClient",
+        domain_id: int,
+        folder_id: str,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+    ) -> tuple["httpx.Response", T.Optional[Folder]]:
+        """
+        See :meth:`pyshortio.link_queries.LinkQueriesMixin.get_folder`.
+        """
+        response = await self.http_get(
+            **_get_folder_request(
+                endpoint=self.endpoint,
+                domain_id=domain_id,
+                folder_id=folder_id,
+            )
+        )
+        return response, _parse_get_folder(response, raise_for_status)
+
+    async def create_folder(
+        self: "AsyncClient",
+        domain_id: int,
+        name: str,
+        color: str = NA,
+        background_color: str = NA,
+        logo_url: str = NA,
+        logo_height: str = NA,
+        logo_width: str = NA,
+        ec_level: str = NA,
+        integration_fb: str = NA,
+        integration_ga: str = NA,
+        integration_gtm: str = NA,
+        integration_adroll: str = NA,
+        utm_campaign: str = NA,
+        utm_medium: str = NA,
+        utm_source: str = NA,
+        redirect_type: int = NA,
+        expires_at_days: int = NA,
+        icon: str = NA,
+        prefix: str = NA,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+    ) -> tuple["httpx.Response", T.Optional[Folder]]:
+        """
+        See :meth:`pyshortio.link_queries.LinkQueriesMixin.create_folder`.
+        """
+        response = await self.http_post(
+            **_create_folder_request(
+                endpoint=self.endpoint,
+                domain_id=domain_id,
+                name=name,
+                color=color,
+                background_color=background_color,
+                logo_url=logo_url,
+                logo_height=logo_height,
+                logo_width=logo_width,
+                ec_level=ec_level,
+                integration_fb=integration_fb,
+                integration_ga=integration_ga,
+                integration_gtm=integration_gtm,
+                integration_adroll=integration_adroll,
+                utm_campaign=utm_campaign,
+                utm_medium=utm_medium,
+                utm_source=utm_source,
+                redirect_type=redirect_type,
+                expires_at_days=expires_at_days,
+                icon=icon,
+                prefix=prefix,
+            )
+        )
+        return response, _parse_create_folder(response, raise_for_status)
@@ -0,0 +1,304 @@
+# -*- coding: utf-8 -*-
+
+"""
+Concurrent link scan for :class:`pyshortio.async_client.AsyncClient`.
+
+See :mod:`pyshortio.link_scan`, the windows and the folders are scanned by
+concurrent tasks instead of a thread pool. The window bookkeeping is the same
+:class:`~pyshortio.link_scan.WindowScan` and
+:class:`~pyshortio.link_scan.EdgeScan`.
+"""
+
+import typing as T
+import asyncio
+from datetime import datetime
+
+from .arg import NA
+from .constants import DEFAULT_RAISE_FOR_STATUS
+from .model import Link, Folder
+from .link_scan import (
+    ScanWindow,
+    WindowScan,
+    EdgeScan,
+    _merge_edges,
+    _get_initial_windows,
+    _check_strategy,
+    _select_no_folder_links,
+)
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    from .async_client import AsyncClient
+
+
+class _TaskGroup:
+    """
+    Run coroutine functions as tasks, at most ``max_workers`` at a time, and
+    get the results in completion order.
+    """
+
+    def __init__(self, max_workers: int):
+        self.limiter = asyncio.Semaphore(max_workers)
+        self.pending: set[asyncio.Task] = set()
+
+    def submit(self, func: T.Callable[..., T.Awaitable], **kwargs):
+        async def run():
+            async with self.limiter:
+                return await func(**kwargs)
+
+        self.pending.add(asyncio.ensure_future(run()))
+
+    async def as_completed(self) -> T.AsyncIterator[T.Any]:
+        while self.pending:
+            done, self.pending = await asyncio.wait(
+                self.pending,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for task in done:
+                yield task.result()
+
+    async def cancel(self):
+        for task in self.pending:
+            task.cancel()
+        await asyncio.gather(*self.pending, return_exceptions=True)
+        self.pending.clear()
+
+
+class AsyncLinkScanMixin:
+    """
+    Mixin class providing concurrent link scan for the AsyncClient.
+    """
+
+    async def _scan_edges(
+        self: "AsyncClient",
+        domain_id: int,
+        limit: int,
+        folder_id: T.Optional[str] = NA,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+    ) -> tuple[T.Optional[tuple[datetime, datetime]], list[Link]]:
+        """
+        See :meth:`pyshortio.link_scan.LinkScanMixin._scan_edges`.
+        """
+        edges = list()
+        for date_sort_order in ["asc", "desc"]:
+            edge = EdgeScan(date_sort_order=date_sort_order)
+            while True:
+                page = await self._list_links_page(
+                    domain_id=domain_id,
+                    limit=limit,
+                    folder_id=folder_id,
+                    raise_for_status=raise_for_status,
+                    **edge.list_links_kwargs(),
+                )
+                if edge.add_page(page):
+                    break
+            edges.append(edge)
+        return _merge_edges(edges)
+
+    async def _scan_window(
+        self: "AsyncClient",
+        domain_id: int,
+        window: ScanWindow,
+        limit: int,
+        max_pages_per_window: int,
+        folder_id: T.Optional[str] = NA,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+    ) -> tuple[list[Link], list[ScanWindow]]:
+        """
+        See :meth:`pyshortio.link_scan.LinkScanMixin._scan_window`.
+        """
+        scan = WindowScan.start(window)
+        for _ in range(max_pages_per_window):
+            page = await self._list_links_page(
+                domain_id=domain_id,
+                limit=limit,
+                folder_id=folder_id,
+                raise_for_status=raise_for_status,
+                **scan.list_links_kwargs(),
+            )
+            if scan.add_page(page):
+                break
+        return scan.links, scan.rest()
+
+    async def _list_folder_page(
+        self: "AsyncClient",
+        domain_id: int,
+        folder: Folder,
+        limit: int,
+        page_token: T.Optional[str] = None,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+    ) -> tuple[Folder, list[Link], T.Optional[str]]:
+        """
+        See :meth:`pyshortio.link_scan.LinkScanMixin._list_folder_page`.
+        """
+        page = await self._list_links_page(
+            domain_id=domain_id,
+            limit=limit,
+            page_token=NA if page_token is None else page_token,
+            folder_id=folder.id,
+            raise_for_status=raise_for_status,
+        )
+        next_token = page.data.get("nextPageToken")
+        return folder, page.result, next_token
+
+    async def _scan_no_folder_window(
+        self: "AsyncClient",
+        domain_id: int,
+        window: ScanWindow,
+        limit: int,
+        max_pages_per_window: int,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+    ) -> tuple[None, list[Link], list[ScanWindow]]:
+        """
+        See :meth:`pyshortio.link_scan.LinkScanMixin._scan_no_folder_window`.
+        """
+        links, rest = await self._scan_window(
+            domain_id=domain_id,
+            window=window,
+            limit=limit,
+            max_pages_per_window=max_pages_per_window,
+            raise_for_status=raise_for_status,
+        )
+        return None, _select_no_folder_links(links), rest
+
+    async def pagi_list_links_by_folder(
+        self: "AsyncClient",
+        domain_id: int,
+        max_workers: int = 8,
+        limit: int = 150,
+        include_no_folder: bool = False,
+        n_windows: int = 8,
+        max_pages_per_window: int = 10,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+    ) -> T.AsyncIterator[tuple[T.Optional[Folder], list[Link]]]:
+        """
+        See :meth:`pyshortio.link_scan.LinkScanMixin.pagi_list_links_by_folder`,
+        an async generator.
+
+        :param max_workers: The number of folders and windows scanned at the
+            same time, the client's ``max_concurrency`` still bounds the
+            number of in-flight requests
+        """
+        _, folder_list = await self.list_folders(
+            domain_id=domain_id,
+            raise_for_status=raise_for_status,
+        )
+        windows = list()
+        no_time_links = list()
+        if include_no_folder:
+            time_range, no_time_links = await self._scan_edges(
+                domain_id=domain_id,
+                limit=limit,
+                raise_for_status=raise_for_status,
+            )
+            windows = _get_initial_windows(time_range, n_windows)
+            no_time_links = _select_no_folder_links(no_time_links)
+
+        def submit(folder: Folder, page_token: T.Optional[str] = None):
+            group.submit(
+                self._list_folder_page,
+                domain_id=domain_id,
+                folder=folder,
+                limit=limit,
+                page_token=page_token,
+                raise_for_status=raise_for_status,
+            )
+
+        def submit_window(window: ScanWindow):
+            group.submit(
+                self._scan_no_folder_window,
+                domain_id=domain_id,
+                window=window,
+                limit=limit,
+                max_pages_per_window=max_pages_per_window,
+                raise_for_status=raise_for_status,
+            )
+
+        if no_time_links:
+            yield None, no_time_links
+
+        group = _TaskGroup(max_workers=max_workers)
+        try:
+            for folder in folder_list:
+                submit(folder)
+            for window in windows:
+                submit_window(window)
+            async for folder, link_list, rest in group.as_completed():
+                if folder is None:
+                    for window in rest:
+                        submit_window(window)
+                elif rest is not None:
+                    submit(folder, rest)
+                yield folder, link_list
+        finally:
+            await group.cancel()
+
+    async def scan_links(
+        self: "AsyncClient",
+        domain_id: int,
+        n_windows: int = 8,
+        max_workers: int = 8,
+        limit: int = 150,
+        max_pages_per_window: int = 10,
+        folder_id: T.Optional[str] = NA,
+        strategy: str = "time",
+        include_no_folder: bool = False,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+    ) -> T.AsyncIterator[Link]:
+        """
+        See :meth:`pyshortio.link_scan.LinkScanMixin.scan_links`, an async
+        generator.
+
+        >>> async for link in client.scan_links(domain_id=45678):
+        >>>     process_link(link)
+
+        :param max_workers: The number of windows scanned at the same time,
+            the client's ``max_concurrency`` still bounds the number of
+            in-flight requests
+        """
+        _check_strategy(strategy, folder_id)
+        if strategy == "folder":
+            async for _, link_list in self.pagi_list_links_by_folder(
+                domain_id=domain_id,
+                max_workers=max_workers,
+                limit=limit,
+                include_no_folder=include_no_folder,
+                n_windows=n_windows,
+                max_pages_per_window=max_pages_per_window,
+                raise_for_status=raise_for_status,
+            ):
+                for link in link_list:
+                    yield link
+            return
+
+        time_range, no_time_links = await self._scan_edges(
+            domain_id=domain_id,
+            limit=limit,
+            folder_id=folder_id,
+            raise_for_status=raise_for_status,
+        )
+        for link in no_time_links:
+            yield link
+        windows = _get_initial_windows(time_range, n_windows)
+
+        def submit(window: ScanWindow):
+            group.submit(
+                self._scan_window,
+                domain_id=domain_id,
+                window=window,
+                limit=limit,
+                max_pages_per_window=max_pages_per_window,
+                folder_id=folder_id,
+                raise_for_status=raise_for_status,
+            )
+
+        group = _TaskGroup(max_workers=max_workers)
+        try:
+            for window in windows:
+                submit(window)
+            async for links, rest in group.as_completed():
+                for window in rest:
+                    submit(window)
+                for link in links:
+                    yield link
+        finally:
+            await group.cancel()
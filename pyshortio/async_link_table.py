@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+"""
+Columnar link table for :class:`pyshortio.async_client.AsyncClient`.
+
+See :mod:`pyshortio.link_table`.
+"""
+
+import typing as T
+from datetime import datetime
+
+from .arg import NA
+from .constants import DEFAULT_RAISE_FOR_STATUS
+from .link_table import LinkTable
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    from .async_client import AsyncClient
+
+
+class AsyncLinkTableMixin:
+    """
+    Mixin class providing columnar link tables for the AsyncClient.
+    """
+
+    async def get_link_table(
+        self: "AsyncClient",
+        domain_id: int,
+        folder_id: T.Optional[str] = NA,
+        after_date: T.Optional[datetime] = NA,
+        limit: int = 150,
+        prefetch: int = 2,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+    ) -> LinkTable:
+        """
+        See :meth:`pyshortio.link_table.LinkTableMixin.get_link_table`.
+        """
+        raw_dfs = list()
+        async for page in self.pagi_list_links(
+            domain_id=domain_id,
+            limit=limit,
+            folder_id=folder_id,
+            after_date=after_date,
+            prefetch=prefetch,
+            raise_for_status=raise_for_status,
+            table=True,
+        ):
+            raw_dfs.append(LinkTable._read_page(page))
+        return LinkTable._from_raw_dfs(raw_dfs)
+
+    async def iter_link_tables(
+        self: "AsyncClient",
+        domain_id: int,
+        folder_id: T.Optional[str] = NA,
+        after_date: T.Optional[datetime] = NA,
+        date_sort_order: T.Optional[str] = NA,
+        limit: int = 150,
+        prefetch: int = 2,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+    ) -> T.AsyncIterator[LinkTable]:
+        """
+        See :meth:`pyshortio.link_table.LinkTableMixin.iter_link_tables`.
+        """
+        async for page in self.pagi_list_links(
+            domain_id=domain_id,
+            limit=limit,
+            folder_id=folder_id,
+            after_date=after_date,
+            date_sort_order=date_sort_order,
+            prefetch=prefetch,
+            raise_for_status=raise_for_status,
+            table=True,
+        ):
+            yield LinkTable.from_page(page)
@@ -0,0 +1,399 @@
+# -*- coding: utf-8 -*-
+
+"""
+Short.io TSV Synchronization for :class:`pyshortio.async_client.AsyncClient`.
+
+The TSV parsing and the create / update / delete planning are shared with
+:mod:`pyshortio.sync_tsv`, only the API calls are awaited.
+"""
+
+try:
+    import typing_extensions as T
+except ImportError:  # pragma: no cover
+    import typing as T
+
+from pathlib import Path
+
+from .arg import NA
+from .constants import DEFAULT_RAISE_FOR_STATUS
+from .utils import chunked
+from .model import Link, Folder
+from .logger import logger
+from .sync_tsv import (
+    T_LINK_DATA,
+    SyncResult,
+    SyncTSVMixin,
+    _to_update_kwargs,
+    _chunk_links_to_create,
+    _check_delete_success,
+    _log_create_result,
+    _log_update_result,
+    _log_delete_result,
+    _save_sync_state,
+)
+from .sync_plan import SyncPlan, plan_sync_df, log_plan, _resolve_folder_id
+from .sync_state import SyncState, fingerprint_rows, plan_incremental
+from .sync_source import T_SOURCE
+from .sync_stream import iter_link_chunks, plan_sync_chunks
+from .executor import TaskResult, async_run_tasks
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    import polars as pl
+    from .async_client import AsyncClient
+
+
+class AsyncSyncTSVMixin:
+    """
+    Mixin class providing TSV synchronization capabilities for the AsyncClient.
+    """
+
+    # reading the link data doesn't do any API call
+    _sync_read_link_df = SyncTSVMixin._sync_read_link_df
+    _sync_read_link_df_from_tsv = SyncTSVMixin._sync_read_link_df_from_tsv
+    _sync_read_link_data_from_tsv = SyncTSVMixin._sync_read_link_data_from_tsv
+    _sync_scan_links = SyncTSVMixin._sync_scan_links
+
+    async def _read_folders_from_short_io(
+        self: "AsyncClient",
+        domain_id: int,
+    ) -> dict[str, Folder]:
+        """
+        See :meth:`pyshortio.sync_tsv.SyncTSVMixin._read_folders_from_short_io`.
+        """
+        _, folder_list = await self.list_folders(domain_id=domain_id)
+        return {folder.name: folder for folder in folder_list}
+
+    async def _create_folder_if_they_do_not_exists(
+        self: "AsyncClient",
+        domain_id: int,
+        folder_name_list: list[str],
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+    ) -> dict[str, str]:
+        """
+        See :meth:`pyshortio.sync_tsv.SyncTSVMixin._create_folder_if_they_do_not_exists`.
+        """
+        logger.info("Read existing folder info from short.io ...")
+        existing_folders = await self._read_folders_from_short_io(domain_id=domain_id)
+        logger.info(f"Got {len(existing_folders)} existing folders")
+        folder_name_to_id_mapping = dict()
+        for folder_name in folder_name_list:
+            if folder_name not in existing_folders:
+                logger.info(f"{folder_name!r} folder not exists, create it ...")
+                _, folder = await self.create_folder(
+                    domain_id=domain_id,
+                    name=folder_name,
+                    raise_for_status=raise_for_status,
+                )
+                logger.info(f"succeeded! folder_id = {folder.id}")
+                folder_name_to_id_mapping[folder_name] = folder.id
+            else:
+                logger.info(f"{folder_name!r} folder already exists")
+                folder_id = existing_folders[folder_name].id
+                folder_name_to_id_mapping[folder_name] = folder_id
+        return folder_name_to_id_mapping
+
+    async def _sync_identify_link_to_create_update_and_delete(
+        self: "AsyncClient",
+        domain_id: int,
+        wanted_df: "pl.DataFrame",
+        folder_name_to_id_mapping: dict[str, str],
+    ) -> SyncPlan:
+        """
+        See :meth:`pyshortio.sync_tsv.SyncTSVMixin._sync_identify_link_to_create_update_and_delete`.
+        """
+        logger.info("Read existing link info from short.io ...")
+        existing_table = await self.get_link_table(domain_id=domain_id)
+        logger.info(f"Got {len(existing_table)} existing links")
+        return plan_sync_df(
+            wanted_df=wanted_df,
+            existing_df=existing_table.df,
+            folder_name_to_id_mapping=folder_name_to_id_mapping,
+        )
+
+    async def _sync_identify_incrementally(
+        self: "AsyncClient",
+        hostname: str,
+        domain_id: int,
+        wanted_df: "pl.DataFrame",
+        folder_name_to_id_mapping: dict[str, str],
+        state_file: Path,
+    ) -> tuple[SyncPlan, dict[str, str]]:
+        """
+        See :meth:`pyshortio.sync_tsv.SyncTSVMixin._sync_identify_incrementally`.
+        """
+        wanted_df = _resolve_folder_id(wanted_df, folder_name_to_id_mapping)
+        fingerprints = fingerprint_rows(wanted_df)
+        state = SyncState.load(state_file, hostname=hostname, domain_id=domain_id)
+        plan = None
+        if state is not None:
+            logger.info(f"Read links created since {state.watermark} ...")
+            new_table = await self.get_link_table(
+                domain_id=domain_id,
+                after_date=NA if state.after_date is None else state.after_date,
+            )
+            logger.info(f"Got {len(new_table)} links")
+            drift = state.find_drift(new_table.df)
+            if drift is None:
+                plan = plan_incremental(
+                    wanted_df=wanted_df,
+                    fingerprints=fingerprints,
+                    state=state,
+                    new_df=new_table.df,
+                )
+            else:
+                logger.info(f"{drift}, fall back to a full scan")
+        if plan is None:
+            plan = await self._sync_identify_link_to_create_update_and_delete(
+                domain_id=domain_id,
+                wanted_df=wanted_df,
+                folder_name_to_id_mapping=folder_name_to_id_mapping,
+            )
+        else:
+            log_plan(plan)
+        return plan, fingerprints
+
+    async def _sync_identify_in_chunks(
+        self: "AsyncClient",
+        domain_id: int,
+        lf: "pl.LazyFrame",
+        chunk_size: int,
+        folder_name_to_id_mapping: dict[str, str],
+    ) -> SyncPlan:
+        """
+        See :meth:`pyshortio.sync_tsv.SyncTSVMixin._sync_identify_in_chunks`.
+        """
+        logger.info("Read existing link info from short.io ...")
+        existing_table = await self.get_link_table(domain_id=domain_id)
+        logger.info(f"Got {len(existing_table)} existing links")
+        return plan_sync_chunks(
+            chunks=iter_link_chunks(lf, chunk_size=chunk_size),
+            existing_df=existing_table.df,
+            folder_name_to_id_mapping=folder_name_to_id_mapping,
+        )
+
+    async def _sync_create_links(
+        self: "AsyncClient",
+        hostname: str,
+        to_create: list[T_LINK_DATA],
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+        real_run: bool = True,
+        max_workers: int = 8,
+    ) -> list[TaskResult[tuple[str, list[T_LINK_DATA]]]]:
+        """
+        See :meth:`pyshortio.sync_tsv.SyncTSVMixin._sync_create_links`.
+        """
+
+        async def create(item: tuple[str, list[T_LINK_DATA]]) -> list[Link]:
+            folder_id, link_data_list = item
+            if real_run:
+                _, link_list = await self.batch_create_links(
+                    hostname=hostname,
+                    links=link_data_list,
+                    folder_id=folder_id,
+                    raise_for_status=raise_for_status,
+                )
+                return link_list
+            return []
+
+        return await async_run_tasks(
+            func=create,
+            items=_chunk_links_to_create(to_create),
+            max_workers=max_workers,
+            on_result=_log_create_result,
+        )
+
+    async def _sync_update_links(
+        self: "AsyncClient",
+        domain_id: int,
+        to_update: list[tuple[str, T_LINK_DATA]],
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+        real_run: bool = True,
+        max_workers: int = 8,
+    ) -> list[TaskResult[tuple[str, T_LINK_DATA]]]:
+        """
+        See :meth:`pyshortio.sync_tsv.SyncTSVMixin._sync_update_links`.
+        """
+        for link_id, link_data in to_update:
+            if "folder_id" in link_data:
+                link_data.pop("folder_id")
+
+        async def update(item: tuple[str, T_LINK_DATA]):
+            link_id, link_data = item
+            if real_run:
+                await self.update_link(
+                    link_id=link_id,
+                    domain_id=domain_id,
+                    **_to_update_kwargs(link_data),
+                    raise_for_status=raise_for_status,
+                )
+
+        return await async_run_tasks(
+            func=update,
+            items=to_update,
+            max_workers=max_workers,
+            on_result=_log_update_result,
+        )
+
+    async def _sync_delete_links(
+        self: "AsyncClient",
+        to_delete: list[str],
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+        real_run: bool = True,
+        max_workers: int = 8,
+    ) -> list[TaskResult[list[str]]]:
+        """
+        See :meth:`pyshortio.sync_tsv.SyncTSVMixin._sync_delete_links`.
+        """
+
+        async def delete(link_id_list: list[str]):
+            if real_run:
+                _, success = await self.batch_delete_links(
+                    link_ids=link_id_list,
+                    raise_for_status=raise_for_status,
+                )
+                _check_delete_success(success)
+
+        return await async_run_tasks(
+            func=delete,
+            items=list(chunked(to_delete, 150)),
+            max_workers=max_workers,
+            on_result=_log_delete_result,
+        )
+
+    async def sync_links(
+        self: "AsyncClient",
+        hostname: str,
+        source: T_SOURCE,
+        format: T.Optional[str] = None,
+        update_if_not_the_same: bool = True,
+        delete_if_not_in_file: bool = False,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+        real_run: bool = True,
+        max_workers: int = 8,
+        state_file: T.Optional[T.Union[str, Path]] = None,
+        chunk_size: T.Optional[int] = None,
+    ) -> SyncResult:
+        """
+        See :meth:`pyshortio.sync_tsv.SyncTSVMixin.sync_links`.
+        """
+        logger.info(f"{hostname = }")
+        logger.info(f"{update_if_not_the_same = }")
+        logger.info(f"{delete_if_not_in_file = }")
+        if chunk_size is not None and state_file is not None:
+            raise ValueError("chunk_size can't be used with state_file")
+        with logger.nested():
+            if chunk_size is None:
+                wanted_df, folder_name_list = self._sync_read_link_df(
+                    source=source,
+                    format=format,
+                )
+            else:
+                lf, folder_name_list = self._sync_scan_links(
+                    source=source,
+                    chunk_size=chunk_size,
+                    format=format,
+                )
+
+            _, domain = await self.get_domain_by_hostname(hostname=hostname)
+
+            folder_name_to_id_mapping = await self._create_folder_if_they_do_not_exists(
+                domain_id=domain.id,
+                folder_name_list=folder_name_list,
+                raise_for_status=raise_for_status,
+            )
+
+            if chunk_size is not None:
+                plan = await self._sync_identify_in_chunks(
+                    domain_id=domain.id,
+                    lf=lf,
+                    chunk_size=chunk_size,
+                    folder_name_to_id_mapping=folder_name_to_id_mapping,
+                )
+            elif state_file is None:
+                plan = await self._sync_identify_link_to_create_update_and_delete(
+                    domain_id=domain.id,
+                    wanted_df=wanted_df,
+                    folder_name_to_id_mapping=folder_name_to_id_mapping,
+                )
+            else:
+                plan, fingerprints = await self._sync_identify_incrementally(
+                    hostname=hostname,
+                    domain_id=domain.id,
+                    wanted_df=wanted_df,
+                    folder_name_to_id_mapping=folder_name_to_id_mapping,
+                    state_file=Path(state_file),
+                )
+            to_create, to_update, to_delete = (
+                plan.to_create,
+                plan.to_update,
+                plan.to_delete,
+            )
+            result = SyncResult(plan=plan)
+
+            if len(to_create):
+                result.create_results = await self._sync_create_links(
+                    hostname=hostname,
+                    to_create=to_create,
+                    raise_for_status=raise_for_status,
+                    real_run=real_run,
+                    max_workers=max_workers,
+                )
+
+            if update_if_not_the_same:
+                if len(to_update):
+                    result.update_results = await self._sync_update_links(
+                        domain_id=domain.id,
+                        to_update=to_update,
+                        raise_for_status=raise_for_status,
+                        real_run=real_run,
+                        max_workers=max_workers,
+                    )
+
+            if delete_if_not_in_file:
+                if len(to_delete):
+                    result.delete_results = await self._sync_delete_links(
+                        to_delete=to_delete,
+                        raise_for_status=raise_for_status,
+                        real_run=real_run,
+                        max_workers=max_workers,
+                    )
+
+            result.log_summary()
+            if state_file is not None and real_run:
+                _save_sync_state(
+                    state_file=state_file,
+                    hostname=hostname,
+                    domain_id=domain.id,
+                    plan=plan,
+                    fingerprints=fingerprints,
+                    result=result,
+                )
+        return result
+
+    async def sync_tsv(
+        self: "AsyncClient",
+        hostname: str,
+        file: T_SOURCE,
+        update_if_not_the_same: bool = True,
+        delete_if_not_in_file: bool = False,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+        real_run: bool = True,
+        max_workers: int = 8,
+        state_file: T.Optional[T.Union[str, Path]] = None,
+        chunk_size: T.Optional[int] = None,
+    ) -> SyncResult:
+        """
+        See :meth:`pyshortio.sync_tsv.SyncTSVMixin.sync_tsv`.
+        """
+        return await self.sync_links(
+            hostname=hostname,
+            source=file,
+            format="tsv",
+            update_if_not_the_same=update_if_not_the_same,
+            delete_if_not_in_file=delete_if_not_in_file,
+            raise_for_status=raise_for_status,
+            real_run=real_run,
+            max_workers=max_workers,
+            state_file=state_file,
+            chunk_size=chunk_size,
+        )
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+
+"""
+Persisted page token checkpoints for resumable pagination.
+
+A multi-hour walk of a huge domain should not restart from page one when the
+process dies. Pass a checkpoint store to
+:meth:`~pyshortio.link_queries.LinkQueriesMixin.pagi_list_links` (or
+:meth:`~pyshortio.link_queries.LinkQueriesMixin.iter_links`) and the paginator
+will:
+
+1. Resume from the saved ``nextPageToken`` and item count, if any.
+2. Save the next page token and item count after each page is consumed, i.e.
+   when the caller asks for the next page. A page that was handed out but not
+   fully processed is fetched again after a restart.
+3. Delete the checkpoint once the pagination is complete.
+
+Example:
+
+.. code-block:: python
+
+    from pyshortio.api import Client, FileCheckpointStore
+
+    store = FileCheckpointStore(dir="/tmp/pyshortio-checkpoints")
+    for link in client.iter_links(domain_id=45678, checkpoint_store=store):
+        mirror(link)
+"""
+
+import typing as T
+import re
+import os
+import json
+import sqlite3
+import hashlib
+import threading
+import dataclasses
+from pathlib import Path
+
+from .arg import _NOTHING
+
+
+@dataclasses.dataclass
+class Checkpoint:
+    """
+    The pagination progress.
+
+    :param next_token: The token of the next page to fetch
+    :param n_items: The number of items consumed so far
+    """
+
+    next_token: str = dataclasses.field()
+    n_items: int = dataclasses.field(default=0)
+
+
+def make_checkpoint_key(
+    method: T.Callable,
+    kwargs: dict[str, T.Any],
+) -> str:
+    """
+    Derive a stable checkpoint key from the API method name and its arguments,
+    so the same query resumes from the same checkpoint.
+    """
+    kwargs = {k: v for k, v in kwargs.items() if not isinstance(v, _NOTHING)}
+    payload = json.dumps(kwargs, sort_keys=True, default=str)
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+    name = getattr(method, "__name__", "paginate").strip("_")
+    return f"{name}-{digest}"
+
+
+class BaseCheckpointStore:
+    """
+    Base class of checkpoint stores.
+    """
+
+    def load(self, key: str) -> T.Optional[Checkpoint]:  # pragma: no cover
+        """
+        Load the checkpoint, None if there is no checkpoint.
+        """
+        raise NotImplementedError
+
+    def save(self, key: str, checkpoint: Checkpoint):  # pragma: no cover
+        """
+        Save the checkpoint, overwriting the existing one.
+        """
+        raise NotImplementedError
+
+    def delete(self, key: str):  # pragma: no cover
+        """
+        Delete the checkpoint, do nothing if it doesn't exist.
+        """
+        raise NotImplementedError
+
+
+@dataclasses.dataclass
+class FileCheckpointStore(BaseCheckpointStore):
+    """
+    Store every checkpoint as a small JSON file in ``dir``.
+
+    Files are replaced atomically, so a crash never leaves a half written
+    checkpoint.
+    """
+
+    dir: Path = dataclasses.field()
+
+    def __post_init__(self):
+        self.dir = Path(self.dir)
+
+    def _path(self, key: str) -> Path:
+        return self.dir.joinpath(re.sub(r"[^\w.-]", "_", key) + ".json")
+
+    def load(self, key: str) -> T.Optional[Checkpoint]:
+        try:
+            data = json.loads(self._path(key).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        return Checkpoint(**data)
+
+    def save(self, key: str, checkpoint: Checkpoint):
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path_tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        path_tmp.write_text(
+            json.dumps(dataclasses.asdict(checkpoint)),
+            encoding="utf-8",
+        )
+        os.replace(path_tmp, path)
+
+    def delete(self, key: str):
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+
+@dataclasses.dataclass
+class SqliteCheckpointStore(BaseCheckpointStore):
+    """
+    Store all checkpoints in one SQLite database file, convenient when many
+    paginations run side by side.
+    """
+
+    path: Path = dataclasses.field()
+
+    _lock: threading.Lock = dataclasses.field(
+        default_factory=threading.Lock,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def __post_init__(self):
+        self.path = Path(self.path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._execute(
+            "CREATE TABLE IF NOT EXISTS checkpoints ("
+            "key TEXT PRIMARY KEY, "
+            "next_token TEXT NOT NULL, "
+            "n_items INTEGER NOT NULL)",
+            (),
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        # a short lived connection per call is safe across threads and forks
+        return sqlite3.connect(str(self.path), timeout=30)
+
+    def _execute(self, sql: str, params: tuple) -> list[tuple]:
+        with self._lock:
+            conn = self._connect()
+            try:
+                with conn:
+                    return conn.execute(sql, params).fetchall()
+            finally:
+                conn.close()
+
+    def load(self, key: str) -> T.Optional[Checkpoint]:
+        rows = self._execute(
+            "SELECT next_token, n_items FROM checkpoints WHERE key = ?",
+            (key,),
+        )
+        if len(rows) == 0:
+            return None
+        next_token, n_items = rows[0]
+        return Checkpoint(next_token=next_token, n_items=n_items)
+
+    def save(self, key: str, checkpoint: Checkpoint):
+        self._execute(
+            "INSERT OR REPLACE INTO checkpoints (key, next_token, n_items) "
+            "VALUES (?, ?, ?)",
+            (key, checkpoint.next_token, checkpoint.n_items),
+        )
+
+    def delete(self, key: str):
+        self._execute("DELETE FROM checkpoints WHERE key = ?", (key,))
@@ -11,20 +11,29 @@ Short.io API endpoints while maintaining clean separation of concerns.
 
 import typing as T
 import json
+import time
+import threading
 import dataclasses
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .type_hint import T_KWARGS
 from .constants import DEFAULT_DEBUG
+from .retry import RetryPolicy
+from .rate_limit import RateLimiter
+from .json_backend import response_json
 
 # mixin modules
 from .domain import DomainMixin
 from .link_queries import LinkQueriesMixin
 from .link_management import LinkManagementMixin
+from .link_scan import LinkScanMixin
+from .link_table import LinkTableMixin
 from .sync_tsv import SyncTSVMixin
 from .export import ExportMixin
 
+
 def normalize_endpoint(endpoint: str) -> str:
     """
     Normalize the endpoint URL by ensuring it ends with a slash.
@@ -50,6 +59,8 @@ class Client(
     DomainMixin,
     LinkQueriesMixin,
     LinkManagementMixin,
+    LinkScanMixin,
+    LinkTableMixin,
     SyncTSVMixin,
     ExportMixin,
 ):
@@ -66,36 +77,195 @@ class Client(
     This ensures consistent request handling and error management across all
     API calls.
 
+    All HTTP calls go through one pooled, keep-alive :class:`requests.Session`
+    owned by the client, so consecutive API calls reuse the same TCP / TLS
+    connection instead of doing a new handshake for every request. The session
+    is created lazily on first use and can be released with :meth:`close`,
+    or by using the client as a context manager:
+
+    .. code-block:: python
+
+        with Client(token="...") as client:
+            for _, link_list in client.pagi_list_links(domain_id=45678):
+                ...
+
     :param token: The Short.io API token for authentication
     :param endpoint: The base URL for the Short.io API (defaults to "https://api.short.io")
+    :param pool_connections: The number of per-host connection pools to cache
+    :param pool_maxsize: The maximum number of connections to keep per host,
+        set it to at least the number of threads sharing this client
+    :param pool_block: Whether to block when all connections of a pool are busy
+        instead of opening an extra, non-reusable connection
+    :param keep_alive: Whether to keep connections open between requests,
+        if False every request is sent with ``connection: close``
+    :param retry_policy: Optional :class:`~pyshortio.retry.RetryPolicy`, if
+        set, throttled (429), unavailable (5xx) and dropped requests are retried
+        with backoff instead of failing the API call right away.
+        POST requests are only retried on 429 unless they are marked as
+        ``retry_safe``.
+    :param rate_limiter: Optional :class:`~pyshortio.rate_limit.RateLimiter`,
+        if set, every attempt waits for a token from the bucket of its endpoint
+        before it is sent.
     """
 
     token: str = dataclasses.field()
     endpoint: str = dataclasses.field(default="https://api.short.io")
+    pool_connections: int = dataclasses.field(default=10)
+    pool_maxsize: int = dataclasses.field(default=10)
+    pool_block: bool = dataclasses.field(default=False)
+    keep_alive: bool = dataclasses.field(default=True)
+    retry_policy: T.Optional[RetryPolicy] = dataclasses.field(default=None)
+    rate_limiter: T.Optional[RateLimiter] = dataclasses.field(default=None)
+
+    _session: T.Optional[requests.Session] = dataclasses.field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _session_lock: threading.Lock = dataclasses.field(
+        default_factory=threading.Lock,
+        init=False,
+        repr=False,
+        compare=False,
+    )
 
     def __post_init__(self):
         self.endpoint = normalize_endpoint(self.endpoint)
+        # build the default headers once, ``http_*`` methods only copy them
+        # when the caller wants to add extra headers
+        self._headers = {
+            "accept": "application/json",
+            "content-type": "application/json",
+            "authorization": self.token,
+        }
+        self._delete_headers = {
+            "accept": "application/json",
+            "authorization": self.token,
+        }
+        if self.keep_alive is False:
+            self._headers["connection"] = "close"
+            self._delete_headers["connection"] = "close"
 
     @property
     def headers(self) -> dict[str, str]:
         """
         Get the default HTTP headers for API requests.
         """
-        return {
-            "accept": "application/json",
-            "content-type": "application/json",
-            "authorization": self.token,
-        }
+        return dict(self._headers)
 
     @property
     def delete_headers(self) -> dict[str, str]:
         """
         Get the default HTTP headers for delete API requests.
         """
-        return {
-            "accept": "application/json",
-            "authorization": self.token,
-        }
+        return dict(self._delete_headers)
+
+    def _new_session(self) -> requests.Session:
+        """
+        Create a :class:`requests.Session` with a pooled :class:`HTTPAdapter`
+        mounted for both http and https.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        The pooled HTTP session used by all API calls, created on first access.
+
+        It is safe to access from multiple threads, only one session is created.
+        """
+        session = self._session
+        if session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._new_session()
+                session = self._session
+        return session
+
+    def close(self):
+        """
+        Close the underlying HTTP session and release all pooled connections.
+
+        The client stays usable, a new session is created on the next API call.
+        """
+        with self._session_lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _merge_headers(
+        self,
+        default_headers: dict[str, str],
+        headers: T.Optional[T_KWARGS],
+    ) -> dict[str, str]:
+        if headers is None:
+            return default_headers
+        else:  # pragma: no cover
+            return {**default_headers, **headers}
+
+    def _send_once(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        params: T.Optional[T_KWARGS] = None,
+        data: T.Optional[T_KWARGS] = None,
+    ) -> requests.Response:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(url)
+        return self.session.request(
+            method,
+            url,
+            headers=headers,
+            params=params,
+            json=data,
+        )
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        params: T.Optional[T_KWARGS] = None,
+        data: T.Optional[T_KWARGS] = None,
+        idempotent: bool = True,
+    ) -> requests.Response:
+        """
+        Send the request through the pooled session, retry it according to
+        :attr:`retry_policy`.
+        """
+        if self.retry_policy is None:
+            return self._send_once(method, url, headers, params, data)
+
+        state = self.retry_policy.start()
+        while 1:
+            try:
+                res = self._send_once(method, url, headers, params, data)
+            except (requests.ConnectionError, requests.Timeout):
+                delay = state.next_delay(response=None, idempotent=idempotent)
+                if delay is None:
+                    raise
+            else:
+                delay = state.next_delay(response=res, idempotent=idempotent)
+                if delay is None:
+                    return res
+                res.close()
+            time.sleep(delay)
 
     def http_get(
         self,
@@ -114,22 +284,21 @@ class Client(
         if debug:  # pragma: no cover
             print(f"===== Start of GET request.url = {url} =====")
 
-        final_headers = self.headers
-        if headers is not None:  # pragma: no cover
-            final_headers.update(headers)
+        final_headers = self._merge_headers(self._headers, headers)
         if debug:  # pragma: no cover
             print(f"request.headers = {final_headers}")
             print(f"request.params = {params}")
 
-        res = requests.get(
-            url,
+        res = self._send(
+            method="GET",
+            url=url,
             headers=final_headers,
             params=params,
         )
         if debug:  # pragma: no cover
             print(f"response.status = {res.status_code}")
             print("response.data =")
-            print(json.dumps(res.json(), indent=4, ensure_ascii=False))
+            print(json.dumps(response_json(res), indent=4, ensure_ascii=False))
             print(f"===== End of GET request.url = {url} =====")
         return res
 
@@ -139,33 +308,38 @@ class Client(
         headers: T.Optional[dict[str, T.Any]] = None,
         params: T.Optional[dict[str, T.Any]] = None,
         data: T.Optional[dict[str, T.Any]] = None,
+        retry_safe: bool = False,
         debug: bool = DEFAULT_DEBUG,
     ):
         """
         Perform an HTTP POST request to the Short.io API.
+
+        :param retry_safe: Whether sending the request twice has the same
+            effect as sending it once, e.g. updating a link. Only such requests
+            are retried on 5xx and connection errors.
         """
         if debug:  # pragma: no cover
             print(f"===== Start of POST request.url = {url} =====")
 
-        final_headers = self.headers
-        if headers is not None:  # pragma: no cover
-            final_headers.update(headers)
+        final_headers = self._merge_headers(self._headers, headers)
         if debug:  # pragma: no cover
             print(f"request.headers = {final_headers}")
             print(f"request.params = {params}")
             print(f"request.data = {data}")
 
-        res = requests.post(
-            url,
+        res = self._send(
+            method="POST",
+            url=url,
             headers=final_headers,
             params=params,
-            json=data,
+            data=data,
+            idempotent=retry_safe,
         )
         if debug:  # pragma: no cover
             print(f"response.status = {res.status_code}")
             print(f"response.headers = {res.headers}")
             print("response.data =")
-            print(json.dumps(res.json(), indent=4, ensure_ascii=False))
+            print(json.dumps(response_json(res), indent=4, ensure_ascii=False))
             print(f"===== End of POST request.url = {url} =====")
         return res
 
@@ -183,24 +357,23 @@ class Client(
         if debug:  # pragma: no cover
             print(f"===== Start of DELETE request.url = {url} =====")
 
-        final_headers = self.delete_headers
-        if headers is not None:  # pragma: no cover
-            final_headers.update(headers)
+        final_headers = self._merge_headers(self._delete_headers, headers)
         if debug:  # pragma: no cover
             print(f"request.headers = {final_headers}")
             print(f"request.params = {params}")
             print(f"request.data = {data}")
 
-        res = requests.delete(
-            url,
+        res = self._send(
+            method="DELETE",
+            url=url,
             headers=final_headers,
             params=params,
-            json=data,
+            data=data,
         )
         if debug:  # pragma: no cover
             print(f"response.status = {res.status_code}")
             print(f"response.headers = {res.headers}")
             print("response.data =")
-            print(json.dumps(res.json(), indent=4, ensure_ascii=False))
+            print(json.dumps(response_json(res), indent=4, ensure_ascii=False))
             print(f"===== End of DELETE request.url = {url} =====")
         return res
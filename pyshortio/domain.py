@@ -6,6 +6,10 @@ Short.io Domain API implementation.
 This module provides classes and methods for interacting with the Short.io Domain-related
 API endpoints. It includes the Domain model class and API methods for retrieving domain
 information.
+
+The request arguments and the response parsing of every method are module
+level helpers, shared with :mod:`pyshortio.async_domain`, so the two clients
+only differ in how the request is sent.
 """
 
 import typing as T
@@ -13,13 +17,68 @@ import typing as T
 from requests import Response
 
 from .arg import NA, rm_na
+from .type_hint import T_KWARGS
 from .constants import DEFAULT_RAISE_FOR_STATUS
 from .model import Domain
+from .json_backend import response_json
 
 if T.TYPE_CHECKING:  # pragma: no cover
     from .client import Client
 
 
+def _list_domains_request(
+    endpoint: str,
+    limit: T.Optional[int] = NA,
+    offset: T.Optional[int] = NA,
+    no_team_id: T.Optional[bool] = NA,
+    pattern: T.Optional[str] = NA,
+    team_id: T.Optional[str] = NA,
+) -> T_KWARGS:
+    """
+    The ``http_get`` arguments of :meth:`DomainMixin.list_domains`.
+    """
+    params = {
+        "limit": limit,
+        "offset": offset,
+        "noTeamId": no_team_id,
+        "pattern": pattern,
+        "teamId": team_id,
+    }
+    return dict(url=f"{endpoint}/api/domains", params=rm_na(**params))
+
+
+def _parse_list_domains(response, raise_for_status: bool) -> list[Domain]:
+    if raise_for_status:
+        response.raise_for_status()
+    return [Domain._from_api_data(dct) for dct in response_json(response)]
+
+
+def _get_domain_request(endpoint: str, domain_id: int) -> T_KWARGS:
+    """
+    The ``http_get`` arguments of :meth:`DomainMixin.get_domain`.
+    """
+    return dict(url=f"{endpoint}/domains/{domain_id}")
+
+
+def _parse_get_domain(response, raise_for_status: bool) -> T.Optional[Domain]:
+    if raise_for_status:
+        response.raise_for_status()
+    if response.status_code == 404:
+        return None
+    else:
+        return Domain._from_api_data(response_json(response))
+
+
+def _find_domain_by_hostname(
+    domain_list: list[Domain],
+    hostname: str,
+) -> T.Optional[Domain]:
+    for domain in domain_list:
+        if domain.hostname == hostname:
+            return domain
+    return None
+
+
 class DomainMixin:
     """
     Mixin class providing Domain-related API methods for the Client.
@@ -41,23 +100,17 @@ class DomainMixin:
 
         - https://developers.short.io/reference/get_api-domains
         """
-        url = f"{self.endpoint}/api/domains"
-        params = {
-            "limit": limit,
-            "offset": offset,
-            "noTeamId": no_team_id,
-            "pattern": pattern,
-            "teamId": team_id,
-        }
-        params = rm_na(**params)
         response = self.http_get(
-            url=url,
-            params=params,
+            **_list_domains_request(
+                endpoint=self.endpoint,
+                limit=limit,
+                offset=offset,
+                no_team_id=no_team_id,
+                pattern=pattern,
+                team_id=team_id,
+            )
         )
-        if raise_for_status:
-            response.raise_for_status()
-        domain_list = [Domain(_data=dct) for dct in response.json()]
-        return response, domain_list
+        return response, _parse_list_domains(response, raise_for_status)
 
     def get_domain(
         self: "Client",
@@ -71,17 +124,10 @@ class DomainMixin:
 
         - https://developers.short.io/reference/get_domains-domainid
         """
-        url = f"{self.endpoint}/domains/{domain_id}"
         response = self.http_get(
-            url=url,
+            **_get_domain_request(endpoint=self.endpoint, domain_id=domain_id)
         )
-        if raise_for_status:
-            response.raise_for_status()
-        if response.status_code == 404:
-            domain = None
-        else:
-            domain = Domain(_data=response.json())
-        return response, domain
+        return response, _parse_get_domain(response, raise_for_status)
 
     def get_domain_by_hostname(
         self: "Client",
@@ -95,7 +141,4 @@ class DomainMixin:
         This is a convenience method that combines :meth:`list_domains` and filtering.
         """
         response, domain_list = self.list_domains(raise_for_status=raise_for_status)
-        for domain in domain_list:
-            if domain.hostname == hostname:
-                return response, domain
-        return response, None
+        return response, _find_domain_by_hostname(domain_list, hostname)
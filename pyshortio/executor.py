@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+"""
+Bounded concurrent execution of independent API calls.
+
+Short.io has no bulk endpoint for some operations, e.g. ``update_link``, and
+the bulk endpoints take at most 150 links per call, so a big sync is made of
+many independent requests. :func:`run_tasks` (thread pool) and
+:func:`async_run_tasks` (asyncio) run them with at most ``max_workers``
+requests in flight:
+
+- an exception is captured in the :class:`TaskResult` of its item instead of
+  aborting the other tasks
+- the results, and the ``on_result`` progress callback, come in input order,
+  so the progress log reads the same as a sequential run
+"""
+
+import typing as T
+import asyncio
+import dataclasses
+from concurrent.futures import ThreadPoolExecutor
+
+ItemT = T.TypeVar("ItemT")
+
+
+@dataclasses.dataclass
+class TaskResult(T.Generic[ItemT]):
+    """
+    The outcome of one task.
+
+    :param item: The input item
+    :param value: The return value of the task, None if it failed
+    :param error: The exception raised by the task, None if it succeeded
+    """
+
+    item: ItemT = dataclasses.field()
+    value: T.Any = dataclasses.field(default=None)
+    error: T.Optional[Exception] = dataclasses.field(default=None)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+T_ON_RESULT = T.Callable[[int, TaskResult], None]
+
+
+def _run_one(func: T.Callable[[ItemT], T.Any], item: ItemT) -> TaskResult[ItemT]:
+    try:
+        return TaskResult(item=item, value=func(item))
+    except Exception as e:
+        return TaskResult(item=item, error=e)
+
+
+def run_tasks(
+    func: T.Callable[[ItemT], T.Any],
+    items: T.Iterable[ItemT],
+    max_workers: int = 8,
+    on_result: T.Optional[T_ON_RESULT] = None,
+) -> list[TaskResult[ItemT]]:
+    """
+    Call ``func(item)`` for every item on a thread pool.
+
+    :param max_workers: The maximum number of concurrent calls, 1 runs the
+        tasks one by one in the current thread
+    :param on_result: Called with ``(index, result)`` in input order as soon
+        as the result and all the results before it are available
+    """
+    results = list()
+
+    def collect(result_iterator: T.Iterable[TaskResult[ItemT]]):
+        for index, result in enumerate(result_iterator):
+            results.append(result)
+            if on_result is not None:
+                on_result(index, result)
+
+    if max_workers <= 1:
+        collect(_run_one(func, item) for item in items)
+        return results
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        collect(executor.map(lambda item: _run_one(func, item), items))
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+    return results
+
+
+async def async_run_tasks(
+    func: T.Callable[[ItemT], T.Awaitable[T.Any]],
+    items: T.Iterable[ItemT],
+    max_workers: int = 8,
+    on_result: T.Optional[T_ON_RESULT] = None,
+) -> list[TaskResult[ItemT]]:
+    """
+    The asyncio version of :func:`run_tasks`, at most ``max_workers``
+    coroutines are awaited at the same time.
+    """
+    semaphore = asyncio.Semaphore(max(max_workers, 1))
+
+    async def run_one(item: ItemT) -> TaskResult[ItemT]:
+        async with semaphore:
+            try:
+                return TaskResult(item=item, value=await func(item))
+            except Exception as e:
+                return TaskResult(item=item, error=e)
+
+    tasks = [asyncio.ensure_future(run_one(item)) for item in items]
+    results = list()
+    try:
+        for index, task in enumerate(tasks):
+            result = await task
+            results.append(result)
+            if on_result is not None:
+                on_result(index, result)
+    finally:
+        for task in tasks:
+            task.cancel()
+    return results
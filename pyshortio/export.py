@@ -6,88 +6,239 @@ Short.io Export functionality for exporting links to TSV format.
 This module provides capabilities to export URL shortening data from Short.io
 to a TSV (Tab-Separated Values) format, enabling users to analyze their links,
 perform bulk operations, or keep local backups of their Short.io configuration.
+
+:meth:`ExportMixin.export_links` streams the export to a file page by page,
+see :mod:`pyshortio.export_writer`. :meth:`ExportMixin.export_links_incremental`
+only exports the links created since the last run, see
+:mod:`pyshortio.export_incremental`.
 """
 
 import io
+from pathlib import Path
 
 try:
     import typing_extensions as T
 except ImportError:  # pragma: no cover
     import typing as T
 
-try:
-    import polars as pl
-except ImportError:  # pragma: no cover
-    pass
-
+from .type_hint import T_KWARGS
+from .arg import NA
 from .constants import DEFAULT_RAISE_FOR_STATUS
+from .export_writer import T_SINK, open_sink, get_export_writer
+from .export_incremental import (
+    ExportManifest,
+    PartitionWriter,
+    split_partitions,
+    prepare_export,
+    finish_export,
+)
 
 if T.TYPE_CHECKING:  # pragma: no cover
     from .client import Client
 
 
+EXPORT_COLUMNS = [
+    "id",
+    "short_url",
+    "original_url",
+    "title",
+    "path",
+    "tags",
+    "folder_name",
+    "allow_duplicates",
+    "clicks_limit",
+    "cloaking",
+    "password",
+    "password_contact",
+    "redirect_type",
+    "ttl",
+    "expire_at",
+    "expire_url",
+    "utm_source",
+    "utm_medium",
+    "utm_campaign",
+    "utm_term",
+    "utm_content",
+    "android_url",
+    "iphone_url",
+    "skip_qs",
+    "archived",
+    "split_url",
+    "split_percent",
+    "integration_adroll",
+    "integration_fb",
+    "integration_ga",
+    "integration_gtm",
+]
+"""
+The columns of the exported TSV, in order. Except ``folder_name``, they are
+:data:`~pyshortio.link_schema.LINK_FIELDS` names, so the TSV can be synced back.
+"""
+
+TYPED_EXPORT_COLUMNS = EXPORT_COLUMNS + ["created_at", "updated_at"]
+"""
+The columns of the typed exports, e.g. Parquet, they keep the native types
+so the creation and update timestamps are added.
+"""
+
 class ExportMixin:
     """
     Mixin class providing export capabilities for the Client.
     """
 
-    def export_to_tsv(
+    def _get_folder_id_to_name_mapping(
+        self: "Client",
+        domain_id: int,
+    ) -> dict[str, str]:
+        _, folder_list = self.list_folders(domain_id=domain_id)
+        return {folder.id: folder.name for folder in folder_list}
+
+    def export_links(
         self: "Client",
         hostname: str,
+        sink: T_SINK,
+        format: str = "tsv",
+        limit: int = 150,
+        prefetch: int = 2,
+        writer_options: T.Optional[T_KWARGS] = None,
         raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
-    ) -> str:
+    ) -> int:
+        """
+        Export every link of a domain to a file, one page at a time.
+
+        Each page is written as soon as it is received, while the next pages
+        are prefetched, so the memory used doesn't grow with the number of
+        links.
+
+        >>> client.export_links(hostname="example.short.gy", sink="links.tsv")
+
+        :param hostname: The hostname of the Short.io domain
+        :param sink: A file path, or a binary stream that is left open
+        :param format: A :data:`~pyshortio.export_writer.EXPORT_WRITERS` key.
+            Defaults to ``tsv``, the same columns as :meth:`export_to_tsv`.
+            ``parquet``, ``ipc`` and ``jsonl`` keep the native types, see
+            :data:`TYPED_EXPORT_COLUMNS`.
+        :param limit: The number of links per page
+        :param prefetch: The number of pages fetched ahead
+        :param writer_options: The options of the writer, e.g.
+            ``{"compression": "zstd", "row_group_size": 10_000}`` for Parquet,
+            see :mod:`pyshortio.export_writer`
+
+        :returns: the number of exported links
+        """
         _, domain = self.get_domain_by_hostname(hostname=hostname)
-        _, folder_list = self.list_folders(domain_id=domain.id)
-        folder_id_to_name_mapping = {folder.id: folder.name for folder in folder_list}
+        folder_id_to_name_mapping = self._get_folder_id_to_name_mapping(
+            domain_id=domain.id,
+        )
+        n_link = 0
+        with open_sink(sink) as file:
+            writer = get_export_writer(format, file, **(writer_options or {}))
 
-        rows = []
-        paginator = self.pagi_list_links(
+            def iter_dfs():
+                nonlocal n_link
+                for table in self.iter_link_tables(
+                    domain_id=domain.id,
+                    limit=limit,
+                    prefetch=prefetch,
+                    raise_for_status=raise_for_status,
+                ):
+                    n_link += len(table)
+                    yield table.to_export_df(
+                        folder_id_to_name_mapping,
+                        typed=writer.typed,
+                    )
+
+            writer.write_all(iter_dfs())
+        return n_link
+
+    def export_links_incremental(
+        self: "Client",
+        hostname: str,
+        dir: T.Union[str, Path],
+        format: str = "parquet",
+        partition_format: str = "%Y-%m-%d",
+        limit: int = 150,
+        prefetch: int = 2,
+        writer_options: T.Optional[T_KWARGS] = None,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+    ) -> ExportManifest:
+        """
+        Export the links created since the last run to a directory partitioned
+        by creation date, see :mod:`pyshortio.export_incremental`. The first
+        run exports every link.
+
+        >>> manifest = client.export_links_incremental(
+        ...     hostname="example.short.gy",
+        ...     dir="backup",
+        ... )
+
+        :param hostname: The hostname of the Short.io domain
+        :param dir: The export directory, it has the ``manifest.json``
+        :param format: A :data:`~pyshortio.export_writer.EXPORT_WRITERS` key,
+            it can't change between runs
+        :param partition_format: The :meth:`datetime.strftime` format of the
+            creation time that names the partitions, e.g. ``%Y-%m`` for one
+            partition per month, it can't change between runs
+        :param limit: The number of links per page
+        :param prefetch: The number of pages fetched ahead
+        :param writer_options: See :meth:`export_links`
+
+        :returns: the saved manifest
+        """
+        _, domain = self.get_domain_by_hostname(hostname=hostname)
+        manifest = prepare_export(
+            dir=Path(dir),
+            hostname=hostname,
             domain_id=domain.id,
-            limit=150,
-            total_max_results=9999,
+            format=format,
+            partition_format=partition_format,
+        )
+        writer = PartitionWriter(
+            dir=Path(dir),
+            format=format,
+            folder_id_to_name_mapping=self._get_folder_id_to_name_mapping(
+                domain_id=domain.id,
+            ),
+            writer_options=writer_options or {},
+            watermark=manifest.watermark,
+            watermark_ids=list(manifest.watermark_ids),
+        )
+
+        def iter_pieces():
+            for table in self.iter_link_tables(
+                domain_id=domain.id,
+                after_date=(
+                    NA if manifest.after_date is None else manifest.after_date
+                ),
+                # oldest first, so that a partition is one run of links
+                date_sort_order="asc",
+                limit=limit,
+                prefetch=prefetch,
+                raise_for_status=raise_for_status,
+            ):
+                yield from split_partitions(
+                    table,
+                    partition_format=partition_format,
+                    exclude_ids=manifest.watermark_ids,
+                )
+
+        writer.write_all(iter_pieces())
+        return finish_export(dir=Path(dir), manifest=manifest, writer=writer)
+
+    def export_to_tsv(
+        self: "Client",
+        hostname: str,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+    ) -> str:
+        """
+        Export every link of a domain to TSV text, see :meth:`export_links`
+        to write a big domain to a file.
+        """
+        buffer = io.BytesIO()
+        self.export_links(
+            hostname=hostname,
+            sink=buffer,
+            format="tsv",
             raise_for_status=raise_for_status,
         )
-        for _, link_list in paginator:
-            for link in link_list:
-                row = {
-                    "id": link.id,
-                    "short_url": link.short_url,
-                    "original_url": link.original_url,
-                    "title": link.title,
-                    "path": link.path,
-                    "tags": ", ".join(link.tags) if link.tags else None,
-                    "folder_name": (
-                        folder_id_to_name_mapping[link.folder_id]
-                        if link.folder_id
-                        else None
-                    ),
-                    "allow_duplicates": False,
-                    "clicks_limit": link.clicks_limit,
-                    "cloaking": link.cloaking,
-                    "password": link.password,
-                    "password_contact": link.password_contact,
-                    "redirect_type": link.redirect_type,
-                    "ttl": link.ttl,
-                    "expire_at": link.expires_at,
-                    "expire_url": link.expired_url,
-                    "utm_source": link.utm_source,
-                    "utm_medium": link.utm_medium,
-                    "utm_campaign": link.utm_campaign,
-                    "utm_term": link.utm_term,
-                    "utm_content": link.utm_content,
-                    "android_url": link.android_url,
-                    "iphone_url": link.iphone_url,
-                    "skip_qs": link.skip_qs,
-                    "archived": link.archived,
-                    "split_url": link.split_url,
-                    "split_percent": link.split_percent,
-                    "integration_adroll": link.integration_adroll,
-                    "integration_fb": link.integration_fb,
-                    "integration_ga": link.integration_ga,
-                    "integration_gtm": link.integration_gtm,
-                }
-                rows.append(row)
-        df = pl.DataFrame(rows)
-        buffer = io.StringIO()
-        df.write_csv(buffer, separator="\t")
-        return buffer.getvalue()
+        return buffer.getvalue().decode("utf-8")
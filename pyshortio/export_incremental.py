@@ -0,0 +1,387 @@
+# -*- coding: utf-8 -*-
+
+"""
+Incremental exports for nightly backups of large domains.
+
+:meth:`~pyshortio.export.ExportMixin.export_links` reads the whole domain on
+every run. ``export_links_incremental(hostname, dir)`` only reads the links
+created since the last run, and appends them to a directory partitioned by
+creation date:
+
+.. code-block:: text
+
+    backup/
+    ├── manifest.json
+    ├── created_date=2025-01-01/
+    │   └── part-20250102T030000000000Z-0000.parquet
+    └── created_date=2025-01-02/
+        ├── part-20250102T030000000000Z-0001.parquet
+        └── part-20250103T030000000000Z-0000.parquet
+
+The :class:`ExportManifest`, ``manifest.json``, is the state of the export,
+it has:
+
+- a watermark, the creation time of the newest exported link, and the ids of
+  the links created at the watermark
+- every file of the export, with its partition and number of links
+
+The next run lists the links created since the watermark, the links created
+at the watermark are listed again and skipped by id, so links sharing a
+timestamp are never lost nor exported twice. Every run writes new files, the
+existing files are never rewritten. The manifest is saved after all the files
+are written, if a run fails the files it wrote are deleted, so the directory
+always matches the manifest.
+
+The export is append only: the links edited or deleted after they were
+exported are not updated, run a full :meth:`~pyshortio.export.ExportMixin.export_links`
+from time to time to take a snapshot.
+
+The directory is a hive partitioned dataset, e.g. for Parquet:
+
+.. code-block:: python
+
+    manifest = ExportManifest.load(dir)
+    df = pl.scan_parquet(manifest.get_paths(dir), hive_partitioning=True).collect()
+
+.. note::
+
+    This feature requires the ``polars`` library, install it with
+    ``pip install "pyshortio[export]"``.
+"""
+
+import typing as T
+import os
+import itertools
+import dataclasses
+from pathlib import Path
+from datetime import datetime, timedelta, timezone
+
+try:
+    import polars as pl
+except ImportError:  # pragma: no cover
+    pass
+
+from .json_backend import loads, dumps
+from .export_writer import open_sink, get_export_writer
+from .logger import logger
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    from .link_table import LinkTable
+
+EXPORT_MANIFEST_VERSION = 1
+
+MANIFEST_NAME = "manifest.json"
+
+PARTITION_KEY = "created_date"
+
+SUFFIX_BY_FORMAT = {
+    "tsv": ".tsv",
+    "csv": ".csv",
+    "parquet": ".parquet",
+    "ipc": ".arrow",
+    "jsonl": ".jsonl",
+}
+"""
+The file extension of each :data:`~pyshortio.export_writer.EXPORT_WRITERS`
+format.
+"""
+
+# the partition of the links without creation time, as in hive
+_NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+_PAD = timedelta(milliseconds=1)
+_PARTITION = "__partition"
+_RUN = "__run"
+
+
+@dataclasses.dataclass
+class ExportFile:
+    """
+    One file of an incremental export.
+
+    :param path: The path relative to the export directory, with ``/``
+    :param partition: The partition value, e.g. ``2025-01-01``
+    :param n_link: The number of links in the file
+    :param exported_at: When the file was written, in ISO format
+    """
+
+    path: str = dataclasses.field()
+    partition: str = dataclasses.field()
+    n_link: int = dataclasses.field()
+    exported_at: str = dataclasses.field()
+
+
+@dataclasses.dataclass
+class ExportManifest:
+    """
+    The manifest of an incremental export, see :mod:`pyshortio.export_incremental`.
+
+    :param hostname: The domain hostname
+    :param domain_id: The domain id
+    :param format: The :data:`~pyshortio.export_writer.EXPORT_WRITERS` format
+        of the files
+    :param partition_format: The :meth:`datetime.strftime` format of the
+        partition value
+    :param watermark: The creation time of the newest exported link
+    :param watermark_ids: The ids of the exported links created at the
+        watermark
+    :param files: Every file of the export, in the order they were written
+    """
+
+    hostname: str = dataclasses.field()
+    domain_id: int = dataclasses.field()
+    format: str = dataclasses.field()
+    partition_format: str = dataclasses.field()
+    watermark: T.Optional[datetime] = dataclasses.field(default=None)
+    watermark_ids: list[str] = dataclasses.field(default_factory=list)
+    files: list[ExportFile] = dataclasses.field(default_factory=list)
+
+    @classmethod
+    def load(cls, dir: Path) -> T.Optional["ExportManifest"]:
+        """
+        Load the manifest of an export directory, None if there is no export.
+        """
+        try:
+            data = loads(Path(dir).joinpath(MANIFEST_NAME).read_bytes())
+        except FileNotFoundError:
+            return None
+        if data.get("version") != EXPORT_MANIFEST_VERSION:
+            raise ValueError(
+                f"unsupported export manifest version {data.get('version')!r}"
+            )
+        watermark = data["watermark"]
+        return cls(
+            hostname=data["hostname"],
+            domain_id=data["domain_id"],
+            format=data["format"],
+            partition_format=data["partition_format"],
+            watermark=None if watermark is None else datetime.fromisoformat(watermark),
+            watermark_ids=data["watermark_ids"],
+            files=[ExportFile(**file) for file in data["files"]],
+        )
+
+    def save(self, dir: Path):
+        """
+        Save the manifest, the file is replaced atomically.
+        """
+        path = Path(dir).joinpath(MANIFEST_NAME)
+        data = {
+            "version": EXPORT_MANIFEST_VERSION,
+            "hostname": self.hostname,
+            "domain_id": self.domain_id,
+            "format": self.format,
+            "partition_format": self.partition_format,
+            "watermark": (
+                None if self.watermark is None else self.watermark.isoformat()
+            ),
+            "watermark_ids": self.watermark_ids,
+            "n_link": self.n_link,
+            "files": [dataclasses.asdict(file) for file in self.files],
+        }
+        path_tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        path_tmp.write_bytes(dumps(data))
+        os.replace(path_tmp, path)
+
+    def check(
+        self,
+        hostname: str,
+        domain_id: int,
+        format: str,
+        partition_format: str,
+    ):
+        """
+        Check that the next run appends the same kind of files.
+        """
+        expected = (self.hostname, self.domain_id, self.format, self.partition_format)
+        got = (hostname, domain_id, format, partition_format)
+        if expected != got:
+            raise ValueError(
+                f"the export directory has the (hostname, domain_id, format, "
+                f"partition_format) {expected}, not {got}"
+            )
+
+    @property
+    def n_link(self) -> int:
+        """
+        The number of exported links.
+        """
+        return sum(file.n_link for file in self.files)
+
+    @property
+    def after_date(self) -> T.Optional[datetime]:
+        """
+        The ``after_date`` to list the links created since the watermark,
+        the links created at the watermark are included.
+        """
+        return None if self.watermark is None else self.watermark - _PAD
+
+    def get_paths(self, dir: Path) -> list[Path]:
+        """
+        The absolute paths of the files of the export.
+        """
+        dir = Path(dir)
+        return [dir.joinpath(file.path) for file in self.files]
+
+
+def split_partitions(
+    table: "LinkTable",
+    partition_format: str,
+    exclude_ids: T.Collection[str] = (),
+) -> T.Iterator[tuple[str, "LinkTable"]]:
+    """
+    Split a page of links into runs of consecutive links of the same
+    partition. The links of the page are sorted by creation time, and the
+    pages are listed oldest first, so a partition is usually one run.
+
+    :param exclude_ids: The ids of the links that are already exported
+    """
+    df = table.df
+    if len(exclude_ids):
+        df = df.filter(~pl.col("id").is_in(list(exclude_ids)))
+    df = df.sort("created_at", nulls_last=True, maintain_order=True)
+    key = (
+        pl.col("created_at")
+        .dt.strftime(partition_format)
+        .fill_null(_NULL_PARTITION)
+        .alias(_PARTITION)
+    )
+    df = df.with_columns(key).with_columns(pl.col(_PARTITION).rle_id().alias(_RUN))
+    for run_df in df.partition_by(_RUN, maintain_order=True, include_key=False):
+        partition = run_df.get_column(_PARTITION)[0]
+        yield partition, dataclasses.replace(table, df=run_df.drop(_PARTITION))
+
+
+@dataclasses.dataclass
+class PartitionWriter:
+    """
+    Write the links of a run into new files of the export directory, one
+    file per run of consecutive links of the same partition, and track the
+    new watermark.
+
+    :param dir: The export directory
+    :param format: The :data:`~pyshortio.export_writer.EXPORT_WRITERS` format
+    :param folder_id_to_name_mapping: See
+        :meth:`~pyshortio.link_table.LinkTable.to_export_df`
+    :param writer_options: The options of the export writer
+    :param watermark: The watermark of the last run
+    :param watermark_ids: The ids of the links created at the watermark
+    """
+
+    dir: Path = dataclasses.field()
+    format: str = dataclasses.field()
+    folder_id_to_name_mapping: dict[str, str] = dataclasses.field()
+    writer_options: dict[str, T.Any] = dataclasses.field(default_factory=dict)
+    watermark: T.Optional[datetime] = dataclasses.field(default=None)
+    watermark_ids: list[str] = dataclasses.field(default_factory=list)
+    files: list[ExportFile] = dataclasses.field(default_factory=list, init=False)
+
+    def _track(self, table: "LinkTable"):
+        created_at = table.df.get_column("created_at")
+        last_created_at = created_at.max()
+        if last_created_at is None:
+            return
+        ids = table.df.filter(created_at == last_created_at).get_column("id")
+        if self.watermark is None or last_created_at > self.watermark:
+            self.watermark = last_created_at
+            self.watermark_ids = ids.to_list()
+        elif last_created_at == self.watermark:
+            self.watermark_ids.extend(ids.to_list())
+
+    def write_all(self, pieces: T.Iterable[tuple[str, "LinkTable"]]):
+        """
+        Write the ``(partition, table)`` pieces of :func:`split_partitions`.
+        If it fails, the files written so far are deleted.
+        """
+        now = datetime.now(timezone.utc)
+        run_id = now.strftime("%Y%m%dT%H%M%S%fZ")
+        suffix = SUFFIX_BY_FORMAT[self.format]
+        try:
+            for seq, (partition, group) in enumerate(
+                itertools.groupby(pieces, key=lambda piece: piece[0])
+            ):
+                path = f"{PARTITION_KEY}={partition}/part-{run_id}-{seq:04d}{suffix}"
+                file = ExportFile(
+                    path=path,
+                    partition=partition,
+                    n_link=0,
+                    exported_at=now.isoformat(),
+                )
+                self.files.append(file)
+                self.dir.joinpath(path).parent.mkdir(parents=True, exist_ok=True)
+
+                def iter_dfs():
+                    for _, table in group:
+                        file.n_link += len(table)
+                        self._track(table)
+                        yield table.to_export_df(
+                            self.folder_id_to_name_mapping,
+                            typed=writer.typed,
+                        )
+
+                with open_sink(self.dir.joinpath(path)) as f:
+                    writer = get_export_writer(self.format, f, **self.writer_options)
+                    writer.write_all(iter_dfs())
+                logger.info(f"wrote {file.n_link} links to {path}")
+        except BaseException:
+            for file in self.files:
+                self.dir.joinpath(file.path).unlink(missing_ok=True)
+            raise
+
+
+def prepare_export(
+    dir: Path,
+    hostname: str,
+    domain_id: int,
+    format: str,
+    partition_format: str,
+) -> ExportManifest:
+    """
+    Load the manifest of the export directory and check it, or start a new
+    export.
+    """
+    if format not in SUFFIX_BY_FORMAT:
+        raise ValueError(
+            f"unknown format {format!r}, the formats are {list(SUFFIX_BY_FORMAT)}"
+        )
+    dir = Path(dir)
+    manifest = ExportManifest.load(dir)
+    if manifest is None:
+        logger.info("no export manifest found, export every link")
+        dir.mkdir(parents=True, exist_ok=True)
+        return ExportManifest(
+            hostname=hostname,
+            domain_id=domain_id,
+            format=format,
+            partition_format=partition_format,
+        )
+    manifest.check(
+        hostname=hostname,
+        domain_id=domain_id,
+        format=format,
+        partition_format=partition_format,
+    )
+    logger.info(
+        f"{manifest.n_link} links are exported, "
+        f"export the links created since {manifest.watermark}"
+    )
+    return manifest
+
+
+def finish_export(
+    dir: Path,
+    manifest: ExportManifest,
+    writer: PartitionWriter,
+) -> ExportManifest:
+    """
+    Add the files of the run to the manifest and save it.
+    """
+    manifest = dataclasses.replace(
+        manifest,
+        watermark=writer.watermark,
+        watermark_ids=writer.watermark_ids,
+        files=manifest.files + writer.files,
+    )
+    manifest.save(dir)
+    n_link = sum(file.n_link for file in writer.files)
+    logger.info(f"exported {n_link} new links to {len(writer.files)} files")
+    return manifest
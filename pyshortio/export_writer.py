@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+
+"""
+Streaming writers for :meth:`~pyshortio.export.ExportMixin.export_links`.
+
+An export writer gets the links one page at a time, as an iterator of
+:class:`polars.DataFrame`, and writes them to a binary file. Nothing is kept
+between pages, so the memory used doesn't grow with the number of links, and
+the first page is on disk while the next pages are still being fetched.
+
+The text formats, TSV and CSV, have the same columns as
+:meth:`~pyshortio.export.ExportMixin.export_to_tsv`. The typed formats,
+Parquet, Arrow IPC and JSON lines, keep the native types: ``tags`` is a list
+column and the datetimes are UTC timestamps, see
+:data:`~pyshortio.export.TYPED_EXPORT_COLUMNS`. They are written by the
+polars streaming sinks, which pull the pages from the iterator, so a Parquet
+row group or an IPC record batch is written as soon as enough rows arrived.
+
+The writers are registered by format name in :data:`EXPORT_WRITERS`, the
+options of a writer, e.g. the Parquet compression, are its fields:
+
+.. code-block:: python
+
+    client.export_links(
+        hostname="example.short.gy",
+        sink="links.parquet",
+        format="parquet",
+        writer_options={"compression": "zstd", "row_group_size": 10_000},
+    )
+
+.. note::
+
+    This feature requires the ``polars`` library, install it with
+    ``pip install "pyshortio[export]"``.
+"""
+
+import typing as T
+import queue
+import asyncio
+import contextlib
+import dataclasses
+import functools
+from pathlib import Path
+
+from .paginator import _DONE, _Failure
+
+try:
+    import polars as pl
+    from polars.io.plugins import register_io_source
+except ImportError:  # pragma: no cover
+    pass
+
+T_SINK = T.Union[str, Path, T.BinaryIO]
+
+
+@dataclasses.dataclass
+class ExportWriter:
+    """
+    The base class of the export writers.
+
+    :param file: The binary file to write to, it is not closed
+    """
+
+    typed: T.ClassVar[bool] = False
+    """
+    If True, the pages keep the native types, see
+    :meth:`~pyshortio.link_table.LinkTable.to_export_df`.
+    """
+
+    file: T.BinaryIO = dataclasses.field()
+
+    def write_all(self, dfs: T.Iterable["pl.DataFrame"]):  # pragma: no cover
+        """
+        Write every page of links, the pages all have the same columns.
+        """
+        raise NotImplementedError
+
+
+@dataclasses.dataclass
+class DelimitedWriter(ExportWriter):
+    """
+    Write TSV or CSV text, the header is written with the first page, and
+    the file is flushed after every page.
+    """
+
+    separator: str = dataclasses.field(default="\t")
+
+    def write_all(self, dfs: T.Iterable["pl.DataFrame"]):
+        include_header = True
+        for df in dfs:
+            # a page is serialized in memory and written here, some polars
+            # releases ignore the errors of writing to a Python file object
+            text = df.write_csv(
+                separator=self.separator,
+                include_header=include_header,
+            )
+            self.file.write(text.encode("utf-8"))
+            self.file.flush()
+            include_header = False
+
+
+def _chain(first: "pl.DataFrame", dfs: T.Iterator["pl.DataFrame"]):
+    yield first
+    yield from dfs
+
+
+def _empty_typed_df() -> "pl.DataFrame":
+    # link_table imports this module through export
+    from .link_table import LinkTable
+
+    return LinkTable.from_raw_links([]).to_export_df(dict(), typed=True)
+
+
+def scan_pages(dfs: T.Iterable["pl.DataFrame"]) -> "pl.LazyFrame":
+    """
+    Wrap the pages into a :class:`polars.LazyFrame` that a streaming sink
+    pulls from, one page at a time. The schema is the one of the first page,
+    and the pages can be scanned only once. Without any page, the frame is
+    empty with the :data:`~pyshortio.export.TYPED_EXPORT_COLUMNS`, so the
+    file still has the full schema.
+    """
+    dfs = iter(dfs)
+    first = next(dfs, None)
+    if first is None:
+        return _empty_typed_df().lazy()
+
+    def io_source(
+        with_columns: T.Optional[list[str]],
+        predicate: T.Optional["pl.Expr"],
+        n_rows: T.Optional[int],
+        batch_size: T.Optional[int],
+    ) -> T.Iterator["pl.DataFrame"]:
+        for df in _chain(first, dfs):
+            if with_columns is not None:
+                df = df.select(with_columns)
+            if predicate is not None:
+                df = df.filter(predicate)
+            if n_rows is not None:
+                df = df.head(n_rows)
+                n_rows -= df.height
+            yield df
+            if n_rows == 0:
+                break
+
+    return register_io_source(io_source, schema=first.schema)
+
+
+@dataclasses.dataclass
+class ParquetWriter(ExportWriter):
+    """
+    Write a Parquet file.
+
+    :param compression: ``zstd``, ``snappy``, ``gzip``, ``lz4``, ``brotli``
+        or ``uncompressed``
+    :param compression_level: The level of ``zstd``, ``gzip`` or ``brotli``,
+        the polars default if None
+    :param row_group_size: The number of rows per row group, the polars
+        default if None
+    """
+
+    typed: T.ClassVar[bool] = True
+
+    compression: str = dataclasses.field(default="zstd")
+    compression_level: T.Optional[int] = dataclasses.field(default=None)
+    row_group_size: T.Optional[int] = dataclasses.field(default=None)
+
+    def write_all(self, dfs: T.Iterable["pl.DataFrame"]):
+        scan_pages(dfs).sink_parquet(
+            self.file,
+            compression=self.compression,
+            compression_level=self.compression_level,
+            row_group_size=self.row_group_size,
+        )
+
+
+@dataclasses.dataclass
+class IpcWriter(ExportWriter):
+    """
+    Write an Arrow IPC file, also known as Feather v2.
+
+    :param compression: ``uncompressed``, ``lz4`` or ``zstd``, uncompressed
+        files can be memory mapped when they are read
+    """
+
+    typed: T.ClassVar[bool] = True
+
+    compression: str = dataclasses.field(default="uncompressed")
+
+    def write_all(self, dfs: T.Iterable["pl.DataFrame"]):
+        scan_pages(dfs).sink_ipc(self.file, compression=self.compression)
+
+
+@dataclasses.dataclass
+class JsonlWriter(ExportWriter):
+    """
+    Write JSON lines, one link object per line, the datetimes are ISO 8601
+    strings and ``tags`` is an array.
+    """
+
+    typed: T.ClassVar[bool] = True
+
+    def write_all(self, dfs: T.Iterable["pl.DataFrame"]):
+        scan_pages(dfs).sink_ndjson(self.file)
+
+
+EXPORT_WRITERS: dict[str, T.Callable[..., ExportWriter]] = {
+    "tsv": functools.partial(DelimitedWriter, separator="\t"),
+    "csv": functools.partial(DelimitedWriter, separator=","),
+    "parquet": ParquetWriter,
+    "ipc": IpcWriter,
+    "jsonl": JsonlWriter,
+}
+"""
+Format name to a function that creates the writer for a binary file, the
+keyword arguments are the writer options.
+"""
+
+
+def get_export_writer(
+    format: str,
+    file: T.BinaryIO,
+    **options,
+) -> ExportWriter:
+    """
+    Create the :data:`EXPORT_WRITERS` writer of ``format``.
+
+    :param options: The writer options, e.g. ``compression`` for Parquet
+    """
+    try:
+        create_writer = EXPORT_WRITERS[format]
+    except KeyError:
+        raise ValueError(
+            f"unknown format {format!r}, the formats are {list(EXPORT_WRITERS)}"
+        )
+    return create_writer(file, **options)
+
+
+def _iter_queue(q: queue.Queue) -> T.Iterator["pl.DataFrame"]:
+    while 1:
+        item = q.get()
+        if item is _DONE:
+            return
+        if isinstance(item, _Failure):
+            raise item.error
+        yield item
+
+
+async def write_all_async(
+    writer: ExportWriter,
+    dfs: T.AsyncIterable["pl.DataFrame"],
+):
+    """
+    The async version of :meth:`ExportWriter.write_all`. The writer runs in
+    a worker thread and gets the pages through a bounded queue, while the
+    event loop keeps fetching the next pages.
+
+    If fetching a page fails, the writer stops and the error is raised. If
+    the writer fails, ``dfs`` is closed and the error is raised.
+
+    :param writer: An :class:`ExportWriter`, or any object with a
+        ``write_all`` method, e.g.
+        :class:`~pyshortio.export_incremental.PartitionWriter`
+    """
+    q = queue.Queue(maxsize=2)
+    task = asyncio.ensure_future(
+        asyncio.to_thread(writer.write_all, _iter_queue(q)),
+    )
+
+    async def put(item):
+        # nobody reads the queue once the writer is done
+        while task.done() is False:
+            try:
+                await asyncio.to_thread(q.put, item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    try:
+        async for df in dfs:
+            await put(df)
+            if task.done():
+                break
+        await put(_DONE)
+    except BaseException as e:
+        await put(_Failure(e))
+        raise
+    finally:
+        aclose = getattr(dfs, "aclose", None)
+        if aclose is not None:
+            await aclose()
+        await asyncio.wait([task])
+        if task.cancelled() is False:
+            # retrieve the error of the writer, so it is not logged when the
+            # error being raised replaces it
+            task.exception()
+    # raise the error of the writer, or CancelledError if it was cancelled
+    task.result()
+
+
+@contextlib.contextmanager
+def open_sink(sink: T_SINK) -> T.Iterator[T.BinaryIO]:
+    """
+    Open a file path for writing, a binary stream is used as it is and is
+    not closed.
+    """
+    if isinstance(sink, (str, Path)):
+        with open(sink, "wb") as file:
+            yield file
+    else:
+        yield sink
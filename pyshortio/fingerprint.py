@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+
+"""
+Link fingerprints for sync diffing.
+
+A fingerprint is a SHA-256 digest over the normalized values of the
+:data:`FINGERPRINT_FIELDS` of a link, it is computed the same way for the link
+data of a TSV row and for a :class:`~pyshortio.model.Link` returned by the
+API, so "did this link change" is one string compare:
+
+.. code-block:: python
+
+    fingerprint_link_data(link_data) == fingerprint_link(link)
+
+The values are normalized before hashing, so equivalent values written in
+different ways have the same fingerprint:
+
+- ``None`` values are skipped, like missing values
+- ``tags`` are sorted, a comma separated string is split first
+- datetimes are converted to ISO 8601 in UTC, naive datetimes are UTC
+- booleans are ``true`` / ``false``, integral floats are integers
+
+Fingerprints are plain hex strings, they can be stored and compared with the
+fingerprints of a later run.
+"""
+
+import typing as T
+import hashlib
+from datetime import datetime, timezone
+
+from .link_schema import FIELDS_BY_NAME, compile_decoder, read_columns
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    from .model import Link
+
+FINGERPRINT_FIELDS = [
+    "original_url",
+    "cloaking",
+    "password",
+    "redirect_type",
+    "expire_at",
+    "expire_url",
+    "title",
+    "tags",
+    "utm_source",
+    "utm_medium",
+    "utm_campaign",
+    "utm_term",
+    "utm_content",
+    "ttl",
+    "path",
+    "android_url",
+    "iphone_url",
+    "clicks_limit",
+    "password_contact",
+    "skip_qs",
+    "archived",
+    "split_url",
+    "split_percent",
+    "integration_adroll",
+    "integration_fb",
+    "integration_ga",
+    "integration_gtm",
+    "folder_id",
+]
+"""
+The :data:`~pyshortio.link_schema.LINK_FIELDS` names compared by the sync.
+"""
+
+_DATETIME_FIELDS = frozenset(
+    name for name in FINGERPRINT_FIELDS if FIELDS_BY_NAME[name].is_datetime
+)
+
+_decode_fingerprint_data = compile_decoder(
+    "_decode_fingerprint_data",
+    read_columns(FINGERPRINT_FIELDS),
+)
+
+
+def _normalize_datetime(value: T.Union[str, datetime]) -> str:
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return value
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat()
+
+
+def normalize_value(name: str, value: T.Any) -> T.Optional[str]:
+    """
+    Convert the value of the field ``name`` to its canonical string,
+    None if the value is None.
+    """
+    if value is None:
+        return None
+    if name == "tags":
+        if isinstance(value, str):
+            value = [tag.strip() for tag in value.split(",") if tag.strip()]
+        return ",".join(sorted(value))
+    if name in _DATETIME_FIELDS:
+        return _normalize_datetime(value)
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def compute_fingerprint(
+    data: T.Mapping[str, T.Any],
+    fields: T.Iterable[str] = FINGERPRINT_FIELDS,
+) -> str:
+    """
+    Compute the fingerprint of a ``{field name: value}`` mapping over
+    ``fields``, keys not in ``fields`` are ignored.
+    """
+    parts = list()
+    for name in fields:
+        value = normalize_value(name, data.get(name))
+        if value is not None:
+            # length prefixed, so values can't run into each other
+            parts.append(f"{name}:{len(value)}:{value};")
+    return hashlib.sha256("".join(parts).encode("utf-8")).hexdigest()
+
+
+def get_fingerprint_data_from_link(link: "Link") -> dict[str, T.Any]:
+    """
+    Extract the :data:`FINGERPRINT_FIELDS` of a Link object, None values are
+    removed and the tags are sorted. The link itself is not modified.
+    """
+    data = _decode_fingerprint_data(link._data)
+    data = {k: v for k, v in data.items() if v is not None}
+    if "tags" in data:
+        data["tags"] = sorted(data["tags"])
+    return data
+
+
+def fingerprint_link(link: "Link") -> str:
+    """
+    Compute the fingerprint of a Link object.
+    """
+    return compute_fingerprint(get_fingerprint_data_from_link(link))
+
+
+def fingerprint_link_data(link_data: T.Mapping[str, T.Any]) -> str:
+    """
+    Compute the fingerprint of the link data of a TSV row.
+    """
+    return compute_fingerprint(link_data)
+
+
+def is_same(
+    link_data: T.Mapping[str, T.Any],
+    link: "Link",
+) -> bool:
+    """
+    Compare a link data dictionary with a Link object to determine if they are
+    equivalent.
+
+    Only the fields that are set on both sides are compared: a TSV doesn't
+    have to list every column, and the API may not return some of the write
+    only fields, e.g. ``password``. Identical values are the common case and
+    are checked first, the two sides are only fingerprinted over these fields
+    when some value is written differently, e.g. a datetime vs its string.
+    """
+    link_fingerprint_data = get_fingerprint_data_from_link(link)
+    fields = [k for k in link_fingerprint_data if k in link_data]
+    for k in fields:
+        if link_data[k] != link_fingerprint_data[k]:
+            break
+    else:
+        return True
+    return compute_fingerprint(link_data, fields) == compute_fingerprint(
+        link_fingerprint_data, fields
+    )
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+
+"""
+Lazy, decode-on-access backing data for the models.
+
+By default a list page is fully decoded, every link becomes a dict of Python
+objects even if the caller only reads ``id`` and ``original_url``. In lazy
+mode (``iter_links(..., lazy=True)``) a page is decoded with
+`msgspec <https://jcristharif.com/msgspec/>`_ into one
+:class:`msgspec.Raw` per link, a zero-copy view into the raw response bytes,
+and the model ``_data`` is a :class:`LazyData` mapping on top of it:
+
+1. Reading a property decodes only that field of that link, and caches it.
+2. After :data:`FULL_DECODE_AFTER` distinct fields, the whole link is decoded
+   once and the raw view is released, so reading every field costs about the
+   same as the eager mode.
+
+The raw page bytes are much smaller than the decoded dicts, a bulk scan that
+keeps 100k links in memory but only reads a few fields of each has a lower
+peak memory and spends less CPU in decoding. The public property API of the
+models stays the same.
+
+.. note::
+
+    This feature requires the ``msgspec`` library, install it with
+    ``pip install msgspec``.
+"""
+
+import typing as T
+from collections.abc import Mapping
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+FULL_DECODE_AFTER = 4
+"""
+Decode the whole link once this many distinct fields were decoded one by one.
+"""
+
+_MISSING = object()
+
+_page_decoder = None
+_field_decoders: dict[str, T.Any] = dict()
+
+
+def _get_page_decoder():
+    global _page_decoder
+    if _page_decoder is None:
+
+        class _LinksPage(msgspec.Struct):
+            links: list[msgspec.Raw] = []
+            nextPageToken: T.Optional[str] = None
+
+        _page_decoder = msgspec.json.Decoder(_LinksPage)
+    return _page_decoder
+
+
+def _get_field_decoder(key: str):
+    """
+    Get a decoder that only extracts ``key`` from a JSON object, all other
+    fields are skipped without creating Python objects.
+    """
+    try:
+        return _field_decoders[key]
+    except KeyError:
+        struct = msgspec.defstruct(
+            "_Field",
+            [("value", T.Any, _MISSING)],
+            rename={"value": key},
+        )
+        decoder = _field_decoders[key] = msgspec.json.Decoder(struct)
+        return decoder
+
+
+class LazyData(Mapping):
+    """
+    A read-only mapping over the raw JSON bytes of one API object, see
+    :mod:`pyshortio.lazy`.
+    """
+
+    __slots__ = ("_raw", "_fields", "_data")
+
+    def __init__(self, raw: "msgspec.Raw"):
+        self._raw = raw
+        self._fields: T.Optional[dict[str, T.Any]] = dict()
+        self._data: T.Optional[dict[str, T.Any]] = None
+
+    def to_dict(self) -> dict[str, T.Any]:
+        """
+        Decode the whole object, it is decoded only once.
+        """
+        if self._data is None:
+            self._data = msgspec.json.decode(self._raw)
+            self._raw = None
+            self._fields = None
+        return self._data
+
+    def get(self, key: str, default: T.Any = None) -> T.Any:
+        if self._data is not None:
+            return self._data.get(key, default)
+        try:
+            value = self._fields[key]
+        except KeyError:
+            if len(self._fields) >= FULL_DECODE_AFTER:
+                return self.to_dict().get(key, default)
+            value = _get_field_decoder(key).decode(self._raw).value
+            self._fields[key] = value
+        return default if value is _MISSING else value
+
+    def __getitem__(self, key: str) -> T.Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __iter__(self) -> T.Iterator[str]:
+        return iter(self.to_dict())
+
+    def __len__(self) -> int:
+        return len(self.to_dict())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def __reduce__(self):
+        # pickle as a plain dict, the raw view can't be pickled
+        return dict, (self.to_dict(),)
+
+
+def decode_links_page(content: bytes) -> dict[str, T.Any]:
+    """
+    Decode the body of a ``GET /api/links`` response lazily, the ``links``
+    are :class:`LazyData`.
+    """
+    if msgspec is None:  # pragma: no cover
+        raise ImportError("lazy mode requires msgspec, run: pip install msgspec")
+    page = _get_page_decoder().decode(content)
+    data = {"links": [LazyData(raw) for raw in page.links]}
+    if page.nextPageToken is not None:
+        data["nextPageToken"] = page.nextPageToken
+    return data
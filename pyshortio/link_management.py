@@ -6,6 +6,10 @@ Short.io Link Management API implementation.
 This module provides classes and methods for creating, updating, and deleting links
 in the Short.io service. It complements the :mod:`pyshortio.link_queries` module
 by focusing on modification operations rather than retrieval operations.
+
+The request arguments and the response parsing of every method are module level
+helpers, shared with :mod:`pyshortio.async_link_management`, so the two clients
+only differ in how the request is sent.
 """
 
 try:
@@ -18,9 +22,11 @@ from datetime import datetime
 from requests import Response
 
 from .arg import NA, rm_na
+from .type_hint import T_KWARGS
 from .constants import DEFAULT_RAISE_FOR_STATUS
-from .utils import datetime_to_iso_string
 from .model import Link
+from .json_backend import response_json
+from .link_schema import encode_create_link, encode_batch_link, encode_update_link
 
 
 if T.TYPE_CHECKING:  # pragma: no cover
@@ -80,6 +86,152 @@ class T_CREATE_LINK(T_CREATE_BATCH_LINK):
     hostname: T.Required[str]
 
 
+def _create_link_data(hostname: str, **kwargs) -> T_KWARGS:
+    """
+    Build the ``POST /links`` request body from the
+    :meth:`LinkManagementMixin.create_link` arguments.
+    """
+    return {"domain": hostname, **encode_create_link(kwargs)}
+
+
+def _batch_create_link_data(dct: T_CREATE_BATCH_LINK) -> T_KWARGS:
+    """
+    Build one item of the ``POST /links/bulk`` request body.
+    """
+    return encode_batch_link(dct)
+
+
+def _update_link_data(**kwargs) -> T_KWARGS:
+    """
+    Build the ``POST /links/{link_id}`` request body from the
+    :meth:`LinkManagementMixin.update_link` arguments.
+    """
+    return encode_update_link(kwargs)
+
+
+def _create_link_request(endpoint: str, hostname: str, **kwargs) -> T_KWARGS:
+    """
+    The ``http_post`` arguments of :meth:`LinkManagementMixin.create_link`,
+    ``kwargs`` are the link fields.
+    """
+    return dict(
+        url=f"{endpoint}/links",
+        data=_create_link_data(hostname=hostname, **kwargs),
+    )
+
+
+def _parse_create_link(response, raise_for_status: bool) -> T.Optional[Link]:
+    if raise_for_status:
+        response.raise_for_status()
+    if response.status_code == 200:
+        return Link._from_api_data(response_json(response))
+    else:  # pragma: no cover
+        raise NotImplementedError("Unexpected response code")
+
+
+def _batch_create_links_request(
+    endpoint: str,
+    hostname: str,
+    links: list[T_CREATE_BATCH_LINK],
+    allow_duplicates: bool = NA,
+    folder_id: str = NA,
+) -> T_KWARGS:
+    """
+    The ``http_post`` arguments of :meth:`LinkManagementMixin.batch_create_links`.
+    """
+    data = {
+        "domain": hostname,
+        "links": [_batch_create_link_data(dct) for dct in links],
+        "allowDuplicates": allow_duplicates,
+        "folderId": folder_id,
+    }
+    return dict(url=f"{endpoint}/links/bulk", data=rm_na(**data))
+
+
+def _parse_batch_create_links(
+    response,
+    raise_for_status: bool,
+) -> T.Optional[list[Link]]:
+    if raise_for_status:
+        response.raise_for_status()
+    if response.status_code == 200:
+        return [Link._from_api_data(dct) for dct in response_json(response)]
+    else:  # pragma: no cover
+        raise NotImplementedError("Unexpected response code")
+
+
+def _update_link_request(
+    endpoint: str,
+    link_id: str,
+    domain_id: int = NA,
+    **kwargs,
+) -> T_KWARGS:
+    """
+    The ``http_post`` arguments of :meth:`LinkManagementMixin.update_link`,
+    ``kwargs`` are the link fields.
+    """
+    params = {
+        "domain_id": domain_id,
+    }
+    return dict(
+        url=f"{endpoint}/links/{link_id}",
+        params=rm_na(**params),
+        data=_update_link_data(**kwargs),
+        # updating a link with the same data twice is harmless
+        retry_safe=True,
+    )
+
+
+def _parse_update_link(response, raise_for_status: bool) -> T.Optional[Link]:
+    if raise_for_status:
+        response.raise_for_status()
+    if response.status_code == 200:
+        return Link._from_api_data(response_json(response))
+    elif response.status_code == 400:
+        return None
+    elif response.status_code == 404:
+        return None
+    else:  # pragma: no cover
+        raise NotImplementedError("Unexpected response code")
+
+
+def _delete_link_request(endpoint: str, link_id: str) -> T_KWARGS:
+    """
+    The ``http_delete`` arguments of :meth:`LinkManagementMixin.delete_link`.
+    """
+    return dict(url=f"{endpoint}/links/{link_id}")
+
+
+def _parse_delete_link(response, raise_for_status: bool) -> T.Optional[bool]:
+    if raise_for_status:
+        response.raise_for_status()
+    if response.status_code == 200:
+        return response_json(response)["success"]
+    elif response.status_code == 404:
+        return False
+    else:  # pragma: no cover
+        raise NotImplementedError("Unexpected response code")
+
+
+def _batch_delete_links_request(endpoint: str, link_ids: list[str]) -> T_KWARGS:
+    """
+    The ``http_delete`` arguments of :meth:`LinkManagementMixin.batch_delete_links`.
+    """
+    data = {
+        "link_ids": link_ids,
+    }
+    return dict(url=f"{endpoint}/links/delete_bulk", data=rm_na(**data))
+
+
+def _parse_batch_delete_links(response, raise_for_status: bool) -> T.Optional[bool]:
+    if raise_for_status:
+        response.raise_for_status()
+    if response.status_code == 200:
+        return response_json(response)["success"]
+    else:
+        return None
+
+
 class LinkManagementMixin:
     """
     Mixin class providing Link management API methods for the Client.
@@ -154,52 +306,43 @@ class LinkManagementMixin:
 
         - https://developers.short.io/reference/post_links
         """
-        url = f"{self.endpoint}/links"
-        data = {
-            "domain": hostname,
-            "originalURL": original_url,
-            "cloaking": cloaking,
-            "password": password,
-            "redirectType": redirect_type,
-            "expiresAt": datetime_to_iso_string(expire_at),
-            "expiredURL": expire_url,
-            "title": title,
-            "tags": tags,
-            "utmSource": utm_source,
-            "utmMedium": utm_medium,
-            "utmCampaign": utm_campaign,
-            "utmTerm": utm_term,
-            "utmContent": utm_content,
-            "ttl": datetime_to_iso_string(ttl),
-            "path": path,
-            "androidURL": android_url,
-            "iphoneURL": iphone_url,
-            "createdAt": datetime_to_iso_string(created_at),
-            "clicksLimit": clicks_limit,
-            "passwordContact": password_contact,
-            "skipQS": skip_qs,
-            "archived": archived,
-            "splitURL": split_url,
-            "splitPercent": split_percent,
-            "integrationAdroll": integration_adroll,
-            "integrationFB": integration_fb,
-            "integrationGA": integration_ga,
-            "integrationGTM": integration_gtm,
-            "allowDuplicates": allow_duplicates,
-            "folderId": folder_id,
-        }
-        data = rm_na(**data)
         response = self.http_post(
-            url=url,
-            data=data,
+            **_create_link_request(
+                endpoint=self.endpoint,
+                hostname=hostname,
+                original_url=original_url,
+                cloaking=cloaking,
+                password=password,
+                redirect_type=redirect_type,
+                expire_at=expire_at,
+                expire_url=expire_url,
+                title=title,
+                tags=tags,
+                utm_source=utm_source,
+                utm_medium=utm_medium,
+                utm_campaign=utm_campaign,
+                utm_term=utm_term,
+                utm_content=utm_content,
+                ttl=ttl,
+                path=path,
+                android_url=android_url,
+                iphone_url=iphone_url,
+                created_at=created_at,
+                clicks_limit=clicks_limit,
+                password_contact=password_contact,
+                skip_qs=skip_qs,
+                archived=archived,
+                split_url=split_url,
+                split_percent=split_percent,
+                integration_adroll=integration_adroll,
+                integration_fb=integration_fb,
+                integration_ga=integration_ga,
+                integration_gtm=integration_gtm,
+                allow_duplicates=allow_duplicates,
+                folder_id=folder_id,
+            )
         )
-        if raise_for_status:
-            response.raise_for_status()
-        if response.status_code == 200:
-            link = Link(_data=response.json())
-        else:  # pragma: no cover
-            raise NotImplementedError("Unexpected response code")
-        return response, link
+        return response, _parse_create_link(response, raise_for_status)
 
     def batch_create_links(
         self: "Client",
@@ -245,61 +388,16 @@ class LinkManagementMixin:
 
         - https://developers.short.io/reference/post_links-bulk
         """
-        links = [
-            rm_na(
-                **{
-                    "originalURL": dct["original_url"],
-                    "cloaking": dct.get("cloaking", NA),
-                    "password": dct.get("password", NA),
-                    "redirectType": dct.get("redirect_type", NA),
-                    "expiresAt": datetime_to_iso_string(dct.get("expires_at", NA)),
-                    "expiredURL": dct.get("expired_url", NA),
-                    "title": dct.get("title", NA),
-                    "tags": dct.get("tags", NA),
-                    "utmSource": dct.get("utm_source", NA),
-                    "utmMedium": dct.get("utm_medium", NA),
-                    "utmCampaign": dct.get("utm_campaign", NA),
-                    "utmTerm": dct.get("utm_term", NA),
-                    "utmContent": dct.get("utm_content", NA),
-                    "ttl": datetime_to_iso_string(dct.get("ttl", NA)),
-                    "path": dct.get("path", NA),
-                    "androidURL": dct.get("android_url", NA),
-                    "iphoneURL": dct.get("iphone_url", NA),
-                    "createdAt": datetime_to_iso_string(dct.get("created_at", NA)),
-                    "clicksLimit": dct.get("clicks_limit", NA),
-                    "passwordContact": dct.get("password_contact", NA),
-                    "skipQS": dct.get("skip_qs", NA),
-                    "archived": dct.get("archived", NA),
-                    "splitURL": dct.get("split_url", NA),
-                    "splitPercent": dct.get("split_percent", NA),
-                    "integrationAdroll": dct.get("integration_adroll", NA),
-                    "integrationFB": dct.get("integration_fb", NA),
-                    "integrationGA": dct.get("integration_ga", NA),
-                    "integrationGTM": dct.get("integration_gtm", NA),
-                    "allowDuplicates": dct.get("allow_duplicates", NA),
-                }
-            )
-            for dct in links
-        ]
-        data = {
-            "domain": hostname,
-            "links": links,
-            "allowDuplicates": allow_duplicates,
-            "folderId": folder_id,
-        }
-        data = rm_na(**data)
-        url = f"{self.endpoint}/links/bulk"
         response = self.http_post(
-            url=url,
-            data=data,
+            **_batch_create_links_request(
+                endpoint=self.endpoint,
+                hostname=hostname,
+                links=links,
+                allow_duplicates=allow_duplicates,
+                folder_id=folder_id,
+            )
         )
-        if raise_for_status:
-            response.raise_for_status()
-        if response.status_code == 200:
-            link_list = [Link(_data=dct) for dct in response.json()]
-        else:  # pragma: no cover
-            raise NotImplementedError("Unexpected response code")
-        return response, link_list
+        return response, _parse_batch_create_links(response, raise_for_status)
 
     def update_link(
         self: "Client",
@@ -368,58 +466,42 @@ class LinkManagementMixin:
 
         - https://developers.short.io/reference/post_links-linkid
         """
-        url = f"{self.endpoint}/links/{link_id}"
-        params = {
-            "domain_id": domain_id,
-        }
-        params = rm_na(**params)
-        data = {
-            "originalURL": original_url,
-            "cloaking": cloaking,
-            "password": password,
-            "redirectType": redirect_type,
-            "expiresAt": datetime_to_iso_string(expire_at),
-            "expiredURL": expire_url,
-            "title": title,
-            "tags": tags,
-            "utmSource": utm_source,
-            "utmMedium": utm_medium,
-            "utmCampaign": utm_campaign,
-            "utmTerm": utm_term,
-            "utmContent": utm_content,
-            "ttl": datetime_to_iso_string(ttl),
-            "path": path,
-            "androidURL": android_url,
-            "iphoneURL": iphone_url,
-            "createdAt": datetime_to_iso_string(created_at),
-            "clicksLimit": clicks_limit,
-            "passwordContact": password_contact,
-            "skipQS": skip_qs,
-            "archived": archived,
-            "splitURL": split_url,
-            "splitPercent": split_percent,
-            "integrationAdroll": integration_adroll,
-            "integrationFB": integration_fb,
-            "integrationGA": integration_ga,
-            "integrationGTM": integration_gtm,
-        }
-        data = rm_na(**data)
         response = self.http_post(
-            url=url,
-            params=params,
-            data=data,
+            **_update_link_request(
+                endpoint=self.endpoint,
+                link_id=link_id,
+                domain_id=domain_id,
+                original_url=original_url,
+                cloaking=cloaking,
+                password=password,
+                redirect_type=redirect_type,
+                expire_at=expire_at,
+                expire_url=expire_url,
+                title=title,
+                tags=tags,
+                utm_source=utm_source,
+                utm_medium=utm_medium,
+                utm_campaign=utm_campaign,
+                utm_term=utm_term,
+                utm_content=utm_content,
+                ttl=ttl,
+                path=path,
+                android_url=android_url,
+                iphone_url=iphone_url,
+                created_at=created_at,
+                clicks_limit=clicks_limit,
+                password_contact=password_contact,
+                skip_qs=skip_qs,
+                archived=archived,
+                split_url=split_url,
+                split_percent=split_percent,
+                integration_adroll=integration_adroll,
+                integration_fb=integration_fb,
+                integration_ga=integration_ga,
+                integration_gtm=integration_gtm,
+            )
         )
-        if raise_for_status:
-            response.raise_for_status()
-        if response.status_code == 200:
-            link = Link(_data=response.json())
-        elif response.status_code == 400:
-            link = None
-        elif response.status_code == 404:
-            link = None
-        else:
-            raise NotImplementedError("Unexpected response code")
-        return response, link
+        return response, _parse_update_link(response, raise_for_status)
 
     def delete_link(
         self: "Client",
@@ -454,19 +536,10 @@ class LinkManagementMixin:
 
         - https://developers.short.io/reference/delete_links-link-id
         """
-        url = f"{self.endpoint}/links/{link_id}"
         response = self.http_delete(
-            url=url,
+            **_delete_link_request(endpoint=self.endpoint, link_id=link_id)
         )
-        if raise_for_status:
-            response.raise_for_status()
-        if response.status_code == 200:
-            success = response.json()["success"]
-        elif response.status_code == 404:
-            success = False
-        else:  # pragma: no cover
-            raise NotImplementedError("Unexpected response code")
-        return response, success
+        return response, _parse_delete_link(response, raise_for_status)
 
     def batch_delete_links(
         self: "Client",
@@ -501,19 +574,7 @@ class LinkManagementMixin:
 
         - https://developers.short.io/reference/delete_links-delete-bulk
         """
-        url = f"{self.endpoint}/links/delete_bulk"
-        data = {
-            "link_ids": link_ids,
-        }
-        data = rm_na(**data)
         response = self.http_delete(
-            url=url,
-            data=data,
+            **_batch_delete_links_request(endpoint=self.endpoint, link_ids=link_ids)
         )
-        if raise_for_status:
-            response.raise_for_status()
-        if response.status_code == 200:
-            success = response.json()["success"]
-        else:
-            success = None
-        return response, success
+        return response, _parse_batch_delete_links(response, raise_for_status)
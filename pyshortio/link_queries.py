@@ -34,6 +34,10 @@ a universal pagination mechanism that converts any regular API method to an
 auto-paginating method. These methods are prefixed with `pagi_` followed by the
 original method name and return an iterable of the original method's return values
 (typically tuples of response and specialized objects).
+
+The request arguments and the response parsing of every method are module level
+helpers, shared with :mod:`pyshortio.async_link_queries`, so the two clients only
+differ in how the request is sent.
 """
 
 import typing as T
@@ -42,15 +46,276 @@ from datetime import datetime
 from requests import Response
 
 from .arg import NA, rm_na
+from .type_hint import T_KWARGS
 from .constants import DEFAULT_RAISE_FOR_STATUS
+from .utils import datetime_to_iso_string
 from .model import Link, Folder
-from .paginator import _paginate
+from .json_backend import response_json
+from .lazy import decode_links_page
+from .link_table import read_links_page
+from .checkpoint import BaseCheckpointStore
+from .paginator import Page, _paginate
 
 
 if T.TYPE_CHECKING:  # pragma: no cover
     from .client import Client
 
 
+def _list_links_request(
+    endpoint: str,
+    domain_id: int,
+    limit: T.Optional[int] = NA,
+    id_string: T.Optional[int] = NA,
+    create_at: T.Optional[datetime] = NA,
+    before_date: T.Optional[datetime] = NA,
+    after_date: T.Optional[datetime] = NA,
+    date_sort_order: T.Optional[str] = NA,
+    page_token: T.Optional[str] = NA,
+    folder_id: T.Optional[str] = NA,
+) -> T_KWARGS:
+    """
+    The ``http_get`` arguments of :meth:`LinkQueriesMixin.list_links`.
+    """
+    params = {
+        "domain_id": domain_id,
+        "limit": limit,
+        "idString": id_string,
+        "createdAt": datetime_to_iso_string(create_at),
+        "beforeDate": datetime_to_iso_string(before_date),
+        "afterDate": datetime_to_iso_string(after_date),
+        "dateSortOrder": date_sort_order,
+        "pageToken": page_token,
+        "folderId": folder_id,
+    }
+    return dict(url=f"{endpoint}/api/links", params=rm_na(**params))
+
+
+def _parse_list_links_page(
+    response,
+    raise_for_status: bool,
+    lazy: bool = False,
+    table: bool = False,
+) -> Page:
+    """
+    Read a ``GET /api/links`` response, see
+    :meth:`LinkQueriesMixin._list_links_page`.
+    """
+    if raise_for_status:
+        response.raise_for_status()
+    if response.status_code == 200 and table:
+        raw_df, next_token = read_links_page(response.content)
+        data = {"links": raw_df}
+        if next_token is not None:
+            data["nextPageToken"] = next_token
+        return Page(response=response, data=data, result=raw_df)
+    if response.status_code == 200:
+        if lazy:
+            data = decode_links_page(response.content)
+        else:
+            data = response_json(response)
+        link_list = [Link._from_api_data(dct) for dct in data.get("links", [])]
+    else:
+        raise NotImplementedError("Unexpected response code")
+    return Page(response=response, data=data, result=link_list)
+
+
+def _get_link_opengraph_properties_request(
+    endpoint: str,
+    domain_id: int,
+    link_id: str,
+) -> T_KWARGS:
+    """
+    The ``http_get`` arguments of
+    :meth:`LinkQueriesMixin.get_link_opengraph_properties`.
+    """
+    return dict(url=f"{endpoint}/links/opengraph/{domain_id}/{link_id}")
+
+
+def _parse_get_link_opengraph_properties(
+    response,
+    raise_for_status: bool,
+) -> T.Optional[list]:
+    if raise_for_status:
+        response.raise_for_status()
+    if response.status_code == 200:
+        return response_json(response)
+    else:  # pragma: no cover
+        raise NotImplementedError("Unexpected response code")
+
+
+def _get_link_info_by_link_id_request(endpoint: str, link_id: str) -> T_KWARGS:
+    """
+    The ``http_get`` arguments of :meth:`LinkQueriesMixin.get_link_info_by_link_id`.
+    """
+    return dict(url=f"{endpoint}/links/{link_id}")
+
+
+def _get_link_info_by_path_request(
+    endpoint: str,
+    hostname: str,
+    path: str,
+) -> T_KWARGS:
+    """
+    The ``http_get`` arguments of :meth:`LinkQueriesMixin.get_link_info_by_path`.
+    """
+    params = {
+        "domain": hostname,
+        "path": path,
+    }
+    return dict(url=f"{endpoint}/links/expand", params=params)
+
+
+def _parse_get_link_info(response, raise_for_status: bool) -> T.Optional[Link]:
+    """
+    Read the response of :meth:`LinkQueriesMixin.get_link_info_by_link_id`
+    and :meth:`LinkQueriesMixin.get_link_info_by_path`.
+    """
+    if raise_for_status:
+        response.raise_for_status()
+    if response.status_code == 200:
+        return Link._from_api_data(response_json(response))
+    elif response.status_code == 404:
+        return None
+    else:  # pragma: no cover
+        raise NotImplementedError("Unexpected response code")
+
+
+def _list_links_by_original_url_request(
+    endpoint: str,
+    hostname: str,
+    original_url: str,
+) -> T_KWARGS:
+    """
+    The ``http_get`` arguments of
+    :meth:`LinkQueriesMixin.list_links_by_original_url`.
+    """
+    params = {
+        "domain": hostname,
+        "originalURL": original_url,
+    }
+    return dict(url=f"{endpoint}/links/multiple-by-url", params=params)
+
+
+def _parse_list_links_by_original_url(
+    response,
+    raise_for_status: bool,
+) -> list[Link]:
+    if raise_for_status:
+        response.raise_for_status()
+    if response.status_code == 200:
+        return [Link._from_api_data(dct) for dct in response_json(response).get("links", [])]
+    elif response.status_code == 404:
+        return []
+    else:  # pragma: no cover
+        raise NotImplementedError("Unexpected response code")
+
+
+def _list_folders_request(endpoint: str, domain_id: int) -> T_KWARGS:
+    """
+    The ``http_get`` arguments of :meth:`LinkQueriesMixin.list_folders`.
+    """
+    return dict(url=f"{endpoint}/links/folders/{domain_id}")
+
+
+def _parse_list_folders(response, raise_for_status: bool) -> list[Folder]:
+    if raise_for_status:
+        response.raise_for_status()
+    if response.status_code == 200:
+        return [
+            Folder._from_api_data(dct) for dct in response_json(response).get("linkFolders", [])
+        ]
+    else:  # pragma: no cover
+        raise NotImplementedError("Unexpected response code")
+
+
+def _get_folder_request(endpoint: str, domain_id: int, folder_id: str) -> T_KWARGS:
+    """
+    The ``http_get`` arguments of :meth:`LinkQueriesMixin.get_folder`.
+    """
+    return dict(url=f"{endpoint}/links/folders/{domain_id}/{folder_id}")
+
+
+def _parse_get_folder(response, raise_for_status: bool) -> T.Optional[Folder]:
+    if raise_for_status:  # pragma: no cover
+        response.raise_for_status()
+    if response.status_code == 200:
+        data = response_json(response)
+        if data is None:
+            return None
+        else:
+            return Folder._from_api_data(data)
+    elif response.status_code == 404:  # pragma: no cover
+        return None
+    else:  # pragma: no cover
+        raise NotImplementedError("Unexpected response code")
+
+
+def _create_folder_data(
+    domain_id: int,
+    name: str,
+    color: str = NA,
+    background_color: str = NA,
+    logo_url: str = NA,
+    logo_height: str = NA,
+    logo_width: str = NA,
+    ec_level: str = NA,
+    integration_fb: str = NA,
+    integration_ga: str = NA,
+    integration_gtm: str = NA,
+    integration_adroll: str = NA,
+    utm_campaign: str = NA,
+    utm_medium: str = NA,
+    utm_source: str = NA,
+    redirect_type: int = NA,
+    expires_at_days: int = NA,
+    icon: str = NA,
+    prefix: str = NA,
+) -> T_KWARGS:
+    """
+    Build the ``POST /links/folders`` request body from the
+    :meth:`LinkQueriesMixin.create_folder` arguments.
+    """
+    data = {
+        "domainId": domain_id,
+        "name": name,
+        "color": color,
+        "backgroundColor": background_color,
+        "logoUrl": logo_url,
+        "logoHeight": logo_height,
+        "logoWidth": logo_width,
+        "ecLevel": ec_level,
+        "integrationFB": integration_fb,
+        "integrationGA": integration_ga,
+        "integrationGTM": integration_gtm,
+        "integrationAdroll": integration_adroll,
+        "utmCampaign": utm_campaign,
+        "utmMedium": utm_medium,
+        "utmSource": utm_source,
+        "redirectType": redirect_type,
+        "expiresAtDays": expires_at_days,
+        "icon": icon,
+        "prefix": prefix,
+    }
+    return rm_na(**data)
+
+
+def _create_folder_request(endpoint: str, **kwargs) -> T_KWARGS:
+    """
+    The ``http_post`` arguments of :meth:`LinkQueriesMixin.create_folder`,
+    ``kwargs`` are the :func:`_create_folder_data` arguments.
+    """
+    return dict(url=f"{endpoint}/links/folders", data=_create_folder_data(**kwargs))
+
+
+def _parse_create_folder(response, raise_for_status: bool) -> T.Optional[Folder]:
+    if raise_for_status:  # pragma: no cover
+        response.raise_for_status()
+    if response.status_code in [200, 201]:
+        return Folder._from_api_data(response_json(response))
+    else:  # pragma: no cover
+        raise NotImplementedError("Unexpected response code")
+
+
 class LinkQueriesMixin:
     """
     Mixin class providing Link-related query methods for the Client.
@@ -70,6 +335,52 @@ class LinkQueriesMixin:
     providing a clean separation between data models and API operations.
     """
 
+    def _list_links_page(
+        self: "Client",
+        domain_id: int,
+        limit: T.Optional[int] = NA,
+        id_string: T.Optional[int] = NA,
+        create_at: T.Optional[datetime] = NA,
+        before_date: T.Optional[datetime] = NA,
+        after_date: T.Optional[datetime] = NA,
+        date_sort_order: T.Optional[str] = NA,
+        page_token: T.Optional[str] = NA,
+        folder_id: T.Optional[str] = NA,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+        lazy: bool = False,
+        table: bool = False,
+    ) -> Page:
+        """
+        Same as :meth:`list_links`, but returns a :class:`~pyshortio.paginator.Page`
+        that also carries the decoded response body.
+
+        :param lazy: Decode the links on access, see :mod:`pyshortio.lazy`
+        :param table: Read the links into a :class:`polars.DataFrame` with
+            :func:`~pyshortio.link_table.read_links_page`, the page ``result``
+            and ``data["links"]`` are this data frame, no
+            :class:`~pyshortio.model.Link` is created
+        """
+        response = self.http_get(
+            **_list_links_request(
+                endpoint=self.endpoint,
+                domain_id=domain_id,
+                limit=limit,
+                id_string=id_string,
+                create_at=create_at,
+                before_date=before_date,
+                after_date=after_date,
+                date_sort_order=date_sort_order,
+                page_token=page_token,
+                folder_id=folder_id,
+            )
+        )
+        return _parse_list_links_page(
+            response,
+            raise_for_status=raise_for_status,
+            lazy=lazy,
+            table=table,
+        )
+
     def list_links(
         self: "Client",
         domain_id: int,
@@ -109,30 +420,19 @@ class LinkQueriesMixin:
 
         - https://developers.short.io/reference/get_api-domains
         """
-        url = f"{self.endpoint}/api/links"
-        params = {
-            "domain_id": domain_id,
-            "limit": limit,
-            "idString": id_string,
-            "createdAt": create_at,
-            "beforeDate": before_date,
-            "afterDate": after_date,
-            "dateSortOrder": date_sort_order,
-            "pageToken": page_token,
-            "folderId": folder_id,
-        }
-        params = rm_na(**params)
-        response = self.http_get(
-            url=url,
-            params=params,
+        page = self._list_links_page(
+            domain_id=domain_id,
+            limit=limit,
+            id_string=id_string,
+            create_at=create_at,
+            before_date=before_date,
+            after_date=after_date,
+            date_sort_order=date_sort_order,
+            page_token=page_token,
+            folder_id=folder_id,
+            raise_for_status=raise_for_status,
         )
-        if raise_for_status:
-            response.raise_for_status()
-        if response.status_code == 200:
-            link_list = [Link(_data=dct) for dct in response.json().get("links", [])]
-        else:
-            raise NotImplementedError("Unexpected response code")
-        return response, link_list
+        return page.response, page.result
 
     def pagi_list_links(
         self: "Client",
@@ -144,9 +444,14 @@ class LinkQueriesMixin:
         after_date: T.Optional[datetime] = NA,
         date_sort_order: T.Optional[str] = NA,
         folder_id: T.Optional[str] = NA,
-        total_max_results: int = 9999,
+        total_max_results: T.Optional[int] = None,
         raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
-    ) -> T.Iterable[tuple[Response, list[Link]]]:
+        prefetch: int = 0,
+        checkpoint_store: T.Optional[BaseCheckpointStore] = None,
+        checkpoint_key: T.Optional[str] = None,
+        lazy: bool = False,
+        table: bool = False,
+    ) -> T.Iterable[Page]:
         """
         Auto-paginated version of list_link method.
 
@@ -159,9 +464,26 @@ class LinkQueriesMixin:
         >>>     for link in links:
         >>>         process_link(link)
 
+        Every page is a :class:`~pyshortio.paginator.Page`, it unpacks into
+        ``(response, links)`` and its body is decoded only once.
+
         .. note::
 
             This method automatically handles fetching subsequent pages until
+
+        :param total_max_results: Stop after the page that reaches this many
+            links, None means no limit
+        :param prefetch: If greater than 0, fetch up to this many pages ahead in
+            a background thread while the current page is being processed
+        :param checkpoint_store: If given, resume from the saved page token and
+            save the progress after each consumed page, see
+            :mod:`pyshortio.checkpoint`
+        :param checkpoint_key: The checkpoint key, derived from the query if
+            not given
+        :param lazy: Keep the raw page bytes and decode each link field on
+            access, requires ``msgspec``, see :mod:`pyshortio.lazy`
+        :param table: Yield the links of every page as a data frame, see
+            :mod:`pyshortio.link_table`
         """
 
         def get_next_token(res):
@@ -171,7 +493,7 @@ class LinkQueriesMixin:
             kwargs["page_token"] = next_token
 
         yield from _paginate(
-            method=self.list_links,
+            method=self._list_links_page,
             list_key="links",
             get_next_token=get_next_token,
             set_next_token=set_next_token,
@@ -185,10 +507,71 @@ class LinkQueriesMixin:
                 date_sort_order=date_sort_order,
                 folder_id=folder_id,
                 raise_for_status=raise_for_status,
+                lazy=lazy,
+                table=table,
             ),
             max_results=total_max_results,
+            prefetch=prefetch,
+            checkpoint_store=checkpoint_store,
+            checkpoint_key=checkpoint_key,
         )
 
+    def iter_links(
+        self: "Client",
+        domain_id: int,
+        limit: T.Optional[int] = 150,
+        before_date: T.Optional[datetime] = NA,
+        after_date: T.Optional[datetime] = NA,
+        date_sort_order: T.Optional[str] = NA,
+        folder_id: T.Optional[str] = NA,
+        max_results: T.Optional[int] = None,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+        prefetch: int = 0,
+        checkpoint_store: T.Optional[BaseCheckpointStore] = None,
+        checkpoint_key: T.Optional[str] = None,
+        lazy: bool = False,
+    ) -> T.Iterator[Link]:
+        """
+        Iterate over every link of a domain, one :class:`~pyshortio.model.Link`
+        at a time.
+
+        Only the current page, and the prefetched ones, are kept: a response
+        is released when the next page is fetched. Unlike
+        :meth:`pagi_list_links` there is no limit on the number of links by
+        default, so memory stays constant no matter how big the domain is.
+
+        >>> for link in client.iter_links(domain_id=45678):
+        >>>     process_link(link)
+
+        :param max_results: Stop after this many links, None means no limit
+        :param prefetch: See :meth:`pagi_list_links`
+        :param checkpoint_store: See :meth:`pagi_list_links`. Progress is saved
+            once all links of a page are consumed.
+        :param checkpoint_key: See :meth:`pagi_list_links`
+        :param lazy: See :meth:`pagi_list_links`
+        """
+        n = 0
+        for page in self.pagi_list_links(
+            domain_id=domain_id,
+            limit=limit,
+            before_date=before_date,
+            after_date=after_date,
+            date_sort_order=date_sort_order,
+            folder_id=folder_id,
+            total_max_results=max_results,
+            raise_for_status=raise_for_status,
+            prefetch=prefetch,
+            checkpoint_store=checkpoint_store,
+            checkpoint_key=checkpoint_key,
+            lazy=lazy,
+        ):
+            link_list = page.result
+            for link in link_list:
+                if max_results is not None and n >= max_results:
+                    return
+                n += 1
+                yield link
+
     def get_link_opengraph_properties(
         self: "Client",
         domain_id: int,
@@ -212,15 +595,16 @@ class LinkQueriesMixin:
 
         - https://developers.short.io/reference/get_links-opengraph-domainid-linkid
         """
-        url = f"https://api.short.io/links/opengraph/{domain_id}/{link_id}"
-        response = self.http_get(url=url)
-        if raise_for_status:
-            response.raise_for_status()
-        if response.status_code == 200:
-            result = response.json()
-        else:  # pragma: no cover
-            raise NotImplementedError("Unexpected response code")
-        return response, result
+        response = self.http_get(
+            **_get_link_opengraph_properties_request(
+                endpoint=self.endpoint,
+                domain_id=domain_id,
+                link_id=link_id,
+            )
+        )
+        return response, _parse_get_link_opengraph_properties(
+            response, raise_for_status
+        )
 
     def get_link_info_by_link_id(
         self: "Client",
@@ -249,17 +633,13 @@ class LinkQueriesMixin:
 
         - https://developers.short.io/reference/get_links-linkid
         """
-        url = f"{self.endpoint}/links/{link_id}"
-        response = self.http_get(url=url)
-        if raise_for_status:
-            response.raise_for_status()
-        if response.status_code == 200:
-            link = Link(_data=response.json())
-        elif response.status_code == 404:
-            link = None
-        else:  # pragma: no cover
-            raise NotImplementedError("Unexpected response code")
-        return response, link
+        response = self.http_get(
+            **_get_link_info_by_link_id_request(
+                endpoint=self.endpoint,
+                link_id=link_id,
+            )
+        )
+        return response, _parse_get_link_info(response, raise_for_status)
 
     def get_link_info_by_path(
         self: "Client",
@@ -293,21 +673,14 @@ class LinkQueriesMixin:
 
         - https://developers.short.io/reference/get_links-expand
         """
-        url = f"{self.endpoint}/links/expand"
-        params = {
-            "domain": hostname,
-            "path": path,
-        }
-        response = self.http_get(url=url, params=params)
-        if raise_for_status:
-            response.raise_for_status()
-        if response.status_code == 200:
-            link = Link(_data=response.json())
-        elif response.status_code == 404:
-            link = None
-        else:  # pragma: no cover
-            raise NotImplementedError("Unexpected response code")
-        return response, link
+        response = self.http_get(
+            **_get_link_info_by_path_request(
+                endpoint=self.endpoint,
+                hostname=hostname,
+                path=path,
+            )
+        )
+        return response, _parse_get_link_info(response, raise_for_status)
 
     def list_links_by_original_url(
         self: "Client",
@@ -340,21 +713,16 @@ class LinkQueriesMixin:
 
         - https://developers.short.io/reference/get_links-multiple-by-url
         """
-        url = f"{self.endpoint}/links/multiple-by-url"
-        params = {
-            "domain": hostname,
-            "originalURL": original_url,
-        }
-        response = self.http_get(url=url, params=params)
-        if raise_for_status:
-            response.raise_for_status()
-        if response.status_code == 200:
-            link_list = [Link(_data=dct) for dct in response.json().get("links", [])]
-        elif response.status_code == 404:
-            link_list = []
-        else:  # pragma: no cover
-            raise NotImplementedError("Unexpected response code")
-        return response, link_list
+        response = self.http_get(
+            **_list_links_by_original_url_request(
+                endpoint=self.endpoint,
+                hostname=hostname,
+                original_url=original_url,
+            )
+        )
+        return response, _parse_list_links_by_original_url(
+            response, raise_for_status
+        )
 
     def list_folders(
         self: "Client",
@@ -378,17 +746,10 @@ class LinkQueriesMixin:
 
         - https://developers.short.io/reference/get_links-folders-domainid
         """
-        url = f"{self.endpoint}/links/folders/{domain_id}"
-        response = self.http_get(url=url)
-        if raise_for_status:
-            response.raise_for_status()
-        if response.status_code == 200:
-            folder_list = [
-                Folder(_data=dct) for dct in response.json().get("linkFolders", [])
-            ]
-        else:
-            raise NotImplementedError("Unexpected response code")
-        return response, folder_list
+        response = self.http_get(
+            **_list_folders_request(endpoint=self.endpoint, domain_id=domain_id)
+        )
+        return response, _parse_list_folders(response, raise_for_status)
 
     def get_folder(
         self: "Client",
@@ -421,21 +782,14 @@ class LinkQueriesMixin:
 
         - https://developers.short.io/reference/get_links-folders-domainid-folderid
         """
-        url = f"{self.endpoint}/links/folders/{domain_id}/{folder_id}"
-        response = self.http_get(url=url)
-        if raise_for_status:  # pragma: no cover
-            response.raise_for_status()
-        if response.status_code == 200:
-            response_json = response.json()
-            if response_json is None:
-                folder = None
-            else:
-                folder = Folder(_data=response.json())
-        elif response.status_code == 404:  # pragma: no cover
-            folder = None
-        else:  # pragma: no cover
-            raise NotImplementedError("Unexpected response code")
-        return response, folder
+        response = self.http_get(
+            **_get_folder_request(
+                endpoint=self.endpoint,
+                domain_id=domain_id,
+                folder_id=folder_id,
+            )
+        )
+        return response, _parse_get_folder(response, raise_for_status)
 
     def list_folders(
         self: "Client",
@@ -459,17 +813,10 @@ class LinkQueriesMixin:
 
         - https://developers.short.io/reference/get_links-folders-domainid
         """
-        url = f"{self.endpoint}/links/folders/{domain_id}"
-        response = self.http_get(url=url)
-        if raise_for_status:
-            response.raise_for_status()
-        if response.status_code == 200:
-            folder_list = [
-                Folder(_data=dct) for dct in response.json().get("linkFolders", [])
-            ]
-        else:
-            raise NotImplementedError("Unexpected response code")
-        return response, folder_list
+        response = self.http_get(
+            **_list_folders_request(endpoint=self.endpoint, domain_id=domain_id)
+        )
+        return response, _parse_list_folders(response, raise_for_status)
 
     def create_folder(
         self: "Client",
@@ -501,34 +848,28 @@ class LinkQueriesMixin:
 
         - https://developers.short.io/reference/post_links-folders
         """
-        url = f"{self.endpoint}/links/folders"
-        data = {
-            "domainId": domain_id,
-            "name": name,
-            "color": color,
-            "backgroundColor": background_color,
-            "logoUrl": logo_url,
-            "logoHeight": logo_height,
-            "logoWidth": logo_width,
-            "ecLevel": ec_level,
-            "integrationFB": integration_fb,
-            "integrationGA": integration_ga,
-            "integrationGTM": integration_gtm,
-            "integrationAdroll": integration_adroll,
-            "utmCampaign": utm_campaign,
-            "utmMedium": utm_medium,
-            "utmSource": utm_source,
-            "redirectType": redirect_type,
-            "expiresAtDays": expires_at_days,
-            "icon": icon,
-            "prefix": prefix,
-        }
-        data = rm_na(**data)
-        response = self.http_post(url=url, data=data)
-        if raise_for_status:  # pragma: no cover
-            response.raise_for_status()
-        if response.status_code in [200, 201]:
-            folder = Folder(_data=response.json())
-        else:  # pragma: no cover
-            raise NotImplementedError("Unexpected response code")
-        return response, folder
+        response = self.http_post(
+            **_create_folder_request(
+                endpoint=self.endpoint,
+                domain_id=domain_id,
+                name=name,
+                color=color,
+                background_color=background_color,
+                logo_url=logo_url,
+                logo_height=logo_height,
+                logo_width=logo_width,
+                ec_level=ec_level,
+                integration_fb=integration_fb,
+                integration_ga=integration_ga,
+                integration_gtm=integration_gtm,
+                integration_adroll=integration_adroll,
+                utm_campaign=utm_campaign,
+                utm_medium=utm_medium,
+                utm_source=utm_source,
+                redirect_type=redirect_type,
+                expires_at_days=expires_at_days,
+                icon=icon,
+                prefix=prefix,
+            )
+        )
+        return response, _parse_create_folder(response, raise_for_status)
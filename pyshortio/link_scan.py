@@ -0,0 +1,546 @@
+# -*- coding: utf-8 -*-
+
+"""
+Parallel link scan for very large Short.io domains.
+
+:meth:`~pyshortio.link_queries.LinkQueriesMixin.pagi_list_links` has to walk a
+domain one page at a time, because each page needs the ``nextPageToken`` of
+the previous one. :meth:`LinkScanMixin.scan_links` splits the creation time
+range of the domain into windows instead, and paginates every window
+concurrently on a thread pool.
+
+How the windows are built:
+
+1. The oldest and the newest link are found by listing the domain oldest
+   first and newest first. The links without creation time are in no window,
+   the API sorts them together at one end of the order, so these two edge
+   scans read them until the first link that has a creation time, and they
+   are yielded first, see :class:`EdgeScan`.
+2. ``[oldest, newest]`` is split into ``n_windows`` half-open windows
+   ``[start, end)`` of equal duration, so every timestamp belongs to exactly
+   one window.
+3. Every window is listed in ascending creation time order. The query range is
+   padded by one millisecond and the links are filtered on the client side,
+   so the result doesn't depend on whether the API treats the date filters as
+   inclusive or exclusive.
+4. A window that is still not done after ``max_pages_per_window`` pages is
+   dense, the rest of it, starting from the last seen creation time, is split
+   in two new windows and scheduled again. Links that share the boundary
+   timestamp and were already returned are excluded from the new window.
+
+:meth:`LinkScanMixin.pagi_list_links_by_folder` (``scan_links(strategy="folder")``)
+splits the domain by folder instead, every folder is paginated concurrently,
+so reading the links in folders costs about as much as reading the largest
+folder. The API can't list only the links that are not in any folder, it
+lists them together with every other link, so this bucket is opt-in with
+``include_no_folder=True``. It is then read like a time scan of the whole
+domain, split in ``n_windows`` windows that run concurrently with the
+folders, and the links in a folder are dropped on the client side. It costs
+as many requests as a full walk of the domain on top of the folders, but not
+a sequential one.
+
+The window bookkeeping, :class:`ScanWindow`, :class:`WindowScan` and
+:class:`EdgeScan`, is shared
+with :mod:`pyshortio.async_link_scan`, the asyncio counterpart.
+"""
+
+import typing as T
+import dataclasses
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from .arg import NA
+from .type_hint import T_KWARGS
+from .constants import DEFAULT_RAISE_FOR_STATUS
+from .model import Link, Folder
+from .paginator import Page
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    from .client import Client
+
+_PAD = timedelta(milliseconds=1)
+
+
+@dataclasses.dataclass(frozen=True)
+class ScanWindow:
+    """
+    A half-open creation time window ``[start, end)`` of a link scan.
+
+    :param exclude_ids: Links in this window that were already returned
+    :param page_token: Continue the window from this page
+    """
+
+    start: datetime = dataclasses.field()
+    end: datetime = dataclasses.field()
+    exclude_ids: frozenset = dataclasses.field(default=frozenset())
+    page_token: T.Optional[str] = dataclasses.field(default=None)
+
+    def contains(self, link: Link) -> bool:
+        created_at = link.created_at
+        return (
+            created_at is not None
+            and self.start <= created_at < self.end
+            and link.id not in self.exclude_ids
+        )
+
+    def split(self, n: int) -> list["ScanWindow"]:
+        """
+        Split the window into ``n`` windows of equal duration, the
+        ``exclude_ids`` go to the first one.
+        """
+        step = (self.end - self.start) / n
+        if step < _PAD:
+            return [self]
+        windows = list()
+        for i in range(n):
+            start = self.start + step * i
+            end = self.end if i == n - 1 else self.start + step * (i + 1)
+            windows.append(
+                ScanWindow(
+                    start=start,
+                    end=end,
+                    exclude_ids=self.exclude_ids if i == 0 else frozenset(),
+                )
+            )
+        return windows
+
+
+@dataclasses.dataclass
+class WindowScan:
+    """
+    The progress of the scan of one :class:`ScanWindow`, page by page.
+
+    :param links: The links of the window read so far
+    :param page_token: The token of the next page
+    :param last_created_at: The creation time of the last link read so far
+    """
+
+    window: ScanWindow = dataclasses.field()
+    links: list[Link] = dataclasses.field(default_factory=list)
+    page_token: T.Optional[str] = dataclasses.field(default=None)
+    last_created_at: T.Optional[datetime] = dataclasses.field(default=None)
+
+    @classmethod
+    def start(cls, window: ScanWindow) -> "WindowScan":
+        return cls(window=window, page_token=window.page_token)
+
+    def list_links_kwargs(self) -> T_KWARGS:
+        """
+        The ``_list_links_page`` arguments of the next page, on top of the
+        domain, the page size and the folder.
+        """
+        return dict(
+            after_date=self.window.start - _PAD,
+            before_date=self.window.end + _PAD,
+            date_sort_order="asc",
+            page_token=NA if self.page_token is None else self.page_token,
+        )
+
+    def add_page(self, page: Page) -> bool:
+        """
+        Keep the links of the page that are in the window.
+
+        :return: True if it was the last page of the window
+        """
+        link_list = page.result
+        for link in link_list:
+            if self.window.contains(link):
+                self.links.append(link)
+        if len(link_list):
+            self.last_created_at = link_list[-1].created_at
+        self.page_token = page.data.get("nextPageToken")
+        return self.page_token is None
+
+    def rest(self) -> list[ScanWindow]:
+        """
+        The windows that still need to be scanned, once the window is dense.
+        """
+        window = self.window
+        last_created_at = self.last_created_at
+        if self.page_token is None:
+            return []
+        if (
+            last_created_at is None
+            or last_created_at <= window.start
+            or last_created_at >= window.end
+        ):
+            # no progress in time, e.g. a lot of links share one timestamp,
+            # keep paginating the same window
+            return [dataclasses.replace(window, page_token=self.page_token)]
+        exclude_ids = frozenset(
+            link.id for link in self.links if link.created_at == last_created_at
+        )
+        rest = ScanWindow(
+            start=last_created_at,
+            end=window.end,
+            exclude_ids=exclude_ids,
+        )
+        return rest.split(2)
+
+
+@dataclasses.dataclass
+class EdgeScan:
+    """
+    The progress of the walk of the links from one end of the creation time
+    order, until the first link that has a creation time.
+
+    :param date_sort_order: ``"asc"`` or ``"desc"``
+    :param links: The links without creation time read so far
+    :param created_at: The creation time of the first link that has one, the
+        oldest or the newest one
+    :param page_token: The token of the next page
+    """
+
+    date_sort_order: str = dataclasses.field()
+    links: list[Link] = dataclasses.field(default_factory=list)
+    created_at: T.Optional[datetime] = dataclasses.field(default=None)
+    page_token: T.Optional[str] = dataclasses.field(default=None)
+
+    def list_links_kwargs(self) -> T_KWARGS:
+        """
+        The ``_list_links_page`` arguments of the next page, on top of the
+        domain, the page size and the folder.
+        """
+        return dict(
+            date_sort_order=self.date_sort_order,
+            page_token=NA if self.page_token is None else self.page_token,
+        )
+
+    def add_page(self, page: Page) -> bool:
+        """
+        Keep the links of the page that have no creation time.
+
+        :return: True if the walk is done
+        """
+        for link in page.result:
+            if link.created_at is None:
+                self.links.append(link)
+            elif self.created_at is None:
+                self.created_at = link.created_at
+        self.page_token = page.data.get("nextPageToken")
+        return self.created_at is not None or self.page_token is None
+
+
+def _merge_edges(
+    edges: list[EdgeScan],
+) -> tuple[T.Optional[tuple[datetime, datetime]], list[Link]]:
+    """
+    Get the creation time range of the links, None if no link has one, and
+    the links without creation time, from the edge scans.
+    """
+    # when no link has a creation time, every edge scan reads every link
+    links = {link.id: link for edge in edges for link in edge.links}
+    created_at_list = [edge.created_at for edge in edges if edge.created_at is not None]
+    if len(created_at_list) == 0:
+        return None, list(links.values())
+    return (min(created_at_list), max(created_at_list)), list(links.values())
+
+
+def _get_initial_windows(
+    time_range: T.Optional[tuple[datetime, datetime]],
+    n_windows: int,
+) -> list[ScanWindow]:
+    """
+    Split the ``(oldest, newest)`` creation time range into ``n_windows``
+    windows, no window if there is no link.
+    """
+    if time_range is None:
+        return []
+    start, end = time_range
+    return ScanWindow(start=start, end=end + _PAD).split(n_windows)
+
+
+def _check_strategy(strategy: str, folder_id: T.Optional[str]):
+    """
+    Validate the ``scan_links`` strategy arguments.
+    """
+    if strategy == "folder":
+        if folder_id is not NA:
+            raise ValueError("folder_id is not supported by the folder strategy")
+    elif strategy != "time":
+        raise ValueError(f"unknown scan strategy {strategy!r}")
+
+
+def _select_no_folder_links(links: list[Link]) -> list[Link]:
+    return [link for link in links if link.folder_id is None]
+
+
+class LinkScanMixin:
+    """
+    Mixin class providing parallel link scan for the Client.
+    """
+
+    def _scan_edges(
+        self: "Client",
+        domain_id: int,
+        limit: int,
+        folder_id: T.Optional[str] = NA,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+    ) -> tuple[T.Optional[tuple[datetime, datetime]], list[Link]]:
+        """
+        Get the creation time of the oldest and the newest link, None if no
+        link has one, and the links without creation time, see
+        :class:`EdgeScan`.
+        """
+        edges = list()
+        for date_sort_order in ["asc", "desc"]:
+            edge = EdgeScan(date_sort_order=date_sort_order)
+            while True:
+                page = self._list_links_page(
+                    domain_id=domain_id,
+                    limit=limit,
+                    folder_id=folder_id,
+                    raise_for_status=raise_for_status,
+                    **edge.list_links_kwargs(),
+                )
+                if edge.add_page(page):
+                    break
+            edges.append(edge)
+        return _merge_edges(edges)
+
+    def _scan_window(
+        self: "Client",
+        domain_id: int,
+        window: ScanWindow,
+        limit: int,
+        max_pages_per_window: int,
+        folder_id: T.Optional[str] = NA,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+    ) -> tuple[list[Link], list[ScanWindow]]:
+        """
+        List up to ``max_pages_per_window`` pages of the window.
+
+        :return: the links in the window, and the windows that still need to
+            be scanned
+        """
+        scan = WindowScan.start(window)
+        for _ in range(max_pages_per_window):
+            page = self._list_links_page(
+                domain_id=domain_id,
+                limit=limit,
+                folder_id=folder_id,
+                raise_for_status=raise_for_status,
+                **scan.list_links_kwargs(),
+            )
+            if scan.add_page(page):
+                break
+        return scan.links, scan.rest()
+
+    def _list_folder_page(
+        self: "Client",
+        domain_id: int,
+        folder: Folder,
+        limit: int,
+        page_token: T.Optional[str] = None,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+    ) -> tuple[Folder, list[Link], T.Optional[str]]:
+        """
+        List one page of a folder.
+
+        :return: the folder, the links and the next page token
+        """
+        page = self._list_links_page(
+            domain_id=domain_id,
+            limit=limit,
+            page_token=NA if page_token is None else page_token,
+            folder_id=folder.id,
+            raise_for_status=raise_for_status,
+        )
+        next_token = page.data.get("nextPageToken")
+        return folder, page.result, next_token
+
+    def _scan_no_folder_window(
+        self: "Client",
+        domain_id: int,
+        window: ScanWindow,
+        limit: int,
+        max_pages_per_window: int,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+    ) -> tuple[None, list[Link], list[ScanWindow]]:
+        """
+        Scan a time window of the whole domain and keep the links that are
+        not in any folder, see :meth:`_scan_window`.
+
+        :return: None as the folder, the links, and the windows that still
+            need to be scanned
+        """
+        links, rest = self._scan_window(
+            domain_id=domain_id,
+            window=window,
+            limit=limit,
+            max_pages_per_window=max_pages_per_window,
+            raise_for_status=raise_for_status,
+        )
+        return None, _select_no_folder_links(links), rest
+
+    def pagi_list_links_by_folder(
+        self: "Client",
+        domain_id: int,
+        max_workers: int = 8,
+        limit: int = 150,
+        include_no_folder: bool = False,
+        n_windows: int = 8,
+        max_pages_per_window: int = 10,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+    ) -> T.Iterable[tuple[T.Optional[Folder], list[Link]]]:
+        """
+        List all folders of the domain, then paginate every folder concurrently.
+
+        Pages of different folders are interleaved, pages of the same folder
+        come in order.
+
+        >>> for folder, links in client.pagi_list_links_by_folder(domain_id=45678):
+        >>>     for link in links:
+        >>>         process_link(folder.name, link)
+
+        :param domain_id: The domain ID to list
+        :param max_workers: The number of threads, the client's
+            ``pool_maxsize`` should be at least this number
+        :param limit: The page size
+        :param include_no_folder: Whether to also list the links that are not
+            in any folder, yielded with ``folder = None``. The API can only
+            list them together with every other link, so they are read by a
+            time scan of the whole domain, see :mod:`pyshortio.link_scan`.
+        :param n_windows: The number of initial time windows of the links that
+            are not in any folder
+        :param max_pages_per_window: See :meth:`scan_links`
+        """
+        _, folder_list = self.list_folders(
+            domain_id=domain_id,
+            raise_for_status=raise_for_status,
+        )
+        windows = list()
+        no_time_links = list()
+        if include_no_folder:
+            time_range, no_time_links = self._scan_edges(
+                domain_id=domain_id,
+                limit=limit,
+                raise_for_status=raise_for_status,
+            )
+            windows = _get_initial_windows(time_range, n_windows)
+            no_time_links = _select_no_folder_links(no_time_links)
+
+        def submit(folder: Folder, page_token: T.Optional[str] = None):
+            return executor.submit(
+                self._list_folder_page,
+                domain_id=domain_id,
+                folder=folder,
+                limit=limit,
+                page_token=page_token,
+                raise_for_status=raise_for_status,
+            )
+
+        def submit_window(window: ScanWindow):
+            return executor.submit(
+                self._scan_no_folder_window,
+                domain_id=domain_id,
+                window=window,
+                limit=limit,
+                max_pages_per_window=max_pages_per_window,
+                raise_for_status=raise_for_status,
+            )
+
+        if no_time_links:
+            yield None, no_time_links
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            pending = {submit(folder) for folder in folder_list}
+            pending.update(submit_window(window) for window in windows)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    folder, link_list, rest = future.result()
+                    if folder is None:
+                        for window in rest:
+                            pending.add(submit_window(window))
+                    elif rest is not None:
+                        pending.add(submit(folder, rest))
+                    yield folder, link_list
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def scan_links(
+        self: "Client",
+        domain_id: int,
+        n_windows: int = 8,
+        max_workers: int = 8,
+        limit: int = 150,
+        max_pages_per_window: int = 10,
+        folder_id: T.Optional[str] = NA,
+        strategy: str = "time",
+        include_no_folder: bool = False,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+    ) -> T.Iterator[Link]:
+        """
+        List all links of a domain in parallel.
+        See :mod:`pyshortio.link_scan` for how it works.
+
+        Every link is yielded exactly once, in no particular order. The
+        ``"folder"`` strategy only yields the links in a folder, unless
+        ``include_no_folder`` is True.
+
+        >>> for link in client.scan_links(domain_id=45678, max_workers=16):
+        >>>     process_link(link)
+
+        :param domain_id: The domain ID to scan
+        :param strategy: ``"time"`` splits the domain by creation time windows,
+            ``"folder"`` splits it by folder, see
+            :meth:`pagi_list_links_by_folder`
+        :param n_windows: The number of initial time windows
+        :param max_workers: The number of threads, the client's
+            ``pool_maxsize`` should be at least this number
+        :param limit: The page size
+        :param max_pages_per_window: Split a window after this many pages
+        :param folder_id: Only scan links in this folder, only for the
+            ``"time"`` strategy
+        :param include_no_folder: Also yield the links that are not in any
+            folder, only for the ``"folder"`` strategy, see
+            :meth:`pagi_list_links_by_folder`
+        """
+        _check_strategy(strategy, folder_id)
+        if strategy == "folder":
+            for _, link_list in self.pagi_list_links_by_folder(
+                domain_id=domain_id,
+                max_workers=max_workers,
+                limit=limit,
+                include_no_folder=include_no_folder,
+                n_windows=n_windows,
+                max_pages_per_window=max_pages_per_window,
+                raise_for_status=raise_for_status,
+            ):
+                yield from link_list
+            return
+
+        time_range, no_time_links = self._scan_edges(
+            domain_id=domain_id,
+            limit=limit,
+            folder_id=folder_id,
+            raise_for_status=raise_for_status,
+        )
+        yield from no_time_links
+        windows = _get_initial_windows(time_range, n_windows)
+
+        def submit(window: ScanWindow):
+            return executor.submit(
+                self._scan_window,
+                domain_id=domain_id,
+                window=window,
+                limit=limit,
+                max_pages_per_window=max_pages_per_window,
+                folder_id=folder_id,
+                raise_for_status=raise_for_status,
+            )
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            pending = {submit(window) for window in windows}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    links, rest = future.result()
+                    for window in rest:
+                        pending.add(submit(window))
+                    yield from links
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
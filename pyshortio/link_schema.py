@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+
+"""
+The declarative link field schema.
+
+:data:`LINK_FIELDS` is the single source of truth for how a link field is
+named in Python (request arguments, TSV columns), in the request JSON body and
+in the API response, and which endpoints accept it. Every path that maps link
+fields uses it:
+
+- the request bodies of ``create_link``, ``batch_create_links`` and
+  ``update_link``
+- the export rows and the :class:`~pyshortio.link_table.LinkTable` columns
+- the sync fingerprint data
+
+The encoders and decoders are specialized Python functions generated from the
+schema at import time, a flat sequence of ``dict.get`` calls and identity
+checks, instead of a dict literal per call filtered through
+:func:`~pyshortio.arg.rm_na`.
+"""
+
+import typing as T
+import dataclasses
+
+from .arg import NA
+from .utils import datetime_to_iso_string
+
+
+@dataclasses.dataclass(frozen=True)
+class LinkField:
+    """
+    One link field.
+
+    :param name: The Python name, used by request arguments and TSV columns
+    :param key: The request JSON key, None if the field is read only
+    :param read_key: The response JSON key
+    :param attr: The :class:`~pyshortio.model.Link` property name
+    :param dtype: The ``polars`` data type name of the
+        :class:`~pyshortio.link_table.LinkTable` column
+    :param is_datetime: The request value is a datetime sent as ISO 8601
+    :param create: Accepted by ``create_link``
+    :param batch: Accepted per link by ``batch_create_links``
+    :param update: Accepted by ``update_link``
+    """
+
+    name: str = dataclasses.field()
+    key: T.Optional[str] = dataclasses.field()
+    read_key: T.Optional[str] = dataclasses.field()
+    attr: T.Optional[str] = dataclasses.field()
+    dtype: str = dataclasses.field(default="Utf8")
+    is_datetime: bool = dataclasses.field(default=False)
+    create: bool = dataclasses.field(default=False)
+    batch: bool = dataclasses.field(default=False)
+    update: bool = dataclasses.field(default=False)
+
+
+def _writable(name: str, key: str, dtype: str = "Utf8", **kwargs) -> LinkField:
+    """
+    A field accepted by every create and update endpoint, it has the same
+    name everywhere.
+    """
+    params = dict(
+        name=name,
+        key=key,
+        read_key=key,
+        attr=name,
+        dtype=dtype,
+        create=True,
+        batch=True,
+        update=True,
+    )
+    params.update(kwargs)
+    return LinkField(**params)
+
+
+def _read_only(name: str, read_key: str, dtype: str = "Utf8", **kwargs) -> LinkField:
+    """
+    A field that is only returned by the API.
+    """
+    return LinkField(
+        name=name,
+        key=None,
+        read_key=read_key,
+        attr=name,
+        dtype=dtype,
+        **kwargs,
+    )
+
+
+LINK_FIELDS: list[LinkField] = [
+    _read_only("id", "id"),
+    _read_only("id_string", "idString"),
+    _read_only("short_url", "shortURL"),
+    _read_only("secure_short_url", "secureShortURL"),
+    _writable("original_url", "originalURL"),
+    _writable("title", "title"),
+    _writable("path", "path"),
+    _writable("tags", "tags", dtype="List(Utf8)"),
+    # the request key is ``folderId`` but the response key is ``FolderId``,
+    # it can't be changed by update and is given per request by batch create
+    LinkField(
+        name="folder_id",
+        key="folderId",
+        read_key="FolderId",
+        attr="folder_id",
+        create=True,
+    ),
+    _read_only("domain_id", "DomainId", dtype="Int64"),
+    _read_only("owner_id", "OwnerId", dtype="Int64"),
+    _writable("cloaking", "cloaking", dtype="Boolean"),
+    _writable("password", "password"),
+    _writable("password_contact", "passwordContact", dtype="Boolean"),
+    _read_only("has_password", "hasPassword", dtype="Boolean"),
+    _writable("redirect_type", "redirectType"),
+    _writable("ttl", "ttl", is_datetime=True),
+    _writable("expire_at", "expiresAt", attr="expires_at", is_datetime=True),
+    _writable("expire_url", "expiredURL", attr="expired_url"),
+    _writable("utm_source", "utmSource"),
+    _writable("utm_medium", "utmMedium"),
+    _writable("utm_campaign", "utmCampaign"),
+    _writable("utm_term", "utmTerm"),
+    _writable("utm_content", "utmContent"),
+    _writable("android_url", "androidURL"),
+    _writable("iphone_url", "iphoneURL"),
+    _writable("clicks_limit", "clicksLimit", dtype="Int64"),
+    _writable("skip_qs", "skipQS", dtype="Boolean"),
+    _writable("archived", "archived", dtype="Boolean"),
+    _writable("split_url", "splitURL"),
+    _writable("split_percent", "splitPercent", dtype="Int64"),
+    _writable("integration_adroll", "integrationAdroll"),
+    _writable("integration_fb", "integrationFB"),
+    _writable("integration_ga", "integrationGA"),
+    _writable("integration_gtm", "integrationGTM"),
+    _writable("created_at", "createdAt", is_datetime=True),
+    _read_only("updated_at", "updatedAt"),
+    # a request only flag, it is not returned by the API
+    LinkField(
+        name="allow_duplicates",
+        key="allowDuplicates",
+        read_key=None,
+        attr=None,
+        dtype="Boolean",
+        create=True,
+        batch=True,
+    ),
+]
+
+FIELDS_BY_NAME: dict[str, LinkField] = {field.name: field for field in LINK_FIELDS}
+
+CREATE_FIELDS = [field for field in LINK_FIELDS if field.create]
+BATCH_FIELDS = [field for field in LINK_FIELDS if field.batch]
+UPDATE_FIELDS = [field for field in LINK_FIELDS if field.update]
+
+UPDATE_FIELD_NAMES = frozenset(field.name for field in UPDATE_FIELDS)
+"""
+The link data keys accepted by ``update_link``.
+"""
+
+
+def _compile(func_name: str, source: str, namespace: dict[str, T.Any]) -> T.Callable:
+    code = compile(source, f"<pyshortio.link_schema.{func_name}>", "exec")
+    exec(code, namespace)
+    return namespace[func_name]
+
+
+def compile_encoder(
+    func_name: str,
+    fields: list[LinkField],
+    required: T.Iterable[str] = (),
+) -> T.Callable[[T.Mapping[str, T.Any]], dict[str, T.Any]]:
+    """
+    Generate a function that converts a ``{name: value}`` mapping, e.g. the
+    keyword arguments of an API method or one link of a batch, into a request
+    body.
+
+    Missing and ``NA`` values are skipped, unknown keys are ignored, datetime
+    values are converted to ISO 8601 strings. ``required`` names raise
+    ``KeyError`` when missing.
+    """
+    required = set(required)
+    lines = [
+        f"def {func_name}(src, _NA=NA, _iso=datetime_to_iso_string):",
+        "    get = src.get",
+        "    data = {}",
+    ]
+    for field in fields:
+        value = "_iso(v)" if field.is_datetime else "v"
+        if field.name in required:
+            lines.append(f"    v = src[{field.name!r}]")
+        else:
+            lines.append(f"    v = get({field.name!r}, _NA)")
+        lines.append(f"    if v is not _NA:")
+        lines.append(f"        data[{field.key!r}] = {value}")
+    lines.append("    return data")
+    return _compile(
+        func_name,
+        "\n".join(lines),
+        {"NA": NA, "datetime_to_iso_string": datetime_to_iso_string},
+    )
+
+
+def read_expr(name: str) -> str:
+    """
+    The source code that reads the field ``name`` from an API response, for
+    :func:`compile_decoder`.
+    """
+    return f"get({FIELDS_BY_NAME[name].read_key!r})"
+
+
+def compile_decoder(
+    func_name: str,
+    columns: list[tuple[str, str]],
+    args: T.Iterable[str] = (),
+) -> T.Callable[..., dict[str, T.Any]]:
+    """
+    Generate a function that converts the raw API data of a link into a
+    ``{column: value}`` dict with one dict display, in column order.
+
+    :param columns: ``(column, expression)`` pairs, in the expressions ``get``
+        is ``data.get``, see :func:`read_expr`
+    :param args: Extra arguments of the generated function
+    """
+    params = ", ".join(["data", *args])
+    lines = [
+        f"def {func_name}({params}):",
+        "    get = data.get",
+        "    return {",
+    ]
+    for column, expr in columns:
+        lines.append(f"        {column!r}: {expr},")
+    lines.append("    }")
+    return _compile(func_name, "\n".join(lines), {})
+
+
+def read_columns(names: T.Iterable[str]) -> list[tuple[str, str]]:
+    """
+    ``(name, expression)`` pairs that read the fields as they are.
+    """
+    return [(name, read_expr(name)) for name in names]
+
+
+encode_create_link = compile_encoder(
+    "encode_create_link",
+    CREATE_FIELDS,
+    required=["original_url"],
+)
+"""
+Build the ``POST /links`` body, without the ``domain``.
+"""
+
+encode_batch_link = compile_encoder(
+    "encode_batch_link",
+    BATCH_FIELDS,
+    required=["original_url"],
+)
+"""
+Build one item of the ``POST /links/bulk`` body.
+"""
+
+encode_update_link = compile_encoder(
+    "encode_update_link",
+    UPDATE_FIELDS,
+)
+"""
+Build the ``POST /links/{link_id}`` body.
+"""
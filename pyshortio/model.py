@@ -28,13 +28,22 @@ information across different model types.
 These models are designed to be instantiated by the API client methods, not directly
 by users of the library. They provide a Pythonic interface to the JSON data returned
 by the Short.io API.
+
+The models use ``__slots__``, so an instance has no per-instance ``__dict__``, and
+the client builds them with :meth:`BaseModel._from_api_data`, which skips the
+validation, because API payloads are trusted. This keeps a scan of 100k+ links
+cheap in both time and memory.
+
+Datetime properties are parsed on first access and cached in their own slot,
+sorting or filtering by ``created_at`` doesn't parse the same string again.
+Use :func:`parse_created_at` to parse the ``created_at`` of a whole page in
+one pass.
 """
 
 import typing as T
 import json
 import dataclasses
 from datetime import datetime
-from functools import cached_property
 
 from .exc import ParamError
 from .arg import REQ, _REQUIRED, rm_na, T_KWARGS
@@ -42,6 +51,23 @@ from .arg import REQ, _REQUIRED, rm_na, T_KWARGS
 T_RESPONSE = T.Dict[str, T.Any]
 
 
+def _parse_datetime(value: T.Any) -> T.Optional[datetime]:
+    """
+    Parse a datetime value of the API, an ISO 8601 string or a unix timestamp.
+    """
+    if value:
+        try:
+            # Check if it's a string format that needs conversion
+            if isinstance(value, str):
+                return datetime.fromisoformat(value.replace("Z", "+00:00"))
+            # If it's a timestamp
+            elif isinstance(value, (int, float)):
+                return datetime.fromtimestamp(value)
+        except (ValueError, TypeError):  # pragma: no cover
+            pass
+    return None
+
+
 @dataclasses.dataclass
 class BaseModel:
     """
@@ -59,6 +85,8 @@ class BaseModel:
     to manage required vs. optional fields in a dataclass-friendly way.
     """
 
+    __slots__ = ()
+
     def _validate(self):
         """
         Validate that all required fields have values.
@@ -72,6 +100,16 @@ class BaseModel:
     def __post_init__(self):
         self._validate()
 
+    @classmethod
+    def _from_api_data(cls, _data: T_RESPONSE):
+        """
+        Trusted constructor for payloads returned by the Short.io API, it skips
+        ``__init__`` and the validation.
+        """
+        obj = cls.__new__(cls)
+        obj._data = _data
+        return obj
+
     @classmethod
     def _split_req_opt(
         cls, kwargs: T_KWARGS
@@ -84,7 +122,10 @@ class BaseModel:
         """
         req_kwargs, opt_kwargs = dict(), dict()
         for field in dataclasses.fields(cls):
-            if isinstance(field.default, _REQUIRED):
+            if isinstance(field.default, _REQUIRED) or (
+                field.default is dataclasses.MISSING
+                and field.default_factory is dataclasses.MISSING
+            ):
                 try:
                     req_kwargs[field.name] = kwargs[field.name]
                 except KeyError:
@@ -129,7 +170,16 @@ class Domain(BaseModel):
     - https://developers.short.io/reference/post_domains
     """
 
-    _data: dict[str, T.Any] = dataclasses.field(default=REQ)
+    # the other slots cache the parsed datetime properties
+    __slots__ = (
+        "_data",
+        "_created_at",
+        "_updated_at",
+        "_ssl_cert_expiration_date",
+    )
+
+    # no default value, a default would conflict with the slot
+    _data: dict[str, T.Any]
 
     @property
     def id(self) -> T.Optional[int]:  # pragma: no cover
@@ -148,26 +198,20 @@ class Domain(BaseModel):
         return self._data.get("state")
 
     @property
-    def created_at(self) -> T.Optional[datetime]:  # pragma: no cover
-        created_at_str = self._data.get("createdAt")
-        if created_at_str:
-            try:
-                return datetime.fromisoformat(created_at_str.replace("Z", "+00:00"))
-            except (ValueError, TypeError):  # pragma: no cover
-                pass
-        else:  # pragma: no cover
-            return None
+    def created_at(self) -> T.Optional[datetime]:
+        try:
+            return self._created_at
+        except AttributeError:
+            self._created_at = _parse_datetime(self._data.get("createdAt"))
+            return self._created_at
 
     @property
-    def updated_at(self) -> T.Optional[datetime]:  # pragma: no cover
-        updated_at_str = self._data.get("updatedAt")
-        if updated_at_str:
-            try:
-                return datetime.fromisoformat(updated_at_str.replace("Z", "+00:00"))
-            except (ValueError, TypeError):  # pragma: no cover
-                pass
-        else:  # pragma: no cover
-            return None
+    def updated_at(self) -> T.Optional[datetime]:
+        try:
+            return self._updated_at
+        except AttributeError:
+            self._updated_at = _parse_datetime(self._data.get("updatedAt"))
+            return self._updated_at
 
     @property
     def team_id(self) -> T.Optional[int]:  # pragma: no cover
@@ -250,17 +294,14 @@ class Domain(BaseModel):
         return self._data.get("robots")
 
     @property
-    def ssl_cert_expiration_date(self) -> T.Optional[datetime]:  # pragma: no cover
-        expiration_date_str = self._data.get("sslCertExpirationDate")
-        if expiration_date_str:
-            try:
-                return datetime.fromisoformat(
-                    expiration_date_str.replace("Z", "+00:00")
-                )
-            except (ValueError, TypeError):  # pragma: no cover
-                pass
-        else:  # pragma: no cover
-            return None
+    def ssl_cert_expiration_date(self) -> T.Optional[datetime]:
+        try:
+            return self._ssl_cert_expiration_date
+        except AttributeError:
+            self._ssl_cert_expiration_date = _parse_datetime(
+                self._data.get("sslCertExpirationDate")
+            )
+            return self._ssl_cert_expiration_date
 
     @property
     def ssl_cert_installed_success(self) -> T.Optional[bool]:  # pragma: no cover
@@ -325,7 +366,10 @@ class Link(BaseModel):
     - https://developers.short.io/reference/get_api-links
     """
 
-    _data: dict[str, T.Any] = dataclasses.field(default=REQ)
+    # the other slots cache the parsed datetime properties
+    __slots__ = ("_data", "_created_at", "_updated_at")
+
+    _data: dict[str, T.Any]
 
     @property
     def original_url(self) -> T.Optional[str]:  # pragma: no cover
@@ -392,19 +436,20 @@ class Link(BaseModel):
         return self._data.get("iphoneURL")
 
     @property
-    def created_at(self) -> T.Optional[datetime]:  # pragma: no cover
-        created_at_val = self._data.get("createdAt")
-        if created_at_val:
-            try:
-                # Check if it's a string format that needs conversion
-                if isinstance(created_at_val, str):
-                    return datetime.fromisoformat(created_at_val.replace("Z", "+00:00"))
-                # If it's a timestamp
-                elif isinstance(created_at_val, (int, float)):
-                    return datetime.fromtimestamp(created_at_val)
-            except (ValueError, TypeError):  # pragma: no cover
-                pass
-        return None
+    def created_at(self) -> T.Optional[datetime]:
+        try:
+            return self._created_at
+        except AttributeError:
+            self._created_at = _parse_datetime(self._data.get("createdAt"))
+            return self._created_at
+
+    @property
+    def updated_at(self) -> T.Optional[datetime]:
+        try:
+            return self._updated_at
+        except AttributeError:
+            self._updated_at = _parse_datetime(self._data.get("updatedAt"))
+            return self._updated_at
 
     @property
     def clicks_limit(self) -> T.Optional[int]:  # pragma: no cover
@@ -539,7 +584,9 @@ class Folder(BaseModel):
     for accessing specific attributes.
     """
 
-    _data: dict[str, T.Any] = dataclasses.field(default=REQ)
+    __slots__ = ("_data",)
+
+    _data: dict[str, T.Any]
 
     @property
     def domain_id(self) -> T.Optional[int]:  # pragma: no cover
@@ -560,3 +607,34 @@ class Folder(BaseModel):
             "id": self.id,
             "name": self.name,
         }
+
+
+def parse_created_at(links: T.Iterable[Link]) -> list[T.Optional[datetime]]:
+    """
+    Parse the ``created_at`` of many links in one pass and cache it on every
+    link, so later sorting and filtering never parses again.
+
+    Links created in the same bulk request share the same timestamp string,
+    every distinct string is parsed only once.
+
+    >>> _, links = client.list_links(domain_id=45678)
+    >>> parse_created_at(links)
+    >>> links.sort(key=lambda link: link.created_at)
+    """
+    memo: dict[T.Any, T.Optional[datetime]] = dict()
+    created_at_list = list()
+    for link in links:
+        try:
+            created_at = link._created_at
+        except AttributeError:
+            value = link._data.get("createdAt")
+            try:
+                created_at = memo[value]
+            except KeyError:
+                created_at = memo[value] = _parse_datetime(value)
+            except TypeError:  # pragma: no cover
+                # unhashable value
+                created_at = _parse_datetime(value)
+            link._created_at = created_at
+        created_at_list.append(created_at)
+    return created_at_list
@@ -10,6 +10,250 @@ specific API endpoints while accommodating different pagination implementations.
 """
 
 import typing as T
+import queue
+import asyncio
+import threading
+import dataclasses
+
+from .checkpoint import Checkpoint, BaseCheckpointStore, make_checkpoint_key
+from .json_backend import response_json
+
+
+@dataclasses.dataclass
+class Page:
+    """
+    One page returned by a list API call.
+
+    It carries the decoded response body next to the Pythonic result, so the
+    paginator reads the item count and the next page token without decoding
+    the body again. It unpacks like the ``(response, result)`` tuple returned
+    by the list methods:
+
+    .. code-block:: python
+
+        for response, link_list in client.pagi_list_links(domain_id=45678):
+            ...
+
+    :param response: The raw HTTP response
+    :param data: The decoded JSON body of the response
+    :param result: The method-specific result, e.g. a list of Link objects
+    """
+
+    response: T.Any = dataclasses.field()
+    data: T.Any = dataclasses.field()
+    result: T.Any = dataclasses.field()
+
+    def __iter__(self):
+        yield self.response
+        yield self.result
+
+
+def _get_page_data(page) -> tuple[T.Any, T.Any]:
+    """
+    Get the page to yield and its decoded body, ``page`` is either a
+    :class:`Page` or a ``(response, result)`` tuple.
+    """
+    if isinstance(page, Page):
+        return page, page.data
+    response, result = page
+    return (response, result), response_json(response)
+
+
+class _Done:
+    pass
+
+
+_DONE = _Done()
+
+
+class _Failure:
+    def __init__(self, error: Exception):
+        self.error = error
+
+
+def _prefetch(
+    iterable: T.Iterable,
+    prefetch: int,
+) -> T.Iterator:
+    """
+    Consume ``iterable`` in a background thread and yield its items, keeping
+    up to ``prefetch`` items ready ahead of the consumer.
+
+    - The queue between the two threads is bounded, so the background thread
+      never runs more than ``prefetch`` items ahead.
+    - If the background thread raises, the error is re-raised in the consumer
+      after all the items produced before it.
+    - If the consumer stops early (``break`` or ``close()``), the background
+      thread stops after the item it is currently producing.
+    """
+    q = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        iterator = iter(iterable)
+        try:
+            for item in iterator:
+                if put(item) is False:
+                    return
+            put(_DONE)
+        except Exception as e:
+            put(_Failure(e))
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    thread = threading.Thread(target=produce, name="pyshortio-prefetch", daemon=True)
+    thread.start()
+    try:
+        while 1:
+            item = q.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
+
+
+async def _aprefetch(
+    aiterable: T.AsyncIterable,
+    prefetch: int,
+) -> T.AsyncIterator:
+    """
+    The asyncio version of :func:`_prefetch`, ``aiterable`` is consumed by a
+    background task.
+    """
+    q = asyncio.Queue(maxsize=prefetch)
+
+    async def produce():
+        try:
+            async for item in aiterable:
+                await q.put(item)
+            await q.put(_DONE)
+        except Exception as e:
+            await q.put(_Failure(e))
+        finally:
+            aclose = getattr(aiterable, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    task = asyncio.ensure_future(produce())
+    try:
+        while 1:
+            item = await q.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    finally:
+        if task.done() is False:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+
+def _iter_pages(
+    method: T.Callable,
+    list_key: str,
+    get_next_token: T.Callable,
+    set_next_token: T.Callable,
+    kwargs: dict[str, T.Any],
+    max_results: T.Optional[int],
+    n: int = 0,
+):
+    """
+    Yield ``(page, n_items_so_far, next_token)``, ``next_token`` is None on
+    the last page.
+    """
+    while 1:
+        page, response_data = _get_page_data(method(**kwargs))
+        n += len(response_data.get(list_key, []))
+        if max_results is not None and n >= max_results:
+            next_token = None
+        else:
+            next_token = get_next_token(response_data)
+        yield page, n, next_token
+
+        if next_token is None:
+            break
+        else:
+            set_next_token(kwargs, next_token)
+
+
+async def _aiter_pages(
+    method: T.Callable[..., T.Awaitable],
+    list_key: str,
+    get_next_token: T.Callable,
+    set_next_token: T.Callable,
+    kwargs: dict[str, T.Any],
+    max_results: T.Optional[int],
+    n: int = 0,
+):
+    while 1:
+        page, response_data = _get_page_data(await method(**kwargs))
+        n += len(response_data.get(list_key, []))
+        if max_results is not None and n >= max_results:
+            next_token = None
+        else:
+            next_token = get_next_token(response_data)
+        yield page, n, next_token
+
+        if next_token is None:
+            break
+        else:
+            set_next_token(kwargs, next_token)
+
+
+def _resume(
+    method: T.Callable,
+    set_next_token: T.Callable,
+    kwargs: dict[str, T.Any],
+    checkpoint_store: T.Optional[BaseCheckpointStore],
+    checkpoint_key: T.Optional[str],
+) -> tuple[T.Optional[str], int]:
+    """
+    Apply the saved checkpoint to ``kwargs``.
+
+    :return: the checkpoint key and the number of items already consumed
+    """
+    if checkpoint_store is None:
+        return None, 0
+    if checkpoint_key is None:
+        checkpoint_key = make_checkpoint_key(method, kwargs)
+    checkpoint = checkpoint_store.load(checkpoint_key)
+    if checkpoint is None:
+        return checkpoint_key, 0
+    set_next_token(kwargs, checkpoint.next_token)
+    return checkpoint_key, checkpoint.n_items
+
+
+def _save_checkpoint(
+    checkpoint_store: BaseCheckpointStore,
+    checkpoint_key: str,
+    n: int,
+    next_token: T.Optional[str],
+):
+    if next_token is None:
+        checkpoint_store.delete(checkpoint_key)
+    else:
+        checkpoint_store.save(
+            checkpoint_key,
+            Checkpoint(next_token=next_token, n_items=n),
+        )
 
 
 def _paginate(
@@ -19,6 +263,9 @@ def _paginate(
     set_next_token: T.Callable,
     kwargs: T.Optional[dict[str, T.Any]] = None,
     max_results: T.Optional[int] = None,
+    prefetch: int = 0,
+    checkpoint_store: T.Optional[BaseCheckpointStore] = None,
+    checkpoint_key: T.Optional[str] = None,
 ) -> dict[str, T.Any]:
     """
     Convert a single API call into a generator that handles pagination.
@@ -60,28 +307,98 @@ def _paginate(
 
         Each yield produces the exact same return value structure as the original method
 
-    :param method: The original API method to call (e.g., list_link)
+    :param method: The original API method to call (e.g., list_link), it
+        returns either a :class:`Page` or a ``(response, result)`` tuple, the
+        body of the latter is decoded again to find the next page token
     :param list_key: The key in the response JSON that contains the list of items
     :param get_next_token: Function that extracts the next page token from a response
     :param set_next_token: Function that sets the next page token in the kwargs
     :param kwargs: Original kwargs to pass to the method
-    :param max_results: Total maximum results to return across all pages
+    :param max_results: Total maximum results to return across all pages,
+        None means no limit
+    :param prefetch: If greater than 0, fetch up to this many pages ahead in a
+        background thread while the caller is processing the current page,
+        so network time and processing time overlap
+    :param checkpoint_store: If given, resume from the saved checkpoint and
+        save the progress after each consumed page,
+        see :mod:`pyshortio.checkpoint`
+    :param checkpoint_key: The checkpoint key, derived from ``method`` and
+        ``kwargs`` if not given
     """
-    n = 0
     if kwargs is None: # pragma: no cover
         kwargs = {}
 
-    while 1:
-        response, result = method(**kwargs)
-        response_data = response.json()
-        n += len(response_data.get(list_key, []))
-        yield response, result
+    checkpoint_key, n = _resume(
+        method=method,
+        set_next_token=set_next_token,
+        kwargs=kwargs,
+        checkpoint_store=checkpoint_store,
+        checkpoint_key=checkpoint_key,
+    )
+    pages = _iter_pages(
+        method=method,
+        list_key=list_key,
+        get_next_token=get_next_token,
+        set_next_token=set_next_token,
+        kwargs=kwargs,
+        max_results=max_results,
+        n=n,
+    )
+    if prefetch > 0:
+        pages = _prefetch(pages, prefetch=prefetch)
+    for page, n, next_token in pages:
+        yield page
+        # the caller asks for the next page, so this one is consumed
+        if checkpoint_store is not None:
+            _save_checkpoint(checkpoint_store, checkpoint_key, n, next_token)
 
-        if n >= max_results: # pragma: no cover
-            break
 
-        next_token = get_next_token(response_data)
-        if next_token is None:
-            break
-        else:
-            set_next_token(kwargs, next_token)
\ No newline at end of file
+async def _apaginate(
+    method: T.Callable[..., T.Awaitable],
+    list_key: str,
+    get_next_token: T.Callable,
+    set_next_token: T.Callable,
+    kwargs: T.Optional[dict[str, T.Any]] = None,
+    max_results: T.Optional[int] = None,
+    prefetch: int = 0,
+    checkpoint_store: T.Optional[BaseCheckpointStore] = None,
+    checkpoint_key: T.Optional[str] = None,
+) -> T.AsyncIterator:
+    """
+    The asyncio version of :func:`_paginate`, ``method`` is a coroutine function
+    and the result is an async generator.
+
+    Example:
+
+    .. code-block:: python
+
+        async for response, link_list in async_client.pagi_list_links(domain_id):
+            ...
+
+    With ``prefetch > 0``, the pages are fetched ahead by a background task.
+    """
+    if kwargs is None:  # pragma: no cover
+        kwargs = {}
+
+    checkpoint_key, n = _resume(
+        method=method,
+        set_next_token=set_next_token,
+        kwargs=kwargs,
+        checkpoint_store=checkpoint_store,
+        checkpoint_key=checkpoint_key,
+    )
+    pages = _aiter_pages(
+        method=method,
+        list_key=list_key,
+        get_next_token=get_next_token,
+        set_next_token=set_next_token,
+        kwargs=kwargs,
+        max_results=max_results,
+        n=n,
+    )
+    if prefetch > 0:
+        pages = _aprefetch(pages, prefetch=prefetch)
+    async for page, n, next_token in pages:
+        yield page
+        if checkpoint_store is not None:
+            _save_checkpoint(checkpoint_store, checkpoint_key, n, next_token)
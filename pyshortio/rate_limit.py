@@ -0,0 +1,366 @@
+# -*- coding: utf-8 -*-
+
+"""
+Client side rate limiting for Short.io API calls.
+
+Short.io enforces per account request limits, when several workers share one
+API token they have to share the budget too. This module provides token
+buckets that can be shared by:
+
+- all threads of one process, :class:`TokenBucket`
+- all processes on one machine, :class:`FileTokenBucket`, the bucket state
+  lives in a small file guarded by an OS level file lock
+
+and a :class:`RateLimiter` that picks the bucket by endpoint, so read and bulk
+write endpoints are throttled independently:
+
+.. code-block:: python
+
+    from pyshortio.api import Client, RateLimiter
+
+    # shared by every process that uses the same lock_dir
+    rate_limiter = RateLimiter.new(
+        read_rate=20,
+        write_rate=1,
+        lock_dir="/tmp/pyshortio-rate-limit",
+    )
+    client = Client(token="...", rate_limiter=rate_limiter)
+"""
+
+import typing as T
+import os
+import sys
+import time
+import struct
+import asyncio
+import threading
+import dataclasses
+from pathlib import Path
+
+if sys.platform == "win32":  # pragma: no cover
+    import msvcrt
+
+    def _lock_file(f: T.BinaryIO):
+        f.seek(0)
+        while 1:
+            try:
+                # LK_LOCK gives up after 10 seconds
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                pass
+
+    def _unlock_file(f: T.BinaryIO):
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock_file(f: T.BinaryIO):
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+    def _unlock_file(f: T.BinaryIO):
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _refill(
+    tokens: float,
+    last: float,
+    now: float,
+    rate: float,
+    capacity: float,
+) -> float:
+    """
+    Return the number of tokens in the bucket at ``now``.
+    """
+    return min(capacity, tokens + max(0.0, now - last) * rate)
+
+
+def _check_tokens(tokens: float, capacity: float):
+    """
+    A bucket never holds more than ``capacity`` tokens, waiting for more
+    would never end.
+    """
+    if tokens > capacity:
+        raise ValueError(
+            f"can't take {tokens} tokens from a bucket of capacity {capacity}"
+        )
+
+
+class BaseBucket:
+    """
+    Base class of all token buckets.
+
+    Subclasses implement :meth:`try_acquire`, and :meth:`_atry_acquire` if
+    :meth:`try_acquire` may block.
+    """
+
+    def try_acquire(self, tokens: float = 1.0) -> float:  # pragma: no cover
+        """
+        Try to take ``tokens`` from the bucket without blocking.
+
+        :return: 0 if the tokens are taken, otherwise the number of seconds to
+            wait before the tokens are likely to be available
+
+        :raises ValueError: if ``tokens`` is more than the bucket capacity
+        """
+        raise NotImplementedError
+
+    async def _atry_acquire(self, tokens: float = 1.0) -> float:
+        """
+        Async version of :meth:`try_acquire`, it must not block the event loop.
+        """
+        return self.try_acquire(tokens)
+
+    def acquire(self, tokens: float = 1.0):
+        """
+        Block until ``tokens`` are taken from the bucket.
+        """
+        while 1:
+            wait = self.try_acquire(tokens)
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    async def aacquire(self, tokens: float = 1.0):
+        """
+        Wait until ``tokens`` are taken from the bucket without blocking the
+        event loop.
+        """
+        while 1:
+            wait = await self._atry_acquire(tokens)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+
+@dataclasses.dataclass
+class TokenBucket(BaseBucket):
+    """
+    Thread safe in-process token bucket.
+
+    :param rate: Tokens added per second, i.e. the sustained request rate
+    :param capacity: The maximum number of tokens, i.e. the allowed burst
+    """
+
+    rate: float = dataclasses.field()
+    capacity: float = dataclasses.field(default=1.0)
+
+    _tokens: float = dataclasses.field(default=None, init=False, repr=False)
+    _last: float = dataclasses.field(default=None, init=False, repr=False)
+    _lock: threading.Lock = dataclasses.field(
+        default_factory=threading.Lock,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def __post_init__(self):
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        _check_tokens(tokens, self.capacity)
+        with self._lock:
+            now = time.monotonic()
+            available = _refill(
+                self._tokens, self._last, now, self.rate, self.capacity
+            )
+            self._last = now
+            if available >= tokens:
+                self._tokens = available - tokens
+                return 0.0
+            self._tokens = available
+            return (tokens - available) / self.rate
+
+
+_STATE = struct.Struct("<dd")  # (tokens, last refill unix timestamp)
+
+
+@dataclasses.dataclass
+class FileTokenBucket(BaseBucket):
+    """
+    Token bucket shared by all processes on the machine that use the same
+    ``path``.
+
+    The bucket state is stored in ``path`` and every read-modify-write is
+    guarded by an exclusive OS file lock (``fcntl.flock`` on POSIX,
+    ``msvcrt.locking`` on Windows). The wall clock is used because a
+    monotonic clock is not comparable across processes.
+
+    :param path: The state file, created if it doesn't exist
+    :param rate: Tokens added per second, i.e. the sustained request rate
+    :param capacity: The maximum number of tokens, i.e. the allowed burst
+    """
+
+    path: Path = dataclasses.field()
+    rate: float = dataclasses.field()
+    capacity: float = dataclasses.field(default=1.0)
+
+    _file: T.Optional[T.BinaryIO] = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _pid: T.Optional[int] = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _lock: threading.Lock = dataclasses.field(
+        default_factory=threading.Lock,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def __post_init__(self):
+        self.path = Path(self.path)
+
+    def _get_file(self) -> T.BinaryIO:
+        # the file lock belongs to the open file, a forked child must open
+        # its own file otherwise it shares the lock with its parent
+        pid = os.getpid()
+        if self._file is None or self._pid != pid:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            self._file = os.fdopen(fd, "r+b", buffering=0)
+            self._pid = pid
+        return self._file
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        _check_tokens(tokens, self.capacity)
+        # the file lock doesn't exclude threads of the same process
+        with self._lock:
+            f = self._get_file()
+            _lock_file(f)
+            try:
+                f.seek(0)
+                raw = f.read(_STATE.size)
+                now = time.time()
+                if len(raw) == _STATE.size:
+                    available, last = _STATE.unpack(raw)
+                    available = _refill(
+                        available, last, now, self.rate, self.capacity
+                    )
+                else:
+                    available = self.capacity
+                if available >= tokens:
+                    available -= tokens
+                    wait = 0.0
+                else:
+                    wait = (tokens - available) / self.rate
+                f.seek(0)
+                f.write(_STATE.pack(available, now))
+                return wait
+            finally:
+                _unlock_file(f)
+
+    async def _atry_acquire(self, tokens: float = 1.0) -> float:
+        # waiting for the file lock blocks, other processes may hold it
+        return await asyncio.to_thread(self.try_acquire, tokens)
+
+    def close(self):
+        """
+        Close the state file, it is reopened on the next call.
+        """
+        with self._lock:
+            f, self._file = self._file, None
+            if f is not None:
+                f.close()
+
+
+READ_PATHS = (
+    "/api/links",
+    "/links/expand",
+)
+"""
+Endpoints throttled by the read bucket.
+"""
+
+BULK_WRITE_PATHS = (
+    "/links/bulk",
+    "/links/delete_bulk",
+)
+"""
+Endpoints throttled by the write bucket.
+"""
+
+
+@dataclasses.dataclass
+class RateLimiter:
+    """
+    Pick the token bucket for each API call by endpoint.
+
+    :param read: The bucket for list and expand endpoints, see :data:`READ_PATHS`
+    :param write: The bucket for bulk create and delete endpoints,
+        see :data:`BULK_WRITE_PATHS`
+    :param other: The bucket for all other endpoints
+
+    A None bucket means that group of endpoints is not throttled.
+    """
+
+    read: T.Optional[BaseBucket] = dataclasses.field(default=None)
+    write: T.Optional[BaseBucket] = dataclasses.field(default=None)
+    other: T.Optional[BaseBucket] = dataclasses.field(default=None)
+
+    @classmethod
+    def new(
+        cls,
+        read_rate: T.Optional[float] = None,
+        read_burst: float = 1.0,
+        write_rate: T.Optional[float] = None,
+        write_burst: float = 1.0,
+        other_rate: T.Optional[float] = None,
+        other_burst: float = 1.0,
+        lock_dir: T.Optional[T.Union[str, Path]] = None,
+    ) -> "RateLimiter":
+        """
+        Create a rate limiter from requests per second.
+
+        :param lock_dir: If given, the buckets are :class:`FileTokenBucket`
+            stored in this directory and shared by all processes using the
+            same directory, otherwise they are :class:`TokenBucket` shared by
+            all threads of the current process.
+        """
+
+        def new_bucket(name: str, rate: T.Optional[float], burst: float):
+            if rate is None:
+                return None
+            if lock_dir is None:
+                return TokenBucket(rate=rate, capacity=burst)
+            return FileTokenBucket(
+                path=Path(lock_dir).joinpath(f"{name}.bucket"),
+                rate=rate,
+                capacity=burst,
+            )
+
+        return cls(
+            read=new_bucket("read", read_rate, read_burst),
+            write=new_bucket("write", write_rate, write_burst),
+            other=new_bucket("other", other_rate, other_burst),
+        )
+
+    def get_bucket(self, url: str) -> T.Optional[BaseBucket]:
+        """
+        Find the bucket for the API url, ignoring the query string.
+        """
+        path = url.split("?", 1)[0].rstrip("/")
+        if path.endswith(READ_PATHS):
+            return self.read
+        if path.endswith(BULK_WRITE_PATHS):
+            return self.write
+        return self.other
+
+    def acquire(self, url: str):
+        """
+        Block until the API call to ``url`` is allowed.
+        """
+        bucket = self.get_bucket(url)
+        if bucket is not None:
+            bucket.acquire()
+
+    async def aacquire(self, url: str):
+        """
+        Async version of :meth:`acquire`.
+        """
+        bucket = self.get_bucket(url)
+        if bucket is not None:
+            await bucket.aacquire()
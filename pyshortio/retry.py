@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+
+"""
+Retry policy for Short.io API calls.
+
+A :class:`RetryPolicy` decides whether a failed HTTP call should be retried and
+how long to wait before the next attempt. It is transport agnostic, it only
+reads ``status_code`` and ``headers`` from the response, so the same policy
+works for both :class:`~pyshortio.client.Client` (``requests``) and
+:class:`~pyshortio.async_client.AsyncClient` (``httpx``).
+
+The waiting time is computed as follows:
+
+1. If the server tells us when to come back, via the ``Retry-After`` header or
+   one of the common rate limit reset headers (``RateLimit-Reset``,
+   ``X-RateLimit-Reset``), we wait that long.
+2. Otherwise we use capped exponential backoff with full jitter, i.e. a random
+   value in ``[0, min(max_delay, base_delay * 2 ** attempt)]``.
+
+Every API call gets its own retry budget, limited by both ``max_attempts`` and
+``max_elapsed`` seconds.
+
+Example:
+
+.. code-block:: python
+
+    from pyshortio.api import Client, RetryPolicy
+
+    client = Client(
+        token="...",
+        retry_policy=RetryPolicy(max_attempts=8, max_delay=60),
+    )
+"""
+
+import typing as T
+import time
+import random
+import dataclasses
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+DEFAULT_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# the request was rejected before being processed, so it is safe to retry
+# even a non-idempotent request
+DEFAULT_NOT_PROCESSED_STATUSES = frozenset({429})
+
+
+def _parse_seconds(value: T.Optional[str]) -> T.Optional[float]:
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+def parse_retry_after(value: T.Optional[str]) -> T.Optional[float]:
+    """
+    Parse the ``Retry-After`` header into seconds to wait.
+
+    The header is either a number of seconds or an HTTP date.
+
+    Example:
+
+    >>> parse_retry_after("3")
+    3.0
+    >>> parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT")  # in the past
+    0.0
+    """
+    seconds = _parse_seconds(value)
+    if seconds is not None or value is None:
+        return seconds
+    try:
+        dt = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if dt.tzinfo is None:  # pragma: no cover
+        dt = dt.replace(tzinfo=timezone.utc)
+    return max(0.0, (dt - datetime.now(timezone.utc)).total_seconds())
+
+
+def parse_rate_limit_reset(headers: T.Mapping[str, str]) -> T.Optional[float]:
+    """
+    Parse the rate limit reset headers into seconds to wait.
+
+    ``RateLimit-Reset`` is always a delta in seconds. ``X-RateLimit-Reset`` is
+    either a delta or an epoch timestamp, depends on the server, a value bigger
+    than ``10 ** 9`` is treated as an epoch timestamp.
+    """
+    seconds = _parse_seconds(headers.get("ratelimit-reset"))
+    if seconds is not None:
+        return seconds
+    seconds = _parse_seconds(headers.get("x-ratelimit-reset"))
+    if seconds is not None:
+        if seconds > 10**9:
+            seconds = max(0.0, seconds - time.time())
+        return seconds
+    return None
+
+
+@dataclasses.dataclass
+class RetryPolicy:
+    """
+    Retry policy for HTTP calls.
+
+    :param max_attempts: The maximum number of attempts per API call,
+        including the first one
+    :param max_elapsed: The maximum number of seconds spent on one API call,
+        including the waiting time. No retry is scheduled if the next wait
+        would exceed it. None means no time limit.
+    :param base_delay: The base delay in seconds of the exponential backoff
+    :param max_delay: The cap of the exponential backoff in seconds
+    :param retryable_statuses: HTTP status codes that are retried for
+        idempotent requests
+    :param not_processed_statuses: HTTP status codes that mean the server
+        rejected the request without processing it, they are retried even
+        for non-idempotent requests
+    :param respect_retry_after: Whether to honor the ``Retry-After`` and the
+        rate limit reset headers
+    :param max_retry_after: The maximum number of seconds we are willing to
+        wait when the server asks us to come back later
+    :param retry_on_connection_error: Whether to retry idempotent requests
+        on connection errors and timeouts
+    """
+
+    max_attempts: int = dataclasses.field(default=5)
+    max_elapsed: T.Optional[float] = dataclasses.field(default=300.0)
+    base_delay: float = dataclasses.field(default=0.5)
+    max_delay: float = dataclasses.field(default=30.0)
+    retryable_statuses: T.FrozenSet[int] = dataclasses.field(
+        default=DEFAULT_RETRYABLE_STATUSES
+    )
+    not_processed_statuses: T.FrozenSet[int] = dataclasses.field(
+        default=DEFAULT_NOT_PROCESSED_STATUSES
+    )
+    respect_retry_after: bool = dataclasses.field(default=True)
+    max_retry_after: float = dataclasses.field(default=300.0)
+    retry_on_connection_error: bool = dataclasses.field(default=True)
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Capped exponential backoff with full jitter.
+
+        :param attempt: The number of failed attempts so far, starting from 1
+        """
+        cap = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, cap)
+
+    def server_delay(self, response) -> T.Optional[float]:
+        """
+        The number of seconds the server asked us to wait, if any.
+        """
+        if self.respect_retry_after is False:
+            return None
+        headers = response.headers
+        delay = parse_retry_after(headers.get("retry-after"))
+        if delay is None:
+            delay = parse_rate_limit_reset(headers)
+        if delay is None:
+            return None
+        return min(delay, self.max_retry_after)
+
+    def is_retryable(
+        self,
+        response=None,
+        idempotent: bool = True,
+    ) -> bool:
+        """
+        Whether the response (or the connection error, if ``response`` is None)
+        is worth a retry.
+        """
+        if response is None:
+            return self.retry_on_connection_error and idempotent
+        status_code = response.status_code
+        if status_code in self.not_processed_statuses:
+            return True
+        if idempotent:
+            return status_code in self.retryable_statuses
+        return False
+
+    def start(self) -> "RetryState":
+        """
+        Start the retry budget of one API call.
+        """
+        return RetryState(policy=self)
+
+
+@dataclasses.dataclass
+class RetryState:
+    """
+    The retry budget of one API call.
+
+    Usage:
+
+    .. code-block:: python
+
+        state = policy.start()
+        while 1:
+            response = send()
+            delay = state.next_delay(response, idempotent=True)
+            if delay is None:
+                return response
+            time.sleep(delay)
+    """
+
+    policy: RetryPolicy = dataclasses.field()
+    attempt: int = dataclasses.field(default=1)
+    start_time: float = dataclasses.field(default_factory=time.monotonic)
+
+    def next_delay(
+        self,
+        response=None,
+        idempotent: bool = True,
+    ) -> T.Optional[float]:
+        """
+        Return the number of seconds to wait before the next attempt, or None
+        if the call should not be retried.
+
+        :param response: The HTTP response, or None if the attempt failed with
+            a connection error
+        :param idempotent: Whether the request is safe to send twice
+        """
+        policy = self.policy
+        if self.attempt >= policy.max_attempts:
+            return None
+        if policy.is_retryable(response=response, idempotent=idempotent) is False:
+            return None
+        delay = None
+        if response is not None:
+            delay = policy.server_delay(response)
+        if delay is None:
+            delay = policy.backoff(self.attempt)
+        if policy.max_elapsed is not None:
+            elapsed = time.monotonic() - self.start_time
+            if elapsed + delay > policy.max_elapsed:
+                return None
+        self.attempt += 1
+        return delay
@@ -0,0 +1,320 @@
+# -*- coding: utf-8 -*-
+
+"""
+Vectorized sync planner.
+
+:func:`plan_sync_df` splits the links of a TSV file into links to create,
+update and delete, like :func:`~pyshortio.sync_tsv.plan_sync`, but on data
+frames instead of one dict and one :class:`~pyshortio.model.Link` per link:
+
+1. The remote state, a :class:`~pyshortio.link_table.LinkTable`, is left
+   joined with the TSV frame on ``original_url``. Unmatched TSV rows are
+   created, unmatched remote links are deleted.
+2. For every compared column a changed mask is computed with vectorized
+   expressions, a value is compared only if it is set on both sides, see
+   :func:`~pyshortio.fingerprint.is_same`.
+3. Values that differ as they are, usually a handful, are compared again with
+   :func:`~pyshortio.fingerprint.normalize_value`, so values written in
+   different ways, e.g. a datetime with and without milliseconds, are not
+   reported as changed.
+
+Only the rows to create or update are converted to dicts.
+
+.. note::
+
+    This feature requires the ``polars`` library, install it with
+    ``pip install "pyshortio[export]"``.
+"""
+
+import typing as T
+import dataclasses
+from datetime import datetime
+
+try:
+    import polars as pl
+except ImportError:  # pragma: no cover
+    pass
+
+from .link_schema import FIELDS_BY_NAME
+from .fingerprint import FINGERPRINT_FIELDS, normalize_value
+from .logger import logger
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    from .sync_tsv import T_LINK_DATA
+
+_LINK_ID = "__link_id"
+_REMOTE = "__remote"
+
+
+@dataclasses.dataclass
+class SyncPlan:
+    """
+    The result of :func:`plan_sync_df`.
+
+    :param to_create: The link data to create
+    :param to_update: ``(link_id, link_data)`` pairs to update
+    :param to_delete: The link ids to delete
+    :param changes: One row per link to update, with the ``id``, the
+        ``original_url`` and one boolean column per compared field that is
+        True when the field has changed, null when it is unknown
+    :param link_ids: ``original_url`` to link id of the existing links
+    :param last_created_at: The creation time of the newest existing link
+    """
+
+    to_create: list["T_LINK_DATA"] = dataclasses.field()
+    to_update: list[tuple[str, "T_LINK_DATA"]] = dataclasses.field()
+    to_delete: list[str] = dataclasses.field()
+    changes: "pl.DataFrame" = dataclasses.field()
+    link_ids: dict[str, str] = dataclasses.field(default_factory=dict)
+    last_created_at: T.Optional[datetime] = dataclasses.field(default=None)
+
+
+def _resolve_folder_id(
+    df: "pl.DataFrame",
+    folder_name_to_id_mapping: dict[str, str],
+) -> "pl.DataFrame":
+    """
+    Replace the ``folder_name`` column with the ``folder_id``.
+    """
+    if "folder_name" not in df.columns:
+        return df
+    folder_id = pl.col("folder_name").replace_strict(
+        folder_name_to_id_mapping,
+        default=None,
+        return_dtype=pl.Utf8,
+    )
+    if "folder_id" in df.columns:
+        folder_id = pl.coalesce(folder_id, pl.col("folder_id").cast(pl.Utf8))
+    return df.with_columns(folder_id=folder_id).drop("folder_name")
+
+
+def _raw_differs(
+    name: str,
+    dtype: "pl.DataType",
+    remote_dtype: "pl.DataType",
+) -> "pl.Expr":
+    """
+    True when the value is set on both sides and the raw values differ.
+    """
+    wanted = pl.col(name)
+    remote = pl.col(f"{name}{_REMOTE}")
+    both_set = wanted.is_not_null() & remote.is_not_null()
+    is_list = isinstance(dtype, pl.List), isinstance(remote_dtype, pl.List)
+    if all(is_list):
+        # the TSV reader sorts the tags, the API doesn't, unsorted wanted tags
+        # are still handled by normalize_value
+        return both_set & (wanted != remote.list.eval(pl.element().sort()))
+    if any(is_list):
+        # can't be compared in polars, let normalize_value decide
+        return both_set
+    if (
+        isinstance(dtype, pl.Datetime)
+        and dtype.time_zone is not None
+        and remote_dtype == pl.Utf8
+    ):
+        # a typed source, the API returns ISO 8601 strings, the values that
+        # can't be parsed are left to normalize_value
+        remote = remote.str.to_datetime(time_zone="UTC", strict=False)
+        return both_set & (wanted != remote).fill_null(True)
+    if dtype != remote_dtype:
+        wanted, remote = wanted.cast(pl.Utf8), remote.cast(pl.Utf8)
+    return both_set & (wanted != remote)
+
+
+def log_plan(plan: SyncPlan):
+    """
+    Log the number of links to create, update and delete, and every link.
+    """
+    logger.info(f"🟢 got {len(plan.to_create)} links to create")
+    logger.info(f"🟡 got {len(plan.to_update)} links to update")
+    logger.info(f"🔴 got {len(plan.to_delete)} links to delete")
+    for link_data in plan.to_create:
+        logger.info(f"To create: {link_data = }")
+    for link_id, link_data in plan.to_update:
+        logger.info(f"To update: {link_id = }, {link_data = }")
+    for link_id in plan.to_delete:
+        logger.info(f"To delete: {link_id = }")
+
+
+def plan_sync_df(
+    wanted_df: "pl.DataFrame",
+    existing_df: "pl.DataFrame",
+    folder_name_to_id_mapping: dict[str, str],
+) -> SyncPlan:
+    """
+    Split the wanted links into links to create, update and delete.
+    See :mod:`pyshortio.sync_plan` for how it works.
+
+    :param wanted_df: The TSV data, one row per link, ``original_url`` is
+        unique, ``tags`` is a list column
+    :param existing_df: The :attr:`~pyshortio.link_table.LinkTable.df` of the
+        existing links
+    :param folder_name_to_id_mapping: folder name to folder id mapping
+    """
+    plan = _plan_sync_df(
+        wanted_df=_resolve_folder_id(wanted_df, folder_name_to_id_mapping),
+        existing_df=existing_df,
+    )
+    log_plan(plan)
+    return plan
+
+
+def _get_fields(columns: list[str]) -> list[str]:
+    """
+    The compared fields that are TSV columns, ``original_url`` is the key.
+    """
+    return [
+        name
+        for name in FINGERPRINT_FIELDS
+        if name in columns and name != "original_url"
+    ]
+
+
+def _get_remote_df(
+    existing_df: "pl.DataFrame",
+    fields: list[str],
+) -> "pl.DataFrame":
+    """
+    One row per ``original_url`` with the link id and the compared fields.
+    """
+    # the API can return several links with the same original_url, the last
+    # one wins like in plan_sync
+    return (
+        existing_df.filter(pl.col("original_url").is_not_null())
+        .unique(subset=["original_url"], keep="last", maintain_order=True)
+        .select(
+            pl.col("id").alias(_LINK_ID),
+            pl.col("original_url"),
+            *[
+                pl.col(FIELDS_BY_NAME[name].attr).alias(f"{name}{_REMOTE}")
+                for name in fields
+            ],
+        )
+    )
+
+
+def _get_no_url_ids(existing_df: "pl.DataFrame") -> list[str]:
+    """
+    The ids of the links without ``original_url``, no TSV row can match them
+    so they are always deleted, like in plan_sync.
+    """
+    return (
+        existing_df.filter(pl.col("original_url").is_null())
+        .get_column("id")
+        .to_list()
+    )
+
+
+def _get_link_ids(remote_df: "pl.DataFrame") -> dict[str, str]:
+    return dict(
+        zip(
+            remote_df.get_column("original_url").to_list(),
+            remote_df.get_column(_LINK_ID).to_list(),
+        )
+    )
+
+
+def _plan_rows(
+    wanted_df: "pl.DataFrame",
+    remote_df: "pl.DataFrame",
+    fields: list[str],
+) -> tuple[
+    list["T_LINK_DATA"],
+    list[tuple[str, "T_LINK_DATA"]],
+    "pl.DataFrame",
+    "pl.Series",
+]:
+    """
+    Find the wanted rows to create and to update.
+
+    :return: the link data to create, the ``(link_id, link_data)`` to update,
+        the changes, see :attr:`SyncPlan.changes`, and the ids of the remote
+        links that match a wanted row
+    """
+    columns = wanted_df.columns
+    joined_df = wanted_df.join(
+        remote_df,
+        on="original_url",
+        how="left",
+        maintain_order="left",
+    )
+    is_matched = pl.col(_LINK_ID).is_not_null()
+
+    to_create = [
+        {k: v for k, v in row.items() if v is not None}
+        for row in joined_df.filter(~is_matched).select(columns).iter_rows(named=True)
+    ]
+
+    matched_df = joined_df.filter(is_matched)
+    masks = [
+        _raw_differs(
+            name,
+            joined_df.schema[name],
+            joined_df.schema[f"{name}{_REMOTE}"],
+        ).alias(f"{name}__changed")
+        for name in fields
+    ]
+    to_update = list()
+    change_rows = list()
+    if len(fields):
+        candidate_df = (
+            matched_df.with_columns(masks)
+            .filter(pl.any_horizontal([f"{name}__changed" for name in fields]))
+        )
+        for row in candidate_df.iter_rows(named=True):
+            changed = {
+                name: row[f"{name}__changed"]
+                and normalize_value(name, row[name])
+                != normalize_value(name, row[f"{name}{_REMOTE}"])
+                for name in fields
+            }
+            if any(changed.values()):
+                link_data = {k: row[k] for k in columns if row[k] is not None}
+                to_update.append((row[_LINK_ID], link_data))
+                change_rows.append(
+                    {
+                        "id": row[_LINK_ID],
+                        "original_url": row["original_url"],
+                        **changed,
+                    }
+                )
+    changes = pl.DataFrame(
+        change_rows,
+        schema={
+            "id": pl.Utf8,
+            "original_url": pl.Utf8,
+            **{name: pl.Boolean for name in fields},
+        },
+    )
+    return to_create, to_update, changes, matched_df.get_column(_LINK_ID)
+
+
+def _plan_sync_df(
+    wanted_df: "pl.DataFrame",
+    existing_df: "pl.DataFrame",
+) -> SyncPlan:
+    """
+    The part of :func:`plan_sync_df` after the folder names are resolved.
+    """
+    fields = _get_fields(wanted_df.columns)
+    remote_df = _get_remote_df(existing_df, fields)
+    to_create, to_update, changes, _ = _plan_rows(wanted_df, remote_df, fields)
+    to_delete = (
+        remote_df.join(
+            wanted_df.select("original_url"),
+            on="original_url",
+            how="anti",
+            maintain_order="left",
+        )
+        .get_column(_LINK_ID)
+        .to_list()
+    )
+    to_delete.extend(_get_no_url_ids(existing_df))
+    return SyncPlan(
+        to_create=to_create,
+        to_update=to_update,
+        to_delete=to_delete,
+        changes=changes,
+        link_ids=_get_link_ids(remote_df),
+        last_created_at=existing_df.get_column("created_at").max(),
+    )
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+
+"""
+Input formats for ``sync_links``.
+
+The links to sync can come from a TSV, CSV, Parquet, Arrow IPC or JSON lines
+file, or from an in-memory Arrow table. Each format is read by a scanner in
+:data:`SOURCE_SCANNERS` into a :class:`polars.LazyFrame`, then
+:func:`scan_links` normalizes it into the frame the sync planner expects:
+
+- the ``original_url`` column is required, rows without it are skipped
+- ``tags`` is a sorted list of stripped strings, from a comma separated string
+  column or from a list column
+- datetime columns are in UTC, naive datetimes are UTC
+- ``folder_name`` is a string
+
+Typed formats keep their types, so booleans, integers, tag lists and
+datetimes are not parsed from strings again. Arrow IPC files are memory
+mapped by :func:`polars.scan_ipc` and in-memory Arrow data is read through the
+Arrow C stream interface, the columns are not copied.
+
+A new format can be added to :data:`SOURCE_SCANNERS`:
+
+.. code-block:: python
+
+    SOURCE_SCANNERS["psv"] = lambda source: pl.scan_csv(source, separator="|")
+
+.. note::
+
+    This feature requires the ``polars`` library, install it with
+    ``pip install "pyshortio[export]"``.
+"""
+
+import typing as T
+from pathlib import Path
+
+try:
+    import polars as pl
+except ImportError:  # pragma: no cover
+    pass
+
+T_SOURCE = T.Union[str, Path, T.TextIO, T.BinaryIO, T.Any]
+
+SOURCE_SCANNERS: dict[str, T.Callable[[T.Any], "pl.LazyFrame"]] = {
+    "tsv": lambda source: pl.scan_csv(source, separator="\t"),
+    "csv": lambda source: pl.scan_csv(source),
+    "parquet": lambda source: pl.scan_parquet(source),
+    "ipc": lambda source: pl.scan_ipc(source),
+    "jsonl": lambda source: pl.scan_ndjson(source),
+    "arrow": lambda source: pl.DataFrame(source).lazy(),
+}
+"""
+Format name to a function that scans a source of this format.
+"""
+
+FORMAT_BY_SUFFIX = {
+    ".tsv": "tsv",
+    ".tab": "tsv",
+    ".csv": "csv",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".arrow": "ipc",
+    ".ipc": "ipc",
+    ".feather": "ipc",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+}
+
+
+def guess_format(source: T_SOURCE) -> str:
+    """
+    Guess the format of a source from the file extension, in-memory Arrow
+    data, e.g. a ``pyarrow.Table``, is ``arrow``.
+    """
+    if isinstance(source, (pl.DataFrame, pl.LazyFrame)) or (
+        not isinstance(source, (str, Path))
+        and hasattr(source, "__arrow_c_stream__")
+    ):
+        return "arrow"
+    if isinstance(source, (str, Path)):
+        suffix = Path(source).suffix.lower()
+        if suffix in FORMAT_BY_SUFFIX:
+            return FORMAT_BY_SUFFIX[suffix]
+    raise ValueError(f"can't guess the format of {source!r}, set the format")
+
+
+def _tags_expr(dtype: "pl.DataType") -> "pl.Expr":
+    tags = pl.col("tags")
+    if dtype == pl.Utf8:
+        tags = tags.str.split(",")
+    elif dtype != pl.List(pl.Utf8):
+        tags = tags.cast(pl.List(pl.Utf8))
+    # one eval is faster than list.eval + list.sort
+    return tags.list.eval(pl.element().str.strip_chars().sort())
+
+
+def normalize_links(lf: "pl.LazyFrame") -> "pl.LazyFrame":
+    """
+    Normalize the link data, see :mod:`pyshortio.sync_source`.
+    """
+    schema = lf.collect_schema()
+    if "original_url" not in schema.names():
+        raise ValueError("original_url column not found")
+    exprs = list()
+    for name, dtype in schema.items():
+        if name == "tags":
+            exprs.append(_tags_expr(dtype).alias(name))
+        elif name == "folder_name" and dtype != pl.Utf8:
+            exprs.append(pl.col(name).cast(pl.Utf8))
+        elif isinstance(dtype, pl.Datetime):
+            if dtype.time_zone is None:
+                exprs.append(pl.col(name).dt.replace_time_zone("UTC"))
+            else:
+                exprs.append(pl.col(name).dt.convert_time_zone("UTC"))
+    lf = lf.drop_nulls("original_url")
+    if len(exprs):
+        lf = lf.with_columns(exprs)
+    return lf
+
+
+def scan_links(
+    source: T_SOURCE,
+    format: T.Optional[str] = None,
+) -> "pl.LazyFrame":
+    """
+    Scan the link data of a source lazily and normalize it.
+
+    :param source: A file path, a file object or in-memory Arrow data
+    :param format: A :data:`SOURCE_SCANNERS` key, guessed from the source by
+        default
+    """
+    if format is None:
+        format = guess_format(source)
+    if isinstance(source, pl.LazyFrame):
+        lf = source
+    else:
+        try:
+            scanner = SOURCE_SCANNERS[format]
+        except KeyError:
+            raise ValueError(
+                f"unknown format {format!r}, "
+                f"the formats are {list(SOURCE_SCANNERS)}"
+            )
+        lf = scanner(source)
+    return normalize_links(lf)
+
+
+def read_links(
+    source: T_SOURCE,
+    format: T.Optional[str] = None,
+) -> tuple["pl.DataFrame", list[str]]:
+    """
+    Read the link data of a source into a normalized data frame, see
+    :func:`scan_links`, ``original_url`` must be unique.
+
+    :return: the data frame and the unique folder names
+    """
+    df = scan_links(source, format=format).collect()
+    if df["original_url"].n_unique() != df.height:
+        raise ValueError("original_url column must be unique")
+    if "folder_name" in df.columns:
+        folder_name_list = df["folder_name"].drop_nulls().unique().to_list()
+    else:
+        folder_name_list = list()
+    return df, folder_name_list
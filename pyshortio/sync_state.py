@@ -0,0 +1,332 @@
+# -*- coding: utf-8 -*-
+
+"""
+Local state for incremental ``sync_tsv`` runs.
+
+A full sync reads every link of the domain and compares every TSV row. With
+``sync_tsv(..., state_file=path)`` a :class:`SyncState` is saved after each
+successful sync, it has:
+
+- the id and the :mod:`~pyshortio.fingerprint` of the TSV row of every link
+  that is in sync
+- a watermark, the creation time of the newest link on Short.io
+
+The next run:
+
+1. Reads only the links created since the watermark from Short.io.
+2. Skips the TSV rows whose fingerprint didn't change since the last sync.
+3. Updates the known links whose row changed, without comparing them with
+   Short.io, and plans the rest, i.e. new rows and links created since the
+   watermark, like a full sync.
+
+It falls back to a full scan when the state doesn't match the domain, or when
+drift is detected:
+
+- the newest known link is gone, so links were deleted outside the sync
+- a link created since the watermark has the original url of a known link,
+  so it was re-created outside the sync
+
+A link edited outside the sync can't be detected without a full scan, run a
+sync without ``state_file`` from time to time. A sync that failed, even
+partially, deletes the state so the next run does a full scan.
+"""
+
+import typing as T
+import os
+import dataclasses
+from pathlib import Path
+from datetime import datetime, timedelta
+
+try:
+    import polars as pl
+except ImportError:  # pragma: no cover
+    pass
+
+from .json_backend import loads, dumps
+from .fingerprint import compute_fingerprint
+from .sync_plan import SyncPlan, _plan_sync_df, _get_no_url_ids
+from .logger import logger
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    from .sync_tsv import SyncResult
+
+SYNC_STATE_VERSION = 1
+
+_PAD = timedelta(milliseconds=1)
+_STATE_ID = "__state_id"
+_STATE_FINGERPRINT = "__state_fingerprint"
+_FINGERPRINT = "__fingerprint"
+_IS_NEW = "__is_new"
+
+
+@dataclasses.dataclass
+class SyncState:
+    """
+    The state saved by an incremental sync, see :mod:`pyshortio.sync_state`.
+
+    :param hostname: The domain hostname
+    :param domain_id: The domain id
+    :param watermark: The creation time of the newest link on Short.io
+    :param links: ``original_url`` to ``[link_id, fingerprint]``, the
+        fingerprint is None when the link is not in sync with its TSV row
+    """
+
+    hostname: str = dataclasses.field()
+    domain_id: int = dataclasses.field()
+    watermark: T.Optional[datetime] = dataclasses.field(default=None)
+    links: dict[str, list[T.Optional[str]]] = dataclasses.field(
+        default_factory=dict
+    )
+
+    @classmethod
+    def load(
+        cls,
+        path: Path,
+        hostname: str,
+        domain_id: int,
+    ) -> T.Optional["SyncState"]:
+        """
+        Load the state of the domain, None if there is no usable state.
+        """
+        try:
+            data = loads(Path(path).read_bytes())
+        except FileNotFoundError:
+            logger.info("no sync state found, do a full scan")
+            return None
+        except ValueError:
+            logger.info("the sync state is corrupted, do a full scan")
+            return None
+        if (
+            data.get("version") != SYNC_STATE_VERSION
+            or data.get("hostname") != hostname
+            or data.get("domain_id") != domain_id
+        ):
+            logger.info("the sync state is for another domain, do a full scan")
+            return None
+        watermark = data["watermark"]
+        return cls(
+            hostname=hostname,
+            domain_id=domain_id,
+            watermark=None if watermark is None else datetime.fromisoformat(watermark),
+            links=data["links"],
+        )
+
+    def save(self, path: Path):
+        """
+        Save the state, the file is replaced atomically.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": SYNC_STATE_VERSION,
+            "hostname": self.hostname,
+            "domain_id": self.domain_id,
+            "watermark": (
+                None if self.watermark is None else self.watermark.isoformat()
+            ),
+            "links": self.links,
+        }
+        path_tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        path_tmp.write_bytes(dumps(data))
+        os.replace(path_tmp, path)
+
+    @staticmethod
+    def delete(path: Path):
+        """
+        Delete the state, so the next sync does a full scan.
+        """
+        try:
+            Path(path).unlink()
+        except FileNotFoundError:
+            pass
+
+    @property
+    def after_date(self) -> T.Optional[datetime]:
+        """
+        The ``after_date`` to list the links created since the watermark,
+        the links created at the watermark are included.
+        """
+        return None if self.watermark is None else self.watermark - _PAD
+
+    def find_drift(self, new_df: "pl.DataFrame") -> T.Optional[str]:
+        """
+        Check the links created since the watermark for changes made outside
+        the sync.
+
+        :param new_df: The :class:`~pyshortio.link_table.LinkTable` data frame
+            of the links created since the watermark
+
+        :return: the reason, None if there is no drift
+        """
+        if self.watermark is not None:
+            last_created_at = new_df.get_column("created_at").max()
+            if last_created_at is None or last_created_at < self.watermark:
+                return "the newest known link was deleted"
+        for original_url, link_id in zip(
+            new_df.get_column("original_url").to_list(),
+            new_df.get_column("id").to_list(),
+        ):
+            entry = self.links.get(original_url)
+            if entry is not None and entry[0] != link_id:
+                return f"the link of {original_url} was re-created"
+        return None
+
+    def to_df(self) -> "pl.DataFrame":
+        return pl.DataFrame(
+            {
+                "original_url": list(self.links),
+                _STATE_ID: [entry[0] for entry in self.links.values()],
+                _STATE_FINGERPRINT: [entry[1] for entry in self.links.values()],
+            },
+            schema={
+                "original_url": pl.Utf8,
+                _STATE_ID: pl.Utf8,
+                _STATE_FINGERPRINT: pl.Utf8,
+            },
+        )
+
+
+def fingerprint_rows(wanted_df: "pl.DataFrame") -> dict[str, str]:
+    """
+    Compute the fingerprint of every TSV row, by ``original_url``. The folder
+    names must be resolved to folder ids first.
+    """
+    return {
+        row["original_url"]: compute_fingerprint(row)
+        for row in wanted_df.iter_rows(named=True)
+    }
+
+
+def plan_incremental(
+    wanted_df: "pl.DataFrame",
+    fingerprints: dict[str, str],
+    state: SyncState,
+    new_df: "pl.DataFrame",
+) -> SyncPlan:
+    """
+    Plan a sync from the saved state and the links created since the
+    watermark, see :mod:`pyshortio.sync_state`.
+
+    :param wanted_df: The TSV data, the folder names are resolved
+    :param fingerprints: The result of :func:`fingerprint_rows`
+    :param state: The state saved by the last sync
+    :param new_df: The :class:`~pyshortio.link_table.LinkTable` data frame of
+        the links created since the watermark
+    """
+    columns = wanted_df.columns
+    new_urls = new_df.select("original_url").unique().with_columns(
+        pl.lit(True).alias(_IS_NEW)
+    )
+    df = (
+        wanted_df.with_columns(
+            pl.Series(_FINGERPRINT, list(fingerprints.values()), dtype=pl.Utf8)
+        )
+        .join(state.to_df(), on="original_url", how="left", maintain_order="left")
+        .join(new_urls, on="original_url", how="left", maintain_order="left")
+    )
+    is_new = pl.col(_IS_NEW).fill_null(False)
+    is_known = pl.col(_STATE_ID).is_not_null()
+    is_changed = pl.col(_FINGERPRINT) != pl.col(_STATE_FINGERPRINT).fill_null("")
+
+    # rows matching a link created since the watermark are compared with it
+    new_plan = _plan_sync_df(
+        wanted_df=df.filter(is_new).select(columns),
+        existing_df=new_df,
+    )
+
+    # known links whose row changed are updated without comparing
+    changed_df = df.filter(~is_new & is_known & is_changed)
+    to_update = list(new_plan.to_update)
+    for row in changed_df.iter_rows(named=True):
+        link_data = {k: row[k] for k in columns if row[k] is not None}
+        to_update.append((row[_STATE_ID], link_data))
+    fields = new_plan.changes.columns[2:]
+    changes = pl.concat(
+        [
+            new_plan.changes,
+            changed_df.select(
+                pl.col(_STATE_ID).alias("id"),
+                pl.col("original_url"),
+                *[pl.lit(None, dtype=pl.Boolean).alias(name) for name in fields],
+            ),
+        ]
+    )
+
+    to_create = [
+        {k: v for k, v in row.items() if v is not None}
+        for row in df.filter(~is_new & ~is_known).select(columns).iter_rows(named=True)
+    ]
+
+    link_ids = {
+        original_url: entry[0] for original_url, entry in state.links.items()
+    }
+    link_ids.update(new_plan.link_ids)
+    wanted_urls = set(fingerprints)
+    to_delete = [
+        link_id
+        for original_url, link_id in link_ids.items()
+        if original_url not in wanted_urls
+    ]
+    to_delete.extend(_get_no_url_ids(new_df))
+
+    last_created_at = state.watermark
+    if new_plan.last_created_at is not None:
+        if last_created_at is None or new_plan.last_created_at > last_created_at:
+            last_created_at = new_plan.last_created_at
+
+    logger.info(
+        f"{df.filter(~is_new & is_known & ~is_changed).height} rows are unchanged "
+        f"since the last sync, {len(new_urls)} links were created since then"
+    )
+    return SyncPlan(
+        to_create=to_create,
+        to_update=to_update,
+        to_delete=to_delete,
+        changes=changes,
+        link_ids=link_ids,
+        last_created_at=last_created_at,
+    )
+
+
+def build_state(
+    hostname: str,
+    domain_id: int,
+    plan: SyncPlan,
+    fingerprints: dict[str, str],
+    result: "SyncResult",
+) -> SyncState:
+    """
+    Build the state after a successful sync.
+
+    :param fingerprints: The result of :func:`fingerprint_rows`
+    :param result: The result of the sync, the links to update or delete
+        that have no result were skipped, e.g. ``update_if_not_the_same=False``
+    """
+    links: dict[str, list[T.Optional[str]]] = {
+        original_url: [link_id, fingerprints.get(original_url)]
+        for original_url, link_id in plan.link_ids.items()
+    }
+    if len(result.update_results) == 0:
+        for _, link_data in plan.to_update:
+            links[link_data["original_url"]][1] = None
+    if len(result.delete_results):
+        for original_url in list(links):
+            if original_url not in fingerprints:
+                links.pop(original_url)
+
+    watermark = plan.last_created_at
+    for task_result in result.create_results:
+        for link in task_result.value:
+            links[link.original_url] = [
+                link.id,
+                fingerprints.get(link.original_url),
+            ]
+            created_at = link.created_at
+            if created_at is not None and (watermark is None or created_at > watermark):
+                watermark = created_at
+    return SyncState(
+        hostname=hostname,
+        domain_id=domain_id,
+        watermark=watermark,
+        links=links,
+    )
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+
+"""
+Streaming input for ``sync_links`` and ``sync_tsv``.
+
+By default ``sync_links`` reads the whole source into one data frame. With
+``sync_links(..., chunk_size=n)`` the source is scanned lazily with
+:func:`~pyshortio.sync_source.scan_links` and read ``n`` rows at a time,
+twice:
+
+1. :func:`check_links` reads only the ``original_url`` and ``folder_name``
+   columns. It checks that ``original_url`` is unique with the 64 bit hash of
+   every url, 8 bytes per row instead of the url itself. The rows whose hash
+   is not unique are read again to compare the urls, so a hash collision
+   can't fail the sync. It also collects the folder names.
+2. :func:`plan_sync_chunks` joins every chunk with the existing links, see
+   :mod:`pyshortio.sync_plan`. Only the rows to create or update are kept,
+   the links to delete are the existing links that matched no chunk.
+
+The memory used by the link data is bounded by the chunk size, plus the rows
+to create or update, instead of growing with the file size. Pass a file
+path, a file object is read into memory by polars first.
+
+.. note::
+
+    This feature requires ``polars>=1.34.0``, see
+    :data:`CHUNK_SIZE_MIN_POLARS_VERSION`, the ``pyshortio[sync]`` extra
+    installs an older release.
+"""
+
+import typing as T
+
+try:
+    import polars as pl
+except ImportError:  # pragma: no cover
+    pass
+
+from .sync_plan import (
+    SyncPlan,
+    log_plan,
+    _LINK_ID,
+    _resolve_folder_id,
+    _get_fields,
+    _get_remote_df,
+    _get_no_url_ids,
+    _get_link_ids,
+    _plan_rows,
+)
+from .logger import logger
+
+CHUNK_SIZE_MIN_POLARS_VERSION = "1.34.0"
+"""
+The first polars release with :meth:`polars.LazyFrame.collect_batches`, which
+reads a lazy frame ``chunk_size`` rows at a time.
+"""
+
+
+def check_chunk_support():
+    """
+    Raise an :class:`ImportError` if the installed polars can't read a source
+    in chunks, the rest of the sync works with older releases.
+    """
+    if hasattr(pl.LazyFrame, "collect_batches") is False:
+        raise ImportError(
+            f"sync with chunk_size requires polars>={CHUNK_SIZE_MIN_POLARS_VERSION}, "
+            f"got polars {pl.__version__}, run: "
+            f'pip install "polars>={CHUNK_SIZE_MIN_POLARS_VERSION}"'
+        )
+
+
+def _find_duplicated_url(
+    lf: "pl.LazyFrame",
+    hashes: "pl.Series",
+    chunk_size: int,
+) -> T.Optional[str]:
+    """
+    Read the urls whose hash is not unique, return one that is really
+    duplicated, None if the hashes collided.
+    """
+    duplicated_hashes = hashes.filter(hashes.is_duplicated()).unique()
+    if len(duplicated_hashes) == 0:
+        return None
+    urls = pl.concat(
+        [
+            df.get_column("original_url")
+            for df in lf.select("original_url")
+            .filter(pl.col("original_url").hash().is_in(duplicated_hashes.implode()))
+            .collect_batches(chunk_size=chunk_size)
+        ]
+    )
+    duplicated_urls = urls.filter(urls.is_duplicated())
+    if len(duplicated_urls) == 0:
+        return None
+    return duplicated_urls[0]
+
+
+def check_links(
+    lf: "pl.LazyFrame",
+    chunk_size: int,
+) -> tuple[int, list[str]]:
+    """
+    Check that ``original_url`` is unique, chunk by chunk.
+
+    :param lf: The result of :func:`~pyshortio.sync_source.scan_links`
+
+    :return: the number of rows and the unique folder names
+    """
+    columns = ["original_url"]
+    has_folder_name = "folder_name" in lf.collect_schema().names()
+    if has_folder_name:
+        columns.append("folder_name")
+    hash_list = list()
+    folder_name_set = set()
+    for df in lf.select(columns).collect_batches(chunk_size=chunk_size):
+        hash_list.append(df.get_column("original_url").hash())
+        if has_folder_name:
+            folder_name_set.update(
+                df.get_column("folder_name").drop_nulls().unique().to_list()
+            )
+    hashes = (
+        pl.concat(hash_list) if len(hash_list) else pl.Series([], dtype=pl.UInt64)
+    )
+    if hashes.n_unique() != len(hashes):
+        duplicated_url = _find_duplicated_url(lf, hashes, chunk_size)
+        if duplicated_url is not None:
+            raise ValueError(
+                f"original_url column must be unique, got {duplicated_url!r} "
+                f"more than once"
+            )
+    return len(hashes), sorted(folder_name_set)
+
+
+def iter_link_chunks(
+    lf: "pl.LazyFrame",
+    chunk_size: int,
+) -> T.Iterator["pl.DataFrame"]:
+    """
+    Read the rows of :func:`~pyshortio.sync_source.scan_links` ``chunk_size``
+    at a time.
+    """
+    yield from lf.collect_batches(chunk_size=chunk_size)
+
+
+def plan_sync_chunks(
+    chunks: T.Iterable["pl.DataFrame"],
+    existing_df: "pl.DataFrame",
+    folder_name_to_id_mapping: dict[str, str],
+) -> SyncPlan:
+    """
+    Like :func:`~pyshortio.sync_plan.plan_sync_df`, but the link data comes
+    in chunks, see :mod:`pyshortio.sync_stream`.
+
+    :param chunks: The link data, every chunk has the same columns, the
+        ``original_url`` is unique across all chunks
+    """
+    remote_df = None
+    fields = list()
+    to_create = list()
+    to_update = list()
+    changes_list = list()
+    matched_list = list()
+    for wanted_df in chunks:
+        wanted_df = _resolve_folder_id(wanted_df, folder_name_to_id_mapping)
+        if remote_df is None:
+            fields = _get_fields(wanted_df.columns)
+            remote_df = _get_remote_df(existing_df, fields)
+        chunk_to_create, chunk_to_update, changes, matched = _plan_rows(
+            wanted_df, remote_df, fields
+        )
+        to_create.extend(chunk_to_create)
+        to_update.extend(chunk_to_update)
+        changes_list.append(changes)
+        matched_list.append(matched)
+    if remote_df is None:
+        remote_df = _get_remote_df(existing_df, fields)
+        changes_list.append(
+            pl.DataFrame(schema={"id": pl.Utf8, "original_url": pl.Utf8})
+        )
+    if len(matched_list):
+        matched_df = pl.concat(matched_list).to_frame(_LINK_ID)
+    else:
+        matched_df = pl.DataFrame(schema={_LINK_ID: pl.Utf8})
+    to_delete = (
+        remote_df.join(matched_df, on=_LINK_ID, how="anti", maintain_order="left")
+        .get_column(_LINK_ID)
+        .to_list()
+    )
+    to_delete.extend(_get_no_url_ids(existing_df))
+    plan = SyncPlan(
+        to_create=to_create,
+        to_update=to_update,
+        to_delete=to_delete,
+        changes=pl.concat(changes_list),
+        link_ids=_get_link_ids(remote_df),
+        last_created_at=existing_df.get_column("created_at").max(),
+    )
+    log_plan(plan)
+    return plan
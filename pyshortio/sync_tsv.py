@@ -16,6 +16,8 @@ except ImportError:  # pragma: no cover
     import typing as T
 
 import io
+import dataclasses
+from pathlib import Path
 from datetime import datetime
 
 try:
@@ -27,6 +29,27 @@ from .arg import NA, T_KWARGS
 from .constants import DEFAULT_RAISE_FOR_STATUS
 from .utils import chunked, group_by
 from .model import Link, Folder
+from .link_schema import UPDATE_FIELD_NAMES
+from .fingerprint import (
+    FINGERPRINT_FIELDS,
+    get_fingerprint_data_from_link,
+    is_same,
+)
+from .sync_plan import SyncPlan, plan_sync_df, log_plan, _resolve_folder_id
+from .sync_state import (
+    SyncState,
+    fingerprint_rows,
+    plan_incremental,
+    build_state,
+)
+from .sync_source import T_SOURCE, scan_links, read_links
+from .sync_stream import (
+    check_chunk_support,
+    check_links,
+    iter_link_chunks,
+    plan_sync_chunks,
+)
+from .executor import TaskResult, run_tasks
 from .logger import logger
 
 if T.TYPE_CHECKING:  # pragma: no cover
@@ -71,82 +94,237 @@ class T_LINK_DATA(T.TypedDict):
     folder_id: T.NotRequired[T.Optional[str]]
 
 
-def get_fingerprint_data_from_link(link: Link) -> T_KWARGS:
+def _to_update_kwargs(link_data: T_LINK_DATA) -> T_KWARGS:
     """
-    Extract relevant data from a Link object for fingerprinting purposes.
+    Keep only the link data keys accepted by ``update_link``, a TSV may have
+    extra columns, e.g. the ``id`` and ``short_url`` of an exported TSV.
+    """
+    return {k: v for k, v in link_data.items() if k in UPDATE_FIELD_NAMES}
+
+
+def _log_update_result(index: int, result: TaskResult):
+    link_id, link_data = result.item
+    msg = f"update link {link_id}, original_url = {link_data['original_url']}"
+    if result.ok:
+        logger.info(msg)
+    else:
+        logger.info(f"❌ failed to {msg}: {result.error!r}")
 
-    This function extracts a standardized subset of link properties from a Link
-    object to create a consistent representation for comparison. It removes None
-    values and sorts tags to ensure consistent comparison regardless of order.
+
+def _chunk_links_to_create(
+    to_create: list[T_LINK_DATA],
+) -> list[tuple[str, list[T_LINK_DATA]]]:
     """
-    data = {
-        "original_url": link.original_url,
-        "cloaking": link.cloaking,
-        "password": link.password,
-        "redirect_type": link.redirect_type,
-        "expires_at": link.expires_at,
-        "expired_url": link.expired_url,
-        "title": link.title,
-        "tags": link.tags,
-        "utm_source": link.utm_source,
-        "utm_medium": link.utm_medium,
-        "utm_campaign": link.utm_campaign,
-        "utm_term": link.utm_term,
-        "utm_content": link.utm_content,
-        "ttl": link.ttl,
-        "path": link.path,
-        "android_url": link.android_url,
-        "iphone_url": link.iphone_url,
-        "clicks_limit": link.clicks_limit,
-        "password_contact": link.password_contact,
-        "skip_qs": link.skip_qs,
-        "archived": link.archived,
-        "split_url": link.split_url,
-        "split_percent": link.split_percent,
-        "integration_adroll": link.integration_adroll,
-        "integration_fb": link.integration_fb,
-        "integration_ga": link.integration_ga,
-        "integration_gtm": link.integration_gtm,
-        "folder_id": link.folder_id,
-    }
-    data = {k: v for k, v in data.items() if v is not None}
-    if "tags" in data:
-        data["tags"].sort()
-    return data
-
-
-def is_same(
-    link_data: T_LINK_DATA,
-    link: Link,
-) -> bool:
+    Split the links to create into ``(folder_id, links)`` chunks of at most
+    150 links, the ``folder_id`` is ``NA`` for links without folder.
     """
-    Compare a link data dictionary with a Link object to determine if they are equivalent.
+    chunks = list()
+    for folder_id, link_data_list in group_by(
+        to_create,
+        get_key=lambda link_data: link_data.get("folder_id", "__no_folder_"),
+    ).items():
+        if folder_id == "__no_folder_":
+            folder_id = NA
+        for link_data_sub_list in chunked(link_data_list, 150):
+            chunks.append((folder_id, link_data_sub_list))
+    return chunks
+
+
+def _log_create_result(index: int, result: TaskResult):
+    _, link_data_list = result.item
+    for link_data in link_data_list:
+        logger.info(f"create link for original_url = {link_data['original_url']}")
+    if not result.ok:
+        logger.info(
+            f"❌ failed to create the {len(link_data_list)} links above: "
+            f"{result.error!r}"
+        )
 
-    This function checks if the properties in the link_data dictionary match the
-    corresponding properties in the Link object. It handles comparing only the
-    properties that are present in both, ignoring properties that are only in the
-    Link object but not in link_data.
 
-    :param link_data: Dictionary containing link properties from TSV
-    :param link: Link object retrieved from Short.io
+def _check_delete_success(success: T.Optional[bool]):
+    if success is not True:
+        raise RuntimeError(f"batch_delete_links failed, {success = }")
 
-    :returns: True if all matching properties are the same, False otherwise
 
-    .. note::
+def _log_delete_result(index: int, result: TaskResult):
+    for link_id in result.item:
+        logger.info(f"delete link {link_id}")
+    if not result.ok:
+        logger.info(
+            f"❌ failed to delete the {len(result.item)} links above: "
+            f"{result.error!r}"
+        )
 
-        The comparison is one-directional: it checks if properties in link_data
-        match those in the Link object, but doesn't require all properties in the
-        Link object to be in link_data.
+
+@dataclasses.dataclass
+class SyncResult:
+    """
+    The result of :meth:`SyncTSVMixin.sync_links`.
+
+    :param plan: The links to create, update and delete
+    :param create_results: One result per ``(folder_id, links)`` chunk to
+        create, the value is the created links
+    :param update_results: One result per link to update, in plan order
+    :param delete_results: One result per chunk of link ids to delete
     """
-    # print("--- start is_same(...) ---") # pragma: no cover
-    link_fingerprint_data = get_fingerprint_data_from_link(link)
-    # print(f"{link_data = }") # pragma: no cover
-    # print(f"{link_fingerprint_data = }")  # pragma: no cover
-    for k, v in link_fingerprint_data.items():
-        if k in link_data:
-            if link_data[k] != v:
-                return False
-    return True
+
+    plan: SyncPlan = dataclasses.field()
+    create_results: list[TaskResult] = dataclasses.field(default_factory=list)
+    update_results: list[TaskResult] = dataclasses.field(default_factory=list)
+    delete_results: list[TaskResult] = dataclasses.field(default_factory=list)
+
+    @property
+    def failed_create_urls(self) -> list[str]:
+        """
+        The original urls of the links in the chunks that failed to create.
+        """
+        return [
+            link_data["original_url"]
+            for result in self.create_results
+            if not result.ok
+            for link_data in result.item[1]
+        ]
+
+    @property
+    def failed_update_ids(self) -> list[str]:
+        """
+        The ids of the links that failed to update.
+        """
+        return [
+            result.item[0] for result in self.update_results if not result.ok
+        ]
+
+    @property
+    def failed_delete_ids(self) -> list[str]:
+        """
+        The ids of the links in the chunks that failed to delete.
+        """
+        return [
+            link_id
+            for result in self.delete_results
+            if not result.ok
+            for link_id in result.item
+        ]
+
+    @property
+    def ok(self) -> bool:
+        """
+        True if every create, update and delete succeeded.
+        """
+        return all(
+            result.ok
+            for results in [
+                self.create_results,
+                self.update_results,
+                self.delete_results,
+            ]
+            for result in results
+        )
+
+    def log_summary(self):
+        """
+        Log how many operations succeeded and what failed.
+        """
+        n_created = sum(
+            len(result.item[1]) for result in self.create_results if result.ok
+        )
+        n_updated = sum(result.ok for result in self.update_results)
+        n_deleted = sum(
+            len(result.item) for result in self.delete_results if result.ok
+        )
+        logger.info(
+            f"created {n_created} links, "
+            f"{len(self.failed_create_urls)} failed"
+        )
+        logger.info(
+            f"updated {n_updated} links, "
+            f"{len(self.failed_update_ids)} failed"
+        )
+        logger.info(
+            f"deleted {n_deleted} links, "
+            f"{len(self.failed_delete_ids)} failed"
+        )
+        for original_url in self.failed_create_urls:
+            logger.info(f"❌ failed to create link for {original_url}")
+        for link_id in self.failed_update_ids:
+            logger.info(f"❌ failed to update link {link_id}")
+        for link_id in self.failed_delete_ids:
+            logger.info(f"❌ failed to delete link {link_id}")
+
+
+def plan_sync(
+    wanted_links: dict[str, T_LINK_DATA],
+    existing_links: dict[str, Link],
+    folder_name_to_id_mapping: dict[str, str],
+) -> tuple[
+    list[T_LINK_DATA],
+    list[tuple[str, T_LINK_DATA]],
+    list[str],
+]:
+    """
+    Split the wanted links into links to create, update and delete.
+
+    This is the dict based planner, it compares one :class:`~pyshortio.model.Link`
+    at a time. The sync and the asyncio client use the faster
+    :func:`~pyshortio.sync_plan.plan_sync_df`, which gives the same result.
+
+    :param wanted_links: original_url to link data mapping from the TSV file
+    :param existing_links: original_url to Link mapping from Short.io,
+        matched links are popped from it
+    :param folder_name_to_id_mapping: folder name to folder id mapping
+    """
+    to_create: list[T_LINK_DATA] = list()
+    to_update: list[tuple[str, T_LINK_DATA]] = list()
+    for original_url, link_data in wanted_links.items():
+        if "folder_name" in link_data:
+            folder_name = link_data.pop("folder_name")
+            link_data["folder_id"] = folder_name_to_id_mapping[folder_name]
+        if original_url in existing_links:
+            link = existing_links.pop(original_url)
+            is_same_flag = is_same(link_data=link_data, link=link)
+            if is_same_flag is False:
+                to_update.append((link.id, link_data))
+        else:
+            to_create.append(link_data)
+    to_delete: list[str] = [link.id for link in existing_links.values()]
+    logger.info(f"🟢 got {len(to_create)} links to create")
+    logger.info(f"🟡 got {len(to_update)} links to update")
+    logger.info(f"🔴 got {len(to_delete)} links to delete")
+
+    for link_data in to_create:
+        logger.info(f"To create: {link_data = }")
+    for link_id, link_data in to_update:
+        logger.info(f"To update: {link_id = }, {link_data = }")
+    for link_id in to_delete:
+        logger.info(f"To delete: {link_id = }")
+    return to_create, to_update, to_delete
+
+
+def _save_sync_state(
+    state_file: T.Union[str, Path],
+    hostname: str,
+    domain_id: int,
+    plan: SyncPlan,
+    fingerprints: dict[str, str],
+    result: SyncResult,
+):
+    """
+    Save the state of a successful incremental sync, delete it if anything
+    failed so the next sync does a full scan.
+    """
+    if result.ok:
+        state = build_state(
+            hostname=hostname,
+            domain_id=domain_id,
+            plan=plan,
+            fingerprints=fingerprints,
+            result=result,
+        )
+        state.save(state_file)
+        logger.info(f"saved the sync state of {len(state.links)} links")
+    else:
+        SyncState.delete(state_file)
+        logger.info("the sync failed, deleted the sync state")
 
 
 class SyncTSVMixin:
@@ -155,49 +333,88 @@ class SyncTSVMixin:
     """
 
     @logger.emoji_block(
-        msg="Read link data from TSV file",
+        msg="Read link data",
         emoji="📄",
     )
-    def _sync_read_link_data_from_tsv(
+    def _sync_read_link_df(
         self: "Client",
-        file: io.StringIO,
+        source: T_SOURCE,
+        format: T.Optional[str] = None,
     ) -> tuple[
-        dict[str, T_LINK_DATA],
+        "pl.DataFrame",
         list[str],
     ]:
         """
-        Read and parse link data from a TSV file.
+        Read and parse link data from a TSV, CSV, Parquet, Arrow IPC or JSON
+        lines source.
 
-        This method reads a TSV file using the polars library, validates the required
-        ``original_url`` column, processes tag values, and extracts folder names.
+        This method reads the source using the polars library, validates the
+        required ``original_url`` column, processes tag values, and extracts
+        folder names, see :func:`~pyshortio.sync_source.read_links`.
         """
         logger.info("Read data ...")
-        df = pl.read_csv(file, separator="\t")
-
-        logger.info("Check original_url column ...")
-        if "original_url" not in df.columns:
-            raise ValueError("original_url column not found")
-        df = df.drop_nulls("original_url")
-        if df["original_url"].unique().count() != df.shape[0]:
-            raise ValueError("original_url column must be unique")
-
-        logger.info("Process tags column ...")
-        df = df.with_columns(
-            tags=pl.col("tags")
-            .str.split(",")
-            .list.eval(pl.element().str.strip_chars())
-            .list.sort()
-        )
+        df, folder_name_list = read_links(source, format=format)
         logger.info(f"Got {df.shape[0]} rows")
+        logger.info(f"Got {len(folder_name_list)} unique folder names")
+        return df, folder_name_list
+
+    def _sync_read_link_df_from_tsv(
+        self: "Client",
+        file: T_SOURCE,
+    ) -> tuple[
+        "pl.DataFrame",
+        list[str],
+    ]:
+        """
+        Read and parse link data from a TSV file, see
+        :meth:`_sync_read_link_df`.
+        """
+        return self._sync_read_link_df(source=file, format="tsv")
+
+    def _sync_read_link_data_from_tsv(
+        self: "Client",
+        file: io.StringIO,
+    ) -> tuple[
+        dict[str, T_LINK_DATA],
+        list[str],
+    ]:
+        """
+        Read and parse link data from a TSV file, as an ``original_url`` to
+        link data mapping, see :meth:`_sync_read_link_df_from_tsv`.
+        """
+        df, folder_name_list = self._sync_read_link_df_from_tsv(file=file)
         mapping: dict[str, T_LINK_DATA] = dict()
         for row in df.to_dicts():
             row = {k: v for k, v in row.items() if v is not None}
             original_url = row["original_url"]
             mapping[original_url] = row
+        return mapping, folder_name_list
 
-        folder_name_list = df["folder_name"].drop_nulls().unique().to_list()
+    @logger.emoji_block(
+        msg="Scan link data",
+        emoji="📄",
+    )
+    def _sync_scan_links(
+        self: "Client",
+        source: T_SOURCE,
+        chunk_size: int,
+        format: T.Optional[str] = None,
+    ) -> tuple[
+        "pl.LazyFrame",
+        list[str],
+    ]:
+        """
+        Scan a source ``chunk_size`` rows at a time, validate the
+        ``original_url`` column and extract the folder names, without keeping
+        the rows in memory, see :mod:`pyshortio.sync_stream`.
+        """
+        check_chunk_support()
+        logger.info("Check original_url column ...")
+        lf = scan_links(source, format=format)
+        n_row, folder_name_list = check_links(lf, chunk_size=chunk_size)
+        logger.info(f"Got {n_row} rows")
         logger.info(f"Got {len(folder_name_list)} unique folder names")
-        return mapping, folder_name_list
+        return lf, folder_name_list
 
     def _read_folders_from_short_io(
         self: "Client",
@@ -209,28 +426,6 @@ class SyncTSVMixin:
         _, folder_list = self.list_folders(domain_id=domain_id)
         return {folder.name: folder for folder in folder_list}
 
-    def _read_links_from_short_io(
-        self: "Client",
-        domain_id: int,
-    ) -> dict[str, Link]:
-        """
-        Retrieve all links from Short.io for a specific domain.
-
-        This method uses pagination to efficiently retrieve all links from the domain,
-        regardless of how many there are, and organizes them by original URL for
-        easy lookup during the synchronization process.
-        """
-        paginator = self.pagi_list_links(
-            domain_id=domain_id,
-            limit=150,
-            total_max_results=9999,
-        )
-        mapping: dict[str, Link] = dict()
-        for _, link_list in paginator:
-            for link in link_list:
-                mapping[link.original_url] = link
-        return mapping
-
     @logger.emoji_block(
         msg="Create folder if they do not exists",
         emoji="📂",
@@ -275,20 +470,18 @@ class SyncTSVMixin:
     def _sync_identify_link_to_create_update_and_delete(
         self: "Client",
         domain_id: int,
-        wanted_links: dict[str, T_LINK_DATA],
+        wanted_df: "pl.DataFrame",
         folder_name_to_id_mapping: dict[str, str],
-    ) -> tuple[
-        list[T_LINK_DATA],
-        list[tuple[str, T_LINK_DATA]],
-        list[str],
-    ]:
+    ) -> SyncPlan:
         """
         Identify which links need to be created, updated, or deleted.
 
-        This method compares the links defined in the TSV file with those that already
-        exist in Short.io to determine which operations are needed to synchronize them.
-        It converts folder names to folder IDs, checks if existing links need updates,
-        and identifies links that should be deleted if they're not in the TSV file.
+        This method reads the existing links of the domain into a
+        :class:`~pyshortio.link_table.LinkTable` and joins it with the links
+        defined in the TSV file, see :func:`~pyshortio.sync_plan.plan_sync_df`.
+        It converts folder names to folder IDs, checks if existing links need
+        updates, and identifies links that should be deleted if they're not
+        in the TSV file.
 
         .. note::
 
@@ -296,37 +489,87 @@ class SyncTSVMixin:
             status (create/update/delete) for debugging and auditing purposes.
         """
         logger.info("Read existing link info from short.io ...")
-        existing_links = self._read_links_from_short_io(domain_id=domain_id)
-        logger.info(f"Got {len(existing_links)} existing links")
-
-        to_create: list[T_LINK_DATA] = list()
-        to_update: list[tuple[str, T_LINK_DATA]] = list()
-        for original_url, link_data in wanted_links.items():
-            if "folder_name" in link_data:
-                folder_name = link_data.pop("folder_name")
-                link_data["folder_id"] = folder_name_to_id_mapping[folder_name]
-            if original_url in existing_links:
-                link = existing_links.pop(original_url)
-                is_same_flag = is_same(link_data=link_data, link=link)
-                # logger.info(f"{link_data = }") # for debug only
-                # logger.info(f"{get_fingerprint_data_from_link(link) = }") # for debug only
-                # logger.info(f"{is_same_flag = }") # for debug only
-                if is_same_flag is False:
-                    to_update.append((link.id, link_data))
+        existing_table = self.get_link_table(domain_id=domain_id)
+        logger.info(f"Got {len(existing_table)} existing links")
+        return plan_sync_df(
+            wanted_df=wanted_df,
+            existing_df=existing_table.df,
+            folder_name_to_id_mapping=folder_name_to_id_mapping,
+        )
+
+    @logger.emoji_block(
+        msg="Identify link to create, update and delete incrementally",
+        emoji="🔍",
+    )
+    def _sync_identify_incrementally(
+        self: "Client",
+        hostname: str,
+        domain_id: int,
+        wanted_df: "pl.DataFrame",
+        folder_name_to_id_mapping: dict[str, str],
+        state_file: Path,
+    ) -> tuple[SyncPlan, dict[str, str]]:
+        """
+        Like :meth:`_sync_identify_link_to_create_update_and_delete`, but from
+        the state saved by the last sync, see :mod:`pyshortio.sync_state`.
+
+        :return: the plan and the fingerprint of every TSV row
+        """
+        wanted_df = _resolve_folder_id(wanted_df, folder_name_to_id_mapping)
+        fingerprints = fingerprint_rows(wanted_df)
+        state = SyncState.load(state_file, hostname=hostname, domain_id=domain_id)
+        plan = None
+        if state is not None:
+            logger.info(f"Read links created since {state.watermark} ...")
+            new_table = self.get_link_table(
+                domain_id=domain_id,
+                after_date=NA if state.after_date is None else state.after_date,
+            )
+            logger.info(f"Got {len(new_table)} links")
+            drift = state.find_drift(new_table.df)
+            if drift is None:
+                plan = plan_incremental(
+                    wanted_df=wanted_df,
+                    fingerprints=fingerprints,
+                    state=state,
+                    new_df=new_table.df,
+                )
             else:
-                to_create.append(link_data)
-        to_delete: list[str] = [link.id for link in existing_links.values()]
-        logger.info(f"🟢 got {len(to_create)} links to create")
-        logger.info(f"🟡 got {len(to_update)} links to update")
-        logger.info(f"🔴 got {len(to_delete)} links to delete")
-
-        for link_data in to_create:
-            logger.info(f"To create: {link_data = }")
-        for link_id, link_data in to_update:
-            logger.info(f"To update: {link_id = }, {link_data = }")
-        for link_id in to_delete:
-            logger.info(f"To delete: {link_id = }")
-        return to_create, to_update, to_delete
+                logger.info(f"{drift}, fall back to a full scan")
+        if plan is None:
+            plan = self._sync_identify_link_to_create_update_and_delete(
+                domain_id=domain_id,
+                wanted_df=wanted_df,
+                folder_name_to_id_mapping=folder_name_to_id_mapping,
+            )
+        else:
+            log_plan(plan)
+        return plan, fingerprints
+
+    @logger.emoji_block(
+        msg="Identify link to create, update and delete in chunks",
+        emoji="🔍",
+    )
+    def _sync_identify_in_chunks(
+        self: "Client",
+        domain_id: int,
+        lf: "pl.LazyFrame",
+        chunk_size: int,
+        folder_name_to_id_mapping: dict[str, str],
+    ) -> SyncPlan:
+        """
+        Like :meth:`_sync_identify_link_to_create_update_and_delete`, but the
+        link data is read ``chunk_size`` rows at a time, see
+        :func:`~pyshortio.sync_stream.plan_sync_chunks`.
+        """
+        logger.info("Read existing link info from short.io ...")
+        existing_table = self.get_link_table(domain_id=domain_id)
+        logger.info(f"Got {len(existing_table)} existing links")
+        return plan_sync_chunks(
+            chunks=iter_link_chunks(lf, chunk_size=chunk_size),
+            existing_df=existing_table.df,
+            folder_name_to_id_mapping=folder_name_to_id_mapping,
+        )
 
     @logger.emoji_block(
         msg="Create links",
@@ -338,32 +581,38 @@ class SyncTSVMixin:
         to_create: list[T_LINK_DATA],
         raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
         real_run: bool = True,
-    ):
+        max_workers: int = 8,
+    ) -> list[TaskResult[tuple[str, list[T_LINK_DATA]]]]:
         """
         Create new links in Short.io.
 
         This method creates new links based on the list identified by
         :meth:`_sync_identify_link_to_create_update_and_delete`. It groups links by folder
         to optimize the creation process and uses batch operations for efficiency.
+
+        The chunks are independent, up to ``max_workers`` of them are sent
+        concurrently. A failed chunk doesn't stop the others, it is logged and
+        returned.
         """
-        for folder_id, link_data_list in group_by(
-            to_create,
-            get_key=lambda link_data: link_data.get("folder_id", "__no_folder_"),
-        ).items():
-            if folder_id == "__no_folder_":
-                folder_id = NA
-            for link_data_sub_list in chunked(link_data_list, 150):
-                for link in link_data_sub_list:
-                    logger.info(
-                        f"create link for original_url = {link['original_url']}"
-                    )
-                if real_run:
-                    _, link_list = self.batch_create_links(
-                        hostname=hostname,
-                        links=link_data_sub_list,
-                        folder_id=folder_id,
-                        raise_for_status=raise_for_status,
-                    )
+
+        def create(item: tuple[str, list[T_LINK_DATA]]) -> list[Link]:
+            folder_id, link_data_list = item
+            if real_run:
+                _, link_list = self.batch_create_links(
+                    hostname=hostname,
+                    links=link_data_list,
+                    folder_id=folder_id,
+                    raise_for_status=raise_for_status,
+                )
+                return link_list
+            return []
+
+        return run_tasks(
+            func=create,
+            items=_chunk_links_to_create(to_create),
+            max_workers=max_workers,
+            on_result=_log_create_result,
+        )
 
     @logger.emoji_block(
         msg="Update links",
@@ -375,28 +624,40 @@ class SyncTSVMixin:
         to_update: list[tuple[str, T_LINK_DATA]],
         raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
         real_run: bool = True,
-    ):
+        max_workers: int = 8,
+    ) -> list[TaskResult[tuple[str, T_LINK_DATA]]]:
         """
         Update existing links in Short.io.
 
         This method updates links based on the list identified by
         :meth:`_sync_identify_link_to_create_update_and_delete`. It removes the folder_id
         from the update data since folders can't be changed via the update API.
+
+        Short.io has no bulk update API, up to ``max_workers`` links are
+        updated concurrently, see :func:`~pyshortio.executor.run_tasks`. A
+        failed update doesn't stop the others, it is logged and returned.
         """
         for link_id, link_data in to_update:
             if "folder_id" in link_data:
                 link_data.pop("folder_id")
-            logger.info(
-                f"update link {link_id}, original_url = {link_data['original_url']}"
-            )
+
+        def update(item: tuple[str, T_LINK_DATA]):
+            link_id, link_data = item
             if real_run:
                 self.update_link(
                     link_id=link_id,
                     domain_id=domain_id,
-                    **link_data,
+                    **_to_update_kwargs(link_data),
                     raise_for_status=raise_for_status,
                 )
 
+        return run_tasks(
+            func=update,
+            items=to_update,
+            max_workers=max_workers,
+            on_result=_log_update_result,
+        )
+
     @logger.emoji_block(
         msg="Delete links",
         emoji="🔴",
@@ -406,59 +667,94 @@ class SyncTSVMixin:
         to_delete: list[str],
         raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
         real_run: bool = True,
-    ):
+        max_workers: int = 8,
+    ) -> list[TaskResult[list[str]]]:
         """
         Delete links from Short.io.
 
         This method deletes links based on the list identified by
         :meth:`_sync_identify_link_to_create_update_and_delete`. It uses batch operations
         for efficiency, processing links in chunks.
+
+        Up to ``max_workers`` chunks are sent concurrently. A failed chunk
+        doesn't stop the others, it is logged and returned.
         """
-        for link_id_list in chunked(to_delete, 150):
-            for link_id in link_id_list:
-                logger.info(f"delete link {link_id}")
+
+        def delete(link_id_list: list[str]):
             if real_run:
-                self.batch_delete_links(
+                _, success = self.batch_delete_links(
                     link_ids=link_id_list,
                     raise_for_status=raise_for_status,
                 )
+                _check_delete_success(success)
+
+        return run_tasks(
+            func=delete,
+            items=list(chunked(to_delete, 150)),
+            max_workers=max_workers,
+            on_result=_log_delete_result,
+        )
 
     @logger.emoji_block(
-        msg="Sync links from TSV file to short.io",
+        msg="Sync links to short.io",
         emoji="🔄",
     )
-    def sync_tsv(
+    def sync_links(
         self: "Client",
         hostname: str,
-        file: T.TextIO,
+        source: T_SOURCE,
+        format: T.Optional[str] = None,
         update_if_not_the_same: bool = True,
         delete_if_not_in_file: bool = False,
         raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
         real_run: bool = True,
-    ):
+        max_workers: int = 8,
+        state_file: T.Optional[T.Union[str, Path]] = None,
+        chunk_size: T.Optional[int] = None,
+    ) -> SyncResult:
         """
-        Synchronize links from a TSV file to Short.io.
+        Synchronize links from a TSV, CSV, Parquet, Arrow IPC or JSON lines
+        file to Short.io.
 
         This is the main public method of the :class:`SyncTSVMixin` class, orchestrating the
-        entire synchronization process. It reads the TSV file, creates folders if needed,
+        entire synchronization process. It reads the link data, creates folders if needed,
         identifies necessary operations, and executes them according to the specified
         options.
 
         :param hostname: The hostname of the Short.io domain (e.g., "example.short.gy")
-        :param file: An open file-like object containing TSV data
+        :param source: The path of the file, an open file-like object, or
+            in-memory Arrow data such as a ``pyarrow.Table``, see
+            :mod:`pyshortio.sync_source`
+        :param format: The format of the source, one of
+            :data:`~pyshortio.sync_source.SOURCE_SCANNERS`. Defaults to None,
+            guessed from the file extension.
         :param update_if_not_the_same: Whether to update links that have
             changed. Defaults to True.
         :param delete_if_not_in_file: Whether to delete links that aren't
-            in the TSV file. Defaults to False.
+            in the source. Defaults to False.
         :param raise_for_status: Whether to raise exceptions for HTTP errors.
             Defaults to DEFAULT_RAISE_FOR_STATUS.
         :param real_run: Whether to actually perform the API calls or
             just simulate them for a dry run. Defaults to True.
+        :param max_workers: The maximum number of concurrent API calls, the
+            client's ``pool_maxsize`` should be at least this number.
+            Defaults to 8.
+        :param state_file: If given, sync incrementally and save the state
+            in this file after a successful sync, see
+            :mod:`pyshortio.sync_state`. Defaults to None, a full sync.
+        :param chunk_size: If given, read the source this many rows at a
+            time, so the memory used doesn't grow with the file size, see
+            :mod:`pyshortio.sync_stream`. Pass a file path, it can't be
+            used with ``state_file``. It requires ``polars>=1.34.0``.
+            Defaults to None, read the whole file.
+
+        :returns: a :class:`SyncResult`, a failed create, update or delete
+            doesn't stop the sync, check :attr:`SyncResult.ok`
 
         .. note::
 
             - Setting ``delete_if_not_in_file=True`` can be destructive, as it will delete
-              any links not defined in the TSV file. Use with caution.
+              any links not defined in the source. Use with caution.
             - Setting ``real_run=False`` performs a dry run, logging what would happen
               without making actual API calls. This is useful for testing.
             - The method logs detailed information about all operations for auditing
@@ -467,10 +763,20 @@ class SyncTSVMixin:
         logger.info(f"{hostname = }")
         logger.info(f"{update_if_not_the_same = }")
         logger.info(f"{delete_if_not_in_file = }")
+        if chunk_size is not None and state_file is not None:
+            raise ValueError("chunk_size can't be used with state_file")
         with logger.nested():
-            wanted_links, folder_name_list = self._sync_read_link_data_from_tsv(
-                file=file
-            )
+            if chunk_size is None:
+                wanted_df, folder_name_list = self._sync_read_link_df(
+                    source=source,
+                    format=format,
+                )
+            else:
+                lf, folder_name_list = self._sync_scan_links(
+                    source=source,
+                    chunk_size=chunk_size,
+                    format=format,
+                )
 
             _, domain = self.get_domain_by_hostname(hostname=hostname)
 
@@ -480,35 +786,101 @@ class SyncTSVMixin:
                 raise_for_status=raise_for_status,
             )
 
-            to_create, to_update, to_delete = (
-                self._sync_identify_link_to_create_update_and_delete(
+            if chunk_size is not None:
+                plan = self._sync_identify_in_chunks(
+                    domain_id=domain.id,
+                    lf=lf,
+                    chunk_size=chunk_size,
+                    folder_name_to_id_mapping=folder_name_to_id_mapping,
+                )
+            elif state_file is None:
+                plan = self._sync_identify_link_to_create_update_and_delete(
+                    domain_id=domain.id,
+                    wanted_df=wanted_df,
+                    folder_name_to_id_mapping=folder_name_to_id_mapping,
+                )
+            else:
+                plan, fingerprints = self._sync_identify_incrementally(
+                    hostname=hostname,
                     domain_id=domain.id,
-                    wanted_links=wanted_links,
+                    wanted_df=wanted_df,
                     folder_name_to_id_mapping=folder_name_to_id_mapping,
+                    state_file=Path(state_file),
                 )
+            to_create, to_update, to_delete = (
+                plan.to_create,
+                plan.to_update,
+                plan.to_delete,
             )
+            result = SyncResult(plan=plan)
 
             if len(to_create):
-                self._sync_create_links(
+                result.create_results = self._sync_create_links(
                     hostname=hostname,
                     to_create=to_create,
                     raise_for_status=raise_for_status,
                     real_run=real_run,
+                    max_workers=max_workers,
                 )
 
             if update_if_not_the_same:
                 if len(to_update):
-                    self._sync_update_links(
+                    result.update_results = self._sync_update_links(
                         domain_id=domain.id,
                         to_update=to_update,
                         raise_for_status=raise_for_status,
                         real_run=real_run,
+                        max_workers=max_workers,
                     )
 
             if delete_if_not_in_file:
                 if len(to_delete):
-                    self._sync_delete_links(
+                    result.delete_results = self._sync_delete_links(
                         to_delete=to_delete,
                         raise_for_status=raise_for_status,
                         real_run=real_run,
+                        max_workers=max_workers,
                     )
+
+            result.log_summary()
+            if state_file is not None and real_run:
+                _save_sync_state(
+                    state_file=state_file,
+                    hostname=hostname,
+                    domain_id=domain.id,
+                    plan=plan,
+                    fingerprints=fingerprints,
+                    result=result,
+                )
+        return result
+
+    def sync_tsv(
+        self: "Client",
+        hostname: str,
+        file: T_SOURCE,
+        update_if_not_the_same: bool = True,
+        delete_if_not_in_file: bool = False,
+        raise_for_status: bool = DEFAULT_RAISE_FOR_STATUS,
+        real_run: bool = True,
+        max_workers: int = 8,
+        state_file: T.Optional[T.Union[str, Path]] = None,
+        chunk_size: T.Optional[int] = None,
+    ) -> SyncResult:
+        """
+        Synchronize links from a TSV file to Short.io, see :meth:`sync_links`.
+
+        :param file: An open file-like object containing TSV data, or the
+            path of the TSV file
+        """
+        return self.sync_links(
+            hostname=hostname,
+            source=file,
+            format="tsv",
+            update_if_not_the_same=update_if_not_the_same,
+            delete_if_not_in_file=delete_if_not_in_file,
+            raise_for_status=raise_for_status,
+            real_run=real_run,
+            max_workers=max_workers,
+            state_file=state_file,
+            chunk_size=chunk_size,
+        )
@@ -0,0 +1,355 @@
+# -*- coding: utf-8 -*-
+
+"""
+A tiny in-memory fake of the Short.io API for offline tests and benchmarks.
+
+It implements the subset of endpoints used by :class:`pyshortio.client.Client`
+on top of :class:`http.server.ThreadingHTTPServer` with HTTP/1.1 keep-alive,
+so it can be used to measure connection reuse, retries and pagination
+without touching the real service.
+
+Example:
+
+.. code-block:: python
+
+    with StubShortIO() as stub:
+        stub.add_domain(hostname="example.short.gy")
+        client = Client(token="dummy", endpoint=stub.endpoint)
+        _, domain_list = client.list_domains()
+"""
+
+import typing as T
+import json
+import time
+import threading
+import dataclasses
+from datetime import datetime, timezone, timedelta
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+
+def _to_iso(dt: datetime) -> str:
+    return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.") + (
+        f"{dt.microsecond // 1000:03d}Z"
+    )
+
+
+def _parse_dt(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00").replace(" ", "T"))
+
+
+@dataclasses.dataclass
+class StubResponse:
+    """
+    A canned response that will be returned instead of the normal route result.
+    """
+
+    status: int = dataclasses.field()
+    body: T.Any = dataclasses.field(default=None)
+    headers: dict[str, str] = dataclasses.field(default_factory=dict)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: "_Server"
+
+    def log_message(self, format, *args):  # pragma: no cover
+        pass
+
+    def _dispatch(self, method: str):
+        parsed = urlparse(self.path)
+        params = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+        length = int(self.headers.get("content-length") or 0)
+        body = json.loads(self.rfile.read(length)) if length else None
+        stub = self.server.stub
+        if stub.latency:
+            time.sleep(stub.latency)
+        with stub._lock:
+            stub.n_requests += 1
+            stub.requests.append((method, parsed.path, params, body))
+            res = stub._pop_fault(method, parsed.path)
+            if res is None:
+                res = stub._route(method, parsed.path, params, body)
+        payload = json.dumps(res.body).encode("utf-8")
+        self.send_response(res.status)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(payload)))
+        for k, v in res.headers.items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    stub: "StubShortIO"
+
+
+class StubShortIO:
+    """
+    In-memory Short.io API server bound to ``127.0.0.1`` on a random port.
+
+    :param latency: seconds to sleep before answering each request, used to
+        emulate network round trips in benchmarks.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.domains: dict[int, dict[str, T.Any]] = dict()
+        self.folders: dict[str, dict[str, T.Any]] = dict()
+        self.links: dict[str, dict[str, T.Any]] = dict()
+        self.faults: list[tuple[T.Optional[str], T.Optional[str], StubResponse]] = []
+        self.requests: list[tuple[str, str, dict, T.Any]] = []
+        self.n_requests = 0
+        self._lock = threading.RLock()
+        self._seq = 0
+        self._clock = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        self._httpd: T.Optional[_Server] = None
+        self._thread: T.Optional[threading.Thread] = None
+
+    # --------------------------------------------------------------------------
+    # lifecycle
+    # --------------------------------------------------------------------------
+    def start(self) -> "StubShortIO":
+        self._httpd = _Server(("127.0.0.1", 0), _Handler)
+        self._httpd.stub = self
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self) -> "StubShortIO":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    @property
+    def endpoint(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    # --------------------------------------------------------------------------
+    # data setup
+    # --------------------------------------------------------------------------
+    def _next_id(self, prefix: str) -> str:
+        self._seq += 1
+        return f"{prefix}_{self._seq:08d}"
+
+    def add_domain(self, hostname: str, domain_id: int = 1) -> dict[str, T.Any]:
+        domain = {
+            "id": domain_id,
+            "hostname": hostname,
+            "createdAt": _to_iso(self._clock),
+            "updatedAt": _to_iso(self._clock),
+        }
+        self.domains[domain_id] = domain
+        return domain
+
+    def add_folder(self, domain_id: int, name: str) -> dict[str, T.Any]:
+        with self._lock:
+            folder = {"id": self._next_id("fld"), "name": name, "DomainId": domain_id}
+            self.folders[folder["id"]] = folder
+            return folder
+
+    def add_link(
+        self,
+        domain_id: int,
+        original_url: str,
+        created_at: T.Optional[datetime] = None,
+        **data,
+    ) -> dict[str, T.Any]:
+        """
+        Add a link, ``data`` uses the Short.io camelCase JSON keys, e.g.
+        ``createdAt=None`` for a link without creation time.
+        """
+        with self._lock:
+            if created_at is None:
+                self._clock += timedelta(seconds=1)
+                created_at = self._clock
+            link_id = self._next_id("lnk")
+            domain = self.domains[domain_id]
+            path = data.pop("path", link_id[-6:])
+            link = {
+                "id": link_id,
+                "idString": link_id,
+                "originalURL": original_url,
+                "path": path,
+                "shortURL": f"https://{domain['hostname']}/{path}",
+                "DomainId": domain_id,
+                "FolderId": None,
+                "tags": [],
+                "archived": False,
+                "cloaking": False,
+                "createdAt": _to_iso(created_at),
+            }
+            link.update(data)
+            self.links[link_id] = link
+            return link
+
+    def fail(
+        self,
+        status: int,
+        times: int = 1,
+        method: T.Optional[str] = None,
+        path: T.Optional[str] = None,
+        body: T.Any = None,
+        headers: T.Optional[dict[str, str]] = None,
+    ):
+        """
+        Make the next ``times`` matching requests return ``status``.
+        """
+        res = StubResponse(
+            status=status,
+            body=body if body is not None else {"error": f"status {status}"},
+            headers=headers or {},
+        )
+        with self._lock:
+            for _ in range(times):
+                self.faults.append((method, path, res))
+
+    def _pop_fault(self, method: str, path: str) -> T.Optional[StubResponse]:
+        for ith, (m, p, res) in enumerate(self.faults):
+            if (m is None or m == method) and (p is None or p == path):
+                self.faults.pop(ith)
+                return res
+        return None
+
+    # --------------------------------------------------------------------------
+    # routes
+    # --------------------------------------------------------------------------
+    def _route(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, str],
+        body: T.Any,
+    ) -> StubResponse:
+        parts = [part for part in path.split("/") if part]
+        if method == "GET":
+            if parts == ["api", "domains"]:
+                return StubResponse(200, list(self.domains.values()))
+            if len(parts) == 2 and parts[0] == "domains":
+                domain = self.domains.get(int(parts[1]))
+                return StubResponse(200 if domain else 404, domain)
+            if parts == ["api", "links"]:
+                return self._list_links(params)
+            if parts == ["links", "expand"]:
+                for link in self.links.values():
+                    if link["path"] == params.get("path"):
+                        return StubResponse(200, link)
+                return StubResponse(404, {"error": "not found"})
+            if len(parts) == 3 and parts[:2] == ["links", "folders"]:
+                folders = [
+                    folder
+                    for folder in self.folders.values()
+                    if folder["DomainId"] == int(parts[2])
+                ]
+                return StubResponse(200, {"linkFolders": folders})
+            if len(parts) == 2 and parts[0] == "links":
+                link = self.links.get(parts[1])
+                return StubResponse(200 if link else 404, link)
+        elif method == "POST":
+            if parts == ["links"]:
+                return StubResponse(200, self._create_link(body["domain"], body))
+            if parts == ["links", "bulk"]:
+                folder_id = body.get("folderId")
+                link_list = []
+                for dct in body["links"]:
+                    if folder_id is not None:
+                        dct = {"folderId": folder_id, **dct}
+                    link_list.append(self._create_link(body["domain"], dct))
+                return StubResponse(200, link_list)
+            if parts == ["links", "folders"]:
+                folder = self.add_folder(body["domainId"], body["name"])
+                return StubResponse(200, folder)
+            if len(parts) == 2 and parts[0] == "links":
+                link = self.links.get(parts[1])
+                if link is None:
+                    return StubResponse(404, {"error": "not found"})
+                link.update(body)
+                return StubResponse(200, link)
+        elif method == "DELETE":
+            if parts == ["links", "delete_bulk"]:
+                for link_id in body["link_ids"]:
+                    self.links.pop(link_id, None)
+                return StubResponse(200, {"success": True})
+            if len(parts) == 2 and parts[0] == "links":
+                link = self.links.pop(parts[1], None)
+                if link is None:
+                    return StubResponse(404, {"error": "not found"})
+                return StubResponse(200, {"success": True})
+        return StubResponse(404, {"error": f"no route for {method} {path}"})
+
+    def _create_link(self, hostname: str, data: dict[str, T.Any]) -> dict[str, T.Any]:
+        domain_id = next(
+            domain["id"]
+            for domain in self.domains.values()
+            if domain["hostname"] == hostname
+        )
+        data = dict(data)
+        original_url = data.pop("originalURL")
+        folder_id = data.pop("folderId", None)
+        data.pop("allowDuplicates", None)
+        created_at = data.pop("createdAt", None)
+        if created_at is not None:
+            created_at = _parse_dt(created_at)
+        link = self.add_link(domain_id, original_url, created_at=created_at, **data)
+        link["FolderId"] = folder_id
+        return link
+
+    def _list_links(self, params: dict[str, str]) -> StubResponse:
+        domain_id = int(params["domain_id"])
+        limit = int(params.get("limit", 150))
+        offset = int(params.get("pageToken", 0))
+        links = [
+            link for link in self.links.values() if link["DomainId"] == domain_id
+        ]
+        if "folderId" in params:
+            links = [link for link in links if link["FolderId"] == params["folderId"]]
+        # like in SQL, a link without creation time matches no date filter,
+        # and is sorted last in ascending order, first in descending order
+        if "afterDate" in params:
+            after = _parse_dt(params["afterDate"])
+            links = [
+                link
+                for link in links
+                if link["createdAt"] is not None and _parse_dt(link["createdAt"]) > after
+            ]
+        if "beforeDate" in params:
+            before = _parse_dt(params["beforeDate"])
+            links = [
+                link
+                for link in links
+                if link["createdAt"] is not None
+                and _parse_dt(link["createdAt"]) < before
+            ]
+        reverse = params.get("dateSortOrder", "desc") == "desc"
+        links.sort(
+            key=lambda link: (
+                link["createdAt"] is None,
+                link["createdAt"] or "",
+                link["id"],
+            ),
+            reverse=reverse,
+        )
+        page = links[offset : offset + limit]
+        data = {"count": len(page), "links": page}
+        if offset + limit < len(links):
+            data["nextPageToken"] = str(offset + limit)
+        return StubResponse(200, data)
@@ -10,6 +10,7 @@ def test():
     _ = api.Client.get_domain_by_hostname
     _ = api.Client.list_links
     _ = api.Client.pagi_list_links
+    _ = api.Client.iter_links
     _ = api.Client.get_link_opengraph_properties
     _ = api.Client.get_link_info_by_link_id
     _ = api.Client.get_link_info_by_path
@@ -21,8 +22,16 @@ def test():
     _ = api.Client.update_link
     _ = api.Client.delete_link
     _ = api.Client.batch_delete_links
+    _ = api.Client.scan_links
+    _ = api.Client.pagi_list_links_by_folder
     _ = api.Client.sync_tsv
     _ = api.Client.export_to_tsv
+    _ = api.Client.get_link_table
+    _ = api.AsyncClient
+    _ = api.RetryPolicy
+    _ = api.RateLimiter
+    _ = api.LinkTable
+    _ = api.parse_created_at
 
 
 if __name__ == "__main__":
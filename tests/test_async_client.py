@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+import io
+import asyncio
+import inspect
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from pyshortio.retry import RetryPolicy
+from pyshortio.client import Client
+from pyshortio.async_client import AsyncClient
+from pyshortio.tests.stub_server import StubShortIO
+
+
+async def _test_async_client(stub: StubShortIO):
+    hostname = "example.short.gy"
+    async with AsyncClient(token="dummy", endpoint=stub.endpoint) as client:
+        _, domain = await client.get_domain_by_hostname(hostname=hostname)
+        assert domain.id == 1
+
+        _, link = await client.create_link(
+            hostname=hostname,
+            original_url="https://example.com/a",
+            title="A",
+        )
+        assert link.title == "A"
+
+        _, link_list = await client.batch_create_links(
+            hostname=hostname,
+            links=[
+                {"original_url": f"https://example.com/{i}"} for i in range(5)
+            ],
+        )
+        assert len(link_list) == 5
+
+        # drive many requests concurrently through the semaphore
+        results = await asyncio.gather(
+            *[
+                client.get_link_info_by_link_id(link_id=link.id)
+                for link in link_list
+            ]
+        )
+        assert [link.id for _, link in results] == [link.id for link in link_list]
+
+        pages = [
+            link_list
+            async for _, link_list in client.pagi_list_links(
+                domain_id=domain.id,
+                limit=2,
+            )
+        ]
+        assert [len(link_list) for link_list in pages] == [2, 2, 2]
+
+        _, link = await client.update_link(link_id=link_list[0].id, title="B")
+        assert link.title == "B"
+
+        _, success = await client.batch_delete_links(
+            link_ids=[link.id for link in link_list]
+        )
+        assert success is True
+        _, success = await client.delete_link(
+            link_id="not-exists",
+            raise_for_status=False,
+        )
+        assert success is False
+
+        tsv = (
+            "original_url\ttitle\ttags\tfolder_name\n"
+            "https://example.com/a\tA new\tx, y\tdocs\n"
+            "https://example.com/b\tB\t\t\n"
+        )
+        await client.sync_tsv(hostname=hostname, file=io.StringIO(tsv))
+        _, link_list = await client.list_links(domain_id=domain.id)
+        assert sorted(link.title for link in link_list) == ["A new", "B"]
+
+        tsv = await client.export_to_tsv(hostname=hostname)
+        assert "A new" in tsv
+
+        # closing the transport keeps the semaphore, the client stays usable
+        semaphore = client.semaphore
+        await client.aclose()
+        assert client.semaphore is semaphore
+        _, domain = await client.get_domain_by_hostname(hostname=hostname)
+        assert domain.id == 1
+
+
+async def _test_async_retry(stub: StubShortIO):
+    policy = RetryPolicy(max_attempts=3, base_delay=0.01)
+    async with AsyncClient(
+        token="dummy",
+        endpoint=stub.endpoint,
+        retry_policy=policy,
+    ) as client:
+        stub.fail(503, times=2, method="GET")
+        _, domain_list = await client.list_domains()
+        assert len(domain_list) == 1
+
+        # a non-idempotent POST is not retried on 5xx
+        stub.fail(503, method="POST")
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.create_link(
+                hostname="example.short.gy",
+                original_url="https://example.com/a",
+            )
+        stub.fail(429, method="POST", headers={"Retry-After": "0"})
+        _, link = await client.create_link(
+            hostname="example.short.gy",
+            original_url="https://example.com/a",
+        )
+        assert link.original_url == "https://example.com/a"
+
+
+def test_async_api_surface():
+    # every API method of the sync client has an async twin with the same
+    # arguments
+    for mixin in Client.__mro__:
+        if mixin.__name__.endswith("Mixin") is False:
+            continue
+        for name, method in vars(mixin).items():
+            if name.startswith("__") or callable(method) is False:
+                continue
+            async_method = getattr(AsyncClient, name)
+            assert list(inspect.signature(async_method).parameters) == list(
+                inspect.signature(method).parameters
+            ), name
+
+
+def test_async_client():
+    pytest.importorskip("polars")
+    with StubShortIO() as stub:
+        stub.add_domain(hostname="example.short.gy")
+        asyncio.run(_test_async_client(stub))
+
+
+def test_async_retry():
+    with StubShortIO() as stub:
+        stub.add_domain(hostname="example.short.gy")
+        asyncio.run(_test_async_retry(stub))
+
+
+if __name__ == "__main__":
+    from pyshortio.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "pyshortio.async_client",
+        preview=False,
+    )
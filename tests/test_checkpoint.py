@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+
+import pytest
+import requests
+
+from pyshortio.checkpoint import (
+    Checkpoint,
+    make_checkpoint_key,
+    FileCheckpointStore,
+    SqliteCheckpointStore,
+)
+from pyshortio.arg import NA
+from pyshortio.client import Client
+from pyshortio.tests.stub_server import StubShortIO
+
+
+def test_make_checkpoint_key():
+    def list_links():  # pragma: no cover
+        pass
+
+    key1 = make_checkpoint_key(list_links, dict(domain_id=1, folder_id=NA))
+    key2 = make_checkpoint_key(list_links, dict(domain_id=1))
+    key3 = make_checkpoint_key(list_links, dict(domain_id=2))
+    assert key1 == key2
+    assert key1 != key3
+    assert key1.startswith("list_links-")
+
+
+@pytest.mark.parametrize("store_type", ["file", "sqlite"])
+def test_checkpoint_store(tmp_path, store_type):
+    if store_type == "file":
+        store = FileCheckpointStore(dir=tmp_path)
+    else:
+        store = SqliteCheckpointStore(path=tmp_path / "checkpoints.sqlite")
+    assert store.load("a/b") is None
+    store.save("a/b", Checkpoint(next_token="t1", n_items=3))
+    store.save("a/b", Checkpoint(next_token="t2", n_items=6))
+    assert store.load("a/b") == Checkpoint(next_token="t2", n_items=6)
+    store.delete("a/b")
+    store.delete("a/b")
+    assert store.load("a/b") is None
+
+
+def _consume_until_failure(client: Client, stub: StubShortIO, store) -> list[str]:
+    """
+    Consume two pages, then the third page request fails.
+    """
+    seen = []
+    paginator = client.pagi_list_links(
+        domain_id=1,
+        limit=3,
+        checkpoint_store=store,
+        checkpoint_key="mirror",
+    )
+    with pytest.raises(requests.HTTPError):
+        for ith, (_, link_list) in enumerate(paginator):
+            seen.extend(link.id for link in link_list)
+            if ith == 1:
+                stub.fail(500, path="/api/links")
+    return seen
+
+
+def test_resume_pagination(tmp_path):
+    store = SqliteCheckpointStore(path=tmp_path / "checkpoints.sqlite")
+    with StubShortIO() as stub:
+        stub.add_domain(hostname="example.short.gy")
+        for i in range(10):
+            stub.add_link(domain_id=1, original_url=f"https://example.com/{i}")
+        with Client(token="dummy", endpoint=stub.endpoint) as client:
+            all_ids = [link.id for link in client.iter_links(domain_id=1, limit=3)]
+
+            seen = _consume_until_failure(client, stub, store)
+            assert len(seen) == 6
+            assert store.load("mirror") == Checkpoint(next_token="6", n_items=6)
+
+            # resume from the checkpoint, only the remaining pages are fetched
+            n_requests = stub.n_requests
+            for link in client.iter_links(
+                domain_id=1,
+                limit=3,
+                checkpoint_store=store,
+                checkpoint_key="mirror",
+            ):
+                seen.append(link.id)
+            assert stub.n_requests == n_requests + 2
+            assert seen == all_ids
+            # the checkpoint is deleted once the pagination is complete
+            assert store.load("mirror") is None
+
+
+def test_resume_async_pagination(tmp_path):
+    pytest.importorskip("httpx")
+    from pyshortio.async_client import AsyncClient
+
+    store = FileCheckpointStore(dir=tmp_path)
+    with StubShortIO() as stub:
+        stub.add_domain(hostname="example.short.gy")
+        for i in range(10):
+            stub.add_link(domain_id=1, original_url=f"https://example.com/{i}")
+        store.save("mirror", Checkpoint(next_token="6", n_items=6))
+
+        async def main():
+            async with AsyncClient(token="dummy", endpoint=stub.endpoint) as client:
+                return [
+                    link.id
+                    async for link in client.iter_links(
+                        domain_id=1,
+                        limit=3,
+                        checkpoint_store=store,
+                        checkpoint_key="mirror",
+                    )
+                ]
+
+        assert len(asyncio.run(main())) == 4
+        assert store.load("mirror") is None
+
+
+if __name__ == "__main__":
+    from pyshortio.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "pyshortio.checkpoint",
+        preview=False,
+    )
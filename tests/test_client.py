@@ -2,14 +2,38 @@
 
 import os
 import pytest
-from pyshortio.client import normalize_endpoint
+from pyshortio.client import normalize_endpoint, Client
 from pyshortio.tests.client import IS_CI, client
+from pyshortio.tests.stub_server import StubShortIO
 
 
 def test_normalize_endpoint():
     assert normalize_endpoint("https://api.short.io/") == "https://api.short.io"
 
 
+def test_session_lifecycle():
+    with StubShortIO() as stub:
+        stub.add_domain(hostname="example.short.gy")
+        with Client(token="dummy", endpoint=stub.endpoint) as client_:
+            session = client_.session
+            _, domain = client_.get_domain_by_hostname(hostname="example.short.gy")
+            assert domain.id == 1
+            _, domain = client_.get_domain(domain_id=1)
+            assert domain.hostname == "example.short.gy"
+            # the same pooled session is reused across calls
+            assert client_.session is session
+            # default headers are built once and returned as a copy
+            headers = client_.headers
+            headers["x-extra"] = "1"
+            assert "x-extra" not in client_.headers
+        assert client_._session is None
+        # a closed client lazily opens a new session
+        _, domain_list = client_.list_domains()
+        assert len(domain_list) == 1
+        assert client_.session is not session
+        client_.close()
+
+
 @pytest.mark.skipif(IS_CI, reason="Skip on CI")
 class TestClient:
     hostname: str = "pyshortio.short.gy"
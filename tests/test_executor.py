@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+
+import io
+import time
+import random
+import asyncio
+
+import pytest
+
+from pyshortio.executor import run_tasks, async_run_tasks
+from pyshortio.client import Client
+from pyshortio.tests.stub_server import StubShortIO
+
+
+def task(i: int) -> int:
+    time.sleep(random.random() * 0.01)
+    if i % 5 == 0:
+        raise ValueError(i)
+    return i * 10
+
+
+async def async_task(i: int) -> int:
+    await asyncio.sleep(random.random() * 0.01)
+    if i % 5 == 0:
+        raise ValueError(i)
+    return i * 10
+
+
+def check_results(results, progress):
+    assert [result.item for result in results] == list(range(20))
+    assert progress == list(range(20))
+    for result in results:
+        if result.item % 5 == 0:
+            assert result.ok is False
+            assert isinstance(result.error, ValueError)
+        else:
+            assert result.ok is True
+            assert result.value == result.item * 10
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_run_tasks(max_workers: int):
+    progress = list()
+    results = run_tasks(
+        func=task,
+        items=range(20),
+        max_workers=max_workers,
+        on_result=lambda index, result: progress.append(index),
+    )
+    check_results(results, progress)
+
+
+def test_async_run_tasks():
+    progress = list()
+    results = asyncio.run(
+        async_run_tasks(
+            func=async_task,
+            items=range(20),
+            max_workers=4,
+            on_result=lambda index, result: progress.append(index),
+        )
+    )
+    check_results(results, progress)
+
+
+def test_sync_tsv_update_failure():
+    pytest.importorskip("polars")
+    hostname = "example.short.gy"
+    with StubShortIO() as stub:
+        stub.add_domain(hostname=hostname)
+        links = [
+            stub.add_link(
+                domain_id=1,
+                original_url=f"https://example.com/{i}",
+                title="old",
+            )
+            for i in range(5)
+        ]
+        tsv = "original_url\ttitle\ttags\tfolder_name\n" + "".join(
+            f"https://example.com/{i}\ttitle {i}\t\t\n" for i in range(5)
+        )
+        failed_id = links[2]["id"]
+        stub.fail(400, method="POST", path=f"/links/{failed_id}")
+        with Client(token="dummy", endpoint=stub.endpoint) as client:
+            result = client.sync_tsv(
+                hostname=hostname,
+                file=io.StringIO(tsv),
+                max_workers=3,
+            )
+        assert result.failed_update_ids == [failed_id]
+        assert len(result.update_results) == 5
+        titles = {link["originalURL"]: link["title"] for link in stub.links.values()}
+        assert titles["https://example.com/2"] == "old"
+        assert titles["https://example.com/4"] == "title 4"
+
+
+def test_sync_tsv_chunk_failure():
+    pytest.importorskip("polars")
+    hostname = "example.short.gy"
+    with StubShortIO() as stub:
+        stub.add_domain(hostname=hostname)
+        for i in range(400):
+            stub.add_link(domain_id=1, original_url=f"https://example.com/old/{i}")
+        tsv = "original_url\ttitle\ttags\tfolder_name\n" + "".join(
+            f"https://example.com/new/{i}\t\t\t\n" for i in range(400)
+        )
+        stub.fail(400, method="POST", path="/links/bulk")
+        stub.fail(400, method="DELETE", path="/links/delete_bulk")
+        with Client(token="dummy", endpoint=stub.endpoint) as client:
+            result = client.sync_tsv(
+                hostname=hostname,
+                file=io.StringIO(tsv),
+                delete_if_not_in_file=True,
+                max_workers=3,
+            )
+        assert result.ok is False
+        assert [len(r.item[1]) for r in result.create_results] == [150, 150, 100]
+        assert [len(r.item) for r in result.delete_results] == [150, 150, 100]
+        # exactly one chunk of each failed, the others went through
+        failed_create_urls = set(result.failed_create_urls)
+        failed_delete_ids = set(result.failed_delete_ids)
+        assert len(failed_create_urls) in (100, 150)
+        assert len(failed_delete_ids) in (100, 150)
+        urls = {link["originalURL"] for link in stub.links.values()}
+        n_new = sum(url.startswith("https://example.com/new/") for url in urls)
+        assert n_new == 400 - len(failed_create_urls)
+        assert failed_create_urls.isdisjoint(urls)
+        assert failed_delete_ids.issubset(stub.links)
+        assert len(stub.links) == n_new + len(failed_delete_ids)
+
+
+if __name__ == "__main__":
+    from pyshortio.tests import run_cov_test
+
+    run_cov_test(__file__, "pyshortio.executor", preview=False)
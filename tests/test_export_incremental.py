@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+
+import json
+import asyncio
+from pathlib import Path
+from datetime import datetime, timezone
+
+import pytest
+
+pl = pytest.importorskip("polars")
+
+from pyshortio.client import Client
+from pyshortio.async_client import AsyncClient
+from pyshortio.export_incremental import (
+    ExportManifest,
+    MANIFEST_NAME,
+    split_partitions,
+)
+from pyshortio.link_table import LinkTable
+from pyshortio.tests.stub_server import StubShortIO
+
+hostname = "example.short.gy"
+
+
+def add_links(stub: StubShortIO, day: int, n_link: int, second: int = 0):
+    for i in range(n_link):
+        stub.add_link(
+            domain_id=1,
+            original_url=f"https://example.com/{day}/{second}/{i}",
+            created_at=datetime(2025, 1, day, 0, 0, second, tzinfo=timezone.utc),
+            tags=["a", "b"],
+        )
+
+
+def read_export(dir: Path) -> "pl.DataFrame":
+    manifest = ExportManifest.load(dir)
+    return pl.scan_parquet(
+        manifest.get_paths(dir),
+        hive_partitioning=True,
+    ).collect()
+
+
+def test_export_links_incremental(tmp_path: Path):
+    with StubShortIO() as stub:
+        stub.add_domain(hostname=hostname)
+        add_links(stub, day=1, n_link=3)
+        add_links(stub, day=2, n_link=2)
+        with Client(token="dummy", endpoint=stub.endpoint) as client:
+            manifest = client.export_links_incremental(
+                hostname=hostname,
+                dir=tmp_path,
+                limit=2,
+            )
+            assert manifest.n_link == 5
+            assert sorted({file.partition for file in manifest.files}) == [
+                "2025-01-01",
+                "2025-01-02",
+            ]
+            # the links are listed oldest first, one file per partition
+            assert len(manifest.files) == 2
+            assert [file.partition for file in manifest.files] == [
+                "2025-01-01",
+                "2025-01-02",
+            ]
+            assert {
+                params.get("dateSortOrder")
+                for _, path, params, _ in stub.requests
+                if path == "/api/links"
+            } == {"asc"}
+            assert manifest.watermark == datetime(2025, 1, 2, tzinfo=timezone.utc)
+            assert len(manifest.watermark_ids) == 2
+
+            df = read_export(tmp_path)
+            assert df.height == 5
+            assert df["tags"].to_list() == [["a", "b"]] * 5
+            assert df["created_date"].n_unique() == 2
+
+            # nothing new
+            manifest = client.export_links_incremental(
+                hostname=hostname,
+                dir=tmp_path,
+            )
+            assert manifest.n_link == 5
+            assert len(manifest.files) == 2
+
+            # a link created at the watermark and newer links
+            add_links(stub, day=2, n_link=1)
+            add_links(stub, day=3, n_link=2, second=1)
+            manifest = client.export_links_incremental(
+                hostname=hostname,
+                dir=tmp_path,
+            )
+            assert manifest.n_link == 8
+            assert len(manifest.files) == 4
+            df = read_export(tmp_path)
+            assert df["id"].n_unique() == 8
+            assert sorted(df["original_url"].to_list()) == sorted(
+                link["originalURL"] for link in stub.links.values()
+            )
+
+            data = json.loads(tmp_path.joinpath(MANIFEST_NAME).read_text())
+            assert data["n_link"] == 8
+            for file in manifest.get_paths(tmp_path):
+                assert file.exists()
+
+            with pytest.raises(ValueError):
+                client.export_links_incremental(
+                    hostname=hostname,
+                    dir=tmp_path,
+                    format="csv",
+                )
+
+
+def test_split_partitions():
+    # a page that is not sorted by creation time
+    table = LinkTable.from_raw_links(
+        [
+            {"id": "lnk_1", "createdAt": "2025-01-02T00:00:00.000Z"},
+            {"id": "lnk_2", "createdAt": "2025-01-01T00:00:00.000Z"},
+            {"id": "lnk_3"},
+            {"id": "lnk_4", "createdAt": "2025-01-02T00:00:01.000Z"},
+            {"id": "lnk_5", "createdAt": "2025-01-01T00:00:01.000Z"},
+        ]
+    )
+    pieces = [
+        (partition, piece.df["id"].to_list())
+        for partition, piece in split_partitions(
+            table,
+            partition_format="%Y-%m-%d",
+            exclude_ids=["lnk_5"],
+        )
+    ]
+    assert pieces == [
+        ("2025-01-01", ["lnk_2"]),
+        ("2025-01-02", ["lnk_1", "lnk_4"]),
+        ("__HIVE_DEFAULT_PARTITION__", ["lnk_3"]),
+    ]
+
+
+def test_export_links_incremental_failure(tmp_path: Path):
+    with StubShortIO() as stub:
+        stub.add_domain(hostname=hostname)
+        add_links(stub, day=1, n_link=3)
+        with Client(token="dummy", endpoint=stub.endpoint) as client:
+            client.export_links_incremental(hostname=hostname, dir=tmp_path)
+            add_links(stub, day=2, n_link=3)
+            add_links(stub, day=3, n_link=3)
+            # the oldest partition is written first, then the next one fails
+            blocker = tmp_path.joinpath("created_date=2025-01-03")
+            blocker.write_text("")
+            with pytest.raises(OSError):
+                client.export_links_incremental(
+                    hostname=hostname,
+                    dir=tmp_path,
+                    limit=2,
+                )
+            # the files of the failed run are deleted
+            assert tmp_path.joinpath("created_date=2025-01-02").is_dir()
+            assert len(list(tmp_path.glob("*/*.parquet"))) == 1
+            assert ExportManifest.load(tmp_path).n_link == 3
+            blocker.unlink()
+            manifest = client.export_links_incremental(
+                hostname=hostname,
+                dir=tmp_path,
+            )
+            assert manifest.n_link == 9
+            assert read_export(tmp_path)["id"].n_unique() == 9
+
+
+def test_export_links_incremental_tsv_by_month(tmp_path: Path):
+    with StubShortIO() as stub:
+        stub.add_domain(hostname=hostname)
+        add_links(stub, day=1, n_link=2)
+        add_links(stub, day=2, n_link=2)
+        with Client(token="dummy", endpoint=stub.endpoint) as client:
+            manifest = client.export_links_incremental(
+                hostname=hostname,
+                dir=tmp_path,
+                format="tsv",
+                partition_format="%Y-%m",
+            )
+    assert [file.partition for file in manifest.files] == ["2025-01"]
+    path = tmp_path.joinpath(manifest.files[0].path)
+    assert path.parent.name == "created_date=2025-01"
+    assert path.suffix == ".tsv"
+    assert len(path.read_text().splitlines()) == 5
+
+
+def test_async_export_links_incremental(tmp_path: Path):
+    async def main():
+        async with AsyncClient(token="dummy", endpoint=stub.endpoint) as client:
+            return await client.export_links_incremental(
+                hostname=hostname,
+                dir=tmp_path,
+                limit=2,
+            )
+
+    with StubShortIO() as stub:
+        stub.add_domain(hostname=hostname)
+        add_links(stub, day=1, n_link=3)
+        assert asyncio.run(main()).n_link == 3
+        add_links(stub, day=1, n_link=2, second=1)
+        add_links(stub, day=2, n_link=2)
+        manifest = asyncio.run(main())
+    assert manifest.n_link == 7
+    assert ExportManifest.load(tmp_path) == manifest
+    assert read_export(tmp_path)["id"].n_unique() == 7
+
+
+if __name__ == "__main__":
+    from pyshortio.tests import run_cov_test
+
+    run_cov_test(__file__, "pyshortio.export_incremental", preview=False)
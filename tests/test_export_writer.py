@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+
+import io
+import json
+import asyncio
+from pathlib import Path
+
+import pytest
+
+pl = pytest.importorskip("polars")
+
+from pyshortio.client import Client
+from pyshortio.async_client import AsyncClient
+from pyshortio.export import TYPED_EXPORT_COLUMNS
+from pyshortio.export_writer import get_export_writer, scan_pages, write_all_async
+from pyshortio.tests.stub_server import StubShortIO
+
+hostname = "example.short.gy"
+
+
+class RecordingSink(io.BytesIO):
+    """
+    A binary stream that records its size every time it is flushed.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.flushed_sizes = list()
+
+    def flush(self):
+        super().flush()
+        self.flushed_sizes.append(len(self.getvalue()))
+
+
+def add_links(stub: StubShortIO, n_link: int):
+    stub.add_domain(hostname=hostname)
+    folder = stub.add_folder(domain_id=1, name="marketing")
+    for i in range(n_link):
+        data = {"FolderId": folder["id"]} if i % 2 == 0 else dict()
+        stub.add_link(
+            domain_id=1,
+            original_url=f"https://example.com/{i}",
+            title=f"title {i}",
+            tags=["a", "b"],
+            **data,
+        )
+
+
+def test_get_export_writer():
+    with pytest.raises(ValueError):
+        get_export_writer("xlsx", io.BytesIO())
+    writer = get_export_writer("parquet", io.BytesIO(), compression="snappy")
+    assert writer.typed is True
+    assert writer.compression == "snappy"
+    assert get_export_writer("csv", io.BytesIO()).typed is False
+
+
+def test_scan_pages():
+    dfs = [
+        pl.DataFrame({"a": [1, 2], "b": ["x", "y"]}),
+        pl.DataFrame({"a": [3], "b": ["z"]}),
+    ]
+    lf = scan_pages(iter(dfs))
+    df = lf.filter(pl.col("a") > 1).select("a").head(1).collect()
+    assert df["a"].to_list() == [2]
+    df = scan_pages([]).collect()
+    assert df.height == 0
+    assert df.columns == TYPED_EXPORT_COLUMNS
+    assert df.schema["tags"] == pl.List(pl.Utf8)
+    assert df.schema["created_at"] == pl.Datetime("us", "UTC")
+
+
+def test_export_links(tmp_path: Path):
+    with StubShortIO() as stub:
+        add_links(stub, n_link=5)
+        with Client(token="dummy", endpoint=stub.endpoint) as client:
+            expected = client.export_to_tsv(hostname=hostname)
+            lines = expected.splitlines()
+            assert len(lines) == 6
+            assert "marketing" in lines[1]
+            assert "a, b" in lines[1]
+
+            path = tmp_path.joinpath("links.tsv")
+            n_link = client.export_links(hostname=hostname, sink=path, limit=2)
+            assert n_link == 5
+            assert path.read_text() == expected
+
+            # every page is flushed as soon as it is written
+            sink = RecordingSink()
+            client.export_links(hostname=hostname, sink=sink, limit=2)
+            assert not sink.closed
+            assert sink.getvalue().decode("utf-8") == expected
+            assert len(set(sink.flushed_sizes)) == 3
+
+            path = tmp_path.joinpath("links.csv")
+            client.export_links(hostname=hostname, sink=path, format="csv")
+            df = pl.read_csv(path)
+            assert df.shape == (5, len(lines[0].split("\t")))
+            assert df["tags"].to_list() == ["a, b"] * 5
+
+
+@pytest.mark.parametrize(
+    "format, read",
+    [
+        ("parquet", pl.read_parquet),
+        ("ipc", pl.read_ipc),
+        ("jsonl", pl.read_ndjson),
+    ],
+)
+def test_export_links_typed(tmp_path: Path, format, read):
+    path = tmp_path.joinpath(f"links.{format}")
+    with StubShortIO() as stub:
+        add_links(stub, n_link=5)
+        link = next(iter(stub.links.values()))
+        link["expiresAt"] = "2030-01-01T00:00:00.000Z"
+        with Client(token="dummy", endpoint=stub.endpoint) as client:
+            n_link = client.export_links(
+                hostname=hostname, sink=path, format=format, limit=2
+            )
+    assert n_link == 5
+    df = read(path)
+    if format == "jsonl":
+        # the reader drops the columns that are all null
+        line = path.read_text().splitlines()[0]
+        assert list(json.loads(line)) == TYPED_EXPORT_COLUMNS
+    else:
+        assert df.columns == TYPED_EXPORT_COLUMNS
+    assert df["tags"].to_list() == [["a", "b"]] * 5
+    assert df["folder_name"].to_list().count("marketing") == 3
+    if format == "jsonl":
+        df = df.with_columns(
+            pl.col("created_at", "expire_at").str.to_datetime(time_zone="UTC")
+        )
+    else:
+        assert df.schema["tags"] == pl.List(pl.Utf8)
+        assert df.schema["allow_duplicates"] == pl.Boolean
+    assert df.schema["created_at"] == pl.Datetime("us", "UTC")
+    assert df["created_at"].null_count() == 0
+    assert df["expire_at"].drop_nulls().dt.year().to_list() == [2030]
+
+
+def test_export_links_parquet_options():
+    sizes = dict()
+    with StubShortIO() as stub:
+        add_links(stub, n_link=50)
+        with Client(token="dummy", endpoint=stub.endpoint) as client:
+            for compression in ["uncompressed", "zstd"]:
+                sink = io.BytesIO()
+                client.export_links(
+                    hostname=hostname,
+                    sink=sink,
+                    format="parquet",
+                    limit=20,
+                    writer_options={
+                        "compression": compression,
+                        "row_group_size": 10,
+                    },
+                )
+                assert pl.read_parquet(sink.getvalue()).height == 50
+                sizes[compression] = len(sink.getvalue())
+    assert sizes["zstd"] < sizes["uncompressed"]
+
+
+def test_export_links_empty_domain():
+    with StubShortIO() as stub:
+        stub.add_domain(hostname=hostname)
+        with Client(token="dummy", endpoint=stub.endpoint) as client:
+            tsv = client.export_to_tsv(hostname=hostname)
+            assert tsv.splitlines()[0].startswith("id\tshort_url\toriginal_url")
+            assert len(tsv.splitlines()) == 1
+
+            expected = scan_pages([]).collect_schema()
+            for format, read in [("parquet", pl.read_parquet), ("ipc", pl.read_ipc)]:
+                sink = io.BytesIO()
+                n_link = client.export_links(
+                    hostname=hostname,
+                    sink=sink,
+                    format=format,
+                )
+                assert n_link == 0
+                df = read(sink.getvalue())
+                assert df.height == 0
+                assert df.schema == expected
+
+
+@pytest.mark.parametrize(
+    "format, read",
+    [("parquet", pl.read_parquet), ("ipc", pl.read_ipc)],
+)
+def test_write_all_no_page(format, read):
+    sink = io.BytesIO()
+    get_export_writer(format, sink).write_all([])
+    df = read(sink.getvalue())
+    assert df.height == 0
+    assert df.columns == TYPED_EXPORT_COLUMNS
+
+
+def test_async_export_links(tmp_path: Path):
+    path = tmp_path.joinpath("links.tsv")
+
+    async def main():
+        async with AsyncClient(token="dummy", endpoint=stub.endpoint) as client:
+            n_link = await client.export_links(hostname=hostname, sink=path, limit=2)
+            assert n_link == 5
+            return await client.export_to_tsv(hostname=hostname)
+
+    with StubShortIO() as stub:
+        add_links(stub, n_link=5)
+        tsv = asyncio.run(main())
+        with Client(token="dummy", endpoint=stub.endpoint) as client:
+            assert client.export_to_tsv(hostname=hostname) == tsv
+    assert path.read_text() == tsv
+
+
+def test_async_export_links_typed(tmp_path: Path):
+    path = tmp_path.joinpath("links.parquet")
+
+    async def main():
+        async with AsyncClient(token="dummy", endpoint=stub.endpoint) as client:
+            return await client.export_links(
+                hostname=hostname,
+                sink=path,
+                format="parquet",
+                limit=2,
+            )
+
+    with StubShortIO() as stub:
+        add_links(stub, n_link=5)
+        assert asyncio.run(main()) == 5
+    df = pl.read_parquet(path)
+    assert df.height == 5
+    assert df["tags"].to_list() == [["a", "b"]] * 5
+
+
+def test_async_export_links_writer_error():
+    class BrokenSink(io.BytesIO):
+        def write(self, data):
+            raise OSError("disk full")
+
+    async def main():
+        async with AsyncClient(token="dummy", endpoint=stub.endpoint) as client:
+            await client.export_links(
+                hostname=hostname,
+                sink=BrokenSink(),
+                format="csv",
+                limit=2,
+            )
+
+    with StubShortIO() as stub:
+        add_links(stub, n_link=5)
+        with pytest.raises(OSError):
+            asyncio.run(main())
+
+
+def test_write_all_async_cancelled_writer():
+    class CancelledWriter:
+        def write_all(self, dfs):
+            next(iter(dfs))
+            raise asyncio.CancelledError
+
+    async def iter_dfs():
+        yield pl.DataFrame({"a": [1]})
+        # the writer is cancelled in the meantime
+        await asyncio.sleep(0.2)
+        raise ValueError("page error")
+
+    # the error of the pages is not masked by the cancelled writer
+    with pytest.raises(ValueError):
+        asyncio.run(write_all_async(CancelledWriter(), iter_dfs()))
+
+
+if __name__ == "__main__":
+    from pyshortio.tests import run_cov_test
+
+    run_cov_test(__file__, "pyshortio.export_writer", preview=False)
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+from datetime import datetime, timezone
+
+from pyshortio.model import Link
+from pyshortio.fingerprint import (
+    normalize_value,
+    compute_fingerprint,
+    fingerprint_link,
+    fingerprint_link_data,
+    is_same,
+)
+
+
+def make_link(**data) -> Link:
+    _data = {
+        "id": "lnk_1",
+        "originalURL": "https://example.com",
+        "title": "Example",
+        "tags": ["b", "a"],
+        "expiresAt": "2030-01-01T00:00:00.000Z",
+        "cloaking": False,
+    }
+    _data.update(data)
+    return Link(_data=_data)
+
+
+def test_normalize_value():
+    assert normalize_value("title", None) is None
+    assert normalize_value("tags", ["b", "a"]) == "a,b"
+    assert normalize_value("tags", "b, a") == "a,b"
+    assert normalize_value("tags", []) == ""
+    assert normalize_value("cloaking", True) == "true"
+    assert normalize_value("clicks_limit", 10.0) == "10"
+    assert (
+        normalize_value("expire_at", "2030-01-01T00:00:00.000Z")
+        == normalize_value("expire_at", datetime(2030, 1, 1))
+        == normalize_value("expire_at", datetime(2030, 1, 1, tzinfo=timezone.utc))
+    )
+    assert normalize_value("expire_at", "not a date") == "not a date"
+
+
+def test_fingerprint():
+    link = make_link()
+    link_data = {
+        "original_url": "https://example.com",
+        "title": "Example",
+        "tags": ["a", "b"],
+        "expire_at": datetime(2030, 1, 1, tzinfo=timezone.utc),
+        "cloaking": False,
+        "short_url": "https://example.short.gy/abc",  # not fingerprinted
+    }
+    assert fingerprint_link(link) == fingerprint_link_data(link_data)
+    assert fingerprint_link(link) != fingerprint_link(make_link(title="Other"))
+    # missing and None are the same
+    assert compute_fingerprint({"title": None}) == compute_fingerprint({})
+    # values can't run into the next field
+    assert compute_fingerprint({"title": "a", "path": "b"}) != compute_fingerprint(
+        {"title": "ab"}
+    )
+
+
+def test_is_same():
+    link = make_link()
+    assert is_same({"original_url": "https://example.com"}, link)
+    assert is_same({"title": "Example", "tags": ["a", "b"]}, link)
+    assert is_same({"title": "Example", "password": "secret"}, link)
+    assert is_same({"expire_at": datetime(2030, 1, 1, tzinfo=timezone.utc)}, link)
+    assert is_same({"title": "Other"}, link) is False
+    assert is_same({"tags": ["a"]}, link) is False
+    # the link data of the model is not modified
+    assert link._data["tags"] == ["b", "a"]
+
+
+if __name__ == "__main__":
+    from pyshortio.tests import run_cov_test
+
+    run_cov_test(__file__, "pyshortio.fingerprint", preview=False)
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+import pickle
+
+import pytest
+
+msgspec = pytest.importorskip("msgspec")
+
+from pyshortio.lazy import FULL_DECODE_AFTER, LazyData, decode_links_page
+from pyshortio.model import Link
+from pyshortio.client import Client
+from pyshortio.tests.stub_server import StubShortIO
+
+
+def test_lazy_data():
+    data = decode_links_page(
+        b'{"links": [{"id": "a", "tags": ["x"], "title": null}, {"id": "b"}],'
+        b' "nextPageToken": "t", "unknown": 1}'
+    )
+    assert data["nextPageToken"] == "t"
+    assert decode_links_page(b'{"links": []}') == {"links": []}
+
+    lazy = data["links"][0]
+    assert isinstance(lazy, LazyData)
+    assert lazy.get("id") == "a"
+    assert lazy.get("title", "default") is None
+    assert lazy.get("missing", "default") == "default"
+    assert "title" in lazy
+    assert "missing" not in lazy
+    with pytest.raises(KeyError):
+        _ = lazy["missing"]
+    # only the accessed fields are decoded so far
+    assert lazy._data is None
+
+    assert lazy == {"id": "a", "tags": ["x"], "title": None}
+    assert lazy._raw is None
+    assert len(lazy) == 3
+    assert sorted(lazy) == ["id", "tags", "title"]
+    assert "LazyData" in repr(lazy)
+    assert pickle.loads(pickle.dumps(lazy)) == {"id": "a", "tags": ["x"], "title": None}
+
+    # the whole object is decoded after a few distinct fields
+    lazy = decode_links_page(b'{"links": [{"a": 1, "b": 2, "c": 3, "d": 4, "e": 5}]}')[
+        "links"
+    ][0]
+    for key in "abcde"[:FULL_DECODE_AFTER]:
+        lazy.get(key)
+    assert lazy._data is None
+    assert lazy.get("e") == 5
+    assert lazy._data == {"a": 1, "b": 2, "c": 3, "d": 4, "e": 5}
+
+
+def test_iter_links_lazy():
+    with StubShortIO() as stub:
+        stub.add_domain(hostname="example.short.gy")
+        for i in range(20):
+            stub.add_link(domain_id=1, original_url=f"https://example.com/{i}")
+        with Client(token="dummy", endpoint=stub.endpoint) as client:
+            eager = list(client.iter_links(domain_id=1, limit=7))
+            lazy = list(client.iter_links(domain_id=1, limit=7, lazy=True))
+            assert len(lazy) == 20
+            for link_eager, link_lazy in zip(eager, lazy):
+                assert isinstance(link_lazy._data, LazyData)
+                assert link_lazy.id == link_eager.id
+                assert link_lazy.original_url == link_eager.original_url
+                assert link_lazy.created_at == link_eager.created_at
+                assert link_lazy == link_eager
+            assert pickle.loads(pickle.dumps(lazy[0])) == eager[0]
+
+
+if __name__ == "__main__":
+    from pyshortio.tests import run_cov_test
+
+    run_cov_test(__file__, "pyshortio.lazy", preview=False)
@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+from datetime import datetime, timezone, timedelta
+
+import pytest
+
+from pyshortio.client import Client
+from pyshortio.async_client import AsyncClient
+from pyshortio.tests.stub_server import StubShortIO
+
+
+def test_scan_links():
+    with StubShortIO() as stub:
+        stub.add_domain(hostname="example.short.gy")
+        with Client(token="dummy", endpoint=stub.endpoint) as client:
+            # empty domain
+            assert list(client.scan_links(domain_id=1)) == []
+
+            # sparse links, one per second
+            for i in range(100):
+                stub.add_link(domain_id=1, original_url=f"https://example.com/{i}")
+            # a dense burst of links sharing a few timestamps
+            base = datetime(2025, 6, 1, tzinfo=timezone.utc)
+            for i in range(200):
+                stub.add_link(
+                    domain_id=1,
+                    original_url=f"https://example.com/burst/{i}",
+                    created_at=base + timedelta(milliseconds=i // 50),
+                )
+            # one link in the far future
+            stub.add_link(
+                domain_id=1,
+                original_url="https://example.com/last",
+                created_at=datetime(2030, 1, 1, tzinfo=timezone.utc),
+            )
+            # links without creation time are in no time window, more than a page
+            for i in range(10):
+                stub.add_link(
+                    domain_id=1,
+                    original_url=f"https://example.com/no-time/{i}",
+                    createdAt=None,
+                )
+            expected = sorted(stub.links)
+
+            link_list = list(
+                client.scan_links(
+                    domain_id=1,
+                    n_windows=4,
+                    max_workers=4,
+                    limit=7,
+                    max_pages_per_window=2,
+                )
+            )
+            link_ids = [link.id for link in link_list]
+            assert len(link_ids) == len(set(link_ids))
+            assert sorted(link_ids) == expected
+
+            # stop early
+            for _ in client.scan_links(domain_id=1, limit=5):
+                break
+
+            # only links without creation time
+            with StubShortIO() as other_stub:
+                other_stub.add_domain(hostname="example.short.gy")
+                for i in range(3):
+                    other_stub.add_link(
+                        domain_id=1,
+                        original_url=f"https://example.com/{i}",
+                        createdAt=None,
+                    )
+                with Client(token="dummy", endpoint=other_stub.endpoint) as other:
+                    link_ids = [
+                        link.id for link in other.scan_links(domain_id=1, limit=2)
+                    ]
+                    assert sorted(link_ids) == sorted(other_stub.links)
+
+        endpoint = stub.endpoint
+
+        async def main():
+            async with AsyncClient(token="dummy", endpoint=endpoint) as client:
+                link_ids = [
+                    link.id
+                    async for link in client.scan_links(
+                        domain_id=1,
+                        n_windows=4,
+                        max_workers=4,
+                        limit=7,
+                        max_pages_per_window=2,
+                    )
+                ]
+                assert len(link_ids) == len(set(link_ids))
+                assert sorted(link_ids) == expected
+
+                # stop early
+                async for _ in client.scan_links(domain_id=1, limit=5):
+                    break
+
+        pytest.importorskip("httpx")
+        asyncio.run(main())
+
+
+def test_scan_links_by_folder():
+    with StubShortIO() as stub:
+        stub.add_domain(hostname="example.short.gy")
+        folder_ids = [stub.add_folder(domain_id=1, name=f"f{i}")["id"] for i in range(5)]
+        for i in range(60):
+            if i % 6 == 5:
+                folder_id = None
+            else:
+                folder_id = folder_ids[i % 6]
+            stub.add_link(
+                domain_id=1,
+                original_url=f"https://example.com/{i}",
+                FolderId=folder_id,
+            )
+        # links without creation time, in a folder or not
+        for i in range(2):
+            stub.add_link(
+                domain_id=1,
+                original_url=f"https://example.com/no-time/{i}",
+                FolderId=None,
+                createdAt=None,
+            )
+        stub.add_link(
+            domain_id=1,
+            original_url="https://example.com/no-time/folder",
+            FolderId=folder_ids[0],
+            createdAt=None,
+        )
+        n_links_in_folders = {folder_id: 10 for folder_id in folder_ids[1:]}
+        with Client(token="dummy", endpoint=stub.endpoint) as client:
+            # only the folders, 10 or 11 links per folder is 3 pages of 4
+            n_requests = stub.n_requests
+            pages = list(
+                client.pagi_list_links_by_folder(domain_id=1, max_workers=3, limit=4)
+            )
+            assert len(pages) == 15
+            assert {folder.id for folder, _ in pages} == set(folder_ids)
+            assert stub.n_requests - n_requests == 1 + 15
+
+            # the links without folder are read by time windows, concurrently
+            del stub.requests[:]
+            pages = list(
+                client.pagi_list_links_by_folder(
+                    domain_id=1,
+                    max_workers=3,
+                    limit=4,
+                    include_no_folder=True,
+                    n_windows=4,
+                )
+            )
+            by_folder = dict()
+            for folder, link_list in pages:
+                key = None if folder is None else folder.id
+                for link in link_list:
+                    assert link.folder_id == key
+                by_folder.setdefault(key, []).extend(link.id for link in link_list)
+            assert set(by_folder) == {None, *folder_ids}
+            n_links = {key: len(link_ids) for key, link_ids in by_folder.items()}
+            assert n_links == {None: 12, folder_ids[0]: 11, **n_links_in_folders}
+            # no request walks the whole domain page by page: apart from the
+            # two edge scans that find the time range and the links without
+            # creation time, every request without folderId is limited to a
+            # time window
+            domain_requests = [
+                params
+                for _, path, params, _ in stub.requests
+                if path == "/api/links" and "folderId" not in params
+            ]
+            unbounded = [params for params in domain_requests if "afterDate" not in params]
+            assert len(unbounded) == 2
+            assert len(domain_requests) > 2
+
+            link_ids = [
+                link.id
+                for link in client.scan_links(
+                    domain_id=1,
+                    strategy="folder",
+                    limit=4,
+                    include_no_folder=True,
+                )
+            ]
+            assert sorted(link_ids) == sorted(stub.links)
+            link_ids = list(client.scan_links(domain_id=1, strategy="folder"))
+            assert len(link_ids) == 51
+
+            with pytest.raises(ValueError):
+                list(client.scan_links(domain_id=1, strategy="folder", folder_id="x"))
+            with pytest.raises(ValueError):
+                list(client.scan_links(domain_id=1, strategy="unknown"))
+
+        endpoint = stub.endpoint
+
+        async def main():
+            async with AsyncClient(token="dummy", endpoint=endpoint) as client:
+                by_folder = dict()
+                async for folder, link_list in client.pagi_list_links_by_folder(
+                    domain_id=1,
+                    max_workers=3,
+                    limit=4,
+                    include_no_folder=True,
+                    n_windows=4,
+                ):
+                    key = None if folder is None else folder.id
+                    for link in link_list:
+                        assert link.folder_id == key
+                    by_folder.setdefault(key, []).extend(link.id for link in link_list)
+                assert set(by_folder) == {None, *folder_ids}
+                assert len(by_folder[None]) == 12
+
+                link_ids = [
+                    link.id
+                    async for link in client.scan_links(
+                        domain_id=1,
+                        strategy="folder",
+                    )
+                ]
+                assert len(link_ids) == 51
+
+                with pytest.raises(ValueError):
+                    async for _ in client.scan_links(domain_id=1, strategy="unknown"):
+                        pass
+
+        pytest.importorskip("httpx")
+        asyncio.run(main())
+
+
+if __name__ == "__main__":
+    from pyshortio.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "pyshortio.link_scan",
+        preview=False,
+    )
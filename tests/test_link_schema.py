@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+import io
+from datetime import datetime, timezone
+
+import pytest
+
+from pyshortio.arg import NA
+from pyshortio.link_schema import (
+    LINK_FIELDS,
+    FIELDS_BY_NAME,
+    encode_create_link,
+    encode_batch_link,
+    encode_update_link,
+)
+from pyshortio.link_management import _create_link_data
+from pyshortio.model import Link
+from pyshortio.sync_tsv import get_fingerprint_data_from_link
+from pyshortio.client import Client
+from pyshortio.tests.stub_server import StubShortIO
+
+
+def test_schema():
+    assert len(FIELDS_BY_NAME) == len(LINK_FIELDS)
+    for field in LINK_FIELDS:
+        if field.create or field.batch or field.update:
+            assert field.key is not None
+        if field.attr is not None:
+            assert hasattr(Link, field.attr)
+
+
+def test_encoders():
+    expire_at = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    kwargs = {name: NA for name in FIELDS_BY_NAME}
+    kwargs.update(
+        hostname="example.short.gy",
+        original_url="https://example.com",
+        title=None,
+        expire_at=expire_at,
+        expire_url="https://example.com/expired",
+        folder_id="fld_1",
+        raise_for_status=True,
+    )
+    assert _create_link_data(**kwargs) == {
+        "domain": "example.short.gy",
+        "originalURL": "https://example.com",
+        "title": None,
+        "expiresAt": expire_at.isoformat(),
+        "expiredURL": "https://example.com/expired",
+        "folderId": "fld_1",
+    }
+    assert encode_update_link(kwargs) == {
+        "originalURL": "https://example.com",
+        "title": None,
+        "expiresAt": expire_at.isoformat(),
+        "expiredURL": "https://example.com/expired",
+    }
+    assert encode_update_link({}) == {}
+
+    # batch links use the same names as create_link and ignore unknown keys
+    assert encode_batch_link(
+        {
+            "original_url": "https://example.com",
+            "expire_at": expire_at,
+            "expire_url": "https://example.com/expired",
+            "tags": ["a"],
+            "allow_duplicates": True,
+            "id": "lnk_1",
+            "folder_id": "fld_1",
+        }
+    ) == {
+        "originalURL": "https://example.com",
+        "tags": ["a"],
+        "expiresAt": expire_at.isoformat(),
+        "expiredURL": "https://example.com/expired",
+        "allowDuplicates": True,
+    }
+    with pytest.raises(KeyError):
+        encode_batch_link({"title": "no original url"})
+    with pytest.raises(KeyError):
+        encode_create_link({})
+
+
+def test_fingerprint_data():
+    link = Link(
+        _data={
+            "id": "lnk_1",
+            "originalURL": "https://example.com",
+            "expiresAt": "2030-01-01",
+            "FolderId": "fld_1",
+            "title": None,
+        }
+    )
+    assert get_fingerprint_data_from_link(link) == {
+        "original_url": "https://example.com",
+        "expire_at": "2030-01-01",
+        "folder_id": "fld_1",
+    }
+
+
+def test_export_then_sync():
+    hostname = "example.short.gy"
+    with StubShortIO() as stub:
+        stub.add_domain(hostname=hostname)
+        with Client(token="dummy", endpoint=stub.endpoint) as client:
+            client.create_link(
+                hostname=hostname,
+                original_url="https://example.com/a",
+                title="A",
+            )
+            # an exported TSV has read only columns like id and short_url,
+            # they must not be sent to update_link
+            tsv = client.export_to_tsv(hostname=hostname)
+            client.sync_tsv(
+                hostname=hostname,
+                file=io.StringIO(tsv.replace("\tA\t", "\tA new\t")),
+            )
+            _, link_list = client.list_links(domain_id=1)
+            assert [link.title for link in link_list] == ["A new"]
+
+
+if __name__ == "__main__":
+    from pyshortio.tests import run_cov_test
+
+    run_cov_test(__file__, "pyshortio.link_schema", preview=False)
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+
+import json
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+pl = pytest.importorskip("polars")
+
+from pyshortio.export import EXPORT_COLUMNS
+from pyshortio.link_table import LINK_COLUMNS, LinkTable, read_links_page
+from pyshortio.model import Link
+from pyshortio.paginator import Page
+from pyshortio.client import Client
+from pyshortio.async_client import AsyncClient
+from pyshortio.tests.stub_server import StubShortIO
+
+
+def add_links(stub: StubShortIO):
+    stub.add_domain(hostname="example.short.gy")
+    folder = stub.add_folder(domain_id=1, name="marketing")
+    for i in range(40):
+        data = dict()
+        if i % 2 == 0:
+            data["FolderId"] = folder["id"]
+        if i % 3 == 0:
+            data["tags"] = ["a", "b"]
+        if i % 4 == 0:
+            data["title"] = f"title {i}"
+            data["clicksLimit"] = i
+            data["passwordContact"] = True
+            data["utmSource"] = "newsletter"
+            data["expiresAt"] = "2030-01-01T00:00:00.000Z"
+            data["expiredURL"] = "https://example.com/expired"
+        stub.add_link(
+            domain_id=1,
+            original_url=f"https://example.com/{i}",
+            **data,
+        )
+    return folder
+
+
+def test_link_table():
+    table = LinkTable.from_raw_links([])
+    assert len(table) == 0
+    assert table.df.columns == [name for name, _, _ in LINK_COLUMNS]
+    assert len(LinkTable.concat([table, table])) == 0
+
+    table = LinkTable.from_raw_links(
+        [
+            {
+                "id": "lnk_1",
+                "DomainId": "45678",  # wrong type is cast
+                "tags": ["a"],
+                "createdAt": "2025-01-01T00:00:00.000Z",
+                "unknownKey": 1,  # unknown keys are ignored
+            },
+            {"id": "lnk_2"},
+        ]
+    )
+    df = table.df
+    assert df["domain_id"].to_list() == [45678, None]
+    assert df["tags"].to_list() == [["a"], None]
+    assert df["created_at"].to_list() == [
+        datetime(2025, 1, 1, tzinfo=timezone.utc),
+        None,
+    ]
+
+
+def test_read_links_page():
+    links = [
+        {
+            "id": "lnk_1",
+            "tags": ["a"],
+            "clicksLimit": 3,
+            "createdAt": "2025-01-01T00:00:00.000Z",
+            "unknownKey": 1,
+        },
+        {"id": "lnk_2"},
+    ]
+    body = {"links": links, "nextPageToken": "token"}
+    raw_df, next_token = read_links_page(json.dumps(body).encode("utf-8"))
+    assert next_token == "token"
+    assert raw_df.equals(LinkTable._read_page(Page(None, body, None)))
+
+    raw_df, next_token = read_links_page(b'{"links": []}')
+    assert next_token is None
+    assert raw_df.height == 0
+    assert raw_df.columns == [key for _, key, _ in LINK_COLUMNS]
+
+    # a value that doesn't match the data type falls back to a lenient read
+    links[0]["DomainId"] = "45678"
+    raw_df, _ = read_links_page(json.dumps(body).encode("utf-8"))
+    assert raw_df["DomainId"].to_list() == [45678, None]
+
+    # a value that can't be cast is set to null, the other links are kept
+    links[1]["archived"] = "true"
+    links[1]["cloaking"] = True
+    raw_df, _ = read_links_page(json.dumps(body).encode("utf-8"))
+    assert raw_df["id"].to_list() == ["lnk_1", "lnk_2"]
+    assert raw_df["archived"].to_list() == [None, None]
+    assert raw_df["cloaking"].to_list() == [None, True]
+    table = LinkTable.from_raw_links(links)
+    assert table.df["archived"].to_list() == [None, None]
+
+
+def test_read_links_page_epoch_created_at():
+    created_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    links = [
+        {"id": "lnk_1", "createdAt": "2025-01-01T00:00:00.000Z"},
+        # unix timestamps, in milliseconds and in seconds
+        {"id": "lnk_2", "createdAt": 1735689600000},
+        {"id": "lnk_3", "createdAt": 1735689600},
+        {"id": "lnk_4", "createdAt": None},
+    ]
+    body = {"links": links}
+    raw_df, _ = read_links_page(json.dumps(body).encode("utf-8"))
+    table = LinkTable.from_page(Page(None, {"links": raw_df}, raw_df))
+    expected = [created_at, created_at, created_at, None]
+    assert table.df["created_at"].to_list() == expected
+    # the first value is a timestamp
+    table = LinkTable.from_raw_links(links[::-1])
+    assert table.df["created_at"].to_list() == expected[::-1]
+
+    table.df = table.df.with_columns(expires_at=pl.lit("1735689600000"))
+    export_df = table.to_export_df(dict(), typed=True)
+    assert export_df["expire_at"].to_list() == [created_at] * 4
+
+
+def test_get_link_table_and_export():
+    with StubShortIO() as stub:
+        folder = add_links(stub)
+        folder_id_to_name_mapping = {folder["id"]: folder["name"]}
+        with Client(token="dummy", endpoint=stub.endpoint) as client:
+            table = client.get_link_table(domain_id=1, limit=7)
+            assert len(table) == 40
+            assert sorted(table.df["id"].to_list()) == sorted(stub.links)
+            for row in table.df.head(3).iter_rows(named=True):
+                link = Link(_data=stub.links[row["id"]])
+                assert row["created_at"] == link.created_at
+                assert row["folder_id"] == link.folder_id
+
+            # the export rows have the same values as the Link objects
+            export_df = table.to_export_df(folder_id_to_name_mapping)
+            assert export_df.columns == EXPORT_COLUMNS
+            for row in export_df.iter_rows(named=True):
+                link = Link(_data=stub.links[row["id"]])
+                assert row["original_url"] == link.original_url
+                assert row["short_url"] == link.short_url
+                assert row["title"] == link.title
+                assert row["tags"] == (", ".join(link.tags) or None)
+                assert row["folder_name"] == folder_id_to_name_mapping.get(
+                    link.folder_id
+                )
+                assert row["clicks_limit"] == link.clicks_limit
+                assert row["password_contact"] == link.password_contact
+                assert row["utm_source"] == link.utm_source
+            expected = export_df.write_csv(separator="\t")
+            assert client.export_to_tsv(hostname="example.short.gy") == expected
+
+            table = client.get_link_table(domain_id=1, folder_id=folder["id"])
+            assert len(table) == 20
+
+            # the table pages don't create any Link
+            pages = list(client.pagi_list_links(domain_id=1, limit=15, table=True))
+            assert [len(page.result) for page in pages] == [15, 15, 10]
+            assert all(isinstance(page.result, pl.DataFrame) for page in pages)
+
+        endpoint = stub.endpoint
+
+        async def main():
+            async with AsyncClient(token="dummy", endpoint=endpoint) as client:
+                table = await client.get_link_table(domain_id=1, limit=7)
+                assert len(table) == 40
+                tsv = await client.export_to_tsv(hostname="example.short.gy")
+                assert tsv == expected
+
+        pytest.importorskip("httpx")
+        asyncio.run(main())
+
+
+if __name__ == "__main__":
+    from pyshortio.tests import run_cov_test
+
+    run_cov_test(__file__, "pyshortio.link_table", preview=False)
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+import pickle
+from datetime import datetime, timezone
+
+import pytest
+
+from pyshortio.model import Domain, Link, Folder, parse_created_at
+
+
+@pytest.mark.parametrize("klass", [Domain, Link, Folder])
+def test_slots(klass):
+    data = {"id": "x"}
+    obj = klass(_data=data)
+    assert not hasattr(obj, "__dict__")
+    with pytest.raises(AttributeError):
+        obj.not_a_field = 1
+
+    fast = klass._from_api_data(data)
+    assert fast == obj
+    assert fast._data is data
+    assert pickle.loads(pickle.dumps(fast)) == obj
+
+    with pytest.raises(TypeError):
+        klass()
+
+
+def test_datetime_cache():
+    data = {
+        "createdAt": "2025-01-01T00:00:00.000Z",
+        "updatedAt": "2025-01-02T00:00:00.000Z",
+        "sslCertExpirationDate": "2026-01-01T00:00:00Z",
+    }
+    domain = Domain._from_api_data(data)
+    assert domain.created_at == datetime(2025, 1, 1, tzinfo=timezone.utc)
+    assert domain.updated_at == datetime(2025, 1, 2, tzinfo=timezone.utc)
+    assert domain.ssl_cert_expiration_date == datetime(2026, 1, 1, tzinfo=timezone.utc)
+    # parsed once, then served from the cache
+    data["createdAt"] = "2030-01-01T00:00:00.000Z"
+    assert domain.created_at.year == 2025
+    assert pickle.loads(pickle.dumps(domain)).created_at.year == 2025
+    assert Domain._from_api_data({}).created_at is None
+
+    link = Link._from_api_data({"createdAt": 1700000000})
+    assert link.created_at == datetime.fromtimestamp(1700000000)
+    assert Link._from_api_data({"createdAt": "not a date"}).created_at is None
+    # the cache is not part of the model identity
+    assert link == Link(_data={"createdAt": 1700000000})
+
+    links = [
+        Link._from_api_data({"createdAt": f"2025-01-0{i % 3 + 1}T00:00:00.000Z"})
+        for i in range(9)
+    ] + [Link._from_api_data({})]
+    created_at_list = parse_created_at(links)
+    assert created_at_list[:3] == [
+        datetime(2025, 1, day, tzinfo=timezone.utc) for day in (1, 2, 3)
+    ]
+    assert created_at_list[-1] is None
+    assert [link.created_at for link in links] == created_at_list
+    assert parse_created_at(links) == created_at_list
+
+
+if __name__ == "__main__":
+    from pyshortio.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "pyshortio.model",
+        preview=False,
+    )
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+
+import time
+import asyncio
+
+import pytest
+import requests
+
+from pyshortio import json_backend
+from pyshortio.json_backend import loads, response_json
+from pyshortio.paginator import Page, _paginate, _prefetch, _aprefetch
+from pyshortio.client import Client
+from pyshortio.tests.stub_server import StubShortIO
+
+
+def test_prefetch():
+    assert list(_prefetch(range(10), prefetch=3)) == list(range(10))
+
+    def fail():
+        yield 1
+        raise ValueError("boom")
+
+    iterator = _prefetch(fail(), prefetch=2)
+    assert next(iterator) == 1
+    with pytest.raises(ValueError):
+        next(iterator)
+
+    # the producer never runs more than ``prefetch`` items ahead
+    produced = []
+
+    def count():
+        for i in range(100):
+            produced.append(i)
+            yield i
+
+    iterator = _prefetch(count(), prefetch=2)
+    assert next(iterator) == 0
+    time.sleep(0.1)
+    assert len(produced) <= 4
+    iterator.close()
+
+
+def test_aprefetch():
+    async def agen(n: int):
+        for i in range(n):
+            yield i
+        if n == 2:
+            raise ValueError("boom")
+
+    async def main():
+        assert [i async for i in _aprefetch(agen(5), prefetch=2)] == list(range(5))
+        with pytest.raises(ValueError):
+            [i async for i in _aprefetch(agen(2), prefetch=2)]
+        # stop early
+        async for i in _aprefetch(agen(100), prefetch=2):
+            break
+
+    asyncio.run(main())
+
+
+def test_page():
+    page = Page(response="res", data={"links": []}, result=[1, 2])
+    response, result = page
+    assert response == "res"
+    assert result == [1, 2]
+    assert loads(b'{"a": [1, "x"]}') == {"a": [1, "x"]}
+
+
+def test_paginate_decode_once(monkeypatch):
+    n_decode = {"count": 0}
+    original_json = requests.Response.json
+
+    def json(self, **kwargs):  # pragma: no cover
+        n_decode["count"] += 1
+        return original_json(self, **kwargs)
+
+    n_loads = {"count": 0}
+
+    def counted_loads(content):
+        n_loads["count"] += 1
+        return loads(content)
+
+    monkeypatch.setattr(requests.Response, "json", json)
+    monkeypatch.setattr(json_backend, "loads", counted_loads)
+
+    with StubShortIO() as stub:
+        stub.add_domain(hostname="example.short.gy")
+        for i in range(10):
+            stub.add_link(domain_id=1, original_url=f"https://example.com/{i}")
+        with Client(token="dummy", endpoint=stub.endpoint) as client:
+            pages = list(client.pagi_list_links(domain_id=1, limit=3))
+            assert len(pages) == 4
+            assert pages[0].data["nextPageToken"] == "3"
+
+            # methods returning a (response, result) tuple still work, the
+            # paginator reuses the body decoded by the method
+            n_loads["count"] = 0
+            pages = list(
+                _paginate(
+                    method=client.list_links,
+                    list_key="links",
+                    get_next_token=lambda res: res.get("nextPageToken"),
+                    set_next_token=lambda kwargs, token: kwargs.update(
+                        page_token=token
+                    ),
+                    kwargs=dict(domain_id=1, limit=3),
+                    max_results=9999,
+                )
+            )
+            assert [len(link_list) for _, link_list in pages] == [3, 3, 3, 1]
+            assert n_loads["count"] == 4
+
+            # the debug logging shares the decode with the method
+            n_loads["count"] = 0
+            response = client.http_get(
+                url=f"{client.endpoint}/api/domains",
+                debug=True,
+            )
+            data = response_json(response)
+            assert [dct["hostname"] for dct in data] == ["example.short.gy"]
+            assert n_loads["count"] == 1
+    assert n_decode["count"] == 0
+
+
+def test_pagi_list_links_prefetch():
+    with StubShortIO() as stub:
+        stub.add_domain(hostname="example.short.gy")
+        for i in range(10):
+            stub.add_link(domain_id=1, original_url=f"https://example.com/{i}")
+        with Client(token="dummy", endpoint=stub.endpoint) as client:
+            expected = [
+                [link.id for link in link_list]
+                for _, link_list in client.pagi_list_links(domain_id=1, limit=3)
+            ]
+            pages = [
+                [link.id for link in link_list]
+                for _, link_list in client.pagi_list_links(
+                    domain_id=1,
+                    limit=3,
+                    prefetch=2,
+                )
+            ]
+            assert pages == expected
+            assert [len(ids) for ids in pages] == [3, 3, 3, 1]
+
+            # an error on a later page is raised to the consumer
+            stub.fail(500, path="/api/links", times=1)
+            paginator = client.pagi_list_links(domain_id=1, limit=3, prefetch=2)
+            with pytest.raises(requests.HTTPError):
+                list(paginator)
+
+
+def test_iter_links():
+    with StubShortIO() as stub:
+        stub.add_domain(hostname="example.short.gy")
+        for i in range(10):
+            stub.add_link(domain_id=1, original_url=f"https://example.com/{i}")
+        with Client(token="dummy", endpoint=stub.endpoint) as client:
+            link_list = list(client.iter_links(domain_id=1, limit=3))
+            assert sorted(link.id for link in link_list) == sorted(stub.links)
+
+            link_list = list(client.iter_links(domain_id=1, limit=3, max_results=4))
+            assert len(link_list) == 4
+            # it stops at the page that reaches max_results
+            n_requests = stub.n_requests
+            list(client.iter_links(domain_id=1, limit=3, max_results=3))
+            assert stub.n_requests == n_requests + 1
+
+
+if __name__ == "__main__":
+    from pyshortio.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "pyshortio.paginator",
+        preview=False,
+    )
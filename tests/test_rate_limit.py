@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+import time
+import asyncio
+import threading
+
+import pytest
+
+from pyshortio import rate_limit
+from pyshortio.rate_limit import (
+    TokenBucket,
+    FileTokenBucket,
+    RateLimiter,
+)
+from pyshortio.client import Client
+from pyshortio.tests.stub_server import StubShortIO
+
+
+def test_token_bucket():
+    bucket = TokenBucket(rate=50, capacity=2)
+    assert bucket.try_acquire() == 0
+    assert bucket.try_acquire() == 0
+    assert bucket.try_acquire() > 0
+
+    # 20 tokens at 100 per second across 4 threads take about 0.2 seconds
+    bucket = TokenBucket(rate=100, capacity=1)
+    bucket.acquire()
+
+    def run():
+        for _ in range(5):
+            bucket.acquire()
+
+    start = time.monotonic()
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert time.monotonic() - start >= 0.18
+
+    start = time.monotonic()
+    asyncio.run(bucket.aacquire())
+    asyncio.run(bucket.aacquire())
+    assert time.monotonic() - start >= 0.009
+
+
+def test_file_token_bucket(tmp_path):
+    path = tmp_path / "bucket" / "read.bucket"
+    # two buckets on the same file share the tokens, like two processes would
+    bucket1 = FileTokenBucket(path=path, rate=50, capacity=2)
+    bucket2 = FileTokenBucket(path=path, rate=50, capacity=2)
+    assert bucket1.try_acquire() == 0
+    assert bucket2.try_acquire() == 0
+    assert bucket1.try_acquire() > 0
+    assert bucket2.try_acquire() > 0
+    bucket2.acquire()
+    bucket1.close()
+    bucket2.close()
+    assert bucket1.try_acquire() > 0
+    bucket1.close()
+
+
+def test_bucket_tokens_more_than_capacity(tmp_path):
+    path = tmp_path / "read.bucket"
+    for bucket in [
+        TokenBucket(rate=50, capacity=2),
+        FileTokenBucket(path=path, rate=50, capacity=2),
+    ]:
+        with pytest.raises(ValueError):
+            bucket.acquire(3)
+        with pytest.raises(ValueError):
+            asyncio.run(bucket.aacquire(3))
+        bucket.acquire(2)
+
+
+def test_file_token_bucket_aacquire(tmp_path):
+    path = tmp_path / "read.bucket"
+    bucket = FileTokenBucket(path=path, rate=50, capacity=1)
+    other = FileTokenBucket(path=path, rate=50, capacity=1)
+
+    async def main():
+        # another process holds the file lock for 0.2 seconds
+        f = other._get_file()
+        await asyncio.to_thread(rate_limit._lock_file, f)
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.2, rate_limit._unlock_file, f)
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while 1:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.ensure_future(tick())
+        await bucket.aacquire()
+        task.cancel()
+        return ticks
+
+    # the event loop keeps running while waiting for the lock
+    assert asyncio.run(main()) >= 5
+    bucket.close()
+    other.close()
+
+
+def test_rate_limiter(tmp_path):
+    rate_limiter = RateLimiter.new(read_rate=10)
+    assert isinstance(rate_limiter.read, TokenBucket)
+    assert rate_limiter.write is None
+    assert rate_limiter.get_bucket("https://api.short.io/api/links?x=1") is rate_limiter.read
+    assert rate_limiter.get_bucket("https://api.short.io/links/expand") is rate_limiter.read
+    assert rate_limiter.get_bucket("https://api.short.io/links/bulk") is None
+    rate_limiter.acquire("https://api.short.io/links/bulk")
+
+    rate_limiter = RateLimiter.new(write_rate=10, other_rate=10, lock_dir=tmp_path)
+    assert isinstance(rate_limiter.write, FileTokenBucket)
+    assert rate_limiter.get_bucket("https://api.short.io/links/delete_bulk") is rate_limiter.write
+    assert rate_limiter.get_bucket("https://api.short.io/links/lnk_1") is rate_limiter.other
+    asyncio.run(rate_limiter.aacquire("https://api.short.io/links/lnk_1"))
+    asyncio.run(rate_limiter.aacquire("https://api.short.io/api/links"))
+
+
+def test_client_rate_limit():
+    with StubShortIO() as stub:
+        stub.add_domain(hostname="example.short.gy")
+        with Client(
+            token="dummy",
+            endpoint=stub.endpoint,
+            rate_limiter=RateLimiter.new(read_rate=50),
+        ) as client:
+            start = time.monotonic()
+            for _ in range(6):
+                client.list_links(domain_id=1)
+            # the first call uses the initial token
+            assert time.monotonic() - start >= 0.09
+            # other endpoints are not throttled
+            start = time.monotonic()
+            for _ in range(6):
+                client.list_domains()
+            assert time.monotonic() - start < 0.09
+
+
+if __name__ == "__main__":
+    from pyshortio.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "pyshortio.rate_limit",
+        preview=False,
+    )
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+
+import time
+
+import pytest
+import requests
+
+from pyshortio.retry import (
+    parse_retry_after,
+    parse_rate_limit_reset,
+    RetryPolicy,
+)
+from pyshortio.client import Client
+from pyshortio.tests.stub_server import StubShortIO
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, headers: dict = None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("-1") == 0.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("not a date") is None
+
+
+def test_parse_rate_limit_reset():
+    assert parse_rate_limit_reset({}) is None
+    assert parse_rate_limit_reset({"ratelimit-reset": "7"}) == 7.0
+    assert parse_rate_limit_reset({"x-ratelimit-reset": "5"}) == 5.0
+    delay = parse_rate_limit_reset({"x-ratelimit-reset": str(int(time.time()) + 10)})
+    assert 8 <= delay <= 10
+
+
+def test_retry_policy():
+    policy = RetryPolicy(max_attempts=3, base_delay=1, max_delay=4)
+    for attempt in range(1, 10):
+        assert 0 <= policy.backoff(attempt) <= 4
+
+    assert policy.is_retryable(FakeResponse(503)) is True
+    assert policy.is_retryable(FakeResponse(400)) is False
+    assert policy.is_retryable(FakeResponse(503), idempotent=False) is False
+    assert policy.is_retryable(FakeResponse(429), idempotent=False) is True
+    assert policy.is_retryable(None) is True
+    assert policy.is_retryable(None, idempotent=False) is False
+
+    # server asked us to wait, capped by max_retry_after
+    policy = RetryPolicy(max_retry_after=2)
+    assert policy.server_delay(FakeResponse(429, {"retry-after": "1"})) == 1
+    assert policy.server_delay(FakeResponse(429, {"retry-after": "60"})) == 2
+    assert policy.server_delay(FakeResponse(429)) is None
+    policy = RetryPolicy(respect_retry_after=False)
+    assert policy.server_delay(FakeResponse(429, {"retry-after": "1"})) is None
+
+    # attempt budget
+    state = RetryPolicy(max_attempts=3).start()
+    assert state.next_delay(FakeResponse(503)) is not None
+    assert state.next_delay(FakeResponse(503)) is not None
+    assert state.next_delay(FakeResponse(503)) is None
+
+    # time budget
+    state = RetryPolicy(max_elapsed=1).start()
+    assert state.next_delay(FakeResponse(429, {"retry-after": "5"})) is None
+    assert state.next_delay(FakeResponse(200)) is None
+
+
+def test_client_retry():
+    policy = RetryPolicy(max_attempts=3, base_delay=0.01)
+    with StubShortIO() as stub:
+        stub.add_domain(hostname="example.short.gy")
+        endpoint = stub.endpoint
+        with Client(
+            token="dummy",
+            endpoint=endpoint,
+            retry_policy=policy,
+        ) as client:
+            # transient errors are retried
+            stub.fail(503, times=2, path="/api/domains")
+            _, domain_list = client.list_domains()
+            assert len(domain_list) == 1
+            assert stub.n_requests == 3
+
+            # Retry-After is honored
+            stub.fail(429, method="GET", headers={"Retry-After": "0.05"})
+            start = time.monotonic()
+            _, domain_list = client.list_domains()
+            assert time.monotonic() - start >= 0.05
+
+            # the budget is exhausted
+            stub.fail(503, times=3, path="/api/domains")
+            with pytest.raises(requests.HTTPError):
+                client.list_domains()
+            stub.faults.clear()
+
+            # a non-idempotent POST is not retried on 5xx ...
+            stub.fail(503, method="POST")
+            with pytest.raises(requests.HTTPError):
+                client.create_link(
+                    hostname="example.short.gy",
+                    original_url="https://example.com/a",
+                )
+            # ... but it is retried on 429
+            stub.fail(429, method="POST")
+            _, link = client.create_link(
+                hostname="example.short.gy",
+                original_url="https://example.com/a",
+            )
+            # updating a link is marked as retry safe
+            stub.fail(503, method="POST")
+            _, link = client.update_link(link_id=link.id, title="A")
+            assert link.title == "A"
+
+    # connection errors are retried, then re-raised
+    client = Client(token="dummy", endpoint=endpoint, retry_policy=policy)
+    with pytest.raises(requests.ConnectionError):
+        client.list_domains()
+
+
+if __name__ == "__main__":
+    from pyshortio.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "pyshortio.retry",
+        preview=False,
+    )
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+pl = pytest.importorskip("polars")
+
+from pyshortio.model import Link
+from pyshortio.link_table import LinkTable
+from pyshortio.sync_plan import plan_sync_df
+from pyshortio.sync_tsv import plan_sync
+
+
+def make_raw_links() -> list[dict]:
+    return [
+        {
+            "id": "lnk_1",
+            "originalURL": "https://example.com/same",
+            "title": "Same",
+            "tags": ["b", "a"],
+            "expiresAt": "2030-01-01T00:00:00.000Z",
+        },
+        {
+            "id": "lnk_2",
+            "originalURL": "https://example.com/changed",
+            "title": "Old",
+            "FolderId": "fld_1",
+        },
+        {
+            "id": "lnk_3",
+            "originalURL": "https://example.com/deleted",
+        },
+        {
+            "id": "lnk_4",
+            "originalURL": "https://example.com/no-title",
+        },
+    ]
+
+
+def make_existing_df() -> "pl.DataFrame":
+    return LinkTable.from_raw_links(make_raw_links()).df
+
+
+def make_wanted_df() -> "pl.DataFrame":
+    return pl.DataFrame(
+        {
+            "original_url": [
+                "https://example.com/same",
+                "https://example.com/changed",
+                "https://example.com/new",
+                "https://example.com/no-title",
+            ],
+            "title": ["Same", "New", "Created", "Title"],
+            "tags": [["a", "b"], None, None, None],
+            "expire_at": ["2030-01-01T00:00:00+00:00", None, None, None],
+            "folder_name": [None, "marketing", "marketing", None],
+        }
+    )
+
+
+def test_plan_sync_df():
+    plan = plan_sync_df(
+        wanted_df=make_wanted_df(),
+        existing_df=make_existing_df(),
+        folder_name_to_id_mapping={"marketing": "fld_1"},
+    )
+    assert plan.to_create == [
+        {
+            "original_url": "https://example.com/new",
+            "title": "Created",
+            "folder_id": "fld_1",
+        }
+    ]
+    # the expire_at is the same datetime, the title of lnk_4 is not set on
+    # short.io so it is not compared, like is_same
+    assert plan.to_update == [
+        (
+            "lnk_2",
+            {
+                "original_url": "https://example.com/changed",
+                "title": "New",
+                "folder_id": "fld_1",
+            },
+        )
+    ]
+    assert plan.to_delete == ["lnk_3"]
+    assert plan.changes.to_dicts() == [
+        {
+            "id": "lnk_2",
+            "original_url": "https://example.com/changed",
+            "title": True,
+            "expire_at": False,
+            "tags": False,
+            "folder_id": False,
+        }
+    ]
+
+
+def test_plan_sync():
+    wanted_links = {
+        row["original_url"]: {k: v for k, v in row.items() if v is not None}
+        for row in make_wanted_df().to_dicts()
+    }
+    existing_links = dict()
+    for data in make_raw_links():
+        link = Link._from_api_data(data)
+        existing_links[link.original_url] = link
+    to_create, to_update, to_delete = plan_sync(
+        wanted_links=wanted_links,
+        existing_links=existing_links,
+        folder_name_to_id_mapping={"marketing": "fld_1"},
+    )
+    plan = plan_sync_df(
+        wanted_df=make_wanted_df(),
+        existing_df=make_existing_df(),
+        folder_name_to_id_mapping={"marketing": "fld_1"},
+    )
+    assert to_create == plan.to_create
+    assert [link_id for link_id, _ in to_update] == [
+        link_id for link_id, _ in plan.to_update
+    ]
+    assert to_delete == plan.to_delete
+
+
+def test_plan_sync_df_no_compared_column():
+    plan = plan_sync_df(
+        wanted_df=pl.DataFrame({"original_url": ["https://example.com/same"]}),
+        existing_df=make_existing_df(),
+        folder_name_to_id_mapping={},
+    )
+    assert plan.to_create == []
+    assert plan.to_update == []
+    assert plan.to_delete == ["lnk_2", "lnk_3", "lnk_4"]
+    assert plan.changes.columns == ["id", "original_url"]
+
+
+def test_plan_sync_df_no_original_url():
+    raw_links = make_raw_links() + [{"id": "lnk_5"}]
+    plan = plan_sync_df(
+        wanted_df=make_wanted_df(),
+        existing_df=LinkTable.from_raw_links(raw_links).df,
+        folder_name_to_id_mapping={"marketing": "fld_1"},
+    )
+    # a link without original_url is deleted, like in plan_sync
+    assert plan.to_delete == ["lnk_3", "lnk_5"]
+    assert None not in plan.link_ids
+
+    wanted_links = {
+        row["original_url"]: {k: v for k, v in row.items() if v is not None}
+        for row in make_wanted_df().to_dicts()
+    }
+    existing_links = {
+        link.original_url: link
+        for link in map(Link._from_api_data, raw_links)
+    }
+    _, _, to_delete = plan_sync(
+        wanted_links=wanted_links,
+        existing_links=existing_links,
+        folder_name_to_id_mapping={"marketing": "fld_1"},
+    )
+    assert to_delete == plan.to_delete
+
+
+if __name__ == "__main__":
+    from pyshortio.tests import run_cov_test
+
+    run_cov_test(__file__, "pyshortio.sync_plan", preview=False)
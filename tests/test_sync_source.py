@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+
+import io
+import asyncio
+from pathlib import Path
+from datetime import datetime
+
+import pytest
+
+pl = pytest.importorskip("polars")
+
+from pyshortio.client import Client
+from pyshortio.async_client import AsyncClient
+from pyshortio.sync_source import guess_format, scan_links, read_links
+from pyshortio.tests.stub_server import StubShortIO
+
+hostname = "example.short.gy"
+
+TSV = (
+    "original_url\ttitle\ttags\texpire_at\tfolder_name\n"
+    "https://example.com/1\tOne\tb, a\t2030-01-01T00:00:00Z\tdocs\n"
+    "\tno url\t\t\t\n"
+    "https://example.com/2\tTwo\t\t\t\n"
+)
+
+
+def make_typed_df() -> "pl.DataFrame":
+    return pl.DataFrame(
+        {
+            "original_url": ["https://example.com/1", None, "https://example.com/2"],
+            "title": ["One", "no url", "Two"],
+            "tags": [["b", " a"], None, None],
+            "expire_at": [datetime(2030, 1, 1), None, None],
+            "folder_name": ["docs", None, None],
+        }
+    )
+
+
+class ArrowStream:
+    """
+    In-memory Arrow data without pyarrow, like a ``pyarrow.Table``.
+    """
+
+    def __init__(self, df: "pl.DataFrame"):
+        self.df = df
+
+    def __arrow_c_stream__(self, requested_schema=None):
+        return self.df.__arrow_c_stream__(requested_schema)
+
+
+def test_guess_format():
+    assert guess_format("links.tsv") == "tsv"
+    assert guess_format(Path("links.CSV")) == "csv"
+    assert guess_format("links.parquet") == "parquet"
+    assert guess_format("links.arrow") == "ipc"
+    assert guess_format("links.ndjson") == "jsonl"
+    assert guess_format(make_typed_df()) == "arrow"
+    assert guess_format(ArrowStream(make_typed_df())) == "arrow"
+    with pytest.raises(ValueError):
+        guess_format("links.txt")
+    with pytest.raises(ValueError):
+        guess_format(io.StringIO(TSV))
+
+
+def test_scan_links_error():
+    with pytest.raises(ValueError):
+        scan_links(io.StringIO("title\nhello\n"), format="tsv")
+    with pytest.raises(ValueError):
+        scan_links(io.StringIO(TSV), format="xlsx")
+    with pytest.raises(ValueError):
+        read_links(
+            io.StringIO("original_url\ttitle\na\t1\na\t2\n"),
+            format="tsv",
+        )
+
+
+def test_read_links(tmp_path: Path):
+    tsv_df, folder_name_list = read_links(io.StringIO(TSV), format="tsv")
+    assert folder_name_list == ["docs"]
+    # text formats keep the datetimes as written
+    assert tsv_df.to_dicts() == [
+        {
+            "original_url": "https://example.com/1",
+            "title": "One",
+            "tags": ["a", "b"],
+            "expire_at": "2030-01-01T00:00:00Z",
+            "folder_name": "docs",
+        },
+        {
+            "original_url": "https://example.com/2",
+            "title": "Two",
+            "tags": None,
+            "expire_at": None,
+            "folder_name": None,
+        },
+    ]
+    expected = tsv_df.with_columns(
+        pl.col("expire_at").str.to_datetime(time_zone="UTC")
+    ).to_dicts()
+
+    typed_df = make_typed_df()
+    typed_df.write_parquet(tmp_path.joinpath("links.parquet"))
+    typed_df.write_ipc(tmp_path.joinpath("links.arrow"))
+    typed_df.write_ndjson(tmp_path.joinpath("links.jsonl"))
+    sources = [
+        tmp_path.joinpath("links.parquet"),
+        tmp_path.joinpath("links.arrow"),
+        typed_df,
+        ArrowStream(typed_df),
+    ]
+    for source in sources:
+        df, folder_name_list = read_links(source)
+        assert folder_name_list == ["docs"]
+        assert df.to_dicts() == expected, source
+
+    # JSON lines has no datetime type
+    df, _ = read_links(tmp_path.joinpath("links.jsonl"))
+    assert df.drop("expire_at").to_dicts() == tsv_df.drop("expire_at").to_dicts()
+
+    tsv_df.with_columns(tags=pl.col("tags").list.join(",")).write_csv(
+        tmp_path.joinpath("links.csv")
+    )
+    df, _ = read_links(tmp_path.joinpath("links.csv"))
+    assert df.to_dicts() == tsv_df.to_dicts()
+
+    # a list column that is not a list of strings
+    df, _ = read_links(pl.DataFrame({"original_url": ["a"], "tags": [[2, 1]]}))
+    assert df["tags"].to_list() == [["1", "2"]]
+
+
+def test_sync_links_parquet(tmp_path: Path):
+    path = tmp_path.joinpath("links.parquet")
+    make_typed_df().write_parquet(path)
+    with StubShortIO() as stub:
+        stub.add_domain(hostname=hostname)
+        with Client(token="dummy", endpoint=stub.endpoint) as client:
+            result = client.sync_links(hostname=hostname, source=path)
+            assert result.ok
+            assert len(result.plan.to_create) == 2
+            assert sorted(link["originalURL"] for link in stub.links.values()) == [
+                "https://example.com/1",
+                "https://example.com/2",
+            ]
+
+            # the typed values are the same as the created links
+            result = client.sync_links(hostname=hostname, source=path, chunk_size=1)
+            assert (result.plan.to_create, result.plan.to_update) == ([], [])
+
+            make_typed_df().with_columns(
+                expire_at=pl.lit(datetime(2031, 1, 1))
+            ).write_parquet(path)
+            result = client.sync_links(hostname=hostname, source=path)
+            assert result.plan.changes["expire_at"].to_list() == [True]
+
+
+def test_async_sync_links_parquet(tmp_path: Path):
+    path = tmp_path.joinpath("links.parquet")
+    make_typed_df().write_parquet(path)
+
+    async def main():
+        async with AsyncClient(token="dummy", endpoint=stub.endpoint) as client:
+            result = await client.sync_links(hostname=hostname, source=path)
+            assert result.ok
+            assert len(result.plan.to_create) == 2
+
+    with StubShortIO() as stub:
+        stub.add_domain(hostname=hostname)
+        asyncio.run(main())
+        assert len(stub.links) == 2
+
+
+if __name__ == "__main__":
+    from pyshortio.tests import run_cov_test
+
+    run_cov_test(__file__, "pyshortio.sync_source", preview=False)
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+
+import io
+import asyncio
+from pathlib import Path
+
+import pytest
+
+pl = pytest.importorskip("polars")
+
+from pyshortio.client import Client
+from pyshortio.async_client import AsyncClient
+from pyshortio.sync_state import SyncState
+from pyshortio.tests.stub_server import StubShortIO
+
+hostname = "example.short.gy"
+
+
+def make_tsv(titles: dict[int, str]) -> io.StringIO:
+    return io.StringIO(
+        "original_url\ttitle\ttags\tfolder_name\n"
+        + "".join(
+            f"https://example.com/{i}\t{title}\t\tdocs\n"
+            for i, title in titles.items()
+        )
+    )
+
+
+def list_link_params(stub: StubShortIO) -> list[dict]:
+    return [
+        params
+        for method, path, params, _ in stub.requests
+        if method == "GET" and path == "/api/links"
+    ]
+
+
+def test_incremental_sync(tmp_path: Path):
+    state_file = tmp_path.joinpath("state.json")
+    titles = {i: f"title {i}" for i in range(10)}
+    with StubShortIO() as stub:
+        stub.add_domain(hostname=hostname)
+        with Client(token="dummy", endpoint=stub.endpoint) as client:
+
+            def sync(**kwargs):
+                stub.requests.clear()
+                return client.sync_tsv(
+                    hostname=hostname,
+                    file=make_tsv(titles),
+                    state_file=state_file,
+                    delete_if_not_in_file=True,
+                    **kwargs,
+                )
+
+            # no state yet, full scan
+            result = sync()
+            assert len(result.plan.to_create) == 10
+            assert "afterDate" not in list_link_params(stub)[0]
+            state = SyncState.load(state_file, hostname=hostname, domain_id=1)
+            assert len(state.links) == 10
+            assert all(entry[1] is not None for entry in state.links.values())
+            assert state.watermark is not None
+
+            # nothing changed
+            result = sync()
+            assert "afterDate" in list_link_params(stub)[0]
+            assert (result.plan.to_create, result.plan.to_update) == ([], [])
+
+            # one row changed, one new row, one removed row
+            titles[3] = "new title"
+            titles[10] = "title 10"
+            titles.pop(5)
+            result = sync()
+            assert "afterDate" in list_link_params(stub)[0]
+            assert [
+                link_data["original_url"] for _, link_data in result.plan.to_update
+            ] == ["https://example.com/3"]
+            assert [
+                link_data["original_url"] for link_data in result.plan.to_create
+            ] == ["https://example.com/10"]
+            assert len(result.plan.to_delete) == 1
+            remote = {
+                link["originalURL"]: link["title"] for link in stub.links.values()
+            }
+            assert remote == {
+                f"https://example.com/{i}": title for i, title in titles.items()
+            }
+
+            # a link created outside the sync is compared with its row
+            stub.add_link(domain_id=1, original_url="https://example.com/20", title="x")
+            titles[20] = "title 20"
+            result = sync()
+            assert [link_id for link_id, _ in result.plan.to_update] == [
+                link_id
+                for link_id, link in stub.links.items()
+                if link["originalURL"] == "https://example.com/20"
+            ]
+
+            # drift: the newest link was deleted outside the sync
+            newest_id = max(
+                stub.links,
+                key=lambda link_id: stub.links[link_id]["createdAt"],
+            )
+            newest_url = stub.links.pop(newest_id)["originalURL"]
+            result = sync()
+            params_list = list_link_params(stub)
+            assert "afterDate" in params_list[0]
+            assert "afterDate" not in params_list[-1]
+            assert [
+                link_data["original_url"] for link_data in result.plan.to_create
+            ] == [newest_url]
+
+            # a new link without original_url is deleted
+            no_url_link = stub.add_link(domain_id=1, original_url=None)
+            result = sync()
+            assert result.plan.to_delete == [no_url_link["id"]]
+            assert no_url_link["id"] not in stub.links
+
+            # a failed sync deletes the state
+            titles[0] = "failed title"
+            link_id = [
+                link_id
+                for link_id, link in stub.links.items()
+                if link["originalURL"] == "https://example.com/0"
+            ][0]
+            stub.fail(400, method="POST", path=f"/links/{link_id}")
+            result = sync()
+            assert result.ok is False
+            assert state_file.exists() is False
+
+
+async def _test_async_incremental_sync(stub: StubShortIO, state_file: Path):
+    titles = {i: f"title {i}" for i in range(5)}
+    async with AsyncClient(token="dummy", endpoint=stub.endpoint) as client:
+        for _ in range(2):
+            stub.requests.clear()
+            result = await client.sync_tsv(
+                hostname=hostname,
+                file=make_tsv(titles),
+                state_file=state_file,
+            )
+            assert result.ok
+        assert "afterDate" in list_link_params(stub)[0]
+        assert (result.plan.to_create, result.plan.to_update) == ([], [])
+
+
+def test_async_incremental_sync(tmp_path: Path):
+    pytest.importorskip("httpx")
+    with StubShortIO() as stub:
+        stub.add_domain(hostname=hostname)
+        asyncio.run(
+            _test_async_incremental_sync(stub, tmp_path.joinpath("state.json"))
+        )
+
+
+def test_load_other_domain(tmp_path: Path):
+    state_file = tmp_path.joinpath("state.json")
+    SyncState(hostname=hostname, domain_id=1).save(state_file)
+    assert SyncState.load(state_file, hostname=hostname, domain_id=1) is not None
+    assert SyncState.load(state_file, hostname=hostname, domain_id=2) is None
+    state_file.write_text("not json")
+    assert SyncState.load(state_file, hostname=hostname, domain_id=1) is None
+
+
+if __name__ == "__main__":
+    from pyshortio.tests import run_cov_test
+
+    run_cov_test(__file__, "pyshortio.sync_state", preview=False)
@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+
+import io
+import asyncio
+from pathlib import Path
+
+import pytest
+
+pl = pytest.importorskip("polars")
+
+from pyshortio.client import Client
+from pyshortio.async_client import AsyncClient
+from pyshortio.link_table import LinkTable
+from pyshortio.sync_plan import plan_sync_df
+from pyshortio.sync_source import scan_links, read_links
+from pyshortio.sync_stream import (
+    check_links,
+    iter_link_chunks,
+    plan_sync_chunks,
+    _find_duplicated_url,
+)
+from pyshortio.tests.stub_server import StubShortIO
+
+hostname = "example.short.gy"
+
+TSV = (
+    "original_url\ttitle\ttags\tfolder_name\n"
+    "https://example.com/1\tSame\tb, a\t\n"
+    "https://example.com/2\tNew\t\tmarketing\n"
+    "\tno url\t\t\n"
+    "https://example.com/3\tCreated\t\tmarketing\n"
+    "https://example.com/4\tTitle\t\tdocs\n"
+    "https://example.com/5\tCreated\tc\t\n"
+)
+
+
+def make_existing_df() -> "pl.DataFrame":
+    links = [
+        {
+            "id": "lnk_1",
+            "originalURL": "https://example.com/1",
+            "title": "Same",
+            "tags": ["b", "a"],
+        },
+        {
+            "id": "lnk_2",
+            "originalURL": "https://example.com/2",
+            "title": "Old",
+            "FolderId": "fld_1",
+        },
+        {
+            "id": "lnk_6",
+            "originalURL": "https://example.com/6",
+        },
+        {
+            "id": "lnk_4",
+            "originalURL": "https://example.com/4",
+            "title": "Title",
+        },
+        # no TSV row can match a link without original_url
+        {"id": "lnk_7"},
+    ]
+    return LinkTable.from_raw_links(links).df
+
+
+def test_check_links():
+    lf = scan_links(io.StringIO(TSV), format="tsv")
+    assert check_links(lf, chunk_size=2) == (5, ["docs", "marketing"])
+
+    lf = scan_links(io.StringIO("original_url\na\nb\n\n"), format="tsv")
+    assert check_links(lf, chunk_size=2) == (2, [])
+
+    lf = scan_links(
+        io.StringIO("original_url\ttitle\na\t1\nb\t2\na\t3\n"),
+        format="tsv",
+    )
+    with pytest.raises(ValueError, match="'a' more than once"):
+        check_links(lf, chunk_size=2)
+
+
+def test_find_duplicated_url():
+    lf = scan_links(io.StringIO("original_url\na\nb\n"), format="tsv")
+    hash_a, hash_b = pl.Series(["a", "b"]).hash().to_list()
+    # two different urls with the same hash are not duplicated
+    hashes = pl.Series([hash_a, hash_a], dtype=pl.UInt64)
+    assert _find_duplicated_url(lf, hashes, chunk_size=1) is None
+    hashes = pl.Series([hash_a, hash_b], dtype=pl.UInt64)
+    assert _find_duplicated_url(lf, hashes, chunk_size=1) is None
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 100])
+def test_plan_sync_chunks(chunk_size: int):
+    mapping = {"marketing": "fld_1", "docs": "fld_2"}
+    expected = plan_sync_df(
+        wanted_df=read_links(io.StringIO(TSV), format="tsv")[0],
+        existing_df=make_existing_df(),
+        folder_name_to_id_mapping=mapping,
+    )
+    plan = plan_sync_chunks(
+        chunks=iter_link_chunks(
+            scan_links(io.StringIO(TSV), format="tsv"),
+            chunk_size=chunk_size,
+        ),
+        existing_df=make_existing_df(),
+        folder_name_to_id_mapping=mapping,
+    )
+    assert [link_data["original_url"] for link_data in plan.to_create] == [
+        "https://example.com/3",
+        "https://example.com/5",
+    ]
+    assert [link_id for link_id, _ in plan.to_update] == ["lnk_2"]
+    assert plan.to_delete == ["lnk_6", "lnk_7"]
+    assert plan.to_create == expected.to_create
+    assert plan.to_update == expected.to_update
+    assert plan.to_delete == expected.to_delete
+    assert plan.changes.to_dicts() == expected.changes.to_dicts()
+    assert plan.link_ids == expected.link_ids
+
+
+def test_plan_sync_chunks_empty():
+    plan = plan_sync_chunks(
+        chunks=[],
+        existing_df=make_existing_df(),
+        folder_name_to_id_mapping={},
+    )
+    assert plan.to_create == []
+    assert plan.to_update == []
+    assert plan.to_delete == ["lnk_1", "lnk_2", "lnk_6", "lnk_4", "lnk_7"]
+
+
+def test_sync_tsv_in_chunks(tmp_path: Path):
+    path = tmp_path.joinpath("links.tsv")
+    path.write_text(TSV)
+    with StubShortIO() as stub:
+        stub.add_domain(hostname=hostname)
+        stub.add_link(domain_id=1, original_url="https://example.com/1", title="Old")
+        stub.add_link(domain_id=1, original_url="https://example.com/6")
+        with Client(token="dummy", endpoint=stub.endpoint) as client:
+            with pytest.raises(ValueError):
+                client.sync_tsv(
+                    hostname=hostname,
+                    file=path,
+                    chunk_size=2,
+                    state_file=tmp_path.joinpath("state.json"),
+                )
+            result = client.sync_tsv(
+                hostname=hostname,
+                file=path,
+                delete_if_not_in_file=True,
+                chunk_size=2,
+            )
+            assert result.ok
+            assert len(result.plan.to_create) == 4
+            assert len(result.plan.to_update) == 1
+            assert len(result.plan.to_delete) == 1
+            remote = {
+                link["originalURL"]: link["title"] for link in stub.links.values()
+            }
+            assert remote == {
+                "https://example.com/1": "Same",
+                "https://example.com/2": "New",
+                "https://example.com/3": "Created",
+                "https://example.com/4": "Title",
+                "https://example.com/5": "Created",
+            }
+
+            result = client.sync_tsv(hostname=hostname, file=path, chunk_size=2)
+            assert (result.plan.to_create, result.plan.to_update) == ([], [])
+
+
+def test_async_sync_tsv_in_chunks(tmp_path: Path):
+    path = tmp_path.joinpath("links.tsv")
+    path.write_text(TSV)
+
+    async def main():
+        async with AsyncClient(token="dummy", endpoint=stub.endpoint) as client:
+            result = await client.sync_tsv(
+                hostname=hostname,
+                file=path,
+                delete_if_not_in_file=True,
+                chunk_size=2,
+            )
+            assert result.ok
+            assert len(result.plan.to_create) == 4
+            assert len(result.plan.to_delete) == 1
+
+    with StubShortIO() as stub:
+        stub.add_domain(hostname=hostname)
+        stub.add_link(domain_id=1, original_url="https://example.com/1", title="Old")
+        stub.add_link(domain_id=1, original_url="https://example.com/6")
+        asyncio.run(main())
+        assert len(stub.links) == 5
+
+
+def test_sync_tsv_in_chunks_old_polars(tmp_path: Path, monkeypatch):
+    path = tmp_path.joinpath("links.tsv")
+    path.write_text(TSV)
+    monkeypatch.delattr(pl.LazyFrame, "collect_batches")
+    with StubShortIO() as stub:
+        stub.add_domain(hostname=hostname)
+        with Client(token="dummy", endpoint=stub.endpoint) as client:
+            with pytest.raises(ImportError, match="chunk_size requires polars"):
+                client.sync_tsv(hostname=hostname, file=path, chunk_size=2)
+        # it fails before any API call
+        assert stub.n_requests == 0
+
+
+if __name__ == "__main__":
+    from pyshortio.tests import run_cov_test
+
+    run_cov_test(__file__, "pyshortio.sync_stream", preview=False)
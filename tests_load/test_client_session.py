@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark: per-request latency with and without the pooled session.
+
+Run it directly to see the numbers::
+
+    python tests_load/test_client_session.py
+"""
+
+import time
+
+import requests
+
+from pyshortio.client import Client
+from pyshortio.tests.stub_server import StubShortIO
+
+N_REQUEST = 200
+
+
+def _bench_without_session(client: Client) -> float:
+    url = f"{client.endpoint}/api/domains"
+    start = time.perf_counter()
+    for _ in range(N_REQUEST):
+        # what the client did before: a brand-new connection for every call
+        requests.get(url, headers=client.headers).raise_for_status()
+    return (time.perf_counter() - start) / N_REQUEST
+
+
+def _bench_with_session(client: Client) -> float:
+    start = time.perf_counter()
+    for _ in range(N_REQUEST):
+        client.list_domains()
+    return (time.perf_counter() - start) / N_REQUEST
+
+
+def test_session_latency():
+    with StubShortIO() as stub:
+        stub.add_domain(hostname="example.short.gy")
+        with Client(token="dummy", endpoint=stub.endpoint) as client:
+            client.list_domains()  # warm up
+            without_session = _bench_without_session(client)
+            n_request_before = stub.n_requests
+            with_session = _bench_with_session(client)
+            assert stub.n_requests - n_request_before == N_REQUEST
+    print(
+        f"\nper request latency: "
+        f"without session = {without_session * 1000:.3f} ms, "
+        f"with session = {with_session * 1000:.3f} ms, "
+        f"speedup = {without_session / with_session:.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    test_session_latency()
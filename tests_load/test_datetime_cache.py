@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark: sorting and filtering 100k links by ``created_at``.
+
+- ``parse on access``: parse the ISO string on every access, like the old
+  ``Link.created_at`` property
+- ``cached``: the cached ``Link.created_at`` property
+- ``parse_created_at``: parse the whole list once with
+  :func:`~pyshortio.model.parse_created_at`, then use the cached property
+
+Run it directly to see the numbers::
+
+    python tests_load/test_datetime_cache.py
+"""
+
+import time
+import typing as T
+from datetime import datetime, timezone, timedelta
+
+from pyshortio.model import Link, _parse_datetime, parse_created_at
+
+N_LINK = 100_000
+N_PASS = 5
+
+
+def _links() -> list[Link]:
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    return [
+        Link._from_api_data(
+            {
+                "id": f"lnk_{i}",
+                # a bulk request creates many links with the same timestamp
+                "createdAt": (base + timedelta(seconds=(i * 7919) % N_LINK // 10))
+                .isoformat()
+                .replace("+00:00", "Z"),
+            }
+        )
+        for i in range(N_LINK)
+    ]
+
+
+def _workload(links: list[Link], get_created_at: T.Callable) -> float:
+    cutoff = datetime(2025, 1, 1, 1, tzinfo=timezone.utc)
+    start = time.perf_counter()
+    for _ in range(N_PASS):
+        sorted(links, key=get_created_at)
+        [link for link in links if get_created_at(link) > cutoff]
+    return time.perf_counter() - start
+
+
+def test_datetime_cache_benchmark():
+    links = _links()
+    elapsed_access = _workload(
+        links, lambda link: _parse_datetime(link._data.get("createdAt"))
+    )
+
+    links = _links()
+    elapsed_cached = _workload(links, lambda link: link.created_at)
+
+    links = _links()
+    start = time.perf_counter()
+    parse_created_at(links)
+    elapsed_batch = time.perf_counter() - start
+    elapsed_batch += _workload(links, lambda link: link.created_at)
+
+    for name, elapsed in [
+        ("parse on access", elapsed_access),
+        ("cached", elapsed_cached),
+        ("parse_created_at", elapsed_batch),
+    ]:
+        print(f"{name:>18}: {elapsed * 1000:7.1f} ms per {N_LINK} links")
+    assert elapsed_cached < elapsed_access
+    assert elapsed_batch < elapsed_access
+
+
+if __name__ == "__main__":
+    test_datetime_cache_benchmark()
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark: the size and the time of exporting a domain with ``export_links``
+to TSV vs the typed formats, Parquet, Arrow IPC and JSON lines.
+
+Run it directly to see the numbers::
+
+    python tests_load/test_export_formats.py
+"""
+
+import time
+import tempfile
+from pathlib import Path
+
+import pytest
+
+pl = pytest.importorskip("polars")
+
+from pyshortio.client import Client
+from pyshortio.tests.stub_server import StubShortIO
+
+N_LINK = 20_000
+FORMATS = ["tsv", "parquet", "ipc", "jsonl"]
+hostname = "example.short.gy"
+
+
+def test_export_formats_benchmark():
+    results = dict()
+    with tempfile.TemporaryDirectory() as dir:
+        dir = Path(dir)
+        with StubShortIO() as stub:
+            stub.add_domain(hostname=hostname)
+            for i in range(N_LINK):
+                stub.add_link(
+                    domain_id=1,
+                    original_url=f"https://example.com/{i}",
+                    title=f"title {i}",
+                    tags=["a", "b", f"tag {i % 100}"],
+                )
+            with Client(token="dummy", endpoint=stub.endpoint) as client:
+                for format in FORMATS:
+                    path = dir.joinpath(f"links.{format}")
+                    start = time.perf_counter()
+                    n_link = client.export_links(
+                        hostname=hostname,
+                        sink=path,
+                        format=format,
+                    )
+                    elapsed = time.perf_counter() - start
+                    assert n_link == N_LINK
+                    results[format] = (elapsed, path.stat().st_size)
+    for format, (elapsed, size) in results.items():
+        print(f"{format:>8}: {elapsed:.3f}s, {size / 1024:.0f} KiB")
+    # the time is dominated by the list API calls, Parquet is much smaller
+    # because its columns are dictionary encoded and compressed
+    assert results["parquet"][1] < results["tsv"][1] / 2
+
+
+if __name__ == "__main__":
+    test_export_formats_benchmark()
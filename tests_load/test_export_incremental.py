@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark: the nightly backup of a 20k link domain with 100 new links, a
+full ``export_links`` vs ``export_links_incremental``, which only lists the
+links created since the last run.
+
+Run it directly to see the numbers::
+
+    python tests_load/test_export_incremental.py
+"""
+
+import time
+import tempfile
+from pathlib import Path
+
+import pytest
+
+pl = pytest.importorskip("polars")
+
+from pyshortio.client import Client
+from pyshortio.tests.stub_server import StubShortIO
+
+N_LINK = 20_000
+N_NEW_LINK = 100
+hostname = "example.short.gy"
+
+
+def add_links(stub: StubShortIO, start: int, n_link: int):
+    for i in range(start, start + n_link):
+        stub.add_link(
+            domain_id=1,
+            original_url=f"https://example.com/{i}",
+            title=f"title {i}",
+            tags=["a", "b"],
+        )
+
+
+def test_export_incremental_benchmark():
+    results = dict()
+    with tempfile.TemporaryDirectory() as dir:
+        dir = Path(dir)
+        with StubShortIO() as stub:
+            stub.add_domain(hostname=hostname)
+            add_links(stub, start=0, n_link=N_LINK)
+            with Client(token="dummy", endpoint=stub.endpoint) as client:
+                client.export_links_incremental(
+                    hostname=hostname,
+                    dir=dir.joinpath("backup"),
+                )
+                add_links(stub, start=N_LINK, n_link=N_NEW_LINK)
+
+                start = time.perf_counter()
+                client.export_links(
+                    hostname=hostname,
+                    sink=dir.joinpath("links.parquet"),
+                    format="parquet",
+                )
+                results["full"] = time.perf_counter() - start
+
+                start = time.perf_counter()
+                manifest = client.export_links_incremental(
+                    hostname=hostname,
+                    dir=dir.joinpath("backup"),
+                )
+                results["incremental"] = time.perf_counter() - start
+                assert manifest.n_link == N_LINK + N_NEW_LINK
+    for name, elapsed in results.items():
+        print(f"{name:>12}: {elapsed:.3f}s")
+    assert results["incremental"] < results["full"] / 5
+
+
+if __name__ == "__main__":
+    test_export_incremental_benchmark()
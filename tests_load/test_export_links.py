@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark: the peak memory of exporting a domain, the whole domain in one
+table then one TSV string, vs ``export_links`` writing page by page to a file.
+
+Every measurement runs in a new process, with the stub server, and the peak
+resident set size, read from ``/proc``, covers the memory allocated by polars.
+The peak is reset once the stub server holds the links, the same links in
+both cases.
+
+Run it directly to see the numbers::
+
+    python tests_load/test_export_links.py
+"""
+
+import sys
+import subprocess
+import tempfile
+from pathlib import Path
+
+import pytest
+
+pl = pytest.importorskip("polars")
+
+SCRIPT = """
+import sys
+from pyshortio.client import Client
+from pyshortio.tests.stub_server import StubShortIO
+
+
+def peak_rss():
+    # the peak resident set size of this process, in KiB. ru_maxrss would
+    # include the peak of the parent process, e.g. the test session
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1])
+
+
+def reset_peak_rss():
+    with open("/proc/self/clear_refs", "w") as f:
+        f.write("5")
+
+
+n_link, mode, path = int(sys.argv[1]), sys.argv[2], sys.argv[3]
+hostname = "example.short.gy"
+with StubShortIO() as stub:
+    stub.add_domain(hostname=hostname)
+    for i in range(n_link):
+        stub.add_link(
+            domain_id=1,
+            original_url=f"https://example.com/{i}",
+            title=f"title {i}" * 10,
+            tags=["a", "b"],
+        )
+    with Client(token="dummy", endpoint=stub.endpoint) as client:
+        reset_peak_rss()
+        before = peak_rss()
+        if mode == "string":
+            table = client.get_link_table(domain_id=1)
+            tsv = table.to_export_df(dict()).write_csv(separator="\t")
+            with open(path, "w") as f:
+                f.write(tsv)
+        else:
+            client.export_links(hostname=hostname, sink=path)
+        after = peak_rss()
+print(after - before)
+"""
+
+
+def peak_memory(n_link: int, mode: str, path: Path) -> int:
+    """
+    The peak memory used by the export, in KiB.
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", SCRIPT, str(n_link), mode, str(path)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return int(output)
+
+
+@pytest.mark.skipif(
+    Path("/proc/self/clear_refs").exists() is False,
+    reason="reads the peak memory of the process from /proc",
+)
+def test_export_links_memory():
+    results = dict()
+    with tempfile.TemporaryDirectory() as dir:
+        path = Path(dir).joinpath("links.tsv")
+        for n_link in [5_000, 20_000]:
+            for mode in ["string", "stream"]:
+                results[(mode, n_link)] = peak_memory(n_link, mode, path)
+    for (mode, n_link), peak in results.items():
+        print(f"{mode:>8}, {n_link:>6} links: {peak / 1024:.1f} MiB")
+    growth = {
+        mode: results[(mode, 20_000)] - results[(mode, 5_000)]
+        for mode in ["string", "stream"]
+    }
+    # 4 times more links, the streaming export stays about the same
+    assert growth["stream"] < growth["string"] / 2
+
+
+if __name__ == "__main__":
+    test_export_links_memory()
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+"""
+Verify that :meth:`pyshortio.client.Client.iter_links` uses constant memory
+and has no cap on the number of links.
+
+The API is replaced by in-process fake pages so that the measurement only
+covers the client side.
+
+Run it directly to see the numbers::
+
+    python tests_load/test_iter_links_memory.py
+"""
+
+import json
+import tracemalloc
+
+import requests
+
+from pyshortio.client import Client
+from pyshortio.model import Link
+from pyshortio.paginator import Page
+
+LIMIT = 150
+
+
+def _fake_client(n_link: int) -> Client:
+    client = Client(token="dummy")
+
+    def _list_links_page(page_token=None, limit=LIMIT, **kwargs):
+        offset = 0 if not isinstance(page_token, str) else int(page_token)
+        links = [
+            {
+                "id": f"lnk_{i}",
+                "originalURL": f"https://example.com/{i}",
+                "createdAt": "2025-01-01T00:00:00.000Z",
+            }
+            for i in range(offset, min(offset + limit, n_link))
+        ]
+        data = {"count": len(links), "links": links}
+        if offset + limit < n_link:
+            data["nextPageToken"] = str(offset + limit)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(data).encode("utf-8")
+        return Page(
+            response=response,
+            data=data,
+            result=[Link(_data=dct) for dct in links],
+        )
+
+    client._list_links_page = _list_links_page
+    return client
+
+
+def _peak_memory(n_link: int) -> int:
+    client = _fake_client(n_link)
+    tracemalloc.start()
+    n = 0
+    for _ in client.iter_links(domain_id=1, limit=LIMIT):
+        n += 1
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert n == n_link
+    return peak
+
+
+def test_iter_links_memory():
+    small = _peak_memory(3_000)
+    big = _peak_memory(60_000)
+    print(f"peak memory, 3k links: {small / 1024:.0f} KiB, 60k links: {big / 1024:.0f} KiB")
+    # 20 times more links, about the same peak memory
+    assert big < small * 2
+
+
+if __name__ == "__main__":
+    test_iter_links_memory()
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+"""
+Micro-benchmark: decoding a 150-link ``list_links`` page.
+
+- ``before``: what the paginator used to do, ``response.json()`` twice
+- ``after``: the body bytes decoded once by :mod:`pyshortio.json_backend`
+
+Run it directly to see the numbers::
+
+    python tests_load/test_json_decode.py
+"""
+
+import json
+import time
+
+import requests
+
+from pyshortio.json_backend import BACKEND, response_json
+
+N_LINK = 150
+N_ROUND = 300
+
+
+def _make_response() -> requests.Response:
+    links = [
+        {
+            "id": f"lnk_abcd_{i:020d}",
+            "idString": f"lnk_abcd_{i:020d}",
+            "originalURL": f"https://example.com/some/long/path/{i}?utm_source=x",
+            "path": f"p{i}",
+            "title": f"Link number {i}",
+            "shortURL": f"https://example.short.gy/p{i}",
+            "secureShortURL": f"https://example.short.gy/p{i}",
+            "tags": ["a", "b", "c"],
+            "DomainId": 1,
+            "FolderId": None,
+            "OwnerId": 1,
+            "archived": False,
+            "cloaking": False,
+            "redirectType": None,
+            "createdAt": "2025-01-01T00:00:00.000Z",
+            "updatedAt": "2025-01-01T00:00:00.000Z",
+        }
+        for i in range(N_LINK)
+    ]
+    response = requests.Response()
+    response.status_code = 200
+    response.encoding = "utf-8"
+    response._content = json.dumps(
+        {"count": N_LINK, "links": links, "nextPageToken": "x"}
+    ).encode("utf-8")
+    return response
+
+
+def _bench(func) -> float:
+    response = _make_response()
+    start = time.perf_counter()
+    for _ in range(N_ROUND):
+        func(response)
+    return (time.perf_counter() - start) / N_ROUND
+
+
+def _before(response: requests.Response):
+    links = response.json().get("links", [])
+    next_token = response.json().get("nextPageToken")
+    return links, next_token
+
+
+def _after(response: requests.Response):
+    data = response_json(response)
+    return data.get("links", []), data.get("nextPageToken")
+
+
+def test_json_decode_benchmark():
+    assert _before(_make_response()) == _after(_make_response())
+    before = _bench(_before)
+    after = _bench(_after)
+    print(
+        f"before: {before * 1000:.3f} ms/page, "
+        f"after ({BACKEND}): {after * 1000:.3f} ms/page, "
+        f"{before / after:.2f}x"
+    )
+    assert after < before
+
+
+if __name__ == "__main__":
+    test_json_decode_benchmark()
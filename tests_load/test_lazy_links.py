@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark: a bulk scan of 100k links that keeps every link but reads only
+``original_url`` and ``id``, e.g. to match the links of a TSV file.
+
+Every link is kept in an ``original_url -> Link`` mapping.
+
+- ``eager``: decode every page into dicts with the fastest JSON backend
+- ``lazy``: keep the raw page bytes and decode each field on access, see
+  :mod:`pyshortio.lazy`
+
+Memory is the peak traced by :mod:`tracemalloc` while the mapping is built,
+it includes the raw page bodies that the lazy links keep alive.
+
+Run it directly to see the numbers::
+
+    python tests_load/test_lazy_links.py
+"""
+
+import gc
+import time
+import tracemalloc
+import typing as T
+
+import pytest
+
+pytest.importorskip("msgspec")
+
+from pyshortio.json_backend import loads, dumps
+from pyshortio.lazy import decode_links_page
+from pyshortio.model import Link
+
+N_LINK = 100_000
+PAGE_SIZE = 150
+
+
+def _bodies() -> list[bytes]:
+    links = [
+        {
+            "id": f"lnk_{i}",
+            "idString": f"lnk_{i}",
+            "originalURL": f"https://example.com/{i}",
+            "shortURL": f"https://example.short.gy/{i}",
+            "secureShortURL": f"https://example.short.gy/{i}",
+            "path": str(i),
+            "title": f"title {i}",
+            "tags": ["a", "b"],
+            "FolderId": "fld_1",
+            "DomainId": 1,
+            "OwnerId": 2,
+            "cloaking": False,
+            "archived": False,
+            "hasPassword": False,
+            "redirectType": None,
+            "utmSource": "newsletter",
+            "utmMedium": "email",
+            "createdAt": "2025-01-01T00:00:00.000Z",
+            "updatedAt": "2025-01-01T00:00:00.000Z",
+            "User": {"id": 2, "name": "someone", "email": "someone@example.com"},
+        }
+        for i in range(N_LINK)
+    ]
+    return [
+        dumps({"links": links[i : i + PAGE_SIZE], "nextPageToken": "token"})
+        for i in range(0, N_LINK, PAGE_SIZE)
+    ]
+
+
+def _scan(bodies: list[bytes], decode: T.Callable) -> dict[str, Link]:
+    mapping = dict()
+    for body in bodies:
+        # a fresh exact size copy, like ``requests.Response.content``
+        body = bytes(memoryview(body))
+        for dct in decode(body)["links"]:
+            link = Link._from_api_data(dct)
+            mapping[link.original_url] = link
+    for link in mapping.values():
+        _ = link.id
+    return mapping
+
+
+def _bench(bodies: list[bytes], decode: T.Callable) -> tuple[float, int]:
+    gc.collect()
+    start = time.perf_counter()
+    mapping = _scan(bodies, decode)
+    elapsed = time.perf_counter() - start
+    assert len(mapping) == N_LINK
+    del mapping
+
+    gc.collect()
+    tracemalloc.start()
+    mapping = _scan(bodies, decode)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del mapping
+    return elapsed, peak
+
+
+def test_lazy_links_benchmark():
+    bodies = _bodies()
+    results = {
+        "eager": _bench(bodies, loads),
+        "lazy": _bench(bodies, decode_links_page),
+    }
+    for name, (elapsed, peak) in results.items():
+        print(
+            f"{name:>6}: {elapsed * 1000:7.1f} ms, "
+            f"peak {peak / 1024 / 1024:7.2f} MiB per {N_LINK} links"
+        )
+    assert results["lazy"][0] < results["eager"][0]
+    assert results["lazy"][1] < results["eager"][1]
+
+
+if __name__ == "__main__":
+    test_lazy_links_benchmark()
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark: sequential ``pagi_list_links`` vs parallel ``scan_links``.
+
+Run it directly to see the numbers::
+
+    python tests_load/test_link_scan.py
+"""
+
+import time
+
+from pyshortio.client import Client
+from pyshortio.tests.stub_server import StubShortIO
+
+N_LINK = 3000
+LIMIT = 50
+LATENCY = 0.01
+
+
+def test_scan_links_benchmark():
+    with StubShortIO(latency=LATENCY) as stub:
+        stub.add_domain(hostname="example.short.gy")
+        for i in range(N_LINK):
+            stub.add_link(domain_id=1, original_url=f"https://example.com/{i}")
+        with Client(token="dummy", endpoint=stub.endpoint, pool_maxsize=16) as client:
+            start = time.perf_counter()
+            n_sequential = 0
+            for _, link_list in client.pagi_list_links(domain_id=1, limit=LIMIT):
+                n_sequential += len(link_list)
+            sequential = time.perf_counter() - start
+
+            start = time.perf_counter()
+            n_scan = 0
+            for _ in client.scan_links(
+                domain_id=1,
+                n_windows=16,
+                max_workers=16,
+                limit=LIMIT,
+            ):
+                n_scan += 1
+            scan = time.perf_counter() - start
+    print(f"pagi_list_links: {sequential:.3f}s, scan_links: {scan:.3f}s")
+    assert n_sequential == n_scan == N_LINK
+
+
+if __name__ == "__main__":
+    test_scan_links_benchmark()
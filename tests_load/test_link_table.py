@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark: reading 100k links from the raw list page bodies into a
+:class:`~pyshortio.link_table.LinkTable`.
+
+- ``decoded``: decode every body to Python objects, build a ``Link`` per link,
+  like a plain list page, then fill the table from the decoded dicts
+- ``raw``: parse every body once with the polars JSON reader, like
+  ``pagi_list_links(..., table=True)``, see
+  :func:`~pyshortio.link_table.read_links_page`
+
+Run it directly to see the numbers::
+
+    python tests_load/test_link_table.py
+"""
+
+import time
+
+import pytest
+
+pl = pytest.importorskip("polars")
+
+from pyshortio.model import Link
+from pyshortio.json_backend import dumps, loads
+from pyshortio.paginator import Page
+from pyshortio.link_table import LinkTable, read_links_page
+
+N_LINK = 100_000
+PAGE_SIZE = 150
+
+
+def _bodies() -> list[bytes]:
+    links = [
+        {
+            "id": f"lnk_{i}",
+            "idString": f"lnk_{i}",
+            "originalURL": f"https://example.com/{i}",
+            "shortURL": f"https://example.short.gy/{i}",
+            "path": str(i),
+            "title": f"title {i}",
+            "tags": ["a", "b"] if i % 3 == 0 else [],
+            "FolderId": "fld_1" if i % 2 == 0 else None,
+            "DomainId": 1,
+            "cloaking": False,
+            "archived": False,
+            "clicksLimit": i % 100 or None,
+            "createdAt": "2025-01-01T00:00:00.000Z",
+        }
+        for i in range(N_LINK)
+    ]
+    return [
+        dumps({"links": links[i : i + PAGE_SIZE], "nextPageToken": str(i)})
+        for i in range(0, N_LINK, PAGE_SIZE)
+    ]
+
+
+def test_link_table_benchmark():
+    bodies = _bodies()
+
+    start = time.perf_counter()
+    pages = list()
+    for body in bodies:
+        data = loads(body)
+        link_list = [Link._from_api_data(dct) for dct in data["links"]]
+        pages.append(Page(None, data, link_list))
+    expected = LinkTable.from_pages(pages)
+    elapsed_decoded = time.perf_counter() - start
+
+    start = time.perf_counter()
+    pages = list()
+    for body in bodies:
+        raw_df, next_token = read_links_page(body)
+        pages.append(Page(None, {"links": raw_df}, raw_df))
+    table = LinkTable.from_pages(pages)
+    elapsed_raw = time.perf_counter() - start
+
+    print(f"  decoded: {elapsed_decoded * 1000:7.1f} ms per {N_LINK} links")
+    print(f"      raw: {elapsed_raw * 1000:7.1f} ms per {N_LINK} links")
+    assert table.df.equals(expected.df)
+    assert elapsed_raw < elapsed_decoded
+
+
+if __name__ == "__main__":
+    test_link_table_benchmark()
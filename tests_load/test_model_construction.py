@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark: building 100k ``Link`` objects from list page payloads.
+
+- ``dict dataclass``: a copy of the old model, a regular dataclass with a
+  per-instance ``__dict__`` that validates its fields in ``__post_init__``
+- ``slots + __init__``: the slotted model built with ``Link(_data=...)``
+- ``slots + _from_api_data``: the trusted constructor used by the client
+
+Memory is the size of the model instances measured by :mod:`tracemalloc`, the
+payload dicts are shared by all variants and excluded.
+
+Run it directly to see the numbers::
+
+    python tests_load/test_model_construction.py
+"""
+
+import gc
+import time
+import tracemalloc
+import typing as T
+import dataclasses
+
+from pyshortio.arg import REQ
+from pyshortio.model import BaseModel, Link
+
+N_LINK = 100_000
+
+
+@dataclasses.dataclass
+class DictLink:
+    _data: dict[str, T.Any] = dataclasses.field(default=REQ)
+
+    def __post_init__(self):
+        for field in dataclasses.fields(self.__class__):
+            if field.init:
+                if getattr(self, field.name) is REQ:  # pragma: no cover
+                    raise ValueError
+
+
+def _payloads() -> list[dict[str, T.Any]]:
+    return [
+        {
+            "id": f"lnk_{i}",
+            "originalURL": f"https://example.com/{i}",
+            "createdAt": "2025-01-01T00:00:00.000Z",
+        }
+        for i in range(N_LINK)
+    ]
+
+
+def _bench(build: T.Callable) -> tuple[float, int]:
+    payloads = _payloads()
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    objects = [build(dct) for dct in payloads]
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(objects) == N_LINK
+    return elapsed, size
+
+
+def test_model_construction_benchmark():
+    results = {
+        "dict dataclass": _bench(lambda dct: DictLink(_data=dct)),
+        "slots + __init__": _bench(lambda dct: Link(_data=dct)),
+        "slots + _from_api_data": _bench(Link._from_api_data),
+    }
+    for name, (elapsed, size) in results.items():
+        print(
+            f"{name:>24}: {elapsed * 1000:7.1f} ms, "
+            f"{size / 1024 / 1024:6.2f} MiB per {N_LINK} links"
+        )
+    assert isinstance(Link._from_api_data({}), BaseModel)
+    assert results["slots + _from_api_data"][0] < results["dict dataclass"][0]
+    assert results["slots + _from_api_data"][1] < results["dict dataclass"][1]
+
+
+if __name__ == "__main__":
+    test_model_construction_benchmark()
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark: walking all pages with and without prefetch, when both the API call
+and the per-page processing take time.
+
+Run it directly to see the numbers::
+
+    python tests_load/test_paginator_prefetch.py
+"""
+
+import time
+
+from pyshortio.client import Client
+from pyshortio.tests.stub_server import StubShortIO
+
+N_LINK = 300
+LIMIT = 20
+LATENCY = 0.02
+PROCESSING = 0.02
+
+
+def _bench(client: Client, prefetch: int) -> float:
+    start = time.perf_counter()
+    for _, link_list in client.pagi_list_links(
+        domain_id=1,
+        limit=LIMIT,
+        prefetch=prefetch,
+    ):
+        time.sleep(PROCESSING)
+    return time.perf_counter() - start
+
+
+def test_prefetch_benchmark():
+    with StubShortIO(latency=LATENCY) as stub:
+        stub.add_domain(hostname="example.short.gy")
+        for i in range(N_LINK):
+            stub.add_link(domain_id=1, original_url=f"https://example.com/{i}")
+        with Client(token="dummy", endpoint=stub.endpoint) as client:
+            serial = _bench(client, prefetch=0)
+            prefetched = _bench(client, prefetch=2)
+    print(f"serial: {serial:.3f}s, prefetch=2: {prefetched:.3f}s")
+    assert prefetched < serial
+
+
+if __name__ == "__main__":
+    test_prefetch_benchmark()
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+
+"""
+Verify that :class:`pyshortio.rate_limit.FileTokenBucket` enforces one rate
+across several processes.
+"""
+
+import time
+import multiprocessing
+
+from pyshortio.rate_limit import FileTokenBucket
+
+RATE = 40
+N_PROCESSES = 4
+N_TOKENS_PER_PROCESS = 10
+
+
+def worker(path: str):
+    bucket = FileTokenBucket(path=path, rate=RATE, capacity=1)
+    for _ in range(N_TOKENS_PER_PROCESS):
+        bucket.acquire()
+
+
+def test_file_token_bucket_across_processes(tmp_path):
+    path = str(tmp_path / "shared.bucket")
+    start = time.monotonic()
+    processes = [
+        multiprocessing.Process(target=worker, args=(path,))
+        for _ in range(N_PROCESSES)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    elapsed = time.monotonic() - start
+    n_tokens = N_PROCESSES * N_TOKENS_PER_PROCESS
+    print(f"{n_tokens} tokens at {RATE}/s across {N_PROCESSES} processes: {elapsed:.3f}s")
+    # the first token is free
+    assert elapsed >= (n_tokens - 1) / RATE * 0.95
+
+
+if __name__ == "__main__":
+    from pyshortio.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "pyshortio.rate_limit",
+        preview=False,
+    )
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark: the create and delete phases of ``sync_tsv``, one bulk call at a
+time vs 8 concurrent bulk calls.
+
+Run it directly to see the numbers::
+
+    python tests_load/test_sync_bulk.py
+"""
+
+import time
+
+from pyshortio.client import Client
+from pyshortio.logger import logger
+from pyshortio.tests.stub_server import StubShortIO
+
+N_LINK = 3000
+LATENCY = 0.05
+
+
+def test_sync_bulk_benchmark():
+    with StubShortIO(latency=LATENCY) as stub:
+        stub.add_domain(hostname="example.short.gy")
+        with Client(token="dummy", endpoint=stub.endpoint, pool_maxsize=16) as client:
+            results = dict()
+            with logger.disabled():
+                for max_workers in [1, 8]:
+                    to_create = [
+                        {
+                            "original_url": f"https://example.com/{max_workers}/{i}",
+                            "folder_id": f"fld_{i % 3}",
+                        }
+                        for i in range(N_LINK)
+                    ]
+                    start = time.perf_counter()
+                    create_results = client._sync_create_links(
+                        hostname="example.short.gy",
+                        to_create=to_create,
+                        max_workers=max_workers,
+                    )
+                    delete_results = client._sync_delete_links(
+                        to_delete=[
+                            link.id
+                            for result in create_results
+                            for link in result.value
+                        ],
+                        max_workers=max_workers,
+                    )
+                    results[max_workers] = time.perf_counter() - start
+                    assert all(result.ok for result in create_results)
+                    assert all(result.ok for result in delete_results)
+                    assert len(stub.links) == 0
+    for max_workers, elapsed in results.items():
+        print(
+            f"max_workers = {max_workers}: {elapsed:.3f}s "
+            f"to create and delete {N_LINK} links"
+        )
+    assert results[8] < results[1]
+
+
+if __name__ == "__main__":
+    test_sync_bulk_benchmark()
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark: planning the sync of a 200k row TSV against 200k existing links,
+1% of the rows changed, 1% new and 1% of the links deleted.
+
+- ``dict loop``: :func:`~pyshortio.sync_tsv.plan_sync`, the TSV converted with
+  ``to_dicts`` and compared one :class:`~pyshortio.model.Link` at a time
+- ``polars join``: :func:`~pyshortio.sync_plan.plan_sync_df` on the TSV frame
+  and the :class:`~pyshortio.link_table.LinkTable` of the existing links
+
+Run it directly to see the numbers::
+
+    python tests_load/test_sync_plan.py
+"""
+
+import time
+
+import pytest
+
+pl = pytest.importorskip("polars")
+
+from pyshortio.model import Link
+from pyshortio.link_table import LinkTable
+from pyshortio.sync_tsv import plan_sync
+from pyshortio.sync_plan import plan_sync_df
+from pyshortio.logger import logger
+
+N_LINK = 200_000
+
+
+def make_raw_links() -> list[dict]:
+    return [
+        {
+            "id": f"lnk_{i}",
+            "originalURL": f"https://example.com/{i}",
+            "title": f"title {i}",
+            "tags": ["b", "a"],
+            "utmSource": "newsletter",
+            "FolderId": "fld_1",
+            "createdAt": "2024-01-01T00:00:00.000Z",
+        }
+        for i in range(N_LINK)
+    ]
+
+
+def make_wanted_df() -> "pl.DataFrame":
+    start = N_LINK // 100
+    ids = range(start, N_LINK + start)
+    return pl.DataFrame(
+        {
+            "original_url": [f"https://example.com/{i}" for i in ids],
+            "title": [
+                f"new title {i}" if i % 100 == 0 else f"title {i}" for i in ids
+            ],
+            "tags": [["a", "b"]] * N_LINK,
+            "utm_source": ["newsletter"] * N_LINK,
+            "folder_name": ["marketing"] * N_LINK,
+        }
+    )
+
+
+def test_sync_plan_benchmark():
+    raw_links = make_raw_links()
+    table = LinkTable.from_raw_links(raw_links)
+    wanted_df = make_wanted_df()
+    mapping = {"marketing": "fld_1"}
+
+    results = dict()
+    with logger.disabled(disable=True):
+        start = time.perf_counter()
+        wanted_links = {
+            row["original_url"]: {k: v for k, v in row.items() if v is not None}
+            for row in wanted_df.to_dicts()
+        }
+        existing_links = dict()
+        for data in raw_links:
+            link = Link._from_api_data(data)
+            existing_links[link.original_url] = link
+        to_create, to_update, to_delete = plan_sync(
+            wanted_links=wanted_links,
+            existing_links=existing_links,
+            folder_name_to_id_mapping=mapping,
+        )
+        results["dict loop"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        plan = plan_sync_df(
+            wanted_df=wanted_df,
+            existing_df=table.df,
+            folder_name_to_id_mapping=mapping,
+        )
+        results["polars join"] = time.perf_counter() - start
+
+    assert len(plan.to_create) == len(to_create) == N_LINK // 100
+    assert len(plan.to_delete) == len(to_delete) == N_LINK // 100
+    assert [link_id for link_id, _ in plan.to_update] == [
+        link_id for link_id, _ in to_update
+    ]
+    for name, elapsed in results.items():
+        print(f"{name:>12}: {elapsed * 1000:7.1f} ms per {N_LINK} rows")
+    assert results["polars join"] < results["dict loop"]
+
+
+if __name__ == "__main__":
+    test_sync_plan_benchmark()
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark: read the link data of a 200k row catalog for ``sync_links``, from
+TSV vs from Parquet and Arrow IPC, which keep the tag lists and datetimes typed.
+
+Run it directly to see the numbers::
+
+    python tests_load/test_sync_source.py
+"""
+
+import time
+import tempfile
+from pathlib import Path
+from datetime import datetime
+
+import pytest
+
+pl = pytest.importorskip("polars")
+
+from pyshortio.sync_source import read_links
+
+N_ROW = 200_000
+
+
+def make_df() -> "pl.DataFrame":
+    return pl.DataFrame(
+        {
+            "original_url": [f"https://example.com/{i}" for i in range(N_ROW)],
+            "title": [f"title {i}" for i in range(N_ROW)],
+            "tags": [["b", "a", f"tag {i % 100}"] for i in range(N_ROW)],
+            "expire_at": [datetime(2030, 1, 1)] * N_ROW,
+            "folder_name": [f"folder {i % 10}" for i in range(N_ROW)],
+        }
+    )
+
+
+def test_sync_source_benchmark():
+    df = make_df()
+    results = dict()
+    with tempfile.TemporaryDirectory() as dir:
+        dir = Path(dir)
+        df.with_columns(tags=pl.col("tags").list.join(", ")).write_csv(
+            dir.joinpath("links.tsv"),
+            separator="\t",
+        )
+        df.write_parquet(dir.joinpath("links.parquet"))
+        df.write_ipc(dir.joinpath("links.arrow"))
+        for name in ["links.tsv", "links.parquet", "links.arrow"]:
+            start = time.perf_counter()
+            links_df, _ = read_links(dir.joinpath(name))
+            results[name] = time.perf_counter() - start
+            assert links_df.height == N_ROW
+    for name, elapsed in results.items():
+        print(f"{name:>14}: {elapsed:.3f}s for {N_ROW} rows")
+    assert results["links.parquet"] < results["links.tsv"]
+
+
+if __name__ == "__main__":
+    test_sync_source_benchmark()
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark: a ``sync_tsv`` run where one row of a 5000 row TSV changed, full
+sync vs incremental sync with a state file.
+
+Run it directly to see the numbers::
+
+    python tests_load/test_sync_state.py
+"""
+
+import io
+import time
+import tempfile
+from pathlib import Path
+
+import pytest
+
+pl = pytest.importorskip("polars")
+
+from pyshortio.client import Client
+from pyshortio.logger import logger
+from pyshortio.tests.stub_server import StubShortIO
+
+N_LINK = 5000
+LATENCY = 0.01
+
+
+def make_tsv(changed: bool) -> io.StringIO:
+    rows = [
+        f"https://example.com/{i}\ttitle {i}\ta, b\n" for i in range(N_LINK)
+    ]
+    if changed:
+        rows[N_LINK // 2] = f"https://example.com/{N_LINK // 2}\tchanged\ta, b\n"
+    return io.StringIO("original_url\ttitle\ttags\tfolder_name\n" + "".join(rows))
+
+
+def test_sync_state_benchmark():
+    hostname = "example.short.gy"
+    with tempfile.TemporaryDirectory() as dir:
+        state_file = Path(dir).joinpath("state.json")
+        with StubShortIO(latency=LATENCY) as stub:
+            stub.add_domain(hostname=hostname)
+            with Client(token="dummy", endpoint=stub.endpoint) as client:
+                results = dict()
+                with logger.disabled():
+                    client.sync_tsv(
+                        hostname=hostname,
+                        file=make_tsv(changed=False),
+                        state_file=state_file,
+                    )
+                    for name, kwargs in [
+                        ("full", dict()),
+                        ("incremental", dict(state_file=state_file)),
+                    ]:
+                        start = time.perf_counter()
+                        result = client.sync_tsv(
+                            hostname=hostname,
+                            file=make_tsv(changed=True),
+                            real_run=False,
+                            **kwargs,
+                        )
+                        results[name] = time.perf_counter() - start
+                        assert len(result.plan.to_update) == 1
+    for name, elapsed in results.items():
+        print(f"{name:>12}: {elapsed:.3f}s per sync of {N_LINK} rows")
+    assert results["incremental"] < results["full"]
+
+
+if __name__ == "__main__":
+    test_sync_state_benchmark()
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark: the peak memory used to read a TSV file for ``sync_tsv``, the whole
+file vs ``chunk_size`` rows at a time, for two file sizes.
+
+Every measurement runs in a new process, the peak resident set size, read
+from ``/proc``, covers the memory allocated by polars, which ``tracemalloc``
+doesn't see. The peak is reset once the modules are imported.
+
+Run it directly to see the numbers::
+
+    python tests_load/test_sync_stream.py
+"""
+
+import sys
+import subprocess
+import tempfile
+from pathlib import Path
+
+import pytest
+
+pl = pytest.importorskip("polars")
+
+CHUNK_SIZE = 10_000
+
+SCRIPT = """
+import sys
+from pyshortio.client import Client
+from pyshortio.logger import logger
+from pyshortio.sync_stream import iter_link_chunks
+
+
+def peak_rss():
+    # the peak resident set size of this process, in KiB. ru_maxrss would
+    # include the peak of the parent process, e.g. the test session
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1])
+
+
+def reset_peak_rss():
+    with open("/proc/self/clear_refs", "w") as f:
+        f.write("5")
+
+
+client = Client(token="dummy")
+path, mode = sys.argv[1], sys.argv[2]
+reset_peak_rss()
+before = peak_rss()
+with logger.disabled():
+    if mode == "full":
+        mapping, _ = client._sync_read_link_data_from_tsv(file=path)
+        n_row = len(mapping)
+    else:
+        lf, _ = client._sync_scan_links(source=path, chunk_size={chunk_size})
+        n_row = sum(df.height for df in iter_link_chunks(lf, chunk_size={chunk_size}))
+after = peak_rss()
+print(n_row, after - before)
+""".format(chunk_size=CHUNK_SIZE)
+
+
+def write_tsv(path: Path, n_row: int):
+    with path.open("w") as f:
+        f.write("original_url\ttitle\ttags\tfolder_name\n")
+        for i in range(n_row):
+            f.write(f"https://example.com/{i}\ttitle {i}\ta, b\tfolder {i % 10}\n")
+
+
+def peak_memory(path: Path, mode: str) -> int:
+    """
+    The peak memory used to read the file, in KiB.
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", SCRIPT, str(path), mode],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    n_row, peak = output.split()
+    return int(peak)
+
+
+@pytest.mark.skipif(
+    Path("/proc/self/clear_refs").exists() is False,
+    reason="reads the peak memory of the process from /proc",
+)
+def test_sync_stream_memory():
+    results = dict()
+    with tempfile.TemporaryDirectory() as dir:
+        for n_row in [100_000, 400_000]:
+            path = Path(dir).joinpath(f"{n_row}.tsv")
+            write_tsv(path, n_row)
+            for mode in ["full", "chunked"]:
+                results[(mode, n_row)] = peak_memory(path, mode)
+    for (mode, n_row), peak in results.items():
+        print(f"{mode:>8}, {n_row:>7} rows: {peak / 1024:.0f} MiB")
+    # 4 times more rows, the chunked reader keeps 8 bytes per row, most of
+    # its growth is the file mapped in memory by polars
+    assert results[("full", 400_000)] > results[("full", 100_000)] * 2
+    assert results[("chunked", 400_000)] < results[("full", 400_000)] / 4
+
+
+if __name__ == "__main__":
+    test_sync_stream_memory()
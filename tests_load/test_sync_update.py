@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark: the update phase of ``sync_tsv``, one link at a time vs 16
+concurrent ``update_link`` calls.
+
+Run it directly to see the numbers::
+
+    python tests_load/test_sync_update.py
+"""
+
+import time
+
+from pyshortio.client import Client
+from pyshortio.logger import logger
+from pyshortio.tests.stub_server import StubShortIO
+
+N_LINK = 300
+LATENCY = 0.01
+
+
+def test_sync_update_benchmark():
+    with StubShortIO(latency=LATENCY) as stub:
+        stub.add_domain(hostname="example.short.gy")
+        link_ids = [
+            stub.add_link(domain_id=1, original_url=f"https://example.com/{i}")["id"]
+            for i in range(N_LINK)
+        ]
+        with Client(token="dummy", endpoint=stub.endpoint, pool_maxsize=16) as client:
+            results = dict()
+            with logger.disabled():
+                for max_workers in [1, 16]:
+                    to_update = [
+                        (
+                            link_id,
+                            {
+                                "original_url": f"https://example.com/{i}",
+                                "title": f"title {max_workers}",
+                            },
+                        )
+                        for i, link_id in enumerate(link_ids)
+                    ]
+                    start = time.perf_counter()
+                    task_results = client._sync_update_links(
+                        domain_id=1,
+                        to_update=to_update,
+                        max_workers=max_workers,
+                    )
+                    results[max_workers] = time.perf_counter() - start
+                    assert all(result.ok for result in task_results)
+    for max_workers, elapsed in results.items():
+        print(f"max_workers = {max_workers:>2}: {elapsed:.3f}s per {N_LINK} updates")
+    assert results[16] < results[1]
+
+
+if __name__ == "__main__":
+    test_sync_update_benchmark()